@@ -0,0 +1,213 @@
+"""
+Fetcher load generator against the local replay server.
+
+Drives N simulated roasters through PlatformFetcherService.fetch_products_with_cascade
+concurrently, the way worker jobs do, and reports roaster latency, products
+fetched and how the server answered (200/304/429/503). Use it to measure
+concurrency, politeness and backoff changes before rolling them out.
+
+Usage:
+    python -m benchmarks.fetcher_load --roasters 50 --concurrency 10 --rate-limit 20
+    python -m benchmarks.fetcher_load --roasters 20 --server-url http://127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from src.config.firecrawl_config import FirecrawlConfig
+from src.config.roaster_schema import RoasterConfigSchema
+from src.fetcher.base_fetcher import FetcherConfig
+from src.fetcher.platform_fetcher_service import PlatformFetcherService
+
+from .replay_server import PLATFORMS, ReplayServer, build_arg_parser, config_from_args
+
+
+@dataclass
+class RoasterRun:
+    """Outcome of one simulated roaster job."""
+    roaster_id: str
+    success: bool
+    platform: Optional[str]
+    products: int
+    duration: float
+    error: Optional[str] = None
+
+
+@dataclass
+class LoadReport:
+    """Aggregate result of a load run."""
+    runs: List[RoasterRun]
+    duration: float
+    server_stats: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for run in self.runs if run.success)
+
+    def latency_percentile(self, fraction: float) -> float:
+        durations = sorted(run.duration for run in self.runs)
+        if not durations:
+            return 0.0
+        return durations[min(len(durations) - 1, int(round(fraction * (len(durations) - 1))))]
+
+    def summary(self) -> str:
+        products = sum(run.products for run in self.runs)
+        requests = self.server_stats.get('total_requests', 0)
+        lines = [
+            f"roasters: {len(self.runs)} ({self.succeeded} succeeded) in {self.duration:.2f}s",
+            f"products: {products} ({products / self.duration if self.duration else 0:.1f}/s)",
+            f"roaster latency p50 {self.latency_percentile(0.5):.2f}s p99 {self.latency_percentile(0.99):.2f}s",
+        ]
+        if self.server_stats:
+            lines.append(
+                f"server requests: {requests} ({requests / self.duration if self.duration else 0:.1f}/s), "
+                f"status counts {self.server_stats.get('status_counts', {})}"
+            )
+        failures = [run for run in self.runs if not run.success]
+        for run in failures[:10]:
+            lines.append(f"  failed {run.roaster_id}: {run.error}")
+        return "\n".join(lines)
+
+
+def roaster_ids(count: int) -> List[str]:
+    """Simulated roaster IDs, alternating platforms."""
+    return [f"{PLATFORMS[i % len(PLATFORMS)]}-{i}" for i in range(count)]
+
+
+async def run_roaster(
+    roaster_id: str,
+    base_url: str,
+    fetcher_config: FetcherConfig,
+    known_platform: bool,
+    job_type: str = "full_refresh"
+) -> RoasterRun:
+    """Run one roaster's fetch through the platform cascade."""
+    roaster_config = RoasterConfigSchema(
+        id=roaster_id,
+        name=roaster_id,
+        base_url=base_url,
+        platform=roaster_id.split('-', 1)[0] if known_platform else None,
+        use_firecrawl_fallback=False
+    )
+    # The cascade always builds a Firecrawl fallback; point it at the replay server,
+    # which does not implement it, so a failed cascade never reaches the real API
+    firecrawl_config = FirecrawlConfig(
+        api_key="replay-server-key",
+        base_url=base_url,
+        budget_limit=0,
+        coffee_keywords=["coffee"]
+    )
+    service = PlatformFetcherService(
+        roaster_config=roaster_config,
+        fetcher_config=fetcher_config,
+        firecrawl_config=firecrawl_config
+    )
+    start = time.perf_counter()
+    try:
+        result = await service.fetch_products_with_cascade(job_type=job_type)
+        return RoasterRun(
+            roaster_id=roaster_id,
+            success=result.success,
+            platform=result.platform,
+            products=len(result.products),
+            duration=time.perf_counter() - start,
+            error=result.error
+        )
+    except Exception as e:
+        return RoasterRun(roaster_id, False, None, 0, time.perf_counter() - start, str(e))
+    finally:
+        await service.close()
+
+
+async def run_load(
+    roasters: int,
+    concurrency: int,
+    fetcher_config: FetcherConfig,
+    server: Optional[ReplayServer] = None,
+    server_url: Optional[str] = None,
+    known_platform: bool = True,
+    job_type: str = "full_refresh"
+) -> LoadReport:
+    """
+    Fetch ``roasters`` simulated roasters, ``concurrency`` at a time.
+
+    Args:
+        roasters: Number of simulated roasters
+        concurrency: Roaster jobs in flight (like WORKER_CONCURRENCY)
+        fetcher_config: Fetcher settings under test
+        server: Running in-process replay server
+        server_url: External replay server (used when no server is given)
+        known_platform: Give roasters their platform; otherwise the cascade detects it
+        job_type: full_refresh or price_only
+
+    Returns:
+        LoadReport with per-roaster runs and server stats
+    """
+    base_url = server.base_url if server else server_url.rstrip('/')
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(roaster_id: str) -> RoasterRun:
+        async with semaphore:
+            return await run_roaster(roaster_id, f"{base_url}/{roaster_id}", fetcher_config, known_platform, job_type)
+
+    start = time.perf_counter()
+    runs = await asyncio.gather(*(run_one(roaster_id) for roaster_id in roaster_ids(roasters)))
+    return LoadReport(
+        runs=list(runs),
+        duration=time.perf_counter() - start,
+        server_stats=server.get_stats() if server else {}
+    )
+
+
+async def _main(args: argparse.Namespace) -> LoadReport:
+    fetcher_config = FetcherConfig(
+        timeout=args.timeout,
+        max_retries=args.max_retries,
+        retry_delay=args.retry_delay,
+        politeness_delay=args.politeness_delay,
+        jitter_range=args.jitter_range,
+        max_concurrent=args.max_concurrent
+    )
+    if args.server_url:
+        return await run_load(args.roasters, args.concurrency, fetcher_config,
+                              server_url=args.server_url, known_platform=not args.detect_platform,
+                              job_type=args.job_type)
+
+    async with ReplayServer(config=config_from_args(args)) as server:
+        return await run_load(args.roasters, args.concurrency, fetcher_config, server=server,
+                              known_platform=not args.detect_platform, job_type=args.job_type)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_arg_parser()
+    parser.description = "Load test fetchers against the replay server"
+    parser.add_argument('--server-url', help="Use an already running replay server instead of starting one")
+    parser.add_argument('--roasters', type=int, default=20, help="Simulated roasters")
+    parser.add_argument('--concurrency', type=int, default=3, help="Roaster jobs in flight")
+    parser.add_argument('--job-type', default='full_refresh', choices=['full_refresh', 'price_only'])
+    parser.add_argument('--detect-platform', action='store_true', help="Run the full platform cascade")
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--max-retries', type=int, default=3)
+    parser.add_argument('--retry-delay', type=float, default=1.0)
+    parser.add_argument('--politeness-delay', type=float, default=0.25)
+    parser.add_argument('--jitter-range', type=float, default=0.1)
+    parser.add_argument('--max-concurrent', type=int, default=3, help="Requests in flight per roaster")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+
+    report = asyncio.run(_main(args))
+    print(report.summary())
+    return 0 if report.succeeded == len(report.runs) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,422 @@
+"""
+End-to-end pipeline benchmark over recorded roaster payloads.
+
+Replays data/samples through the scrape pipeline stages:
+- parse: decode the recorded platform payload into a canonical artifact
+- validate: ArtifactModel validation
+- map: ArtifactMapper RPC payload mapping, running the
+  NormalizerPipelineService (deterministic parsers) as production does
+- upsert: RPCUpsertBatcher against a stubbed Supabase client
+
+The corpus is scaled synthetically (unique product and variant IDs per copy)
+and streamed, so 100k products do not have to be held in memory. Each run
+reports throughput, per-stage p50/p99 latency and peak RSS, and is stored
+as JSON keyed by git commit so runs can be compared between commits.
+
+Usage:
+    python -m benchmarks.pipeline_benchmark --products 10000
+    python -m benchmarks.pipeline_benchmark --products 100000 --baseline benchmarks/results/<run>.json
+"""
+
+import argparse
+import copy
+import itertools
+import json
+import logging
+import platform as platform_module
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import structlog
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+from src.config.pipeline_config import PipelineConfig
+from src.parser.normalizer_pipeline import NormalizerPipelineService
+from src.validator.artifact_mapper import ArtifactMapper
+from src.validator.models import ArtifactModel
+from src.validator.rpc_client import RPCClient, RPCUpsertBatcher
+
+SAMPLES_DIR = Path("data/samples")
+RESULTS_DIR = Path("benchmarks/results")
+STAGES = ("parse", "validate", "map", "upsert")
+ROASTER_ID = "benchmark-roaster"
+
+# Recorded sample: (platform, roaster domain, raw product)
+RawProduct = Tuple[str, str, Dict[str, Any]]
+
+
+class _StubResponse:
+    def __init__(self, data: Any):
+        self.data = data
+
+
+class _StubRPC:
+    def __init__(self, name: str, params: Dict[str, Any]):
+        self.name = name
+        self.params = params
+
+    def execute(self) -> _StubResponse:
+        rows = self.params.get('p_rows')
+        if isinstance(rows, list):
+            return _StubResponse([{'idx': i, 'id': f"{self.name}-{i}"} for i in range(len(rows))])
+        return _StubResponse(f"{self.name}-id")
+
+
+class StubSupabaseClient:
+    """Supabase client stand-in answering every RPC with generated IDs."""
+
+    def rpc(self, name: str, params: Dict[str, Any]) -> _StubRPC:
+        return _StubRPC(name, params)
+
+
+def load_corpus(samples_dir: Path = SAMPLES_DIR) -> List[RawProduct]:
+    """Load recorded Shopify and WooCommerce products."""
+    corpus: List[RawProduct] = []
+    for path in sorted(samples_dir.glob("*/*.json")):
+        platform = path.parent.name
+        domain = f"{path.stem.rsplit('-', 1)[0]}.com"
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        products = payload.get('products', []) if isinstance(payload, dict) else payload
+        corpus.extend((platform, domain, product) for product in products)
+    return corpus
+
+
+def scale_corpus(corpus: List[RawProduct], total: int) -> Iterator[Tuple[str, str, bytes]]:
+    """
+    Yield ``total`` encoded payloads, cycling the corpus with unique IDs.
+
+    Copies get distinct product/variant IDs and titles so content hashes and
+    upsert keys differ, as they would for a large real catalogue.
+    """
+    for n, (platform, domain, product) in zip(range(total), itertools.cycle(corpus)):
+        copy_index = n // len(corpus)
+        if copy_index:
+            product = copy.deepcopy(product)
+            product['id'] = f"{product['id']}-{copy_index}"
+            title_key = 'title' if platform == 'shopify' else 'name'
+            product[title_key] = f"{product.get(title_key, '')} #{copy_index}"
+            for variant in product.get('variants') or product.get('variations') or []:
+                variant['id'] = f"{variant['id']}-{copy_index}"
+        yield platform, domain, json.dumps(product).encode('utf-8')
+
+
+def _shopify_artifact(domain: str, product: Dict[str, Any]) -> Dict[str, Any]:
+    variants = [{
+        'platform_variant_id': str(variant['id']),
+        'sku': variant.get('sku'),
+        'title': variant.get('title'),
+        'price': str(variant.get('price') or '0'),
+        'currency': 'INR',
+        'compare_at_price': variant.get('compare_at_price'),
+        'in_stock': bool(variant.get('available')),
+        'grams': variant.get('grams'),
+        'options': [o for o in (variant.get('option1'), variant.get('option2'), variant.get('option3')) if o]
+    } for variant in product.get('variants', [])]
+    return {
+        'source': 'shopify',
+        'roaster_domain': domain,
+        'scraped_at': datetime.now(timezone.utc).isoformat(),
+        'product': {
+            'platform_product_id': str(product['id']),
+            'platform': 'shopify',
+            'title': product.get('title') or '',
+            'handle': product.get('handle'),
+            'description_html': product.get('body_html'),
+            'source_url': f"https://{domain}/products/{product.get('handle', product['id'])}",
+            'product_type': product.get('product_type'),
+            'tags': product.get('tags') or [],
+            'images': [{'url': image['src'], 'order': image.get('position')} for image in product.get('images', [])],
+            'variants': variants
+        }
+    }
+
+
+def _woocommerce_artifact(domain: str, product: Dict[str, Any]) -> Dict[str, Any]:
+    prices = product.get('prices') or {}
+    minor_unit = prices.get('currency_minor_unit', 2)
+    price = str(int(prices.get('price') or 0) / (10 ** minor_unit))
+    variations = product.get('variations') or [{'id': product['id'], 'attributes': []}]
+    variants = [{
+        'platform_variant_id': str(variation['id']),
+        'price': price,
+        'currency': prices.get('currency_code'),
+        'in_stock': bool(product.get('is_in_stock')),
+        'options': [attribute.get('value') for attribute in variation.get('attributes', [])]
+    } for variation in variations]
+    return {
+        'source': 'woocommerce',
+        'roaster_domain': domain,
+        'scraped_at': datetime.now(timezone.utc).isoformat(),
+        'product': {
+            'platform_product_id': str(product['id']),
+            'platform': 'woocommerce',
+            'title': product.get('name') or '',
+            'slug': product.get('slug'),
+            'description_html': product.get('description') or product.get('short_description'),
+            'source_url': product.get('permalink') or f"https://{domain}/product/{product['id']}",
+            'tags': [tag.get('name') for tag in product.get('tags', [])],
+            'images': [{'url': image['src'], 'alt_text': image.get('alt')} for image in product.get('images', [])],
+            'variants': variants
+        }
+    }
+
+
+def parse_payload(platform: str, domain: str, payload: bytes) -> Dict[str, Any]:
+    """Decode a recorded platform payload into a canonical artifact dict."""
+    product = json.loads(payload)
+    if platform == 'shopify':
+        return _shopify_artifact(domain, product)
+    return _woocommerce_artifact(domain, product)
+
+
+@dataclass
+class StageStats:
+    """Latency summary for one stage."""
+    count: int
+    total_s: float
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of one benchmark run."""
+    products: int
+    failed: int
+    duration_s: float
+    products_per_sec: float
+    peak_rss_mb: Optional[float]
+    stages: Dict[str, StageStats]
+    commit: Optional[str] = None
+    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    python: str = field(default_factory=platform_module.python_version)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BenchmarkResult':
+        data = dict(data)
+        data['stages'] = {name: StageStats(**stats) for name, stats in data['stages'].items()}
+        return cls(**data)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summarize(samples: List[float]) -> StageStats:
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return StageStats(
+        count=len(ordered),
+        total_s=total,
+        mean_ms=(total / len(ordered) * 1000) if ordered else 0.0,
+        p50_ms=_percentile(ordered, 0.50) * 1000,
+        p99_ms=_percentile(ordered, 0.99) * 1000
+    )
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class PipelineBenchmark:
+    """Stream a scaled corpus through every pipeline stage and time each one."""
+
+    def __init__(self, corpus: List[RawProduct], batch_size: int = 500):
+        """
+        Initialize benchmark.
+
+        Args:
+            corpus: Recorded products (see load_corpus)
+            batch_size: Products per bulk upsert flush
+        """
+        if not corpus:
+            raise ValueError("Benchmark corpus is empty")
+        self.corpus = corpus
+        self.batch_size = batch_size
+        self.normalizer = NormalizerPipelineService(PipelineConfig(enable_metrics=False))
+        self.rpc_client = RPCClient(StubSupabaseClient())
+        self.mapper = ArtifactMapper(
+            rpc_client=self.rpc_client,
+            enable_image_deduplication=False,
+            enable_imagekit=False,
+            normalizer_pipeline=self.normalizer
+        )
+
+    def run(self, products: int) -> BenchmarkResult:
+        """Benchmark ``products`` products."""
+        samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        failed = 0
+        batcher = RPCUpsertBatcher(self.rpc_client, include_images=False)
+        clock = time.perf_counter
+        start = clock()
+
+        for platform, domain, payload in scale_corpus(self.corpus, products):
+            try:
+                t0 = clock()
+                artifact_dict = parse_payload(platform, domain, payload)
+                t1 = clock()
+                artifact = ArtifactModel.model_validate(artifact_dict)
+                t2 = clock()
+                # The mapper runs the normalizer pipeline, so this is one call as in production
+                rpc_payloads = self.mapper.map_artifact_to_rpc_payloads(artifact, ROASTER_ID)
+                t3 = clock()
+            except Exception:
+                failed += 1
+                continue
+
+            samples['parse'].append(t1 - t0)
+            samples['validate'].append(t2 - t1)
+            samples['map'].append(t3 - t2)
+
+            batcher.add(artifact.product.platform_product_id, rpc_payloads)
+            if len(batcher) >= self.batch_size:
+                samples['upsert'].append(self._flush(batcher))
+
+        if len(batcher):
+            samples['upsert'].append(self._flush(batcher))
+
+        duration = clock() - start
+        return BenchmarkResult(
+            products=products,
+            failed=failed,
+            duration_s=duration,
+            products_per_sec=(products - failed) / duration if duration > 0 else 0.0,
+            peak_rss_mb=peak_rss_mb(),
+            stages={stage: _summarize(values) for stage, values in samples.items()},
+            commit=git_commit()
+        )
+
+    @staticmethod
+    def _flush(batcher: RPCUpsertBatcher) -> float:
+        start = time.perf_counter()
+        batcher.flush()
+        return time.perf_counter() - start
+
+
+def save_result(result: BenchmarkResult, results_dir: Path = RESULTS_DIR) -> Path:
+    """Store a result as ``<timestamp>-<commit>-<products>.json``."""
+    results_dir.mkdir(parents=True, exist_ok=True)
+    stamp = result.timestamp.replace(':', '').replace('-', '')[:15]
+    path = results_dir / f"{stamp}-{result.commit or 'nocommit'}-{result.products}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(result.to_dict(), f, indent=2)
+    return path
+
+
+def load_result(path: Path) -> BenchmarkResult:
+    with open(path, 'r', encoding='utf-8') as f:
+        return BenchmarkResult.from_dict(json.load(f))
+
+
+def latest_result(results_dir: Path, products: int, exclude: Optional[Path] = None) -> Optional[Path]:
+    """Most recent stored result for the same corpus size."""
+    candidates = sorted(
+        path for path in results_dir.glob(f"*-{products}.json") if path != exclude
+    )
+    return candidates[-1] if candidates else None
+
+
+def compare_results(
+    current: BenchmarkResult,
+    baseline: BenchmarkResult,
+    tolerance: float = 0.2
+) -> List[str]:
+    """
+    List regressions of ``current`` against ``baseline``.
+
+    Throughput dropping, or a stage's p50/p99 growing, by more than
+    ``tolerance`` (a fraction) counts as a regression.
+    """
+    regressions = []
+    if baseline.products_per_sec and current.products_per_sec < baseline.products_per_sec * (1 - tolerance):
+        regressions.append(
+            f"throughput {current.products_per_sec:.1f}/s vs {baseline.products_per_sec:.1f}/s"
+        )
+    for stage, stats in current.stages.items():
+        base = baseline.stages.get(stage)
+        if base is None:
+            continue
+        for metric in ('p50_ms', 'p99_ms'):
+            old, new = getattr(base, metric), getattr(stats, metric)
+            if old and new > old * (1 + tolerance):
+                regressions.append(f"{stage} {metric} {new:.3f} vs {old:.3f}")
+    return regressions
+
+
+def format_result(result: BenchmarkResult) -> str:
+    lines = [
+        f"products: {result.products} (failed {result.failed}) in {result.duration_s:.2f}s "
+        f"-> {result.products_per_sec:.1f} products/s, peak RSS {result.peak_rss_mb or 0:.1f} MB",
+        f"{'stage':<10} {'count':>8} {'mean ms':>10} {'p50 ms':>10} {'p99 ms':>10}"
+    ]
+    for stage, stats in result.stages.items():
+        lines.append(
+            f"{stage:<10} {stats.count:>8} {stats.mean_ms:>10.3f} {stats.p50_ms:>10.3f} {stats.p99_ms:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end pipeline benchmark")
+    parser.add_argument('--products', type=int, default=10000, help="Products to replay (default: 10000)")
+    parser.add_argument('--samples', type=Path, default=SAMPLES_DIR, help="Recorded payload directory")
+    parser.add_argument('--results-dir', type=Path, default=RESULTS_DIR, help="Where results are stored")
+    parser.add_argument('--baseline', type=Path, help="Result to compare against (default: latest stored run)")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed slowdown fraction (default: 0.2)")
+    parser.add_argument('--batch-size', type=int, default=500, help="Products per bulk upsert")
+    parser.add_argument('--no-save', action='store_true', help="Do not store this run")
+    args = parser.parse_args(argv)
+
+    # Per-product logging would dominate the measurements
+    logging.disable(logging.WARNING)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+
+    result = PipelineBenchmark(load_corpus(args.samples), batch_size=args.batch_size).run(args.products)
+    print(format_result(result))
+
+    saved = None if args.no_save else save_result(result, args.results_dir)
+    if saved:
+        print(f"saved {saved}")
+
+    baseline_path = args.baseline or latest_result(args.results_dir, args.products, exclude=saved)
+    if baseline_path:
+        regressions = compare_results(result, load_result(baseline_path), args.tolerance)
+        print(f"compared with {baseline_path}: {'; '.join(regressions) or 'no regressions'}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
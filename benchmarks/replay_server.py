@@ -0,0 +1,305 @@
+"""
+Local HTTP replay server standing in for Shopify and WooCommerce storefronts.
+
+Serves the recorded catalogs in data/samples under one path prefix per
+simulated roaster, so fetchers can be load tested without touching real
+storefronts:
+
+- Shopify: ``/<roaster>/products.json`` (limit/page) and ``/<roaster>/products/<handle>.json``
+- WooCommerce: ``/<roaster>/wp-json/wc/store/products`` (per_page/page, X-WP-Total headers)
+  and ``/<roaster>/wp-json/wc/store/products/<id or slug>``
+
+Roasters named ``shopify-*`` serve only the Shopify API and ``woocommerce-*``
+only the WooCommerce API (the other returns 404, as on a real store), so the
+fetcher cascade is exercised too. Responses carry ETags and honour
+If-None-Match with 304, and latency, 5xx errors and per-roaster 429 rate
+limits with Retry-After are configurable.
+
+Requires aiohttp (see requirements-dev.txt).
+
+Usage:
+    python -m benchmarks.replay_server --port 8765 --latency 0.05 --rate-limit 40
+"""
+
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import random
+import time
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from aiohttp import web
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+SAMPLES_DIR = Path("data/samples")
+PLATFORMS = ("shopify", "woocommerce")
+
+
+@dataclass
+class ReplayConfig:
+    """Behaviour of the replay server."""
+    latency: float = 0.05
+    latency_jitter: float = 0.02
+    error_rate: float = 0.0
+    rate_limit: int = 0
+    rate_limit_window: float = 1.0
+    retry_after: int = 1
+    catalog_scale: int = 1
+    seed: Optional[int] = None
+
+
+def load_catalogs(samples_dir: Path = SAMPLES_DIR, scale: int = 1) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load recorded products per platform.
+
+    Args:
+        samples_dir: Directory with ``<platform>/*.json`` samples
+        scale: Copies of the catalog served, with unique IDs and handles
+
+    Returns:
+        Products keyed by platform
+    """
+    catalogs: Dict[str, List[Dict[str, Any]]] = {}
+    for platform in PLATFORMS:
+        products: List[Dict[str, Any]] = []
+        for path in sorted((samples_dir / platform).glob("*.json")):
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            products.extend(payload.get('products', []) if isinstance(payload, dict) else payload)
+
+        scaled = list(products)
+        for copy_index in range(1, max(scale, 1)):
+            for product in products:
+                duplicate = copy.deepcopy(product)
+                duplicate['id'] = f"{product['id']}{copy_index:03d}"
+                for key in ('handle', 'slug'):
+                    if duplicate.get(key):
+                        duplicate[key] = f"{duplicate[key]}-{copy_index}"
+                scaled.append(duplicate)
+        catalogs[platform] = scaled
+    return catalogs
+
+
+class ReplayServer:
+    """
+    aiohttp application replaying recorded catalogs.
+
+    Stats (requests per status and per roaster) are kept so a load test can
+    report how often clients were throttled or served from cache.
+    """
+
+    def __init__(
+        self,
+        catalogs: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        config: Optional[ReplayConfig] = None
+    ):
+        """
+        Initialize replay server.
+
+        Args:
+            catalogs: Products keyed by platform (recorded samples if omitted)
+            config: Latency, error and rate limit behaviour
+        """
+        self.config = config or ReplayConfig()
+        self.catalogs = catalogs if catalogs is not None else load_catalogs(scale=self.config.catalog_scale)
+        self._rng = random.Random(self.config.seed)
+        self._requests: Dict[str, Deque[float]] = defaultdict(deque)
+        self.status_counts: Counter = Counter()
+        self.roaster_requests: Counter = Counter()
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url: Optional[str] = None
+
+        self.app = web.Application(middlewares=[self._behaviour_middleware])
+        self.app.router.add_get('/{roaster}/products.json', self._shopify_products)
+        self.app.router.add_get('/{roaster}/products/{handle}.json', self._shopify_product)
+        self.app.router.add_get('/{roaster}/wp-json/wc/store/products', self._woocommerce_products)
+        self.app.router.add_get('/{roaster}/wp-json/wc/store/products/{key}', self._woocommerce_product)
+
+    def roaster_url(self, roaster: str) -> str:
+        """Base URL of a simulated roaster (server must be started)."""
+        return f"{self.base_url}/{roaster}"
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Start serving.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+
+        Returns:
+            Server base URL
+        """
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{bound_port}"
+        logger.info("Replay server started", base_url=self.base_url,
+                    products={platform: len(products) for platform, products in self.catalogs.items()})
+        return self.base_url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'ReplayServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'total_requests': sum(self.status_counts.values()),
+            'status_counts': dict(self.status_counts),
+            'roaster_requests': dict(self.roaster_requests)
+        }
+
+    @web.middleware
+    async def _behaviour_middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        roaster = request.match_info.get('roaster', '')
+        self.roaster_requests[roaster] += 1
+
+        delay = self.config.latency + self._rng.uniform(-self.config.latency_jitter, self.config.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self._rate_limited(roaster):
+            response = web.json_response(
+                {'errors': 'Too Many Requests'}, status=429,
+                headers={'Retry-After': str(self.config.retry_after)}
+            )
+        elif self.config.error_rate and self._rng.random() < self.config.error_rate:
+            response = web.json_response({'errors': 'Service Unavailable'}, status=503)
+        else:
+            response = await handler(request)
+
+        self.status_counts[response.status] += 1
+        return response
+
+    def _rate_limited(self, roaster: str) -> bool:
+        if not self.config.rate_limit:
+            return False
+        now = time.monotonic()
+        window = self._requests[roaster]
+        while window and now - window[0] > self.config.rate_limit_window:
+            window.popleft()
+        if len(window) >= self.config.rate_limit:
+            return True
+        window.append(now)
+        return False
+
+    @staticmethod
+    def _platform_of(request: web.Request) -> str:
+        return request.match_info['roaster'].split('-', 1)[0]
+
+    def _catalog(self, request: web.Request, platform: str) -> List[Dict[str, Any]]:
+        if self._platform_of(request) != platform:
+            raise web.HTTPNotFound()
+        return self.catalogs.get(platform, [])
+
+    @staticmethod
+    def _page(request: web.Request, size_param: str, default: int, maximum: int):
+        try:
+            size = min(max(int(request.query.get(size_param, default)), 1), maximum)
+            page = max(int(request.query.get('page', 1)), 1)
+        except ValueError:
+            raise web.HTTPBadRequest()
+        return size, page
+
+    @staticmethod
+    def _conditional(request: web.Request, body: Any, headers: Optional[Dict[str, str]] = None) -> web.Response:
+        """JSON response with an ETag, or 304 when the client already has it."""
+        payload = json.dumps(body).encode('utf-8')
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+        headers = {**(headers or {}), 'ETag': etag}
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=payload, content_type='application/json', headers=headers)
+
+    async def _shopify_products(self, request: web.Request) -> web.Response:
+        products = self._catalog(request, 'shopify')
+        limit, page = self._page(request, 'limit', 30, 250)
+        start = (page - 1) * limit
+        return self._conditional(request, {'products': products[start:start + limit]})
+
+    async def _shopify_product(self, request: web.Request) -> web.Response:
+        handle = request.match_info['handle']
+        for product in self._catalog(request, 'shopify'):
+            if product.get('handle') == handle:
+                return self._conditional(request, {'product': product})
+        raise web.HTTPNotFound()
+
+    async def _woocommerce_products(self, request: web.Request) -> web.Response:
+        products = self._catalog(request, 'woocommerce')
+        per_page, page = self._page(request, 'per_page', 10, 100)
+        start = (page - 1) * per_page
+        total_pages = (len(products) + per_page - 1) // per_page
+        return self._conditional(
+            request,
+            products[start:start + per_page],
+            headers={'X-WP-Total': str(len(products)), 'X-WP-TotalPages': str(total_pages)}
+        )
+
+    async def _woocommerce_product(self, request: web.Request) -> web.Response:
+        key = request.match_info['key']
+        for product in self._catalog(request, 'woocommerce'):
+            if str(product.get('id')) == key or product.get('slug') == key:
+                return self._conditional(request, product)
+        raise web.HTTPNotFound()
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Replay recorded storefront catalogs over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.05, help="Mean response latency in seconds")
+    parser.add_argument('--latency-jitter', type=float, default=0.02, help="Latency jitter in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument('--rate-limit', type=int, default=0, help="Requests per window per roaster before 429 (0: off)")
+    parser.add_argument('--rate-limit-window', type=float, default=1.0, help="Rate limit window in seconds")
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds sent with 429")
+    parser.add_argument('--catalog-scale', type=int, default=1, help="Copies of the recorded catalog to serve")
+    parser.add_argument('--seed', type=int, help="Random seed for latency and error injection")
+    return parser
+
+
+def config_from_args(args: argparse.Namespace) -> ReplayConfig:
+    return ReplayConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        rate_limit_window=args.rate_limit_window,
+        retry_after=args.retry_after,
+        catalog_scale=args.catalog_scale,
+        seed=args.seed
+    )
+
+
+async def _serve(args: argparse.Namespace):
+    server = ReplayServer(config=config_from_args(args))
+    await server.start(args.host, args.port)
+    print(f"Serving on {server.base_url} (roasters: /shopify-<n>/..., /woocommerce-<n>/...)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(_serve(build_arg_parser().parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,243 @@
+-- Bulk write RPCs used by RPCClient.bulk_upsert / RPCUpsertBatcher.
+--
+-- Each function takes a JSON array of rows keyed exactly like the parameters of
+-- the matching single-row RPC (e.g. {"p_coffee_id": ..., "p_sku": ...}) and
+-- calls that RPC for every row inside one server-side call, so the existing
+-- upsert logic is reused unchanged. Keys that are absent keep the single-row
+-- RPC defaults; keys set to JSON null are passed as SQL NULL, so parameters
+-- without a default are always supplied. Every row runs in its own savepoint;
+-- a failing row is reported in the result instead of aborting the batch.
+--
+-- Returns one row per input element: idx (0-based position), id, error.
+--
+-- The dynamic-SQL helper lives in the private schema, which PostgREST does not
+-- expose, and only calls whitelisted single-row RPCs. Supabase grants execute
+-- on new functions to anon, authenticated and service_role by default, so
+-- access is revoked explicitly and the bulk RPCs are granted to service_role
+-- only; they run with the caller's privileges.
+
+create schema if not exists private;
+revoke all on schema private from public, anon, authenticated;
+grant usage on schema private to service_role;
+
+create or replace function private._rpc_bulk_call(p_function text, p_rows jsonb)
+returns table (idx integer, id text, error text)
+language plpgsql
+set search_path = public, pg_temp
+as $$
+declare
+    v_row jsonb;
+    v_args text;
+    v_position integer := 0;
+begin
+    if p_function not in ('rpc_upsert_coffee', 'rpc_upsert_variant', 'rpc_insert_price', 'rpc_upsert_coffee_image') then
+        raise exception 'function % is not a bulk RPC target', p_function;
+    end if;
+
+    for v_row in select value from jsonb_array_elements(p_rows) loop
+        idx := v_position;
+        id := null;
+        error := null;
+        begin
+            -- Named arguments; unknown-typed literals are coerced to each parameter's type.
+            -- JSON arrays for text[] parameters become Postgres array literals and
+            -- JSON nulls become NULL.
+            select string_agg(
+                format(
+                    '%I := %L',
+                    key,
+                    case
+                        when key in ('p_tags', 'p_varieties', 'p_flavors') and jsonb_typeof(value) = 'array'
+                            then (select array_agg(elem)::text from jsonb_array_elements_text(value) as elem)
+                        when jsonb_typeof(value) in ('object', 'array') then value::text
+                        else value #>> '{}'
+                    end
+                ),
+                ', '
+            )
+            into v_args
+            from jsonb_each(v_row);
+
+            execute format('select %I(%s)::text', p_function, v_args) into id;
+        exception when others then
+            error := sqlerrm;
+        end;
+        return next;
+        v_position := v_position + 1;
+    end loop;
+end;
+$$;
+
+create or replace function rpc_bulk_upsert_coffees(p_rows jsonb)
+returns table (idx integer, id text, error text)
+language sql
+as $$ select * from private._rpc_bulk_call('rpc_upsert_coffee', p_rows) $$;
+
+create or replace function rpc_bulk_upsert_variants(p_rows jsonb)
+returns table (idx integer, id text, error text)
+language sql
+as $$ select * from private._rpc_bulk_call('rpc_upsert_variant', p_rows) $$;
+
+create or replace function rpc_bulk_insert_prices(p_rows jsonb)
+returns table (idx integer, id text, error text)
+language sql
+as $$ select * from private._rpc_bulk_call('rpc_insert_price', p_rows) $$;
+
+create or replace function rpc_bulk_upsert_coffee_images(p_rows jsonb)
+returns table (idx integer, id text, error text)
+language sql
+as $$ select * from private._rpc_bulk_call('rpc_upsert_coffee_image', p_rows) $$;
+
+-- private._rpc_bulk_call executes dynamic SQL; only the typed wrappers call it
+revoke execute on function private._rpc_bulk_call(text, jsonb) from public, anon, authenticated;
+grant execute on function private._rpc_bulk_call(text, jsonb) to service_role;
+
+revoke execute on function rpc_bulk_upsert_coffees(jsonb) from public, anon, authenticated;
+revoke execute on function rpc_bulk_upsert_variants(jsonb) from public, anon, authenticated;
+revoke execute on function rpc_bulk_insert_prices(jsonb) from public, anon, authenticated;
+revoke execute on function rpc_bulk_upsert_coffee_images(jsonb) from public, anon, authenticated;
+grant execute on function rpc_bulk_upsert_coffees(jsonb) to service_role;
+grant execute on function rpc_bulk_upsert_variants(jsonb) to service_role;
+grant execute on function rpc_bulk_insert_prices(jsonb) to service_role;
+grant execute on function rpc_bulk_upsert_coffee_images(jsonb) to service_role;
+
+-- Set-based price updates used by RPCClient.apply_price_deltas and
+-- RPCClient.batch_update_variant_pricing.
+--
+-- Unlike the bulk wrappers above these do not loop over single-row RPCs: each
+-- call is one statement, so a chunk is written in one transaction and either
+-- fully applies or fails as a whole.
+
+-- p_deltas: [{"variant_id", "price", "currency", "in_stock", "is_sale",
+--             "scraped_at", "source_url", "source_raw"}, ...]
+-- Updates price_current / in_stock / price_last_checked_at on every matching
+-- variant and appends one price history row per delta. Deltas for unknown
+-- variants are ignored; one row is returned per applied delta.
+create or replace function rpc_apply_price_deltas(p_deltas jsonb)
+returns table (variant_id uuid, price_id uuid)
+language sql
+as $$
+    with deltas as (
+        select *
+        from jsonb_to_recordset(p_deltas) as d(
+            variant_id uuid,
+            price numeric,
+            currency text,
+            in_stock boolean,
+            is_sale boolean,
+            scraped_at timestamptz,
+            source_url text,
+            source_raw jsonb
+        )
+    ),
+    updated as (
+        update variants v
+        set price_current = d.price,
+            currency = coalesce(d.currency, v.currency),
+            in_stock = coalesce(d.in_stock, v.in_stock),
+            price_last_checked_at = coalesce(d.scraped_at, now()),
+            updated_at = now()
+        from deltas d
+        where v.id = d.variant_id
+        returning v.id, v.currency
+    ),
+    inserted as (
+        insert into prices (variant_id, price, currency, is_sale, scraped_at, source_url, source_raw)
+        select d.variant_id,
+               d.price,
+               coalesce(d.currency, u.currency),
+               coalesce(d.is_sale, false),
+               coalesce(d.scraped_at, now()),
+               d.source_url,
+               d.source_raw
+        from deltas d
+        join updated u on u.id = d.variant_id
+        returning prices.variant_id, prices.id
+    )
+    select inserted.variant_id, inserted.id from inserted
+$$;
+
+-- p_updates: [{"variant_id", "price_current", "price_last_checked_at",
+--              "in_stock", "currency"}, ...]
+-- Absent fields keep their current value. Returns the ids of updated variants.
+create or replace function rpc_batch_update_variant_pricing(p_updates jsonb)
+returns table (variant_id uuid)
+language sql
+as $$
+    update variants v
+    set price_current = coalesce(u.price_current, v.price_current),
+        price_last_checked_at = coalesce(u.price_last_checked_at, v.price_last_checked_at),
+        in_stock = coalesce(u.in_stock, v.in_stock),
+        currency = coalesce(u.currency, v.currency),
+        updated_at = now()
+    from jsonb_to_recordset(p_updates) as u(
+        variant_id uuid,
+        price_current numeric,
+        price_last_checked_at timestamptz,
+        in_stock boolean,
+        currency text
+    )
+    where v.id = u.variant_id
+    returning v.id
+$$;
+
+-- Skip-unchanged support used by UnchangedArtifactFilter.
+--
+-- The fingerprint of the last successfully written artifact is kept in
+-- coffees.source_raw->>'artifact_hash'. A run loads every fingerprint for
+-- the roaster up front, skips mapping/upserting products whose fingerprint
+-- is unchanged, and only refreshes last-seen timestamps for them.
+
+create or replace function rpc_get_roaster_content_hashes(p_roaster_id uuid)
+returns table (coffee_id uuid, platform_product_id text, artifact_hash text)
+language sql
+stable
+as $$
+    select c.id, c.platform_product_id, c.source_raw->>'artifact_hash'
+    from coffees c
+    where c.roaster_id = p_roaster_id
+      and c.platform_product_id is not null
+      and c.source_raw ? 'artifact_hash'
+$$;
+
+-- p_rows: [{"coffee_id", "artifact_hash"}, ...]. Returns the number of coffees updated.
+create or replace function rpc_set_coffee_artifact_hashes(p_rows jsonb)
+returns integer
+language sql
+as $$
+    with updated as (
+        update coffees c
+        set source_raw = coalesce(c.source_raw, '{}'::jsonb) || jsonb_build_object('artifact_hash', r.artifact_hash)
+        from jsonb_to_recordset(p_rows) as r(coffee_id uuid, artifact_hash text)
+        where c.id = r.coffee_id
+        returning 1
+    )
+    select count(*)::integer from updated
+$$;
+
+-- Marks the variants of unchanged coffees as seen. Returns the number of variants touched.
+create or replace function rpc_touch_unchanged_coffees(p_coffee_ids uuid[], p_seen_at timestamptz default now())
+returns integer
+language sql
+as $$
+    with touched as (
+        update variants
+        set last_seen_at = p_seen_at
+        where coffee_id = any(p_coffee_ids)
+        returning 1
+    )
+    select count(*)::integer from touched
+$$;
+
+-- Batched form of rpc_check_content_hash used by async image deduplication.
+-- Returns one row per hash that already exists; unknown hashes are omitted.
+create or replace function rpc_check_content_hashes(p_content_hashes text[])
+returns table (content_hash text, image_id uuid)
+language sql
+stable
+as $$
+    select distinct on (ci.content_hash) ci.content_hash, ci.id
+    from coffee_images ci
+    where ci.content_hash = any(p_content_hashes)
+    order by ci.content_hash, ci.id
+$$;
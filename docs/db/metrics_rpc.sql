@@ -0,0 +1,212 @@
+-- Server-side aggregates used by DatabaseMetricsService.
+--
+-- Metric collection used to select every prices / scrape_artifacts row of the
+-- last 24h and every variant, then count and group them in Python. These
+-- functions return one JSON summary instead.
+--
+-- prices and scrape_artifacts grow with every scrape, so they are rolled up
+-- into hourly summary tables. Each metrics call first refreshes the rollups
+-- incrementally: only the hours since the last refresh watermark (plus one
+-- hour for late rows) are re-aggregated, and the summary then reads a few
+-- hundred rollup rows. variants only grow with the catalog and are grouped
+-- directly. Windows are hour-aligned: p_since is truncated to the hour.
+
+create table if not exists metrics_rollup_state (
+    name text primary key,
+    watermark timestamptz not null
+);
+
+create table if not exists metrics_price_hourly (
+    bucket timestamptz not null,
+    roaster_id uuid not null,
+    currency text not null,
+    price_count bigint not null,
+    price_sum numeric not null,
+    price_min numeric,
+    price_max numeric,
+    primary key (bucket, roaster_id, currency)
+);
+
+create table if not exists metrics_artifact_hourly (
+    bucket timestamptz not null,
+    platform text not null,
+    http_status text not null,
+    validation_status text not null,
+    artifact_count bigint not null,
+    body_len_sum bigint not null,
+    body_len_count bigint not null,
+    primary key (bucket, platform, http_status, validation_status)
+);
+
+-- Range scans over the refresh window
+create index if not exists idx_prices_scraped_at on prices (scraped_at);
+create index if not exists idx_scrape_artifacts_created_at on scrape_artifacts (created_at);
+create index if not exists idx_variants_price_last_checked_at on variants (price_last_checked_at);
+
+-- Re-aggregates the hours since the last refresh; returns the first bucket recomputed.
+-- Rollups older than p_retention are dropped.
+create or replace function rpc_refresh_metrics_rollups(p_retention interval default interval '30 days')
+returns timestamptz
+language plpgsql
+as $$
+declare
+    v_now timestamptz := now();
+    v_from timestamptz;
+begin
+    -- Concurrent callers wait for the running refresh instead of repeating it
+    perform pg_advisory_xact_lock(hashtext('metrics_rollups'));
+
+    select date_trunc('hour', watermark) - interval '1 hour'
+    into v_from
+    from metrics_rollup_state
+    where name = 'hourly';
+    v_from := coalesce(v_from, date_trunc('hour', v_now - p_retention));
+
+    delete from metrics_price_hourly where bucket >= v_from;
+    insert into metrics_price_hourly (bucket, roaster_id, currency, price_count, price_sum, price_min, price_max)
+    select date_trunc('hour', p.scraped_at),
+           c.roaster_id,
+           coalesce(p.currency, 'unknown'),
+           count(*),
+           coalesce(sum(p.price), 0),
+           min(p.price),
+           max(p.price)
+    from prices p
+    join variants v on v.id = p.variant_id
+    join coffees c on c.id = v.coffee_id
+    where p.scraped_at >= v_from
+    group by 1, 2, 3;
+
+    delete from metrics_artifact_hourly where bucket >= v_from;
+    insert into metrics_artifact_hourly (bucket, platform, http_status, validation_status,
+                                         artifact_count, body_len_sum, body_len_count)
+    select date_trunc('hour', a.created_at),
+           coalesce(a.artifact_data->>'source', 'unknown'),
+           coalesce(a.http_status::text, 'unknown'),
+           coalesce(a.validation_status, 'unknown'),
+           count(*),
+           coalesce(sum(a.body_len) filter (where a.body_len > 0), 0),
+           count(*) filter (where a.body_len > 0)
+    from scrape_artifacts a
+    where a.created_at >= v_from
+    group by 1, 2, 3, 4;
+
+    delete from metrics_price_hourly where bucket < v_now - p_retention;
+    delete from metrics_artifact_hourly where bucket < v_now - p_retention;
+
+    insert into metrics_rollup_state (name, watermark) values ('hourly', v_now)
+    on conflict (name) do update set watermark = excluded.watermark;
+
+    return v_from;
+end;
+$$;
+
+-- Price summary since p_since. Counts and min/avg/max come from the hourly
+-- rollup; unique_variants and the percentiles come from the variants whose
+-- price was checked in the window, so neither scans price history.
+create or replace function rpc_price_metrics(p_since timestamptz)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_since timestamptz := date_trunc('hour', p_since);
+    v_result jsonb;
+begin
+    perform rpc_refresh_metrics_rollups();
+
+    with window_rows as (
+        select * from metrics_price_hourly where bucket >= v_since
+    ),
+    checked as (
+        select price_current
+        from variants
+        where price_last_checked_at >= v_since
+    )
+    select jsonb_build_object(
+        'total_prices', coalesce((select sum(price_count) from window_rows), 0),
+        'avg_price', coalesce((select sum(price_sum) / nullif(sum(price_count), 0) from window_rows), 0),
+        'min_price', coalesce((select min(price_min) from window_rows), 0),
+        'max_price', coalesce((select max(price_max) from window_rows), 0),
+        'currency_distribution', coalesce((
+            select jsonb_object_agg(currency, total)
+            from (select currency, sum(price_count) as total from window_rows group by currency) t
+        ), '{}'::jsonb),
+        'prices_by_roaster', coalesce((
+            select jsonb_object_agg(roaster_id, total)
+            from (select roaster_id, sum(price_count) as total from window_rows group by roaster_id) t
+        ), '{}'::jsonb),
+        'unique_variants', (select count(*) from checked),
+        'median_price', coalesce((
+            select percentile_cont(0.5) within group (order by price_current) from checked
+        ), 0),
+        'p95_price', coalesce((
+            select percentile_cont(0.95) within group (order by price_current) from checked
+        ), 0)
+    )
+    into v_result;
+
+    return v_result;
+end;
+$$;
+
+-- Artifact summary since p_since, from the hourly rollup.
+create or replace function rpc_artifact_metrics(p_since timestamptz)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_since timestamptz := date_trunc('hour', p_since);
+    v_result jsonb;
+begin
+    perform rpc_refresh_metrics_rollups();
+
+    with window_rows as (
+        select * from metrics_artifact_hourly where bucket >= v_since
+    )
+    select jsonb_build_object(
+        'total_artifacts', coalesce((select sum(artifact_count) from window_rows), 0),
+        'valid_artifacts', coalesce((
+            select sum(artifact_count) from window_rows where validation_status = 'valid'
+        ), 0),
+        'invalid_artifacts', coalesce((
+            select sum(artifact_count) from window_rows where validation_status = 'invalid'
+        ), 0),
+        'avg_body_size', coalesce((
+            select sum(body_len_sum)::numeric / nullif(sum(body_len_count), 0) from window_rows
+        ), 0),
+        'http_status_distribution', coalesce((
+            select jsonb_object_agg(http_status, total)
+            from (select http_status, sum(artifact_count) as total from window_rows group by http_status) t
+        ), '{}'::jsonb),
+        'artifacts_by_platform', coalesce((
+            select jsonb_object_agg(platform, total)
+            from (select platform, sum(artifact_count) as total from window_rows group by platform) t
+        ), '{}'::jsonb)
+    )
+    into v_result;
+
+    return v_result;
+end;
+$$;
+
+-- Variant stock summary. One grouped pass over variants; no rows are returned.
+create or replace function rpc_variant_metrics()
+returns jsonb
+language sql
+stable
+as $$
+    with by_roaster as (
+        select c.roaster_id,
+               count(*) as total,
+               count(*) filter (where v.in_stock) as in_stock
+        from variants v
+        join coffees c on c.id = v.coffee_id
+        group by c.roaster_id
+    )
+    select jsonb_build_object(
+        'total_variants', coalesce(sum(total), 0),
+        'in_stock_variants', coalesce(sum(in_stock), 0),
+        'variants_by_roaster', coalesce(jsonb_object_agg(roaster_id, total), '{}'::jsonb)
+    )
+    from by_roaster
+$$;
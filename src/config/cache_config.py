@@ -9,12 +9,15 @@ import os
 class CacheConfig:
     """Configuration for cache service"""
     
-    backend: str = "memory"  # memory, redis, or database
+    backend: str = "memory"  # memory, redis, database, sqlite, or tiered (sqlite + redis)
     default_ttl: int = 3600  # 1 hour default
     
     # Redis configuration
     redis_url: str = "redis://localhost:6379/0"
     
+    # Local SQLite tier (sqlite and tiered backends)
+    local_cache_path: str = ".cache/llm_cache.sqlite3"
+    
     # Database configuration
     db_config: Dict[str, Any] = field(default_factory=lambda: {
         'table': 'llm_cache',
@@ -32,9 +35,12 @@ class CacheConfig:
         )
         
         # Update Redis config from env if using Redis
-        if backend == 'redis':
+        if backend in ('redis', 'tiered'):
             config.redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
         
+        if backend in ('sqlite', 'tiered'):
+            config.local_cache_path = os.getenv('CACHE_LOCAL_PATH', config.local_cache_path)
+        
         # Update DB config from env if using database
         elif backend == 'database':
             config.db_config = {
@@ -1,7 +1,7 @@
 """Configuration for DeepSeek API integration."""
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Optional
 import os
 
 
@@ -17,6 +17,12 @@ class DeepSeekConfig:
     timeout: int = 30
     retry_attempts: int = 3
     retry_delay: float = 1.0
+    max_concurrent_requests: int = 5  # In-flight artifact calls for batch enrichment
+    
+    # Result caching: answers are keyed by prompt inputs + model + prompt_version, so
+    # bump prompt_version whenever prompts change to invalidate old answers
+    cache_ttl: int = 30 * 24 * 3600  # 30 days
+    prompt_version: str = "v1"
     
     # Rate limiting (per roaster, since DeepSeek has no rate limits)
     rate_limits: Dict[str, int] = field(default_factory=lambda: {
@@ -24,6 +30,8 @@ class DeepSeekConfig:
         "requests_per_hour": 1000,
         "requests_per_day": 10000
     })
+    rate_limit_wait: float = 0.0  # Seconds to wait for quota before failing (0 = fail fast)
+    rate_limit_redis_url: Optional[str] = None  # Share quota across workers when set
     
     # Cost tracking
     cost_per_1k_tokens: float = 0.00027  # Input tokens (cache miss)
@@ -43,4 +51,8 @@ class DeepSeekConfig:
             temperature=float(os.getenv('DEEPSEEK_TEMPERATURE', '0.7')),
             max_tokens=int(os.getenv('DEEPSEEK_MAX_TOKENS', '1000')),
             timeout=int(os.getenv('DEEPSEEK_TIMEOUT', '30')),
+            cache_ttl=int(os.getenv('DEEPSEEK_CACHE_TTL', str(30 * 24 * 3600))),
+            prompt_version=os.getenv('DEEPSEEK_PROMPT_VERSION', 'v1'),
+            rate_limit_wait=float(os.getenv('DEEPSEEK_RATE_LIMIT_WAIT', '0')),
+            rate_limit_redis_url=os.getenv('DEEPSEEK_RATE_LIMIT_REDIS_URL'),
         )
@@ -36,6 +36,21 @@ class FirecrawlConfig(BaseModel):
         ge=1, 
         description="Rate limit per minute"
     )
+    rate_limit_redis_url: Optional[str] = Field(
+        default=None,
+        description="Redis URL for sharing the rate limit across workers (process-local when unset)"
+    )
+    max_concurrent_requests: int = Field(
+        default=5,
+        ge=1,
+        description="Maximum concurrent map/extract operations in batch runs"
+    )
+    budget_stop_threshold: float = Field(
+        default=90.0,
+        ge=0,
+        le=100,
+        description="Budget usage percentage at which batch runs stop admitting new work"
+    )
     
     # Map operation configuration
     max_pages: int = Field(
@@ -71,6 +71,7 @@ class ImageKitResult(BaseModel):
         error: Error message (if failed)
         original_url: Original image URL
         upload_time: Time taken for upload in seconds
+        size: Uploaded file size in bytes (if reported)
     """
     success: bool
     imagekit_url: Optional[str] = None
@@ -78,6 +79,7 @@ class ImageKitResult(BaseModel):
     error: Optional[str] = None
     original_url: Optional[str] = None
     upload_time: Optional[float] = None
+    size: Optional[int] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary."""
@@ -36,6 +36,7 @@ class LLMFallbackConfig(BaseModel):
     max_retries: int = Field(default=3, ge=0, description="Maximum LLM retry attempts")
     batch_size: int = Field(default=10, gt=0, description="Batch size for LLM processing")
     rate_limit_per_minute: int = Field(default=60, gt=0, description="Rate limit for LLM calls per minute")
+    max_concurrent_artifacts: int = Field(default=5, gt=0, description="Artifacts with LLM fallback in flight at once")
 
 
 class ErrorRecoveryConfig(BaseModel):
@@ -114,6 +115,11 @@ class PipelineConfig(BaseModel):
     llm_fallback_threshold: float = Field(default=0.7, description="Confidence threshold for LLM fallback")
     enable_checkpointing: bool = Field(default=True, description="Enable pipeline checkpointing")
     enable_metrics: bool = Field(default=True, description="Enable pipeline metrics")
+    metrics_recent_executions: int = Field(default=1000, ge=0, description="Executions kept in memory for per-execution metric summaries")
+    max_active_executions: int = Field(default=10000, ge=1, description="In-flight pipeline states and transactions kept in memory")
+    execution_ttl_seconds: Optional[float] = Field(default=3600.0, gt=0, description="Age after which unfinished states and transactions are evicted")
+    completed_transactions_retained: int = Field(default=1000, ge=1, description="Completed transactions kept in memory for statistics")
+    transaction_spill_path: Optional[str] = Field(default=None, description="JSON lines file receiving completed transactions evicted from memory")
     log_level: str = Field(default="INFO", description="Logging level")
     
     def get_enabled_parsers(self) -> List[str]:
@@ -15,6 +15,8 @@ from datetime import datetime
 import structlog
 from supabase import create_client, Client
 
+from ..validator.db_gateway import DatabaseGateway, get_database_gateway
+
 logger = structlog.get_logger(__name__)
 
 
@@ -25,6 +27,7 @@ class RoasterConfig:
         self.supabase_url = os.getenv('SUPABASE_URL')
         self.supabase_key = os.getenv('SUPABASE_KEY')
         self.client: Optional[Client] = None
+        self.db: Optional[DatabaseGateway] = None
         
         if not self.supabase_url or not self.supabase_key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set")
@@ -34,6 +37,8 @@ class RoasterConfig:
         if not self.client:
             self.client = create_client(self.supabase_url, self.supabase_key)
             logger.info("Connected to Supabase")
+        if not self.db:
+            self.db = get_database_gateway(self.client)
     
     async def get_roaster_config(self, roaster_id: str) -> Dict[str, Any]:
         """
@@ -49,13 +54,13 @@ class RoasterConfig:
         
         try:
             # Query roaster configuration from database
-            response = self.client.table('roasters').select('*').eq('id', roaster_id).execute()
+            rows = await self.db.select('roasters', '*', {'id': roaster_id})
             
-            if not response.data:
+            if not rows:
                 logger.warning("Roaster not found", roaster_id=roaster_id)
                 return self._get_default_config()
             
-            roaster = response.data[0]
+            roaster = rows[0]
             
             # Extract configuration
             config = {
@@ -117,7 +122,7 @@ class RoasterConfig:
                 update_data['last_modified'] = last_modified
             
             if update_data:
-                self.client.table('roasters').update(update_data).eq('id', roaster_id).execute()
+                await self.db.update('roasters', update_data, {'id': roaster_id})
                 logger.info("Updated roaster metadata", 
                            roaster_id=roaster_id, 
                            updates=update_data)
@@ -133,8 +138,7 @@ class RoasterConfig:
         await self.connect()
         
         try:
-            response = self.client.table('roasters').select('id,name,full_cadence,price_cadence').eq('active', True).execute()
-            return response.data or []
+            return await self.db.select('roasters', 'id,name,full_cadence,price_cadence', {'active': True})
             
         except Exception as e:
             logger.error("Failed to get roasters list", error=str(e), exc_info=True)
@@ -30,6 +30,9 @@ class ValidatorConfig(BaseModel):
     enable_image_deduplication: bool = Field(default=True, description="Enable image deduplication (F.1)")
     enable_imagekit_upload: bool = Field(default=True, description="Enable ImageKit upload (F.2)")
     imagekit_config: Optional[ImageKitConfig] = Field(default=None, description="ImageKit configuration for CDN upload")
+    image_hash_cache_path: Optional[str] = Field(default=None, description="SQLite file persisting image URL hashes across runs (memory only if unset)")
+    image_hash_cache_size: int = Field(default=1000, ge=1, description="Image hashes kept in the in-memory LRU")
+    image_hash_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, ge=0, description="Seconds a cached image hash is trusted before re-checking")
     # Weight parser configuration
     enable_weight_parsing: bool = Field(default=True, description="Enable weight parsing")
     weight_confidence_threshold: float = Field(default=0.8, ge=0.0, le=1.0, description="Minimum confidence for weight parsing")
@@ -84,6 +87,17 @@ class ValidatorConfig(BaseModel):
     classification_skip_threshold: float = Field(default=0.3, ge=0.0, le=1.0, description="Confidence threshold below which to skip to equipment")
     enable_classification_metrics: bool = Field(default=True, description="Enable classification metrics and monitoring")
     
+    # Validation audit trail configuration
+    validation_audit_batch_size: int = Field(default=500, ge=1, description="Maximum validation results per scrape_artifacts insert")
+    # Skip-unchanged configuration
+    enable_skip_unchanged: bool = Field(default=True, description="Skip mapping and upserting artifacts whose content fingerprint is unchanged")
+    # Streaming validate -> map -> upsert pipeline configuration
+    upsert_validation_concurrency: int = Field(default=4, ge=1, description="Artifacts validated concurrently in the upsert pipeline")
+    upsert_mapping_concurrency: int = Field(default=2, ge=1, description="Artifacts mapped to RPC payloads concurrently")
+    upsert_write_concurrency: int = Field(default=2, ge=1, description="Concurrent bulk upsert batches")
+    upsert_queue_size: int = Field(default=100, ge=1, description="Maximum artifacts buffered between pipeline stages")
+    upsert_batch_size: int = Field(default=50, ge=1, description="Artifacts per bulk upsert and validation-result write")
+    
     @field_validator('storage_path', 'invalid_artifacts_path')
     @classmethod
     def validate_paths(cls, v):
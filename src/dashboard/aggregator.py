@@ -0,0 +1,313 @@
+"""
+Background aggregator for dashboard data.
+
+Dashboard endpoints used to query Supabase and the monitoring services on
+every request, each through a fresh ``asyncio.run`` event loop, so every open
+dashboard added its own load. The aggregator owns one long-lived event loop
+in a daemon thread, refreshes each registered section on an interval and
+stores the result as a snapshot (data + ETag) in a shared store. Request
+handlers only read snapshots.
+
+Stores:
+- MemorySnapshotStore: in-process with TTL (default)
+- RedisSnapshotStore: shared between dashboard processes; a per-section
+  refresh claim makes only one process query the database per interval
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SectionProducer = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class DashboardSnapshot:
+    """Precomputed data for one dashboard section."""
+    data: Dict[str, Any]
+    etag: str
+    timestamp: str
+    error: Optional[str] = None
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'DashboardSnapshot':
+        return cls(data=data, etag=compute_etag(data), timestamp=datetime.now(timezone.utc).isoformat())
+
+    @classmethod
+    def from_error(cls, error: str) -> 'DashboardSnapshot':
+        return cls(data={}, etag='', timestamp=datetime.now(timezone.utc).isoformat(), error=error)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), default=str)
+
+    @classmethod
+    def from_json(cls, raw: str) -> 'DashboardSnapshot':
+        return cls(**json.loads(raw))
+
+
+def compute_etag(data: Dict[str, Any]) -> str:
+    """Stable content hash of section data."""
+    payload = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()
+
+
+class MemorySnapshotStore:
+    """In-process snapshot store with TTL."""
+
+    def __init__(self):
+        self._snapshots: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[DashboardSnapshot]:
+        with self._lock:
+            entry = self._snapshots.get(name)
+            if entry is None:
+                return None
+            snapshot, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._snapshots[name]
+                return None
+            return snapshot
+
+    def set(self, name: str, snapshot: DashboardSnapshot, ttl: float):
+        with self._lock:
+            self._snapshots[name] = (snapshot, time.monotonic() + ttl)
+
+    def claim_refresh(self, name: str, interval: float) -> bool:
+        """Only one aggregator per process, so every refresh is ours."""
+        return True
+
+
+class RedisSnapshotStore:
+    """Redis snapshot store shared by all dashboard processes."""
+
+    def __init__(self, redis_url: str, key_prefix: str = 'dashboard:snapshot:'):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("Redis package not installed. Install with: pip install redis")
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self._client = redis.Redis.from_url(redis_url, decode_responses=True)
+
+    def get(self, name: str) -> Optional[DashboardSnapshot]:
+        try:
+            raw = self._client.get(f"{self.key_prefix}{name}")
+            return DashboardSnapshot.from_json(raw) if raw else None
+        except Exception as e:
+            logger.warning("Dashboard snapshot read failed", section=name, error=str(e))
+            return None
+
+    def set(self, name: str, snapshot: DashboardSnapshot, ttl: float):
+        try:
+            self._client.set(f"{self.key_prefix}{name}", snapshot.to_json(), ex=max(int(ttl), 1))
+        except Exception as e:
+            logger.warning("Dashboard snapshot write failed", section=name, error=str(e))
+
+    def claim_refresh(self, name: str, interval: float) -> bool:
+        """Claim this interval's refresh of a section; False if another process has it."""
+        try:
+            return bool(self._client.set(
+                f"{self.key_prefix}{name}:refresh", os.getpid(), nx=True, ex=max(int(interval), 1)
+            ))
+        except Exception as e:
+            logger.warning("Dashboard refresh claim failed", section=name, error=str(e))
+            return True
+
+
+class DashboardAggregator:
+    """
+    Refreshes registered dashboard sections in the background.
+
+    The loop thread starts lazily on first use, so it is created in each
+    server worker process rather than in a parent that forks.
+    """
+
+    def __init__(
+        self,
+        store: Optional[Any] = None,
+        refresh_interval: float = 30.0,
+        ttl: Optional[float] = None,
+        miss_timeout: float = 30.0
+    ):
+        """
+        Initialize aggregator.
+
+        Args:
+            store: Snapshot store (in-process if omitted)
+            refresh_interval: Seconds between refreshes of each section
+            ttl: Seconds a snapshot stays servable (3 intervals if omitted)
+            miss_timeout: Seconds a request waits for a section never computed yet
+        """
+        self.store = store if store is not None else MemorySnapshotStore()
+        self.refresh_interval = refresh_interval
+        self.ttl = ttl if ttl is not None else refresh_interval * 3
+        self.miss_timeout = miss_timeout
+        self._producers: Dict[str, SectionProducer] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._start_lock = threading.Lock()
+
+    def register(self, name: str, producer: SectionProducer):
+        """Register an async producer for a section."""
+        self._producers[name] = producer
+
+    def section(self, name: str) -> Callable[[SectionProducer], SectionProducer]:
+        """Decorator form of register()."""
+        def decorator(producer: SectionProducer) -> SectionProducer:
+            self.register(name, producer)
+            return producer
+        return decorator
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the background loop thread (idempotent)."""
+        with self._start_lock:
+            if self.running:
+                return
+            ready = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run_loop, args=(ready,), name='dashboard-aggregator', daemon=True
+            )
+            self._thread.start()
+            ready.wait()
+            logger.info("Dashboard aggregator started",
+                        sections=list(self._producers), refresh_interval=self.refresh_interval)
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the background loop and wait for the thread."""
+        with self._start_lock:
+            if not self.running:
+                return
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run_loop(self, ready: threading.Event):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._stop_event = asyncio.Event()
+        ready.set()
+        try:
+            self._loop.run_until_complete(self._refresh_forever())
+        finally:
+            self._loop.close()
+
+    async def _refresh_forever(self):
+        while not self._stop_event.is_set():
+            await self.refresh_all()
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.refresh_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def refresh_all(self):
+        """Refresh every section whose refresh this process claims."""
+        names = [name for name in self._producers if self.store.claim_refresh(name, self.refresh_interval)]
+        await asyncio.gather(*(self.refresh(name) for name in names))
+
+    async def refresh(self, name: str) -> DashboardSnapshot:
+        """
+        Recompute one section, sharing the work with concurrent callers.
+
+        A failed refresh keeps serving the last good snapshot until it
+        expires; only a section with no good data stores the error.
+        """
+        in_flight = self._in_flight.get(name)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[name] = future
+        try:
+            snapshot = await self._compute(name)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._in_flight[name]
+        future.set_result(snapshot)
+        return snapshot
+
+    async def _compute(self, name: str) -> DashboardSnapshot:
+        start = time.perf_counter()
+        try:
+            data = await self._producers[name]()
+        except Exception as e:
+            logger.warning("Dashboard section refresh failed", section=name, error=str(e))
+            previous = self.store.get(name)
+            if previous is not None and previous.error is None:
+                return previous
+            snapshot = DashboardSnapshot.from_error(str(e))
+            self.store.set(name, snapshot, self.refresh_interval)
+            return snapshot
+
+        snapshot = DashboardSnapshot.from_data(data)
+        previous = self.store.get(name)
+        if previous is not None and previous.etag == snapshot.etag:
+            # Unchanged content keeps its timestamp so clients' ETags stay valid
+            snapshot = previous
+        self.store.set(name, snapshot, self.ttl)
+        logger.debug("Dashboard section refreshed", section=name,
+                     duration=round(time.perf_counter() - start, 3))
+        return snapshot
+
+    def get(self, name: str) -> DashboardSnapshot:
+        """
+        Snapshot for a section, computing it on the aggregator loop if missing.
+
+        Raises:
+            KeyError: Unknown section
+        """
+        if name not in self._producers:
+            raise KeyError(f"Unknown dashboard section: {name}")
+        snapshot = self.store.get(name)
+        if snapshot is not None:
+            return snapshot
+        return self.submit(self._get_or_refresh(name)).result(self.miss_timeout)
+
+    async def _get_or_refresh(self, name: str) -> DashboardSnapshot:
+        # Checked again on the loop: the background refresh may have just stored it
+        snapshot = self.store.get(name)
+        if snapshot is not None:
+            return snapshot
+        return await self.refresh(name)
+
+    def submit(self, coro: Awaitable[Any]):
+        """Run a coroutine on the aggregator loop; returns a concurrent Future."""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+
+def create_aggregator_from_env() -> DashboardAggregator:
+    """
+    Build an aggregator from environment variables.
+
+    DASHBOARD_REFRESH_INTERVAL (seconds, default 30), DASHBOARD_CACHE_TTL
+    (seconds, default 3 intervals) and DASHBOARD_REDIS_URL (shared Redis
+    store; in-process store if unset).
+    """
+    refresh_interval = float(os.getenv('DASHBOARD_REFRESH_INTERVAL', '30'))
+    ttl = os.getenv('DASHBOARD_CACHE_TTL')
+    redis_url = os.getenv('DASHBOARD_REDIS_URL')
+    store = RedisSnapshotStore(redis_url) if redis_url else MemorySnapshotStore()
+    return DashboardAggregator(
+        store=store,
+        refresh_interval=refresh_interval,
+        ttl=float(ttl) if ttl else None
+    )
@@ -8,7 +8,7 @@ integrating with existing G.1-G.3 monitoring infrastructure.
 import os
 import asyncio
 from datetime import datetime, timezone
-from flask import Flask, render_template, jsonify, request, redirect, url_for, flash
+from flask import Flask, Response, render_template, jsonify, request, redirect, url_for, flash
 from flask_cors import CORS
 import json
 from typing import Dict, List, Any, Optional
@@ -31,6 +31,8 @@ try:
 except ImportError:
     supabase_client = None
 
+from src.dashboard.aggregator import create_aggregator_from_env
+
 # Import authentication module
 from src.dashboard.auth import (
     get_current_user, require_auth, require_role, 
@@ -61,6 +63,9 @@ scheduler = Scheduler()
 roaster_config = RoasterConfig()
 queue_manager = QueueManager()
 
+# Background aggregator serving precomputed dashboard sections
+aggregator = create_aggregator_from_env()
+
 # Initialize Supabase client for business metrics
 def init_supabase():
     """Initialize Supabase client for database queries."""
@@ -149,188 +154,191 @@ def health_check():
     })
 
 
+# =============================================================================
+# CACHED DASHBOARD SECTIONS
+# =============================================================================
+# Sections are computed by the background aggregator on one long-lived event
+# loop and served from its snapshot store, so open dashboards don't each query
+# Supabase and the monitoring services on every poll.
+
+@aggregator.section('overview')
+async def _collect_overview() -> Dict[str, Any]:
+    """Collect dashboard overview data."""
+    # Get platform summary
+    platform_summary = await platform_monitoring.get_platform_summary_report()
+    
+    # Get Firecrawl metrics
+    firecrawl_metrics_data = firecrawl_metrics.get_metrics_summary()
+    
+    # Get active alerts
+    active_alerts = firecrawl_alerts.get_active_alerts()
+    
+    return {
+        'platform_summary': platform_summary,
+        'firecrawl_metrics': firecrawl_metrics_data,
+        'active_alerts': active_alerts,
+        'system_health': _assess_system_health(firecrawl_metrics_data, active_alerts)
+    }
+
+
+@aggregator.section('roasters')
+async def _collect_roasters() -> Dict[str, Any]:
+    """Collect roaster-specific monitoring data."""
+    distribution, usage_stats, recent_activity = await asyncio.gather(
+        platform_monitoring.get_platform_distribution(),
+        platform_monitoring.get_platform_usage_stats(),
+        platform_monitoring.get_recent_platform_activity()
+    )
+    
+    return {
+        'distribution': distribution,
+        'usage_stats': usage_stats,
+        'recent_activity': recent_activity
+    }
+
+
+@aggregator.section('budget')
+async def _collect_budget() -> Dict[str, Any]:
+    """Collect budget and cost monitoring data."""
+    budget_report, operations_data = await asyncio.gather(
+        budget_reporting.generate_budget_report(),
+        budget_reporting.generate_operations_dashboard_data()
+    )
+    
+    return {
+        'budget_report': budget_report,
+        'operations_data': operations_data
+    }
+
+
+@aggregator.section('metrics')
+async def _collect_metrics() -> Dict[str, Any]:
+    """Collect detailed metrics data."""
+    performance_metrics, health_dashboard, firecrawl_usage = await asyncio.gather(
+        platform_monitoring.get_platform_performance_metrics(),
+        platform_monitoring.get_platform_health_dashboard(),
+        platform_monitoring.get_firecrawl_usage_tracking()
+    )
+    
+    return {
+        'performance_metrics': performance_metrics,
+        'health_dashboard': health_dashboard,
+        'firecrawl_usage': firecrawl_usage
+    }
+
+
+@aggregator.section('business_metrics')
+async def _collect_business_metrics() -> Dict[str, Any]:
+    """Collect product counts, price tracking, data quality and roaster metrics."""
+    client = init_supabase()
+    if not client:
+        raise RuntimeError('Database connection not available')
+    
+    # The Supabase client is synchronous; run the queries side by side in threads
+    product_metrics, price_metrics, quality_metrics, roaster_metrics = await asyncio.gather(
+        asyncio.to_thread(_get_product_discovery_metrics, client),
+        asyncio.to_thread(_get_price_tracking_metrics, client),
+        asyncio.to_thread(_get_data_quality_metrics, client),
+        asyncio.to_thread(_get_roaster_performance_metrics, client)
+    )
+    
+    return {
+        'product_metrics': product_metrics,
+        'price_metrics': price_metrics,
+        'quality_metrics': quality_metrics,
+        'roaster_metrics': roaster_metrics
+    }
+
+
+@aggregator.section('pipeline_status')
+async def _collect_pipeline_status() -> Dict[str, Any]:
+    """Collect pipeline status and job queue information."""
+    client = init_supabase()
+    if not client:
+        raise RuntimeError('Database connection not available')
+    
+    pipeline_data, queue_data, run_stats = await asyncio.gather(
+        asyncio.to_thread(_get_pipeline_status, client),
+        asyncio.to_thread(_get_job_queue_status, client),
+        asyncio.to_thread(_get_recent_run_statistics, client)
+    )
+    
+    return {
+        'pipeline_status': pipeline_data,
+        'job_queue': queue_data,
+        'run_statistics': run_stats
+    }
+
+
+def _cached_section_response(name: str) -> Response:
+    """Serve a section snapshot, answering 304 when the client's ETag matches."""
+    try:
+        snapshot = aggregator.get(name)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    
+    if snapshot.error is not None:
+        return jsonify({'error': snapshot.error}), 500
+    
+    response = jsonify({'timestamp': snapshot.timestamp, **snapshot.data})
+    response.set_etag(snapshot.etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
 @app.route('/api/dashboard/overview')
 @require_auth
 def dashboard_overview():
     """Get dashboard overview data."""
-    try:
-        # Get platform summary
-        platform_summary = asyncio.run(platform_monitoring.get_platform_summary_report())
-        
-        # Get Firecrawl metrics
-        firecrawl_metrics_data = firecrawl_metrics.get_metrics_summary()
-        
-        # Get active alerts
-        active_alerts = firecrawl_alerts.get_active_alerts()
-        
-        overview = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'platform_summary': platform_summary,
-            'firecrawl_metrics': firecrawl_metrics_data,
-            'active_alerts': active_alerts,
-            'system_health': _assess_system_health(firecrawl_metrics_data, active_alerts)
-        }
-        
-        return jsonify(overview)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _cached_section_response('overview')
 
 
 @app.route('/api/dashboard/roasters')
 @require_auth
 def roasters_data():
     """Get roaster-specific monitoring data."""
-    try:
-        # Get platform distribution
-        distribution = asyncio.run(platform_monitoring.get_platform_distribution())
-        
-        # Get platform usage stats
-        usage_stats = asyncio.run(platform_monitoring.get_platform_usage_stats())
-        
-        # Get recent activity
-        recent_activity = asyncio.run(platform_monitoring.get_recent_platform_activity())
-        
-        roasters_data = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'distribution': distribution,
-            'usage_stats': usage_stats,
-            'recent_activity': recent_activity
-        }
-        
-        return jsonify(roasters_data)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _cached_section_response('roasters')
 
 
 @app.route('/api/dashboard/budget')
 @require_auth
 def budget_data():
     """Get budget and cost monitoring data."""
-    try:
-        # Get budget report
-        budget_report = asyncio.run(budget_reporting.generate_budget_report())
-        
-        # Get operations dashboard data
-        operations_data = asyncio.run(budget_reporting.generate_operations_dashboard_data())
-        
-        budget_data = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'budget_report': budget_report,
-            'operations_data': operations_data
-        }
-        
-        return jsonify(budget_data)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _cached_section_response('budget')
 
 
 @app.route('/api/dashboard/metrics')
 @require_auth
 def metrics_data():
     """Get detailed metrics data."""
-    try:
-        # Get platform performance metrics
-        performance_metrics = asyncio.run(platform_monitoring.get_platform_performance_metrics())
-        
-        # Get platform health dashboard
-        health_dashboard = asyncio.run(platform_monitoring.get_platform_health_dashboard())
-        
-        # Get Firecrawl usage tracking
-        firecrawl_usage = asyncio.run(platform_monitoring.get_firecrawl_usage_tracking())
-        
-        metrics_data = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'performance_metrics': performance_metrics,
-            'health_dashboard': health_dashboard,
-            'firecrawl_usage': firecrawl_usage
-        }
-        
-        return jsonify(metrics_data)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _cached_section_response('metrics')
 
 
 @app.route('/api/dashboard/business-metrics')
 @require_auth
 def business_metrics():
     """Get business metrics including product counts, price tracking, and data quality."""
-    try:
-        client = init_supabase()
-        if not client:
-            return jsonify({'error': 'Database connection not available'}), 500
-        
-        # Get product discovery metrics
-        product_metrics = _get_product_discovery_metrics(client)
-        
-        # Get price tracking metrics
-        price_metrics = _get_price_tracking_metrics(client)
-        
-        # Get data quality metrics
-        quality_metrics = _get_data_quality_metrics(client)
-        
-        # Get roaster performance metrics
-        roaster_metrics = _get_roaster_performance_metrics(client)
-        
-        business_data = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'product_metrics': product_metrics,
-            'price_metrics': price_metrics,
-            'quality_metrics': quality_metrics,
-            'roaster_metrics': roaster_metrics
-        }
-        
-        return jsonify(business_data)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _cached_section_response('business_metrics')
 
 
 @app.route('/api/dashboard/pipeline-status')
 @require_auth
 def pipeline_status():
     """Get real-time pipeline status and job queue information."""
-    try:
-        client = init_supabase()
-        if not client:
-            return jsonify({'error': 'Database connection not available'}), 500
-        
-        # Get current pipeline status
-        pipeline_data = _get_pipeline_status(client)
-        
-        # Get job queue information
-        queue_data = _get_job_queue_status(client)
-        
-        # Get recent run statistics
-        run_stats = _get_recent_run_statistics(client)
-        
-        status_data = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'pipeline_status': pipeline_data,
-            'job_queue': queue_data,
-            'run_statistics': run_stats
-        }
-        
-        return jsonify(status_data)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _cached_section_response('pipeline_status')
 
 
 def _get_product_discovery_metrics(client) -> Dict[str, Any]:
     """Get product discovery metrics (new products, updates)."""
     try:
         # Get total products count
-        total_coffees = client.table('coffees').select('id', count='exact').execute()
+        total_coffees = client.table('coffees').select('id', count='exact', head=True).execute()
         
         # Get new products in last 7 days
-        new_products = client.table('coffees').select('id', count='exact').gte('created_at', 'now() - interval \'7 days\'').execute()
+        new_products = client.table('coffees').select('id', count='exact', head=True).gte('created_at', 'now() - interval \'7 days\'').execute()
         
         # Get updated products in last 7 days
-        updated_products = client.table('coffees').select('id', count='exact').gte('updated_at', 'now() - interval \'7 days\'').execute()
+        updated_products = client.table('coffees').select('id', count='exact', head=True).gte('updated_at', 'now() - interval \'7 days\'').execute()
         
         return {
             'total_products': total_coffees.count if total_coffees.count else 0,
@@ -346,7 +354,7 @@ def _get_price_tracking_metrics(client) -> Dict[str, Any]:
     """Get price tracking metrics for weekly price updates (per PRD)."""
     try:
         # Get price updates in last 30 days (weekly cadence)
-        price_updates = client.table('prices').select('id', count='exact').gte('scraped_at', 'now() - interval \'30 days\'').execute()
+        price_updates = client.table('prices').select('id', count='exact', head=True).gte('scraped_at', 'now() - interval \'30 days\'').execute()
         
         # Get weekly price trend (last 4 weeks to show weekly cadence)
         price_trend = client.rpc('get_price_trend_4w').execute()
@@ -506,8 +514,8 @@ def trigger_scraping():
         if job_type not in ['full_refresh', 'price_only']:
             return jsonify({'error': 'Invalid job_type. Must be "full_refresh" or "price_only"'}), 400
         
-        # Trigger the scraping job asynchronously
-        asyncio.create_task(scheduler.schedule_jobs(job_type=job_type, roaster_id=roaster_id))
+        # Trigger the scraping job on the aggregator's event loop
+        aggregator.submit(scheduler.schedule_jobs(job_type=job_type, roaster_id=roaster_id))
         
         return jsonify({
             'status': 'success',
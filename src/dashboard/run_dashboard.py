@@ -3,8 +3,17 @@
 Dashboard Runner Script
 
 This script starts the operations dashboard with proper configuration.
+
+By default the app is served by uvicorn (through asgiref's WSGI adapter) when
+both are installed, otherwise by Flask's threaded development server. Either
+way dashboard data comes from the background aggregator, which is started
+here so sections are warm before the first request.
+
+Usage:
+    python run_dashboard.py [--server uvicorn|flask] [--port 5000] [--workers 1]
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -18,18 +27,63 @@ sys.path.insert(0, str(parent_dir))
 os.environ.setdefault('FLASK_ENV', 'development')
 os.environ.setdefault('FLASK_DEBUG', '1')
 
-# Import and run the Flask app
-from app import app
+# Import the Flask app
+from app import app, aggregator
+
+
+def create_asgi_app():
+    """Wrap the Flask app for an ASGI server; Flask handlers run in its thread pool."""
+    from asgiref.wsgi import WsgiToAsgi
+    return WsgiToAsgi(app)
+
+
+def _uvicorn_available() -> bool:
+    try:
+        import asgiref  # noqa: F401
+        import uvicorn  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the operations dashboard")
+    parser.add_argument('--server', choices=['uvicorn', 'flask'],
+                        default='uvicorn' if _uvicorn_available() else 'flask')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=int(os.getenv('PORT', '5000')))
+    parser.add_argument('--workers', type=int, default=1,
+                        help="uvicorn worker processes (each runs its own aggregator; "
+                             "set DASHBOARD_REDIS_URL to share snapshots between them)")
+    args = parser.parse_args()
 
-if __name__ == '__main__':
     print("🚀 Starting Coffee Scraping Operations Dashboard...")
-    print("📊 Dashboard will be available at: http://localhost:5000")
-    print("🔧 API endpoints available at: http://localhost:5000/api/")
+    print(f"📊 Dashboard will be available at: http://localhost:{args.port}")
+    print(f"🔧 API endpoints available at: http://localhost:{args.port}/api/")
+    print(f"⚙️  Server: {args.server}, refresh interval: {aggregator.refresh_interval}s")
     print("💡 Press Ctrl+C to stop the server")
-    
+
+    if args.server == 'uvicorn':
+        import uvicorn
+        if args.workers > 1:
+            # Workers import the app themselves; their aggregators start on first request
+            uvicorn.run('run_dashboard:create_asgi_app', factory=True, host=args.host,
+                        port=args.port, workers=args.workers, lifespan='off')
+        else:
+            aggregator.start()
+            uvicorn.run(create_asgi_app(), host=args.host, port=args.port, lifespan='off')
+        return
+
+    aggregator.start()
     app.run(
-        host='0.0.0.0',
-        port=5000,
-        debug=True,
-        threaded=True
+        host=args.host,
+        port=args.port,
+        debug=os.getenv('FLASK_DEBUG') == '1',
+        threaded=True,
+        # The reloader would fork a second process with its own aggregator
+        use_reloader=False
     )
+
+
+if __name__ == '__main__':
+    main()
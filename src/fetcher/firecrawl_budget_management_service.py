@@ -271,6 +271,40 @@ class FirecrawlBudgetManagementService:
             )
             return False
     
+    def is_budget_near_exhaustion(
+        self,
+        roaster_id: Optional[str] = None,
+        pending_cost: int = 0,
+        threshold_percentage: float = 80.0
+    ) -> bool:
+        """
+        Check whether admitting more work would push usage past the threshold.
+        
+        Uses in-memory state only, so it is cheap enough to call before every
+        scheduled operation.
+        
+        Args:
+            roaster_id: Roaster to check; None checks the global budget
+            pending_cost: Credits already committed to in-flight operations
+            threshold_percentage: Usage percentage treated as near exhaustion
+            
+        Returns:
+            True if the budget is at or past the threshold
+        """
+        if roaster_id is None:
+            used = self.budget_tracker.current_usage + pending_cost
+            limit = self.budget_tracker.config.budget_limit
+        else:
+            roaster_budget = self.budget_state['roaster_budgets'].get(roaster_id)
+            if not roaster_budget:
+                return False
+            used = roaster_budget['used_budget'] + pending_cost
+            limit = roaster_budget['budget_limit']
+        
+        if limit <= 0:
+            return True
+        return (used / limit) * 100 >= threshold_percentage
+    
     async def _get_roaster_budget(self, roaster_id: str) -> Optional[Dict[str, Any]]:
         """Get roaster budget information from database."""
         if not self.supabase_client:
@@ -19,6 +19,7 @@ from firecrawl import FirecrawlApp
 from structlog import get_logger
 
 from ..config.firecrawl_config import FirecrawlConfig, FirecrawlBudgetTracker
+from ..llm.rate_limiter import RateLimiter, create_rate_limiter
 from ..monitoring.firecrawl_metrics import FirecrawlMetrics, FirecrawlAlertManager
 
 logger = get_logger(__name__)
@@ -56,12 +57,16 @@ class FirecrawlClient:
     - Comprehensive logging and monitoring
     """
     
-    def __init__(self, config: FirecrawlConfig):
+    def __init__(self, config: FirecrawlConfig, rate_limiter: Optional[RateLimiter] = None):
         self.config = config
         self.budget_tracker = FirecrawlBudgetTracker(config)
         self.last_request_time = 0
         self.request_count = 0
-        self.request_window_start = time.time()
+        self.rate_limiter = rate_limiter or create_rate_limiter(
+            {'requests_per_minute': config.rate_limit_per_minute},
+            redis_url=config.rate_limit_redis_url,
+            key_prefix="firecrawl_ratelimit"
+        )
         
         # Initialize monitoring
         self.metrics = FirecrawlMetrics()
@@ -79,35 +84,18 @@ class FirecrawlClient:
         )
     
     async def _apply_rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        
-        # Reset window if needed
-        if current_time - self.request_window_start >= 60:  # 1 minute window
-            self.request_count = 0
-            self.request_window_start = current_time
+        """Wait for a slot in the per-minute rate limit (shared across workers when configured)."""
+        started = time.monotonic()
+        await self.rate_limiter.acquire('firecrawl')
+        waited = time.monotonic() - started
         
-        # Check if we're within rate limit
-        if self.request_count >= self.config.rate_limit_per_minute:
-            sleep_time = 60 - (current_time - self.request_window_start)
-            if sleep_time > 0:
-                logger.warning(
-                    "Rate limit reached, sleeping",
-                    sleep_time=sleep_time,
-                    request_count=self.request_count,
-                    rate_limit=self.config.rate_limit_per_minute
-                )
-                await asyncio.sleep(sleep_time)
-                self.request_count = 0
-                self.request_window_start = time.time()
-        
-        # Apply minimum delay between requests
-        time_since_last = current_time - self.last_request_time
-        min_delay = 60.0 / self.config.rate_limit_per_minute
-        
-        if time_since_last < min_delay:
-            sleep_time = min_delay - time_since_last
-            await asyncio.sleep(sleep_time)
+        if waited > 0.5:
+            logger.warning(
+                "Rate limit reached, waited for slot",
+                waited=waited,
+                request_count=self.request_count,
+                rate_limit=self.config.rate_limit_per_minute
+            )
         
         self.last_request_time = time.time()
         self.request_count += 1
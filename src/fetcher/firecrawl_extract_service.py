@@ -17,6 +17,7 @@ from datetime import datetime, timezone
 from structlog import get_logger
 
 from .firecrawl_client import FirecrawlClient, FirecrawlAPIError
+from .firecrawl_scheduler import FirecrawlBatchScheduler, ScheduledOperation
 from ..parser.normalizer_pipeline import NormalizerPipelineService
 
 logger = get_logger(__name__)
@@ -35,9 +36,11 @@ class FirecrawlExtractService:
     - Budget tracking and rate limiting
     """
 
-    def __init__(self, firecrawl_client: FirecrawlClient, normalizer_pipeline: NormalizerPipelineService):
+    def __init__(self, firecrawl_client: FirecrawlClient, normalizer_pipeline: NormalizerPipelineService,
+                 budget_service=None):
         self.client = firecrawl_client
         self.normalizer_pipeline = normalizer_pipeline
+        self.budget_service = budget_service
 
         logger.info(
             "Firecrawl extract service initialized",
@@ -507,34 +510,53 @@ class FirecrawlExtractService:
         self,
         urls: List[str],
         size_options: List[str] = None,
-        job_type: str = "full_refresh"
+        job_type: str = "full_refresh",
+        priorities: Optional[Dict[str, float]] = None,
+        roaster_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Extract multiple coffee products in batch.
 
+        URLs are extracted concurrently in descending priority order; once the
+        Firecrawl budget nears exhaustion the remaining URLs are skipped.
+
         Args:
             urls: List of product URLs to extract
             size_options: List of size options to test
             job_type: Job type - "full_refresh" or "price_only" for Epic B integration
+            priorities: Optional expected value per URL (defaults to input order)
+            roaster_id: Optional roaster whose budget should gate the batch
 
         Returns:
-            List of extraction results
+            List of extraction results, in the same order as urls
         """
-        results = []
-
         logger.info("Starting batch product extraction", url_count=len(urls))
 
-        for i, url in enumerate(urls):
-            try:
-                if job_type == "price_only":
-                    result = await self.extract_price_only_data(url, job_type)
-                else:
-                    result = await self.extract_coffee_product_with_pricing(url, size_options, job_type)
-                
+        async def extract(url: str):
+            if job_type == "price_only":
+                return await self.extract_price_only_data(url, job_type)
+            return await self.extract_coffee_product_with_pricing(url, size_options, job_type)
+
+        priorities = priorities or {}
+        operations = [
+            ScheduledOperation(
+                key=url,
+                run=lambda url=url: extract(url),
+                expected_value=priorities.get(url, 1.0),
+                roaster_id=roaster_id
+            )
+            for url in urls
+        ]
+        scheduler = FirecrawlBatchScheduler.from_client(self.client, self.budget_service)
+        outcomes = await scheduler.run(operations)
+
+        results = []
+        for i, (url, outcome) in enumerate(zip(urls, outcomes)):
+            if outcome.status == 'completed':
                 results.append({
                     'url': url,
                     'success': True,
-                    'result': result
+                    'result': outcome.result
                 })
 
                 logger.info(
@@ -544,21 +566,27 @@ class FirecrawlExtractService:
                     total=len(urls),
                     job_type=job_type
                 )
-
-            except Exception as e:
+            elif outcome.status == 'skipped':
+                results.append({
+                    'url': url,
+                    'success': False,
+                    'skipped': True,
+                    'error': 'Firecrawl budget near exhaustion, extraction not scheduled'
+                })
+            else:
                 logger.error(
                     "Product extraction failed",
                     url=url,
                     index=i + 1,
                     total=len(urls),
                     job_type=job_type,
-                    error=str(e)
+                    error=str(outcome.error)
                 )
 
                 results.append({
                     'url': url,
                     'success': False,
-                    'error': str(e)
+                    'error': str(outcome.error)
                 })
 
         success_count = sum(1 for r in results if r['success'])
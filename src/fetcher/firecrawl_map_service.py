@@ -17,6 +17,7 @@ import json
 from structlog import get_logger
 
 from .firecrawl_client import FirecrawlClient, FirecrawlError, FirecrawlBudgetExceededError
+from .firecrawl_scheduler import FirecrawlBatchScheduler, ScheduledOperation
 from ..config.firecrawl_config import FirecrawlConfig
 from ..config.roaster_schema import RoasterConfigSchema
 
@@ -34,9 +35,10 @@ class FirecrawlMapService:
     - Integrates with RPC pipeline for data processing
     """
     
-    def __init__(self, firecrawl_client: FirecrawlClient):
+    def __init__(self, firecrawl_client: FirecrawlClient, budget_service=None):
         self.client = firecrawl_client
         self.config = firecrawl_client.config
+        self.budget_service = budget_service
         
         logger.info(
             "FirecrawlMapService initialized",
@@ -334,6 +336,9 @@ class FirecrawlMapService:
         """
         Discover product URLs for multiple roasters in batch.
         
+        Roasters are mapped concurrently, stalest first, and scheduling stops
+        once the Firecrawl budget nears exhaustion (see FirecrawlBatchScheduler).
+        
         Args:
             roaster_configs: List of roaster configurations
             search_terms: Optional search terms to filter URLs
@@ -349,31 +354,51 @@ class FirecrawlMapService:
             search_terms=search_terms
         )
         
+        operations = [
+            ScheduledOperation(
+                key=roaster_config.id,
+                run=lambda roaster_config=roaster_config: self.discover_roaster_products(
+                    roaster_config, search_terms, job_type
+                ),
+                expected_value=self._discovery_value(roaster_config),
+                cost=1 if roaster_config.use_firecrawl_fallback else 0,
+                roaster_id=roaster_config.id
+            )
+            for roaster_config in roaster_configs
+        ]
+        scheduler = FirecrawlBatchScheduler.from_client(self.client, self.budget_service)
+        outcomes = await scheduler.run(operations)
+        
         results = []
         successful_discoveries = 0
         total_urls_discovered = 0
         
-        for roaster_config in roaster_configs:
-            try:
-                result = await self.discover_roaster_products(roaster_config, search_terms, job_type)
-                results.append(result)
-                
+        for roaster_config, outcome in zip(roaster_configs, outcomes):
+            if outcome.status == 'completed':
+                result = outcome.result
                 if result['status'] == 'success':
                     successful_discoveries += 1
                     total_urls_discovered += len(result['discovered_urls'])
-                
-            except Exception as e:
+            elif outcome.status == 'skipped':
+                result = {
+                    'roaster_id': roaster_config.id,
+                    'discovered_urls': [],
+                    'status': 'skipped',
+                    'message': 'Firecrawl budget near exhaustion, discovery not scheduled'
+                }
+            else:
                 logger.error(
                     "Batch discovery failed for roaster",
                     roaster_id=roaster_config.id,
-                    error=str(e)
+                    error=str(outcome.error)
                 )
-                results.append({
+                result = {
                     'roaster_id': roaster_config.id,
                     'discovered_urls': [],
                     'status': 'error',
-                    'message': f'Batch discovery failed: {str(e)}'
-                })
+                    'message': f'Batch discovery failed: {str(outcome.error)}'
+                }
+            results.append(result)
         
         batch_result = {
             'batch_timestamp': datetime.now(timezone.utc).isoformat(),
@@ -395,6 +420,16 @@ class FirecrawlMapService:
         
         return batch_result
     
+    def _discovery_value(self, roaster_config: RoasterConfigSchema) -> float:
+        """Expected value of rediscovering a roaster: hours since it was last fetched."""
+        last_modified = roaster_config.last_modified
+        if last_modified is None:
+            return float('inf')
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        age = datetime.now(timezone.utc) - last_modified
+        return max(age.total_seconds() / 3600, 0.0)
+    
     async def discover_price_only_urls(
         self, 
         domain: str, 
@@ -0,0 +1,173 @@
+"""
+Budget-aware scheduler for batched Firecrawl operations.
+
+This module provides:
+- Bounded-concurrency execution of map/extract operations
+- Ordering by expected value per credit so the most useful work runs first
+- Admission control that stops scheduling once the budget nears exhaustion
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True, kw_only=True)
+class ScheduledOperation:
+    """A single Firecrawl operation awaiting a scheduler slot."""
+
+    key: str
+    run: Callable[[], Awaitable[Any]]
+    expected_value: float = 1.0
+    cost: int = 1
+    roaster_id: Optional[str] = None
+
+    @property
+    def value_per_credit(self) -> float:
+        """Expected value per budget credit (free operations rank first)."""
+        if self.cost <= 0:
+            return float('inf')
+        return self.expected_value / self.cost
+
+
+@dataclass(slots=True, kw_only=True)
+class OperationOutcome:
+    """Result of a scheduled operation: completed, failed or skipped."""
+
+    key: str
+    status: str
+    result: Any = None
+    error: Optional[Exception] = None
+
+
+class FirecrawlBatchScheduler:
+    """
+    Run Firecrawl operations concurrently within rate and budget limits.
+
+    Operations are started in descending value-per-credit order by a fixed
+    pool of workers. Before each start the scheduler checks the budget,
+    counting credits reserved by in-flight operations; once the global
+    budget reaches the stop threshold no further operations are admitted.
+    Roasters that are near their own budget are skipped individually.
+    Pacing against the API rate limit is left to FirecrawlClient.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        budget_tracker=None,
+        budget_limit: Optional[int] = None,
+        budget_service=None,
+        stop_threshold: float = 90.0
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.budget_tracker = budget_tracker
+        self.budget_limit = budget_limit
+        self.budget_service = budget_service
+        self.stop_threshold = stop_threshold
+
+    @classmethod
+    def from_client(cls, client, budget_service=None) -> 'FirecrawlBatchScheduler':
+        """Create a scheduler sized from a FirecrawlClient's configuration."""
+        config = getattr(client, 'config', None)
+        if config is None:
+            return cls(budget_service=budget_service)
+
+        return cls(
+            max_concurrency=min(config.max_concurrent_requests, config.rate_limit_per_minute),
+            budget_tracker=getattr(client, 'budget_tracker', None),
+            budget_limit=config.budget_limit,
+            budget_service=budget_service,
+            stop_threshold=config.budget_stop_threshold
+        )
+
+    def _global_budget_exhausted(self, pending_cost: int) -> bool:
+        if self.budget_service is not None:
+            return self.budget_service.is_budget_near_exhaustion(
+                pending_cost=pending_cost,
+                threshold_percentage=self.stop_threshold
+            )
+
+        if self.budget_tracker is None or not self.budget_limit:
+            return False
+        used = self.budget_tracker.current_usage + pending_cost
+        return (used / self.budget_limit) * 100 >= self.stop_threshold
+
+    def _roaster_budget_exhausted(self, operation: ScheduledOperation) -> bool:
+        if self.budget_service is None or operation.roaster_id is None:
+            return False
+        return self.budget_service.is_budget_near_exhaustion(
+            roaster_id=operation.roaster_id,
+            pending_cost=operation.cost,
+            threshold_percentage=self.stop_threshold
+        )
+
+    async def run(self, operations: List[ScheduledOperation]) -> List[OperationOutcome]:
+        """
+        Run operations and return their outcomes in input order.
+
+        Args:
+            operations: Operations to schedule
+
+        Returns:
+            One OperationOutcome per operation, aligned with the input list
+        """
+        if not operations:
+            return []
+
+        # sorted() is stable, so equal-value operations keep their input order
+        pending = deque(sorted(range(len(operations)), key=lambda i: -operations[i].value_per_credit))
+        outcomes: List[Optional[OperationOutcome]] = [None] * len(operations)
+        reserved = 0
+        halted = False
+
+        def admit(operation: ScheduledOperation) -> bool:
+            nonlocal halted
+            if operation.cost <= 0:
+                return True
+            if halted:
+                return False
+            if self._global_budget_exhausted(reserved + operation.cost):
+                halted = True
+                logger.warning(
+                    "Budget near exhaustion, no longer admitting Firecrawl operations",
+                    stop_threshold=self.stop_threshold,
+                    remaining_operations=len(pending) + 1
+                )
+                return False
+            if self._roaster_budget_exhausted(operation):
+                logger.info(
+                    "Roaster budget near exhaustion, skipping operation",
+                    roaster_id=operation.roaster_id,
+                    key=operation.key
+                )
+                return False
+            return True
+
+        async def worker():
+            nonlocal reserved
+            while pending:
+                index = pending.popleft()
+                operation = operations[index]
+
+                if not admit(operation):
+                    outcomes[index] = OperationOutcome(key=operation.key, status='skipped')
+                    continue
+
+                reserved += operation.cost
+                try:
+                    result = await operation.run()
+                    outcomes[index] = OperationOutcome(key=operation.key, status='completed', result=result)
+                except Exception as e:
+                    outcomes[index] = OperationOutcome(key=operation.key, status='failed', error=e)
+                finally:
+                    reserved -= operation.cost
+
+        await asyncio.gather(*(worker() for _ in range(min(self.max_concurrency, len(operations)))))
+
+        return outcomes
@@ -19,6 +19,7 @@ from .shopify_fetcher import ShopifyFetcher
 from .woocommerce_fetcher import WooCommerceFetcher
 from .firecrawl_map_service import FirecrawlMapService
 from .firecrawl_client import FirecrawlClient
+from .firecrawl_budget_management_service import FirecrawlBudgetManagementService
 from ..config.roaster_schema import RoasterConfigSchema
 from ..config.firecrawl_config import FirecrawlConfig
 
@@ -256,7 +257,8 @@ class PlatformFetcherService:
                 )
             
             firecrawl_client = FirecrawlClient(self.firecrawl_config)
-            self.firecrawl_service = FirecrawlMapService(firecrawl_client)
+            budget_service = FirecrawlBudgetManagementService(firecrawl_client.budget_tracker)
+            self.firecrawl_service = FirecrawlMapService(firecrawl_client, budget_service=budget_service)
         
         return self.firecrawl_service
     
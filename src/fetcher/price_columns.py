@@ -0,0 +1,179 @@
+"""
+Columnar price delta detection.
+
+Price-only runs compare every fetched variant of a roaster against its stored
+variant. Building a PriceDelta per variant and then discarding the unchanged
+ones made large catalogs CPU bound on object churn. PriceDeltaFrame aligns the
+fetched and existing variants into NumPy columns once, computes price and
+availability changes and percent deltas in bulk, and leaves materializing
+objects to the caller for the changed rows only.
+
+Prices are stored as integers in PRICE_SCALE units (cents plus two guard
+digits), so equality matches Decimal comparison for prices with up to four
+decimal places.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+PRICE_SCALE = 10_000
+
+# Stock column encoding; UNKNOWN marks variants without a stored value
+IN_STOCK = 1
+OUT_OF_STOCK = 0
+UNKNOWN = -1
+
+
+def _to_scaled(value: Any) -> float:
+    """Price as a float in PRICE_SCALE units, NaN when missing or invalid."""
+    if value is None:
+        return float('nan')
+    try:
+        return float(value) * PRICE_SCALE
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _stock_code(value: Any) -> int:
+    if value is None:
+        return UNKNOWN
+    return IN_STOCK if value else OUT_OF_STOCK
+
+
+class PriceDeltaFrame:
+    """
+    Fetched variants aligned with their stored counterparts as columns.
+
+    Row i describes ``rows[i]``, the fetched variant dict. Existing columns
+    hold the stored values of the variant with the same platform_variant_id,
+    or missing markers for new variants.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], existing_variants: List[Dict[str, Any]], matched,
+                 new_price, old_price, new_stock, old_stock, same_currency):
+        self.rows = rows
+        self.existing_variants = existing_variants
+        self.matched = matched
+        self.new_price = new_price
+        self.old_price = old_price
+        self.new_stock = new_stock
+        self.old_stock = old_stock
+
+        old_known = old_price >= 0
+        self.price_changed = ~old_known | (new_price != old_price)
+        self.availability_changed = (old_stock == UNKNOWN) | (new_stock != old_stock)
+        self.changed = self.price_changed | self.availability_changed
+        # Percent change is only meaningful against a positive price in the same currency
+        self.comparable = (old_price > 0) & same_currency
+        self.percent_change = np.zeros(len(rows), dtype=np.float64)
+        np.divide(
+            (new_price - old_price) * 100.0, old_price,
+            out=self.percent_change, where=self.comparable
+        )
+
+    @classmethod
+    def build(cls, fetched_products: List[Dict[str, Any]],
+              existing_variants: List[Dict[str, Any]]) -> 'PriceDeltaFrame':
+        """
+        Align fetched product variants with existing variant rows.
+
+        Fetched variants without a platform_variant_id or price are skipped.
+        When existing rows share a platform_variant_id the last one wins.
+        """
+        existing_index = {
+            variant['platform_variant_id']: index
+            for index, variant in enumerate(existing_variants)
+        }
+        old_price_all = np.fromiter(
+            (_to_scaled(variant.get('price_current')) for variant in existing_variants),
+            dtype=np.float64, count=len(existing_variants)
+        )
+        old_stock_all = np.fromiter(
+            (_stock_code(variant.get('in_stock')) for variant in existing_variants),
+            dtype=np.int8, count=len(existing_variants)
+        )
+
+        rows: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        new_prices: List[float] = []
+        for product in fetched_products:
+            for variant in product.get('variants', []):
+                variant_id = variant.get('platform_variant_id')
+                scaled = _to_scaled(variant.get('price_decimal'))
+                if not variant_id or scaled != scaled:
+                    continue
+                rows.append(variant)
+                positions.append(existing_index.get(variant_id, -1))
+                new_prices.append(scaled)
+
+        count = len(rows)
+        matched = np.fromiter(positions, dtype=np.int64, count=count)
+        has_existing = matched >= 0
+        take = np.where(has_existing, matched, 0)
+
+        new_price = np.rint(np.fromiter(new_prices, dtype=np.float64, count=count))
+        new_stock = np.fromiter(
+            (IN_STOCK if row.get('in_stock', True) else OUT_OF_STOCK for row in rows),
+            dtype=np.int8, count=count
+        )
+
+        old_price = np.full(count, -1.0)
+        old_stock = np.full(count, UNKNOWN, dtype=np.int8)
+        if len(existing_variants):
+            gathered = old_price_all[take]
+            known = has_existing & ~np.isnan(gathered)
+            old_price[known] = np.rint(gathered[known])
+            old_stock[has_existing] = old_stock_all[take][has_existing]
+
+        # Rows without a stored currency are assumed to be priced in the fetched one
+        same_currency = np.fromiter(
+            (
+                position < 0
+                or existing_variants[position].get('currency') in (None, row.get('currency', 'USD'))
+                for row, position in zip(rows, positions)
+            ),
+            dtype=bool, count=count
+        )
+
+        # -1 marks a missing stored price; real prices are never negative
+        return cls(
+            rows,
+            existing_variants,
+            matched,
+            new_price.astype(np.int64),
+            old_price.astype(np.int64),
+            new_stock,
+            old_stock,
+            same_currency,
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def changed_indices(self):
+        """Row indices with a price or availability change."""
+        return np.flatnonzero(self.changed)
+
+    def spike_indices(self, threshold_percent: float):
+        """Row indices whose price rose by more than threshold_percent."""
+        return np.flatnonzero(self.comparable & (self.percent_change > threshold_percent))
+
+    def existing_row(self, index: int) -> Optional[Dict[str, Any]]:
+        """Stored variant matched to a row, None for new variants."""
+        position = int(self.matched[index])
+        return self.existing_variants[position] if position >= 0 else None
+
+    def old_price_value(self, index: int) -> Optional[float]:
+        """Stored price of a row in major units, None for new variants."""
+        price = int(self.old_price[index])
+        return price / PRICE_SCALE if price >= 0 else None
+
+    def summary(self) -> Dict[str, int]:
+        """Counts of compared rows and detected changes."""
+        return {
+            'variants_compared': len(self.rows),
+            'price_changes': int(self.price_changed.sum()),
+            'availability_changes': int(self.availability_changed.sum()),
+            'total_deltas': int(self.changed.sum()),
+        }
@@ -3,7 +3,7 @@ Price-only fetcher for lightweight price updates.
 Extends existing fetcher infrastructure with price-only mode.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from datetime import datetime, timezone
 from structlog import get_logger
 
@@ -12,6 +12,10 @@ from .price_parser import PriceParser, PriceDelta
 from .shopify_fetcher import ShopifyFetcher
 from .woocommerce_fetcher import WooCommerceFetcher
 from .encoding_utils import safe_decode_json
+from ..validator.variant_snapshot import get_variant_snapshot_cache
+
+if TYPE_CHECKING:
+    from ..monitoring.alert_service import ComprehensiveAlertService
 
 logger = get_logger(__name__)
 
@@ -32,10 +36,12 @@ class PriceFetcher:
         base_fetcher: BaseFetcher,
         price_parser: Optional[PriceParser] = None,
         supabase_client=None,
+        alert_service: Optional['ComprehensiveAlertService'] = None,
     ):
         self.base_fetcher = base_fetcher
         self.price_parser = price_parser or PriceParser(job_type="price_only")
         self.supabase_client = supabase_client
+        self.alert_service = alert_service
         self.roaster_id = base_fetcher.roaster_id
         self.platform = base_fetcher.platform
         self.job_type = base_fetcher.job_type
@@ -290,21 +296,12 @@ class PriceFetcher:
             
             # Query database for existing product handles
             if self.supabase_client:
-                # Query coffees table for existing products
-                # We want both platform_product_id and slug, so we don't filter by null platform_product_id
-                result = self.supabase_client.table("coffees").select(
-                    "platform_product_id, slug"
-                ).eq("roaster_id", self.roaster_id).execute()
+                # Handles (platform_product_id, falling back to slug) come from the
+                # roaster's variant snapshot, shared with delta detection
+                snapshot = await get_variant_snapshot_cache(self.supabase_client).get(self.roaster_id)
+                handles = snapshot.product_handles
                 
-                if result.data:
-                    # Extract handles from platform_product_id or slug
-                    handles = []
-                    for coffee in result.data:
-                        # Use platform_product_id as handle, fallback to slug
-                        handle = coffee.get('platform_product_id') or coffee.get('slug')
-                        if handle:
-                            handles.append(handle)
-                    
+                if handles:
                     logger.info(
                         "Retrieved existing product handles",
                         roaster_id=self.roaster_id,
@@ -395,6 +392,9 @@ class PriceFetcher:
         """
         Detect price deltas and return them for processing.
         
+        When an alert service is configured, the delta frame is also checked
+        for price spikes.
+        
         Args:
             fetched_data: Price data from fetch
             existing_variants: Existing variant data from database
@@ -410,10 +410,11 @@ class PriceFetcher:
                 all_variants.extend(variants)
             
             # Detect deltas
-            deltas = self.price_parser.detect_price_deltas(
-                fetched_products=fetched_data,
-                existing_variants=existing_variants,
-            )
+            frame = self.price_parser.build_delta_frame(fetched_data, existing_variants)
+            deltas = self.price_parser.deltas_from_frame(frame)
+            
+            if self.alert_service:
+                await self.alert_service.check_price_alerts(delta_frame=frame, roaster_id=self.roaster_id)
             
             logger.info(
                 "Detected price deltas",
@@ -8,6 +8,8 @@ from decimal import Decimal
 from datetime import datetime, timezone
 from structlog import get_logger
 
+from .price_columns import PriceDeltaFrame
+
 # Import weight parser for enhanced weight parsing
 try:
     from ..parser.weight_parser import WeightParser, WeightResult
@@ -356,37 +358,30 @@ class PriceParser:
         Returns:
             List of price deltas for changed variants
         """
-        deltas = []
-        
-        # Create lookup for existing variants
-        existing_lookup = {
-            variant['platform_variant_id']: variant
-            for variant in existing_variants
-        }
+        return self.deltas_from_frame(self.build_delta_frame(fetched_products, existing_variants))
+    
+    def build_delta_frame(
+        self,
+        fetched_products: List[Dict[str, Any]],
+        existing_variants: List[Dict[str, Any]],
+    ) -> PriceDeltaFrame:
+        """
+        Align fetched and existing variants into columns for bulk comparison.
         
-        # Process each fetched product
-        for product in fetched_products:
-            variants = product.get('variants', [])
-            
-            for variant in variants:
-                variant_id = variant.get('platform_variant_id')
-                if not variant_id:
-                    continue
-                
-                # Get existing variant data
-                existing = existing_lookup.get(variant_id)
-                
-                # Create price delta
-                delta = self._create_price_delta(variant, existing)
-                if delta and (delta.has_price_change() or delta.has_availability_change()):
-                    deltas.append(delta)
+        The frame can be reused for spike detection, see
+        PriceAlertService.check_price_spike_frame.
+        """
+        return PriceDeltaFrame.build(fetched_products, existing_variants)
+    
+    def deltas_from_frame(self, frame: PriceDeltaFrame) -> List[PriceDelta]:
+        """Create PriceDelta objects for the changed rows of a frame only."""
+        deltas = []
+        for index in frame.changed_indices():
+            delta = self._create_price_delta(frame.rows[index], frame.existing_row(index))
+            if delta:
+                deltas.append(delta)
         
-        logger.info(
-            "Detected price deltas",
-            total_deltas=len(deltas),
-            price_changes=sum(1 for d in deltas if d.has_price_change()),
-            availability_changes=sum(1 for d in deltas if d.has_availability_change()),
-        )
+        logger.info("Detected price deltas", **frame.summary())
         
         return deltas
     
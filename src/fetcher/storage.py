@@ -12,6 +12,8 @@ import hashlib
 
 from structlog import get_logger
 
+from ..monitoring.tracing import traced
+
 logger = get_logger(__name__)
 
 
@@ -107,6 +109,7 @@ class ResponseStorage:
         """
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
     
+    @traced("store")
     async def store_response(
         self,
         roaster_id: str,
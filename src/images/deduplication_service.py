@@ -5,10 +5,12 @@ This service integrates with the existing A.1-A.5 pipeline to provide
 image deduplication based on SHA256 content hashing.
 """
 
+import asyncio
 from typing import Dict, Any, Optional, List, Tuple
 from structlog import get_logger
 
-from .hash_computation import ImageHashComputer, ImageHashComputationError
+from .hash_computation import AsyncImageHashComputer, ImageHashComputer, ImageHashComputationError
+from ..validator.db_gateway import get_database_gateway
 from ..validator.rpc_client import RPCClient
 
 logger = get_logger(__name__)
@@ -31,16 +33,26 @@ class ImageDeduplicationService:
     - Performance monitoring and caching
     """
     
-    def __init__(self, rpc_client: RPCClient, hash_computer: Optional[ImageHashComputer] = None):
+    def __init__(
+        self,
+        rpc_client: RPCClient,
+        hash_computer: Optional[ImageHashComputer] = None,
+        async_hash_computer: Optional[AsyncImageHashComputer] = None
+    ):
         """
         Initialize image deduplication service.
         
         Args:
             rpc_client: RPC client for database operations
             hash_computer: Image hash computer instance (optional)
+            async_hash_computer: Async hash computer for batch processing (optional, created lazily)
         """
         self.rpc_client = rpc_client
         self.hash_computer = hash_computer or ImageHashComputer()
+        self.async_hash_computer = async_hash_computer
+        # A lazily created computer is owned by this service and bound to the loop it was created in
+        self._owns_async_hash_computer = async_hash_computer is None
+        self._async_hash_computer_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Deduplication statistics
         self.stats = {
@@ -230,6 +242,108 @@ class ImageDeduplicationService:
         
         return results
     
+    async def process_batch_with_deduplication_async(
+        self,
+        images_data: List[Dict[str, Any]],
+        coffee_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Process multiple images with concurrent hashing and one duplicate lookup.
+        
+        Hashes are computed concurrently by the async hash computer, then all
+        of them are resolved against the database with a single batched RPC.
+        Results have the same shape as process_batch_with_deduplication.
+        
+        Args:
+            images_data: List of image data dictionaries
+            coffee_id: Coffee ID for the images
+            
+        Returns:
+            List of processed image data with deduplication status
+        """
+        hash_computer = self._get_async_hash_computer()
+        urls = [image_data.get('url') for image_data in images_data]
+        hashes = await hash_computer.compute_batch_hashes([url for url in urls if url])
+        
+        try:
+            gateway = get_database_gateway(getattr(self.rpc_client, 'supabase_client', None))
+            existing = await gateway.run(self.rpc_client.check_content_hashes, list(hashes.values()))
+        except Exception as e:
+            logger.error(
+                "Failed to check duplicate hashes",
+                hash_count=len(hashes),
+                error=str(e)
+            )
+            # Treat every image as new so processing can continue
+            existing = {}
+        
+        results = []
+        for image_data, image_url in zip(images_data, urls):
+            self.stats['images_processed'] += 1
+            content_hash = hashes.get(image_url) if image_url else None
+            
+            if content_hash is None:
+                self.stats['deduplication_errors'] += 1
+                error = "Image URL is required" if not image_url else f"Failed to compute hash for image {image_url}"
+                results.append({
+                    'url': image_url,
+                    'error': error,
+                    'deduplication_status': 'error'
+                })
+            elif existing.get(content_hash):
+                self.stats['duplicates_found'] += 1
+                results.append({
+                    'image_id': existing[content_hash],
+                    'url': image_url,
+                    'content_hash': content_hash,
+                    'is_duplicate': True,
+                    'deduplication_status': 'skipped_duplicate'
+                })
+            else:
+                self.stats['new_images'] += 1
+                image_data['content_hash'] = content_hash
+                image_data['is_duplicate'] = False
+                image_data['deduplication_status'] = 'new_image'
+                results.append(image_data)
+        
+        logger.info(
+            "Async batch deduplication processing completed",
+            total_images=len(images_data),
+            duplicates=sum(1 for r in results if r.get('is_duplicate')),
+            failed=sum(1 for r in results if 'error' in r),
+            coffee_id=coffee_id
+        )
+        
+        return results
+    
+    def _get_async_hash_computer(self) -> AsyncImageHashComputer:
+        """
+        Get the async hash computer, creating one for the running loop if needed.
+        
+        An httpx client cannot be used from another event loop, so an owned
+        computer created in a previous loop is dropped and replaced.
+        """
+        if not self._owns_async_hash_computer:
+            return self.async_hash_computer
+        
+        loop = asyncio.get_running_loop()
+        if self.async_hash_computer is None or self._async_hash_computer_loop is not loop:
+            self.async_hash_computer = AsyncImageHashComputer(
+                timeout=self.hash_computer.timeout,
+                max_retries=self.hash_computer.max_retries,
+                cache=getattr(self.hash_computer, 'hash_cache', None)
+            )
+            self._async_hash_computer_loop = loop
+        return self.async_hash_computer
+    
+    async def aclose(self):
+        """Close the async hash computer if this service created it."""
+        if self._owns_async_hash_computer and self.async_hash_computer is not None:
+            if self._async_hash_computer_loop is asyncio.get_running_loop():
+                await self.async_hash_computer.aclose()
+            self.async_hash_computer = None
+            self._async_hash_computer_loop = None
+    
     def get_deduplication_stats(self) -> Dict[str, Any]:
         """
         Get deduplication statistics.
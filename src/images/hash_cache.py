@@ -0,0 +1,151 @@
+"""
+Persistent URL -> hash cache for image deduplication.
+
+Two tiers: an in-memory LRU in front of an optional SQLite file, so hashes
+survive process restarts and a re-run does not re-check every image.
+Entries are trusted for ``ttl`` seconds after they were last checked.
+Async callers use aget/aset, which run SQLite I/O in a worker thread.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_HASH_TTL = 7 * 24 * 3600
+
+
+class ImageHashCache:
+    """
+    Two-tier image hash cache keyed by image URL.
+
+    Lookups hit the in-memory LRU first and fall back to SQLite, promoting
+    entries found there. Entries older than the TTL are treated as misses so
+    the caller re-checks the image, but stay stored until overwritten.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        path: Optional[str] = None,
+        ttl: float = DEFAULT_HASH_TTL
+    ):
+        """
+        Initialize image hash cache.
+
+        Args:
+            max_size: Maximum entries kept in memory
+            path: SQLite file for the persistent tier (memory only if omitted)
+            ttl: Seconds an entry is trusted before the image is re-checked
+        """
+        self.max_size = max_size
+        self.path = path
+        self.ttl = ttl
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS image_hash_cache "
+                "(url TEXT PRIMARY KEY, content_hash TEXT NOT NULL, checked_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Get the cached hash for a URL.
+
+        Returns:
+            The hash, or None when missing or older than the TTL
+        """
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                self._memory.move_to_end(url)
+            elif self._conn is not None:
+                entry = self._load(url)
+                if entry is not None:
+                    self._remember(url, entry)
+
+        if entry is None or time.time() - entry[1] > self.ttl:
+            return None
+        return entry[0]
+
+    def set(self, url: str, content_hash: str):
+        """Store a freshly checked hash for a URL."""
+        entry = (content_hash, time.time())
+        with self._lock:
+            self._remember(url, entry)
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO image_hash_cache (url, content_hash, checked_at) VALUES (?, ?, ?)",
+                        (url, content_hash, entry[1])
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning("Image hash cache write failed", url=url, error=str(e))
+
+    async def aget(self, url: str) -> Optional[str]:
+        """Get the cached hash for a URL without blocking the event loop on SQLite."""
+        if self._conn is None or url in self._memory:
+            return self.get(url)
+        return await asyncio.to_thread(self.get, url)
+
+    async def aset(self, url: str, content_hash: str):
+        """Store a hash for a URL without blocking the event loop on SQLite."""
+        if self._conn is None:
+            self.set(url, content_hash)
+            return
+        await asyncio.to_thread(self.set, url, content_hash)
+
+    def clear(self):
+        """Clear both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM image_hash_cache")
+                self._conn.commit()
+
+    def close(self):
+        """Close the SQLite tier."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, url: str, entry: Tuple[str, float]):
+        # Least recently used entries are at the front
+        self._memory[url] = entry
+        self._memory.move_to_end(url)
+        while len(self._memory) > max(self.max_size, 0):
+            self._memory.popitem(last=False)
+
+    def _load(self, url: str) -> Optional[Tuple[str, float]]:
+        try:
+            row = self._conn.execute(
+                "SELECT content_hash, checked_at FROM image_hash_cache WHERE url = ?", (url,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Image hash cache read failed", url=url, error=str(e))
+            return None
+        return (row[0], row[1]) if row else None
@@ -5,15 +5,23 @@ This module provides SHA256 hash computation from image content and headers
 for efficient image deduplication across the coffee pipeline.
 """
 
+import asyncio
 import hashlib
+import importlib.util
 import requests
+import httpx
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
 import time
 from structlog import get_logger
 
+from .hash_cache import ImageHashCache
+
 logger = get_logger(__name__)
 
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class ImageHashComputationError(Exception):
     """Exception raised for image hash computation errors."""
@@ -32,13 +40,14 @@ class ImageHashComputer:
     - Performance monitoring and caching
     """
     
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, timeout: int = 30, max_retries: int = 3, cache: Optional[ImageHashCache] = None):
         """
         Initialize image hash computer.
         
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            cache: URL -> hash cache (in-memory LRU only if omitted)
         """
         self.timeout = timeout
         self.max_retries = max_retries
@@ -53,9 +62,16 @@ class ImageHashComputer:
             'total_processing_time': 0.0
         }
         
-        # In-memory cache for frequently accessed hashes
-        self.hash_cache: Dict[str, str] = {}
-        self.cache_max_size = 1000
+        # LRU cache (optionally persistent) for previously checked images
+        self.hash_cache = cache if cache is not None else ImageHashCache(max_size=1000)
+    
+    @property
+    def cache_max_size(self) -> int:
+        return self.hash_cache.max_size
+    
+    @cache_max_size.setter
+    def cache_max_size(self, value: int):
+        self.hash_cache.max_size = value
     
     def compute_image_hash(
         self, 
@@ -80,11 +96,12 @@ class ImageHashComputer:
         start_time = time.time()
         
         try:
-            # Check cache first
-            if use_cache and image_url in self.hash_cache:
+            # Check cache first (entries past their TTL are re-checked)
+            cached_hash = self.hash_cache.get(image_url) if use_cache else None
+            if cached_hash:
                 self.stats['cache_hits'] += 1
                 logger.debug("Hash cache hit", image_url=image_url)
-                return self.hash_cache[image_url]
+                return cached_hash
             
             # Try content-based hashing first
             if content:
@@ -240,18 +257,13 @@ class ImageHashComputer:
     
     def _update_cache(self, image_url: str, hash_result: str):
         """
-        Update hash cache with size management.
+        Update hash cache; the least recently used entry is evicted when full.
         
         Args:
             image_url: Image URL
             hash_result: Computed hash
         """
-        # Remove oldest entries if cache is full
-        while len(self.hash_cache) >= self.cache_max_size:
-            if self.hash_cache:
-                self.hash_cache.pop(next(iter(self.hash_cache)))
-        
-        self.hash_cache[image_url] = hash_result
+        self.hash_cache.set(image_url, hash_result)
     
     def compute_batch_hashes(
         self, 
@@ -367,3 +379,242 @@ class ImageHashComputer:
         """Clear the hash cache."""
         self.hash_cache.clear()
         logger.info("Hash cache cleared")
+
+
+class AsyncImageHashComputer:
+    """
+    Async counterpart of ImageHashComputer for batch hashing.
+    
+    Features:
+    - One shared httpx client (HTTP/2 when available) for all requests
+    - Bounded concurrent HEAD/GET requests
+    - Header-based hashes identical to ImageHashComputer, so stored hashes match
+    - Content fallback that streams the body through SHA256 instead of buffering it
+    """
+    
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        max_concurrency: int = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[ImageHashCache] = None
+    ):
+        """
+        Initialize async image hash computer.
+        
+        Args:
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts for failed requests
+            max_concurrency: Maximum in-flight image requests
+            client: Shared httpx client (created lazily if omitted)
+            cache: URL -> hash cache, e.g. shared with an ImageHashComputer
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_concurrency = max(1, max_concurrency)
+        self._client = client
+        self._owns_client = client is None
+        
+        self.stats = {
+            'content_hashes_computed': 0,
+            'header_hashes_computed': 0,
+            'failed_computations': 0,
+            'cache_hits': 0,
+            'total_processing_time': 0.0
+        }
+        
+        self.hash_cache = cache if cache is not None else ImageHashCache(max_size=1000)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                http2=HTTP2_AVAILABLE,
+                follow_redirects=True
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the HTTP client if this computer created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def compute_image_hash(self, image_url: str, use_cache: bool = True) -> str:
+        """
+        Compute SHA256 hash from image headers, falling back to streamed content.
+        
+        Args:
+            image_url: URL of the image
+            use_cache: Whether to use cache for hash lookup
+            
+        Returns:
+            SHA256 hash as hexadecimal string
+            
+        Raises:
+            ImageHashComputationError: If hash computation fails
+        """
+        start_time = time.time()
+        
+        cached_hash = await self.hash_cache.aget(image_url) if use_cache else None
+        if cached_hash:
+            self.stats['cache_hits'] += 1
+            return cached_hash
+        
+        try:
+            response = await self._request_with_retry('HEAD', image_url)
+            etag = response.headers.get('ETag', '').strip('"')
+            last_modified = response.headers.get('Last-Modified', '')
+            
+            if etag or last_modified:
+                hash_result = hashlib.sha256(f"{etag}:{last_modified}".encode('utf-8')).hexdigest()
+                self.stats['header_hashes_computed'] += 1
+            else:
+                hash_result = await self._stream_content_hash(image_url)
+                self.stats['content_hashes_computed'] += 1
+            
+        except Exception as e:
+            self.stats['failed_computations'] += 1
+            logger.error("Failed to compute image hash", image_url=image_url, error=str(e))
+            raise ImageHashComputationError(
+                f"Failed to compute hash for image {image_url}: {str(e)}"
+            )
+        
+        if use_cache:
+            await self.hash_cache.aset(image_url, hash_result)
+        
+        self.stats['total_processing_time'] += time.time() - start_time
+        return hash_result
+    
+    async def _stream_content_hash(self, image_url: str) -> str:
+        """Hash the response body chunk by chunk without holding it in memory."""
+        last_exception = None
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                hash_obj = hashlib.sha256()
+                size = 0
+                async with self._get_client().stream('GET', image_url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes():
+                        hash_obj.update(chunk)
+                        size += len(chunk)
+                
+                if not size:
+                    raise ImageHashComputationError("Empty image content provided")
+                return hash_obj.hexdigest()
+                
+            except ImageHashComputationError:
+                raise
+            except Exception as e:
+                last_exception = e
+                if attempt < self.max_retries:
+                    await asyncio.sleep(2 ** attempt)
+        
+        raise ImageHashComputationError(
+            f"Failed to fetch {image_url} after {self.max_retries} retries: {str(last_exception)}"
+        )
+    
+    async def _request_with_retry(self, method: str, url: str) -> httpx.Response:
+        """
+        Make HTTP request with retry logic and async backoff.
+        
+        Raises:
+            ImageHashComputationError: If all retry attempts fail
+        """
+        last_exception = None
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._get_client().request(method, url)
+                response.raise_for_status()
+                return response
+                
+            except Exception as e:
+                last_exception = e
+                
+                if attempt < self.max_retries:
+                    delay = 2 ** attempt
+                    logger.warning(
+                        "Request failed, retrying after delay",
+                        url=url,
+                        attempt=attempt + 1,
+                        delay=delay,
+                        error=str(e)
+                    )
+                    await asyncio.sleep(delay)
+        
+        raise ImageHashComputationError(
+            f"Failed to fetch {url} after {self.max_retries} retries: {str(last_exception)}"
+        )
+    
+    async def compute_batch_hashes(
+        self,
+        image_urls: List[str],
+        use_cache: bool = True
+    ) -> Dict[str, str]:
+        """
+        Compute hashes for multiple images concurrently.
+        
+        Args:
+            image_urls: List of image URLs
+            use_cache: Whether to use cache for hash lookup
+            
+        Returns:
+            Dictionary mapping image URLs to their hashes (failed URLs omitted)
+        """
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        unique_urls = list(dict.fromkeys(image_urls))
+        
+        async def compute(image_url: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await self.compute_image_hash(image_url, use_cache=use_cache)
+                except ImageHashComputationError as e:
+                    logger.warning(
+                        "Failed to compute hash for image in batch",
+                        image_url=image_url,
+                        error=str(e)
+                    )
+                    return None
+        
+        hashes = await asyncio.gather(*(compute(url) for url in unique_urls))
+        results = {url: hash_result for url, hash_result in zip(unique_urls, hashes) if hash_result}
+        
+        logger.info(
+            "Async batch hash computation completed",
+            total_images=len(unique_urls),
+            successful=len(results),
+            failed=len(unique_urls) - len(results),
+            processing_time=time.time() - start_time
+        )
+        
+        return results
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get performance statistics."""
+        stats = self.stats.copy()
+        stats['cache_size'] = len(self.hash_cache)
+        return stats
+    
+    def reset_stats(self):
+        """Reset performance statistics."""
+        self.stats = {
+            'content_hashes_computed': 0,
+            'header_hashes_computed': 0,
+            'failed_computations': 0,
+            'cache_hits': 0,
+            'total_processing_time': 0.0
+        }
@@ -10,7 +10,9 @@ from typing import Dict, Any, List, Optional, Tuple
 from structlog import get_logger
 
 from .imagekit_service import ImageKitService
+from .imagekit_uploader import ImageKitBatchUploader
 from .deduplication_service import ImageDeduplicationService
+from .performance_monitor import ImagePerformanceMonitor
 from ..config.imagekit_config import ImageKitConfig, ImageKitResult, BatchUploadConfig
 from .logging_config import get_image_deduplication_logger
 from ..validator.rpc_client import RPCClient
@@ -35,7 +37,8 @@ class ImageKitIntegrationService:
         rpc_client: RPCClient,
         imagekit_config: ImageKitConfig,
         enable_deduplication: bool = True,
-        enable_imagekit: bool = True
+        enable_imagekit: bool = True,
+        monitor: Optional[ImagePerformanceMonitor] = None
     ):
         """
         Initialize ImageKit integration service.
@@ -45,11 +48,13 @@ class ImageKitIntegrationService:
             imagekit_config: ImageKit configuration
             enable_deduplication: Whether to enable F.1 deduplication
             enable_imagekit: Whether to enable ImageKit upload
+            monitor: Performance monitor receiving batch upload throughput
         """
         self.rpc_client = rpc_client
         self.imagekit_config = imagekit_config
         self.enable_deduplication = enable_deduplication
         self.enable_imagekit = enable_imagekit
+        self.monitor = monitor or ImagePerformanceMonitor(enable_system_monitoring=False)
         
         # Initialize services
         self.imagekit_service = ImageKitService(imagekit_config) if enable_imagekit else None
@@ -287,6 +292,114 @@ class ImageKitIntegrationService:
         
         return results
     
+    async def process_batch_with_imagekit_async(
+        self,
+        images_data: List[Dict[str, Any]],
+        coffee_id: str,
+        batch_config: Optional[BatchUploadConfig] = None,
+        uploader: Optional[ImageKitBatchUploader] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process multiple images with concurrent deduplication and uploads.
+        
+        Hashes are resolved with one batched lookup, then non-duplicate images
+        are uploaded ``batch_config.max_concurrent`` at a time. Results have
+        the same shape as process_batch_with_imagekit.
+        
+        Args:
+            images_data: List of image data dictionaries
+            coffee_id: Coffee ID for the images
+            batch_config: Batch upload configuration
+            uploader: Batch uploader (one is created from batch_config if omitted)
+            
+        Returns:
+            List of processed image data with ImageKit and deduplication information
+        """
+        start_time = time.time()
+        batch_config = batch_config or BatchUploadConfig()
+        
+        if self.enable_deduplication and self.deduplication_service:
+            processed = await self.deduplication_service.process_batch_with_deduplication_async(
+                images_data, coffee_id
+            )
+        else:
+            processed = [image_data.copy() for image_data in images_data]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(processed)
+        to_upload: List[Tuple[int, Dict[str, Any]]] = []
+        
+        for index, data in enumerate(processed):
+            if data.get('deduplication_status') == 'error':
+                results[index] = {
+                    **images_data[index],
+                    'integration_status': 'error',
+                    'integration_error': data.get('error'),
+                    'fallback_url': data.get('url')
+                }
+            elif data.get('is_duplicate', False):
+                self.stats['duplicates_skipped'] += 1
+                results[index] = {**data, 'imagekit_upload_skipped': True, 'reason': 'duplicate_found'}
+            elif self.enable_imagekit and self.imagekit_service:
+                to_upload.append((index, data))
+            else:
+                results[index] = {**data, 'imagekit_disabled': True, 'fallback_url': data.get('url')}
+        
+        if to_upload:
+            owns_uploader = uploader is None
+            uploader = uploader or ImageKitBatchUploader(
+                self.imagekit_service,
+                max_concurrent=batch_config.max_concurrent,
+                monitor=self.monitor
+            )
+            # Concurrent batches record into the session opened by the first one
+            owns_session = self.monitor.current_metrics is None
+            if owns_session:
+                self.monitor.start_monitoring()
+            try:
+                upload_results = await uploader.upload_batch([data for _, data in to_upload])
+            finally:
+                if owns_uploader:
+                    await uploader.aclose()
+                if owns_session:
+                    self.monitor.stop_monitoring()
+            
+            for (index, data), upload_result in zip(to_upload, upload_results):
+                if upload_result.success:
+                    self.stats['imagekit_uploads'] += 1
+                    data['imagekit_url'] = upload_result.imagekit_url
+                    data['imagekit_file_id'] = upload_result.file_id
+                    data['imagekit_upload_time'] = upload_result.upload_time
+                else:
+                    self.stats['imagekit_failures'] += 1
+                    self.stats['fallback_used'] += 1
+                    data['imagekit_upload_failed'] = True
+                    data['imagekit_error'] = upload_result.error
+                    data['fallback_url'] = data.get('url')
+                results[index] = data
+        
+        processing_time = time.time() - start_time
+        for result in results:
+            result.setdefault('integration_status', 'completed')
+        self.stats['images_processed'] += len(results)
+        self.stats['total_processing_time'] += processing_time
+        
+        logger.info(
+            "Async batch ImageKit integration processing completed",
+            total_images=len(images_data),
+            uploaded=len(to_upload),
+            duplicates_skipped=sum(1 for r in results if r.get('imagekit_upload_skipped', False)),
+            imagekit_failures=sum(1 for r in results if r.get('imagekit_upload_failed', False)),
+            processing_time=processing_time,
+            coffee_id=coffee_id
+        )
+        
+        return results
+    
+    async def aclose(self):
+        """Close HTTP clients held by the deduplication service."""
+        if self.deduplication_service:
+            await self.deduplication_service.aclose()
+    
     def get_integration_stats(self) -> Dict[str, Any]:
         """
         Get integration service statistics.
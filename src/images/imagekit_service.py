@@ -5,8 +5,9 @@ Provides ImageKit CDN integration with retry logic, batch processing,
 and comprehensive error handling for the coffee pipeline.
 """
 
+import asyncio
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union, BinaryIO
 from structlog import get_logger
 from imagekitio import ImageKit
 from imagekitio.models.UploadFileRequestOptions import UploadFileRequestOptions
@@ -154,6 +155,90 @@ class ImageKitService:
                     )
                     return ImageKitResult(success=False, error=str(last_exception))
     
+    async def upload_image_async(
+        self,
+        image_url: str,
+        file: Union[bytes, str, BinaryIO],
+        file_name: Optional[str] = None,
+        max_retries: Optional[int] = None
+    ) -> ImageKitResult:
+        """
+        Upload image to ImageKit without blocking the event loop.
+        
+        The SDK call runs on a worker thread and retries back off with
+        asyncio.sleep.
+        
+        Args:
+            image_url: The original URL of the image (for logging/filename generation).
+            file: Image bytes, an open binary file (rewound before each attempt),
+                or a URL for ImageKit to fetch itself.
+            file_name: Optional, specific filename for ImageKit. If None, one is generated.
+            max_retries: Override the service's retry count for this upload.
+        
+        Returns:
+            An ImageKitResult object indicating success or failure.
+        """
+        if not self.config.enabled:
+            return ImageKitResult(success=False, error="ImageKit upload disabled")
+        
+        retries = self.max_retries if max_retries is None else max_retries
+        upload_file_name = file_name if file_name else self._generate_filename(image_url)
+        options = UploadFileRequestOptions(
+            folder=self.config.folder,
+            use_unique_file_name=True,
+            transformation=self.config.default_transformation
+        )
+        
+        self.stats['uploads_attempted'] += 1
+        start_time = time.time()
+        last_exception = None
+        
+        for attempt in range(retries + 1):
+            try:
+                if hasattr(file, 'seek'):
+                    file.seek(0)
+                result = await asyncio.to_thread(
+                    self.client.upload_file,
+                    file=file,
+                    file_name=upload_file_name,
+                    options=options
+                )
+                
+                processing_time = time.time() - start_time
+                self.stats['uploads_successful'] += 1
+                self.stats['total_upload_time'] += processing_time
+                return ImageKitResult(
+                    success=True,
+                    imagekit_url=result.url,
+                    file_id=getattr(result, 'file_id', None) or getattr(result, 'fileId', None),
+                    original_url=image_url,
+                    upload_time=processing_time,
+                    size=getattr(result, 'size', None)
+                )
+                
+            except Exception as e:
+                last_exception = e
+                if attempt < retries:
+                    delay = self.backoff_factor ** attempt
+                    logger.warning(
+                        "ImageKit upload failed, retrying",
+                        image_url=image_url,
+                        attempt=attempt + 1,
+                        delay=delay,
+                        error=str(e)
+                    )
+                    await asyncio.sleep(delay)
+        
+        processing_time = time.time() - start_time
+        self.stats['uploads_failed'] += 1
+        self.stats['total_upload_time'] += processing_time
+        return ImageKitResult(
+            success=False,
+            error=str(last_exception),
+            original_url=image_url,
+            upload_time=processing_time
+        )
+    
     def _generate_filename(self, original_url: str) -> str:
         """Generates a filename for ImageKit based on the original URL."""
         # Simple approach: use the last part of the URL, ensure it's unique
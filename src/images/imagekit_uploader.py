@@ -0,0 +1,174 @@
+"""
+Concurrent ImageKit batch uploader.
+
+Uploads many images at once without holding every image in memory:
+- ImageKit fetches the source URL itself when it can
+- Otherwise the source is streamed to a temporary spool file and uploaded from disk
+- Uploads run concurrently with non-blocking backoff
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+from structlog import get_logger
+
+from .imagekit_service import ImageKitService
+from .performance_monitor import ImagePerformanceMonitor
+from ..config.imagekit_config import ImageKitResult
+
+logger = get_logger(__name__)
+
+
+class ImageKitBatchUploader:
+    """
+    Upload images to ImageKit concurrently.
+
+    Each image is uploaded from, in order of preference:
+    1. ``content`` bytes already present in the image data
+    2. its source URL, fetched by ImageKit directly (``remote_fetch``)
+    3. a spool file the source was streamed into chunk by chunk
+
+    At most ``max_concurrent`` uploads (and their downloads) run at once.
+    """
+
+    def __init__(
+        self,
+        imagekit_service: ImageKitService,
+        max_concurrent: int = 5,
+        remote_fetch: bool = True,
+        spool_dir: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        monitor: Optional[ImagePerformanceMonitor] = None,
+        timeout: float = 30.0
+    ):
+        """
+        Initialize batch uploader.
+
+        Args:
+            imagekit_service: ImageKit service performing the uploads
+            max_concurrent: Maximum uploads in flight
+            remote_fetch: Let ImageKit fetch source URLs before downloading them ourselves
+            spool_dir: Directory for temporary spool files (system default if omitted)
+            client: httpx client for source downloads (created lazily if omitted)
+            monitor: Performance monitor receiving upload throughput
+            timeout: Source download timeout in seconds
+        """
+        self.imagekit_service = imagekit_service
+        self.max_concurrent = max(1, max_concurrent)
+        self.remote_fetch = remote_fetch
+        self.spool_dir = spool_dir
+        self.monitor = monitor
+        self.timeout = timeout
+        self._client = client
+        self._owns_client = client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(max_connections=self.max_concurrent),
+                follow_redirects=True
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the download client if this uploader created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def upload(self, image_data: Dict[str, Any]) -> ImageKitResult:
+        """
+        Upload one image.
+
+        Args:
+            image_data: Image data with ``url`` and optional ``content``/``filename``
+
+        Returns:
+            ImageKitResult for the upload
+        """
+        image_url = image_data.get('url')
+        file_name = image_data.get('filename')
+        content = image_data.get('content')
+        start_time = time.time()
+        size = len(content) if content else 0
+
+        if content:
+            result = await self.imagekit_service.upload_image_async(image_url, content, file_name)
+        else:
+            result = None
+            if self.remote_fetch:
+                # Single attempt: on failure fall back to uploading the bytes ourselves
+                result = await self.imagekit_service.upload_image_async(
+                    image_url, image_url, file_name, max_retries=0
+                )
+            if result is None or not result.success:
+                result, size = await self._upload_spooled(image_url, file_name)
+
+        if self.monitor:
+            self.monitor.record_upload(
+                size_bytes=result.size or size,
+                duration=time.time() - start_time,
+                success=result.success
+            )
+        return result
+
+    async def _upload_spooled(self, image_url: str, file_name: Optional[str]):
+        """Stream the source into a temporary file and upload it from disk."""
+        fd, path = tempfile.mkstemp(prefix="imagekit-", dir=self.spool_dir)
+        try:
+            size = 0
+            try:
+                with os.fdopen(fd, 'wb') as spool:
+                    async with self._get_client().stream('GET', image_url) as response:
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes():
+                            spool.write(chunk)
+                            size += len(chunk)
+            except Exception as e:
+                logger.warning("Failed to download image for upload", image_url=image_url, error=str(e))
+                return ImageKitResult(success=False, error=str(e), original_url=image_url), 0
+
+            with open(path, 'rb') as spool:
+                result = await self.imagekit_service.upload_image_async(image_url, spool, file_name)
+            return result, size
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+
+    async def upload_batch(self, images_data: List[Dict[str, Any]]) -> List[ImageKitResult]:
+        """
+        Upload images concurrently.
+
+        Args:
+            images_data: Image data dictionaries
+
+        Returns:
+            One ImageKitResult per image, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def upload_one(image_data: Dict[str, Any]) -> ImageKitResult:
+            async with semaphore:
+                try:
+                    return await self.upload(image_data)
+                except Exception as e:
+                    logger.error("Image upload failed", image_url=image_data.get('url'), error=str(e))
+                    return ImageKitResult(success=False, error=str(e), original_url=image_data.get('url'))
+
+        start_time = time.time()
+        results = await asyncio.gather(*(upload_one(image_data) for image_data in images_data))
+
+        logger.info(
+            "Batch ImageKit upload completed",
+            total_images=len(images_data),
+            successful=sum(1 for r in results if r.success),
+            failed=sum(1 for r in results if not r.success),
+            processing_time=time.time() - start_time,
+            max_concurrent=self.max_concurrent
+        )
+        return list(results)
@@ -7,11 +7,14 @@ recommendations for image hash computation and deduplication operations.
 
 import time
 import psutil
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from structlog import get_logger
 
+from ..monitoring.timeseries import RingBuffer
+
 logger = get_logger(__name__)
 
 
@@ -35,6 +38,8 @@ class PerformanceMetrics:
     avg_processing_time: float = 0.0
     max_processing_time: float = 0.0
     min_processing_time: float = float('inf')
+    p50_processing_time: float = 0.0
+    p95_processing_time: float = 0.0
     
     # System metrics
     memory_usage_mb: float = 0.0
@@ -45,6 +50,14 @@ class PerformanceMetrics:
     cache_misses: int = 0
     cache_hit_rate: float = 0.0
     
+    # Upload metrics
+    uploads_completed: int = 0
+    uploads_failed: int = 0
+    bytes_uploaded: int = 0
+    upload_time_total: float = 0.0
+    uploads_per_second: float = 0.0
+    upload_throughput_bytes_per_sec: float = 0.0
+    
     def calculate_metrics(self):
         """Calculate derived metrics."""
         if self.end_time is None:
@@ -61,6 +74,11 @@ class PerformanceMetrics:
         total_cache_requests = self.cache_hits + self.cache_misses
         if total_cache_requests > 0:
             self.cache_hit_rate = self.cache_hits / total_cache_requests
+        
+        # Wall-clock throughput, so concurrent uploads show up as higher rates
+        if self.total_duration > 0:
+            self.uploads_per_second = self.uploads_completed / self.total_duration
+            self.upload_throughput_bytes_per_sec = self.bytes_uploaded / self.total_duration
 
 
 class ImagePerformanceMonitor:
@@ -75,16 +93,24 @@ class ImagePerformanceMonitor:
     - Memory usage tracking
     """
     
-    def __init__(self, enable_system_monitoring: bool = True):
+    def __init__(
+        self,
+        enable_system_monitoring: bool = True,
+        history_size: int = 100,
+        sample_size: int = 1000
+    ):
         """
         Initialize performance monitor.
         
         Args:
             enable_system_monitoring: Whether to monitor system resources
+            history_size: Number of most recent sessions kept in history
+            sample_size: Number of most recent per-image processing times kept for percentiles
         """
         self.enable_system_monitoring = enable_system_monitoring
-        self.metrics_history: List[PerformanceMetrics] = []
+        self.metrics_history: Deque[PerformanceMetrics] = deque(maxlen=history_size)
         self.current_metrics: Optional[PerformanceMetrics] = None
+        self.processing_times = RingBuffer(sample_size)
         
         # Performance thresholds
         self.thresholds = {
@@ -102,6 +128,7 @@ class ImagePerformanceMonitor:
             PerformanceMetrics instance for tracking
         """
         self.current_metrics = PerformanceMetrics()
+        self.processing_times.clear()
         
         if self.enable_system_monitoring:
             self._update_system_metrics()
@@ -121,6 +148,8 @@ class ImagePerformanceMonitor:
         
         self.current_metrics.end_time = time.time()
         self.current_metrics.calculate_metrics()
+        self.current_metrics.p50_processing_time = self.processing_times.percentile(50)
+        self.current_metrics.p95_processing_time = self.processing_times.percentile(95)
         
         if self.enable_system_monitoring:
             self._update_system_metrics()
@@ -163,6 +192,7 @@ class ImagePerformanceMonitor:
             self.current_metrics.errors += 1
         
         # Update timing metrics
+        self.processing_times.append(processing_time)
         self.current_metrics.max_processing_time = max(
             self.current_metrics.max_processing_time, processing_time
         )
@@ -170,6 +200,25 @@ class ImagePerformanceMonitor:
             self.current_metrics.min_processing_time, processing_time
         )
     
+    def record_upload(self, size_bytes: int, duration: float, success: bool = True):
+        """
+        Record a single image upload.
+        
+        Args:
+            size_bytes: Bytes uploaded (0 if unknown)
+            duration: Time taken by the upload, including retries
+            success: Whether the upload succeeded
+        """
+        if self.current_metrics is None:
+            return
+        
+        if success:
+            self.current_metrics.uploads_completed += 1
+            self.current_metrics.bytes_uploaded += size_bytes
+        else:
+            self.current_metrics.uploads_failed += 1
+        self.current_metrics.upload_time_total += duration
+    
     def record_cache_hit(self):
         """Record a cache hit."""
         if self.current_metrics is None:
@@ -229,9 +278,15 @@ class ImagePerformanceMonitor:
             avg_processing_time=metrics.avg_processing_time,
             max_processing_time=metrics.max_processing_time,
             min_processing_time=metrics.min_processing_time,
+            p50_processing_time=metrics.p50_processing_time,
+            p95_processing_time=metrics.p95_processing_time,
             memory_usage_mb=metrics.memory_usage_mb,
             cpu_usage_percent=metrics.cpu_usage_percent,
-            cache_hit_rate=metrics.cache_hit_rate
+            cache_hit_rate=metrics.cache_hit_rate,
+            uploads_completed=metrics.uploads_completed,
+            uploads_failed=metrics.uploads_failed,
+            uploads_per_second=metrics.uploads_per_second,
+            upload_throughput_bytes_per_sec=metrics.upload_throughput_bytes_per_sec
         )
     
     def _check_performance_thresholds(self):
@@ -328,11 +383,14 @@ class ImagePerformanceMonitor:
         total_duplicates = sum(m.duplicates_found for m in self.metrics_history)
         total_errors = sum(m.errors for m in self.metrics_history)
         total_duration = sum(m.total_duration for m in self.metrics_history)
+        total_uploads = sum(m.uploads_completed for m in self.metrics_history)
+        total_bytes_uploaded = sum(m.bytes_uploaded for m in self.metrics_history)
         
         # Calculate averages
         avg_processing_time = sum(m.avg_processing_time for m in self.metrics_history) / len(self.metrics_history)
         avg_memory_usage = sum(m.memory_usage_mb for m in self.metrics_history) / len(self.metrics_history)
         avg_cache_hit_rate = sum(m.cache_hit_rate for m in self.metrics_history) / len(self.metrics_history)
+        latest = self.metrics_history[-1]
         
         return {
             'total_sessions': len(self.metrics_history),
@@ -341,10 +399,16 @@ class ImagePerformanceMonitor:
             'total_errors': total_errors,
             'total_duration': total_duration,
             'avg_processing_time': avg_processing_time,
+            'last_p50_processing_time': latest.p50_processing_time,
+            'last_p95_processing_time': latest.p95_processing_time,
             'avg_memory_usage_mb': avg_memory_usage,
             'avg_cache_hit_rate': avg_cache_hit_rate,
             'duplicate_rate': total_duplicates / total_images if total_images > 0 else 0,
             'error_rate': total_errors / total_images if total_images > 0 else 0,
+            'total_uploads': total_uploads,
+            'total_bytes_uploaded': total_bytes_uploaded,
+            'uploads_per_second': total_uploads / total_duration if total_duration > 0 else 0,
+            'upload_throughput_bytes_per_sec': total_bytes_uploaded / total_duration if total_duration > 0 else 0,
             'recommendations': self.get_performance_recommendations()
         }
     
@@ -1,7 +1,12 @@
 """Caching service for LLM results with Redis/database backend."""
 
+import asyncio
 import json
-from typing import Optional, Any, Dict
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional, Any, Dict, Tuple
 from datetime import datetime, timedelta
 import structlog
 
@@ -14,21 +19,38 @@ logger = structlog.get_logger(__name__)
 class CacheService:
     """Service for caching LLM results with multiple backend support"""
     
-    def __init__(self, config: CacheConfig):
+    def __init__(self, config: CacheConfig, metrics=None):
         self.config = config
+        # Optional LLMServiceMetrics for per-tier hit/miss counters
+        self.metrics = metrics
         self.backend = self._initialize_backend(config)
     
     def _initialize_backend(self, config: CacheConfig):
-        """Initialize cache backend (Redis or database)"""
+        """Initialize cache backend (Redis, database, SQLite or SQLite over Redis)"""
         if config.backend == 'redis':
             return RedisBackend(config.redis_url)
         elif config.backend == 'database':
             return DatabaseBackend(config.db_config)
         elif config.backend == 'memory':
             return MemoryBackend()
+        elif config.backend == 'sqlite':
+            return SQLiteBackend(config.local_cache_path)
+        elif config.backend == 'tiered':
+            return TieredBackend(
+                SQLiteBackend(config.local_cache_path),
+                RedisBackend(config.redis_url),
+                on_lookup=self._record_lookup,
+                # Only for remote entries without a TTL; backfill normally copies the remote TTL
+                backfill_ttl=config.default_ttl
+            )
         else:
             raise ValueError(f"Unsupported cache backend: {config.backend}")
     
+    def _record_lookup(self, tier: str, hit: bool):
+        """Forward tier lookup outcome to metrics when attached"""
+        if self.metrics is not None:
+            self.metrics.record_cache_lookup(tier, hit)
+    
     async def get(self, key: str) -> Optional[LLMResult]:
         """Retrieve cached LLM result
         
@@ -40,6 +62,8 @@ class CacheService:
         """
         try:
             cached_data = await self.backend.get(key)
+            if not isinstance(self.backend, TieredBackend):
+                self._record_lookup(self.config.backend, bool(cached_data))
             if cached_data:
                 # Parse cached data back to LLMResult
                 data_dict = json.loads(cached_data) if isinstance(cached_data, str) else cached_data
@@ -52,14 +76,15 @@ class CacheService:
             logger.warning("cache_retrieval_failed", key=key, error=str(e))
             return None
     
-    async def set(self, key: str, result: LLMResult, ttl: int = 3600):
+    async def set(self, key: str, result: LLMResult, ttl: Optional[int] = None):
         """Store LLM result in cache
         
         Args:
             key: Cache key
             result: LLMResult to cache
-            ttl: Time to live in seconds (default 1 hour)
+            ttl: Time to live in seconds (defaults to config.default_ttl)
         """
+        ttl = self.config.default_ttl if ttl is None else ttl
         try:
             # Convert LLMResult to dict for storage
             data_dict = result.model_dump()
@@ -115,6 +140,13 @@ class MemoryBackend:
                 del self._cache[key]
         return None
     
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[str], Optional[int]]:
+        """Get value and its remaining TTL in seconds"""
+        value = await self.get(key)
+        if value is None:
+            return None, None
+        return value, max(0, int((self._cache[key][1] - datetime.now()).total_seconds()))
+    
     async def set(self, key: str, value: str, ttl: int = 3600):
         """Set value in memory cache"""
         expiry = datetime.now() + timedelta(seconds=ttl)
@@ -136,6 +168,167 @@ class MemoryBackend:
             self._cache.clear()
 
 
+class SQLiteBackend:
+    """Durable local cache tier backed by a SQLite file
+    
+    Survives process restarts so nightly re-runs on one worker hit the cache even when
+    Redis was flushed or is unavailable. Blocking sqlite3 calls run in a worker thread.
+    Expired rows are deleted on read and, at most every ``prune_interval`` seconds, in
+    bulk on write, so keys that are never read again do not grow the file forever.
+    """
+    
+    def __init__(self, path: str, prune_interval: float = 300.0):
+        self.path = path
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS llm_cache_expires_at ON llm_cache (expires_at)"
+            )
+            self._conn.commit()
+    
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return row[0]
+    
+    def _set(self, key: str, value: str, ttl: int):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + ttl)
+            )
+            if now - self._last_prune >= self.prune_interval:
+                self._delete_expired(now)
+            self._conn.commit()
+    
+    def _delete_expired(self, now: float) -> int:
+        """Delete expired rows; caller holds the lock and commits"""
+        self._last_prune = now
+        return self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+    
+    def _prune(self) -> int:
+        with self._lock:
+            deleted = self._delete_expired(time.time())
+            self._conn.commit()
+            return deleted
+    
+    def _delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._conn.commit()
+    
+    def _clear(self, pattern: Optional[str]):
+        with self._lock:
+            if pattern:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key LIKE ?", (pattern.replace('*', '%'),)
+                )
+            else:
+                self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+    
+    async def get(self, key: str) -> Optional[str]:
+        """Get value from SQLite cache"""
+        try:
+            return await asyncio.to_thread(self._get, key)
+        except sqlite3.Error as e:
+            logger.warning("SQLite cache get failed", key=key, error=str(e))
+            return None
+    
+    async def set(self, key: str, value: str, ttl: int = 3600):
+        """Set value in SQLite cache with TTL"""
+        try:
+            await asyncio.to_thread(self._set, key, value, ttl)
+        except sqlite3.Error as e:
+            logger.warning("SQLite cache set failed", key=key, error=str(e))
+    
+    async def delete(self, key: str):
+        """Delete key from SQLite cache"""
+        try:
+            await asyncio.to_thread(self._delete, key)
+        except sqlite3.Error as e:
+            logger.warning("SQLite cache delete failed", key=key, error=str(e))
+    
+    async def clear(self, pattern: Optional[str] = None):
+        """Clear cache entries matching pattern"""
+        try:
+            await asyncio.to_thread(self._clear, pattern)
+        except sqlite3.Error as e:
+            logger.warning("SQLite cache clear failed", pattern=pattern, error=str(e))
+    
+    async def prune(self) -> int:
+        """Delete all expired entries, returning how many were removed"""
+        try:
+            return await asyncio.to_thread(self._prune)
+        except sqlite3.Error as e:
+            logger.warning("SQLite cache prune failed", error=str(e))
+            return 0
+
+
+class TieredBackend:
+    """Two-tier cache: local tier checked first, remote tier shared across workers
+    
+    Remote hits are written back to the local tier with the remote entry's remaining
+    TTL, so both tiers expire together. ``backfill_ttl`` is only used when the remote
+    tier cannot report a TTL or the entry has none.
+    """
+    
+    def __init__(self, local, remote, on_lookup: Optional[Callable[[str, bool], None]] = None,
+                 backfill_ttl: int = 3600):
+        self.local = local
+        self.remote = remote
+        self.on_lookup = on_lookup or (lambda tier, hit: None)
+        self.backfill_ttl = backfill_ttl
+    
+    async def get(self, key: str) -> Optional[str]:
+        """Get value from local tier, falling back to remote"""
+        value = await self.local.get(key)
+        self.on_lookup('local', value is not None)
+        if value is not None:
+            return value
+        
+        get_with_ttl = getattr(self.remote, 'get_with_ttl', None)
+        if get_with_ttl is not None:
+            value, ttl = await get_with_ttl(key)
+        else:
+            value, ttl = await self.remote.get(key), None
+        self.on_lookup('remote', value is not None)
+        if value is not None:
+            await self.local.set(key, value, ttl=self.backfill_ttl if ttl is None else ttl)
+        return value
+    
+    async def set(self, key: str, value: str, ttl: int = 3600):
+        """Write value to both tiers"""
+        await asyncio.gather(self.local.set(key, value, ttl=ttl), self.remote.set(key, value, ttl=ttl))
+    
+    async def delete(self, key: str):
+        """Delete key from both tiers"""
+        await asyncio.gather(self.local.delete(key), self.remote.delete(key))
+    
+    async def clear(self, pattern: Optional[str] = None):
+        """Clear matching entries from both tiers"""
+        await asyncio.gather(self.local.clear(pattern), self.remote.clear(pattern))
+
+
 class RedisBackend:
     """Redis cache backend implementation"""
     
@@ -167,6 +360,20 @@ class RedisBackend:
             logger.warning("Redis get failed", key=key, error=str(e))
             return None
     
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[str], Optional[int]]:
+        """Get value and its remaining TTL in seconds (None when the key has no expiry)"""
+        try:
+            if not self._client:
+                self._initialize_client()
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.ttl(key)
+                value, ttl = await pipe.execute()
+            return value, (ttl if value is not None and ttl >= 0 else None)
+        except Exception as e:
+            logger.warning("Redis get failed", key=key, error=str(e))
+            return None, None
+    
     async def set(self, key: str, value: str, ttl: int = 3600):
         """Set value in Redis cache with TTL"""
         try:
@@ -2,6 +2,8 @@
 
 import time
 import asyncio
+import hashlib
+import json
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 import structlog
@@ -15,6 +17,13 @@ from src.llm.llm_metrics import LLMServiceMetrics
 
 logger = structlog.get_logger(__name__)
 
+# Artifact fields that can influence an answer; everything else (scrape timestamps,
+# raw payload hashes, ids) is excluded from the cache key so it survives re-scrapes.
+PROMPT_INPUT_FIELDS = ('title', 'name', 'description', 'description_html', 'body_html', 'tags', 'product_type')
+
+# enrich_fields caches parsed per-field values, enrich_field caches raw model output
+MULTI_FIELD_CACHE_NAMESPACE = 'llm-multi'
+
 
 class LLMServiceError(Exception):
     """Base exception for LLM service errors"""
@@ -35,6 +44,8 @@ class DeepSeekWrapperService(LLMServiceInterface):
         self.cache_service = cache_service
         self.rate_limiter = rate_limiter
         self.metrics = metrics or LLMServiceMetrics()
+        if isinstance(cache_service, CacheService) and cache_service.metrics is None:
+            cache_service.metrics = self.metrics
         self._health_status = {
             'available': True,
             'last_success': None,
@@ -73,7 +84,7 @@ class DeepSeekWrapperService(LLMServiceInterface):
         
         try:
             # Generate cache key
-            cache_key = self._generate_cache_key(artifact, field)
+            cache_key = self._generate_cache_key(artifact, field, prompt)
             
             # Check cache first
             cached_result = await self.cache_service.get(cache_key)
@@ -86,7 +97,7 @@ class DeepSeekWrapperService(LLMServiceInterface):
             
             # Check rate limits
             roaster_id = artifact.get('roaster_id', 'unknown')
-            if not self.rate_limiter.can_make_request(roaster_id):
+            if not await self.rate_limiter.acquire(roaster_id, timeout=self.config.rate_limit_wait):
                 logger.warning("rate_limit_exceeded", roaster_id=roaster_id, field=field)
                 # Record rate limit hit
                 self.metrics.record_rate_limit_hit(roaster_id)
@@ -99,7 +110,7 @@ class DeepSeekWrapperService(LLMServiceInterface):
             confidence = result.confidence
             
             # Cache successful result
-            await self.cache_service.set(cache_key, result, ttl=self.config.timeout)
+            await self.cache_service.set(cache_key, result, ttl=self.config.cache_ttl)
             
             return result
         
@@ -122,9 +133,96 @@ class DeepSeekWrapperService(LLMServiceInterface):
                 consecutive_failures=self._health_status['consecutive_failures']
             )
     
+    async def enrich_fields(self, artifact: Dict, prompts: Dict[str, str]) -> Dict[str, LLMResult]:
+        """Enrich several fields of one artifact with a single structured-output call
+        
+        Cached fields are served from cache; the remaining fields are combined into one
+        JSON-object prompt and the response is fanned back out per field. Fields the
+        model leaves out of its answer are omitted from the returned mapping.
+        
+        Args:
+            artifact: The artifact to enrich
+            prompts: Mapping of field name to field-specific instruction
+            
+        Returns:
+            Dictionary of field name to LLMResult
+            
+        Raises:
+            RateLimitExceededError: If rate limit is exceeded
+            LLMServiceError: For other service errors
+        """
+        if len(prompts) == 1:
+            field, prompt = next(iter(prompts.items()))
+            return {field: await self.enrich_field(artifact, field, prompt)}
+        
+        results: Dict[str, LLMResult] = {}
+        pending: Dict[str, str] = {}
+        for field, prompt in prompts.items():
+            cached_result = await self.cache_service.get(
+                self._generate_cache_key(artifact, field, prompt, namespace=MULTI_FIELD_CACHE_NAMESPACE)
+            )
+            if cached_result:
+                results[field] = cached_result
+                self.metrics.record_llm_call(
+                    duration=0.0, field=field, model=self.config.model, success=True,
+                    cache_hit=True, confidence=cached_result.confidence
+                )
+            else:
+                pending[field] = prompt
+        
+        if not pending:
+            return results
+        
+        roaster_id = artifact.get('roaster_id', 'unknown')
+        if not await self.rate_limiter.acquire(roaster_id, timeout=self.config.rate_limit_wait):
+            logger.warning("rate_limit_exceeded", roaster_id=roaster_id, fields=list(pending))
+            self.metrics.record_rate_limit_hit(roaster_id)
+            raise RateLimitExceededError(f"Rate limit exceeded for roaster {roaster_id}")
+        
+        start_time = time.time()
+        combined = await self._call_deepseek_with_retry(
+            artifact,
+            'multi_field',
+            self._build_multi_field_prompt(artifact, pending),
+            response_format={"type": "json_object"}
+        )
+        duration = time.time() - start_time
+        values = self._parse_multi_field_response(combined.value)
+        
+        # Spread the single call's cost evenly so per-field token metrics stay comparable
+        share = {k: v // len(pending) for k, v in combined.usage.items()}
+        for field in pending:
+            if field not in values:
+                logger.warning("multi_field_missing", field=field)
+                continue
+            result = LLMResult(
+                field=field,
+                value=values[field],
+                confidence=combined.confidence,
+                provider=combined.provider,
+                model=combined.model,
+                usage=share,
+                created_at=combined.created_at
+            )
+            results[field] = result
+            await self.cache_service.set(
+                self._generate_cache_key(artifact, field, pending[field], namespace=MULTI_FIELD_CACHE_NAMESPACE),
+                result,
+                ttl=self.config.cache_ttl
+            )
+            self.metrics.record_llm_call(
+                duration=duration, field=field, model=self.config.model, success=True,
+                cache_hit=False, tokens_used=share, confidence=result.confidence
+            )
+        
+        return results
+    
     async def batch_enrich(self, artifacts: List[Dict], fields: List[str]) -> List[LLMResult]:
         """Enrich multiple fields across multiple artifacts using DeepSeek API
         
+        Each artifact is enriched with one multi-field call; artifacts run concurrently,
+        bounded by ``config.max_concurrent_requests``.
+        
         Args:
             artifacts: List of artifacts to enrich
             fields: List of fields to enrich
@@ -132,24 +230,55 @@ class DeepSeekWrapperService(LLMServiceInterface):
         Returns:
             List of LLMResults for each enrichment
         """
-        results = []
-        for artifact in artifacts:
-            for field in fields:
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+        prompts = {field: f"Extract {field} from this coffee data" for field in fields}
+        
+        async def enrich_artifact(artifact: Dict) -> List[LLMResult]:
+            async with semaphore:
                 try:
-                    # Generate prompt for this field (would be customized per field)
-                    prompt = f"Extract {field} from this coffee data"
-                    result = await self.enrich_field(artifact, field, prompt)
-                    results.append(result)
+                    field_results = await self.enrich_fields(artifact, prompts)
                 except Exception as e:
-                    logger.error("batch_enrich_failed", field=field, error=str(e))
+                    logger.error("batch_enrich_failed", fields=fields, error=str(e))
                     # Continue processing other items even if one fails
-                    continue
+                    return []
+                return [field_results[field] for field in fields if field in field_results]
         
-        return results
+        per_artifact = await asyncio.gather(*(enrich_artifact(artifact) for artifact in artifacts))
+        return [result for results in per_artifact for result in results]
     
-    async def _call_deepseek_with_retry(self, artifact: Dict, field: str, prompt: str) -> LLMResult:
+    def _build_multi_field_prompt(self, artifact: Dict, prompts: Dict[str, str]) -> str:
+        """Build a structured-output prompt covering several fields of one product"""
+        product = artifact.get('product', artifact)
+        tags = product.get('tags') or []
+        if isinstance(tags, str):
+            tags = [tags]
+        instructions = "\n".join(f'- "{field}": {prompt}' for field, prompt in prompts.items())
+        
+        return f"""
+You are extracting attributes of a single coffee product.
+
+Product Name: {product.get('title') or product.get('name', '')}
+Description: {product.get('description') or product.get('description_html', '')}
+Tags: {', '.join(tags) if tags else 'None'}
+
+Respond with one JSON object containing exactly these keys:
+{instructions}
+"""
+    
+    def _parse_multi_field_response(self, content: Any) -> Dict[str, Any]:
+        """Parse the JSON object returned for a multi-field prompt"""
+        try:
+            parsed = json.loads(content) if isinstance(content, str) else content
+        except (TypeError, ValueError) as e:
+            logger.warning("multi_field_parse_failed", error=str(e))
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    
+    async def _call_deepseek_with_retry(self, artifact: Dict, field: str, prompt: str,
+                                        response_format: Optional[Dict[str, str]] = None) -> LLMResult:
         """Call DeepSeek API with retry logic for transient failures"""
         last_error = None
+        extra_params = {'response_format': response_format} if response_format else {}
         
         for attempt in range(self.config.retry_attempts):
             try:
@@ -161,7 +290,8 @@ class DeepSeekWrapperService(LLMServiceInterface):
                     model=self.config.model,
                     messages=[{"role": "user", "content": prompt}],
                     temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens
+                    max_tokens=self.config.max_tokens,
+                    **extra_params
                 )
                 
                 duration = time.time() - start_time
@@ -227,17 +357,23 @@ class DeepSeekWrapperService(LLMServiceInterface):
         self._health_status['available'] = self._health_status['consecutive_failures'] < 5
         raise LLMServiceError(f"DeepSeek API call failed after {self.config.retry_attempts} attempts: {last_error}")
     
-    def _generate_cache_key(self, artifact: Dict, field: str) -> str:
-        """Generate cache key using raw_payload_hash and field"""
-        raw_hash = artifact.get('raw_payload_hash', '')
-        if not raw_hash:
-            # Fallback: generate hash from artifact content
-            import hashlib
-            import json
-            content = json.dumps(artifact, sort_keys=True)
-            raw_hash = hashlib.sha256(content.encode()).hexdigest()
+    def _generate_cache_key(self, artifact: Dict, field: str, prompt: str = "", namespace: str = "llm") -> str:
+        """Generate a content-addressed cache key for one field
+        
+        The key hashes only the prompt-relevant product inputs plus the prompt, model and
+        prompt version, so volatile artifact metadata does not defeat caching while any
+        change to what the model would see produces a new key. Results of differently
+        shaped calls use separate namespaces so one never reads the other's values.
+        """
+        product = artifact.get('product', artifact)
+        inputs = {name: product.get(name) for name in PROMPT_INPUT_FIELDS if product.get(name)}
+        content = json.dumps(
+            {'inputs': inputs, 'prompt': prompt, 'field': field},
+            sort_keys=True, default=str
+        )
+        digest = hashlib.sha256(content.encode()).hexdigest()
         
-        return f"llm:{raw_hash}:{field}"
+        return f"{namespace}:{self.config.model}:{self.config.prompt_version}:{digest}:{field}"
     
     def get_confidence_threshold(self, field: str) -> float:
         """Get confidence threshold for specific field
@@ -1,5 +1,6 @@
 """Abstract interface for LLM service operations."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 from datetime import datetime
@@ -34,6 +35,23 @@ class LLMServiceInterface(ABC):
         """
         pass
     
+    async def enrich_fields(self, artifact: Dict, prompts: Dict[str, str]) -> Dict[str, LLMResult]:
+        """Enrich several fields of one artifact
+        
+        Default implementation runs enrich_field concurrently per field; providers that
+        support structured output should override it with a single combined call.
+        
+        Args:
+            artifact: The artifact to enrich
+            prompts: Mapping of field name to field-specific prompt
+            
+        Returns:
+            Dictionary of field name to LLMResult
+        """
+        fields = list(prompts)
+        results = await asyncio.gather(*(self.enrich_field(artifact, field, prompts[field]) for field in fields))
+        return dict(zip(fields, results))
+    
     @abstractmethod
     async def batch_enrich(self, artifacts: List[Dict], fields: List[str]) -> List[LLMResult]:
         """Enrich multiple fields across multiple artifacts using LLM API
@@ -60,6 +60,13 @@ class LLMServiceMetrics(PipelineMetrics):
             registry=self.registry
         )
         
+        self.llm_cache_lookups = Counter(
+            'deepseek_cache_lookups_total',
+            'DeepSeek result cache lookups by tier',
+            ['tier', 'result'],
+            registry=self.registry
+        )
+        
         self.llm_rate_limit_hits = Counter(
             'deepseek_rate_limit_hits_total',
             'DeepSeek API rate limit hits',
@@ -182,6 +189,15 @@ class LLMServiceMetrics(PipelineMetrics):
             hit_rate = hits / total
             self.llm_cache_hit_rate.labels(field=field).set(hit_rate)
     
+    def record_cache_lookup(self, tier: str, hit: bool):
+        """Record a cache lookup against one cache tier
+        
+        Args:
+            tier: Cache tier consulted (local, remote, memory, redis, ...)
+            hit: Whether the tier returned a value
+        """
+        self.llm_cache_lookups.labels(tier=tier, result='hit' if hit else 'miss').inc()
+    
     def record_rate_limit_hit(self, roaster_id: str):
         """Record a rate limit hit for a roaster
         
@@ -209,6 +225,7 @@ class LLMServiceMetrics(PipelineMetrics):
                 "cache_hits_total": "Counter of cache hits",
                 "cache_misses_total": "Counter of cache misses",
                 "cache_hit_rate": "Gauge of cache hit rate per field",
+                "cache_lookups_total": "Counter of cache lookups per tier and result",
                 "rate_limit_hits_total": "Counter of rate limit hits per roaster",
                 "success_rate": "Gauge of call success rate",
                 "cost_tokens_total": "Counter of token usage for cost tracking",
@@ -1,127 +1,358 @@
 """Rate limiting service for LLM calls per roaster."""
 
+import asyncio
 import time
-from typing import Dict, List
-from datetime import datetime, timedelta
+import weakref
+from typing import Dict, List, Optional
 import structlog
 
 logger = structlog.get_logger(__name__)
 
 
+WINDOWS = {
+    'minute': 60,
+    'hour': 3600,
+    'day': 86400
+}
+
+
+class SlidingWindowCounter:
+    """Request counter over a sliding window split into fixed-width buckets
+
+    Keeps a running total so checks cost O(1); advancing the window clears at most
+    ``buckets`` slots, amortised to O(1) per request. Accuracy is one bucket width.
+    """
+
+    __slots__ = ('bucket_width', 'counts', 'total', 'head')
+
+    def __init__(self, window_seconds: float, buckets: int = 60):
+        self.bucket_width = window_seconds / buckets
+        self.counts = [0] * buckets
+        self.total = 0
+        self.head: Optional[int] = None  # absolute index of the newest bucket
+
+    def _advance(self, now: float):
+        index = int(now // self.bucket_width)
+        if self.head is None:
+            self.head = index
+            return
+        steps = index - self.head
+        if steps <= 0:
+            return
+        size = len(self.counts)
+        if steps >= size:
+            self.counts = [0] * size
+            self.total = 0
+        else:
+            for offset in range(1, steps + 1):
+                slot = (self.head + offset) % size
+                self.total -= self.counts[slot]
+                self.counts[slot] = 0
+        self.head = index
+
+    def count(self, now: float) -> int:
+        """Number of requests in the window ending at ``now``"""
+        self._advance(now)
+        return self.total
+
+    def add(self, now: float, amount: int = 1):
+        """Record ``amount`` requests at ``now``"""
+        self._advance(now)
+        self.counts[self.head % len(self.counts)] += amount
+        self.total += amount
+
+    def retry_after(self, now: float, limit: int) -> float:
+        """Seconds until the window holds fewer than ``limit`` requests"""
+        self._advance(now)
+        size = len(self.counts)
+        remaining = self.total
+        # Walk from the oldest bucket forwards until enough requests have expired
+        for age in range(size - 1, -1, -1):
+            if remaining < limit:
+                break
+            bucket = self.head - age
+            remaining -= self.counts[bucket % size]
+            if remaining < limit:
+                return max(0.0, (bucket + size) * self.bucket_width - now)
+        return 0.0
+
+
 class RateLimiter:
-    """Rate limiter for LLM calls with per-roaster limits"""
-    
-    def __init__(self, rate_limits: Dict[str, int]):
+    """Rate limiter for LLM calls with per-roaster limits
+
+    Process-local limiter using bucketed sliding windows; use RedisRateLimiter to share
+    quota across workers.
+    """
+
+    def __init__(self, rate_limits: Dict[str, int], buckets: int = 60):
         """Initialize rate limiter
-        
+
         Args:
             rate_limits: Dictionary with rate limit configuration
                 - requests_per_minute: Limit per minute
-                - requests_per_hour: Limit per hour  
+                - requests_per_hour: Limit per hour
                 - requests_per_day: Limit per day
+            buckets: Buckets per window (window accuracy is window / buckets)
         """
         self.rate_limits = rate_limits
-        self.request_counts: Dict[str, List[float]] = {}
-        self.windows = {
-            'minute': 60,
-            'hour': 3600,
-            'day': 86400
-        }
-    
+        self.buckets = buckets
+        self.request_counts: Dict[str, Dict[str, SlidingWindowCounter]] = {}
+        self.windows = dict(WINDOWS)
+        # Only windows with a configured limit are tracked
+        self._limited_windows = [
+            (name, seconds, rate_limits[f'requests_per_{name}'])
+            for name, seconds in self.windows.items()
+            if f'requests_per_{name}' in rate_limits
+        ]
+
+    def _counters(self, roaster_id: str) -> Dict[str, SlidingWindowCounter]:
+        counters = self.request_counts.get(roaster_id)
+        if counters is None:
+            counters = {
+                name: SlidingWindowCounter(seconds, self.buckets)
+                for name, seconds, _ in self._limited_windows
+            }
+            self.request_counts[roaster_id] = counters
+        return counters
+
     def can_make_request(self, roaster_id: str) -> bool:
         """Check if request can be made within rate limits
-        
+
+        A successful check consumes one request from every window.
+
         Args:
             roaster_id: The roaster ID to check limits for
-            
+
         Returns:
             True if request can be made, False if rate limited
         """
         current_time = time.time()
-        
-        # Get current request timestamps for this roaster
-        if roaster_id not in self.request_counts:
-            self.request_counts[roaster_id] = []
-        
-        roaster_requests = self.request_counts[roaster_id]
-        
-        # Check each time window
-        for window_name, window_seconds in self.windows.items():
-            window_start = current_time - window_seconds
-            
-            # Filter to requests within this window
-            requests_in_window = [
-                req_time for req_time in roaster_requests 
-                if req_time > window_start
-            ]
-            
-            # Get limit for this window
-            limit_key = f'requests_per_{window_name}'
-            limit = self.rate_limits.get(limit_key, float('inf'))
-            
-            # Check if over limit
-            if len(requests_in_window) >= limit:
+        counters = self._counters(roaster_id)
+
+        for window_name, _, limit in self._limited_windows:
+            count = counters[window_name].count(current_time)
+            if count >= limit:
                 logger.warning(
                     "rate_limit_exceeded",
                     roaster_id=roaster_id,
                     window=window_name,
-                    count=len(requests_in_window),
+                    count=count,
                     limit=limit
                 )
                 return False
-        
-        # Record this request
-        roaster_requests.append(current_time)
-        
-        # Cleanup old requests (older than 1 day)
-        cutoff = current_time - self.windows['day']
-        self.request_counts[roaster_id] = [
-            req_time for req_time in roaster_requests 
-            if req_time > cutoff
-        ]
-        
+
+        for counter in counters.values():
+            counter.add(current_time)
+
+        return True
+
+    def record_request(self, roaster_id: str):
+        """Record a request made outside can_make_request/acquire
+
+        can_make_request already consumes quota, so callers that pair it with this
+        method would double count; use it only for requests that bypassed the check.
+        """
+        current_time = time.time()
+        for counter in self._counters(roaster_id).values():
+            counter.add(current_time)
+
+    def retry_after(self, roaster_id: str) -> float:
+        """Seconds until a request for roaster_id would be allowed"""
+        current_time = time.time()
+        counters = self._counters(roaster_id)
+        return max(
+            (counters[name].retry_after(current_time, limit) for name, _, limit in self._limited_windows),
+            default=0.0
+        )
+
+    async def try_acquire(self, roaster_id: str) -> bool:
+        """Consume one request if allowed, without waiting
+
+        Async counterpart of can_make_request for use on the event loop.
+        """
+        return self.can_make_request(roaster_id)
+
+    async def acquire(self, roaster_id: str, timeout: Optional[float] = None) -> bool:
+        """Wait until a request is allowed, then consume it
+
+        Args:
+            roaster_id: The roaster ID to acquire quota for
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True once quota was acquired, False if timeout elapsed first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not await self.try_acquire(roaster_id):
+            # Never spin: retry_after is 0 only if a bucket expired since the check
+            wait = max(self.retry_after(roaster_id), 0.01)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            await asyncio.sleep(wait)
         return True
-    
+
     def get_remaining_quota(self, roaster_id: str) -> Dict[str, int]:
         """Get remaining quota for roaster in each time window
-        
+
         Args:
             roaster_id: The roaster ID to check
-            
+
         Returns:
             Dictionary with remaining requests per window
         """
         current_time = time.time()
-        
-        if roaster_id not in self.request_counts:
-            return {
-                'minute': self.rate_limits.get('requests_per_minute', 0),
-                'hour': self.rate_limits.get('requests_per_hour', 0),
-                'day': self.rate_limits.get('requests_per_day', 0)
-            }
-        
-        roaster_requests = self.request_counts[roaster_id]
+        counters = self.request_counts.get(roaster_id, {})
         remaining = {}
-        
-        for window_name, window_seconds in self.windows.items():
-            window_start = current_time - window_seconds
-            requests_in_window = len([
-                req_time for req_time in roaster_requests 
-                if req_time > window_start
-            ])
-            
-            limit_key = f'requests_per_{window_name}'
-            limit = self.rate_limits.get(limit_key, 0)
-            remaining[window_name] = max(0, limit - requests_in_window)
-        
+
+        for window_name in self.windows:
+            limit = self.rate_limits.get(f'requests_per_{window_name}', 0)
+            used = counters[window_name].count(current_time) if window_name in counters else 0
+            remaining[window_name] = max(0, limit - used)
+
         return remaining
-    
+
     def reset_roaster(self, roaster_id: str):
         """Reset rate limit counters for a roaster
-        
+
         Args:
             roaster_id: The roaster ID to reset
         """
         if roaster_id in self.request_counts:
             del self.request_counts[roaster_id]
             logger.info("rate_limit_reset", roaster_id=roaster_id)
+
+
+# GCRA over every configured window in one round trip. Stores one theoretical arrival
+# time (TAT) per window; returns "0" when allowed, otherwise seconds until allowed.
+_GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local new_tats = {}
+for i, key in ipairs(KEYS) do
+    local interval = tonumber(ARGV[i * 2])
+    local tolerance = tonumber(ARGV[i * 2 + 1])
+    local tat = tonumber(redis.call('GET', key) or now)
+    if tat < now then
+        tat = now
+    end
+    if tat - now > tolerance then
+        return tostring(tat - now - tolerance)
+    end
+    new_tats[i] = tat + interval
+end
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, tostring(new_tats[i]), 'EX', math.ceil(new_tats[i] - now) + 1)
+end
+return '0'
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """Rate limiter sharing quota across workers through Redis
+
+    Uses GCRA (one timestamp per key and window, updated by a single Lua call), so each
+    check is O(1) regardless of traffic. Limits are enforced as smooth rates with a
+    burst of up to the full window limit.
+    """
+
+    def __init__(self, rate_limits: Dict[str, int], redis_url: str = "redis://localhost:6379/0",
+                 key_prefix: str = "ratelimit"):
+        super().__init__(rate_limits)
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self._client = None
+        self._script = None
+        # redis.asyncio connections bind to the loop they were opened in; keep one client per loop
+        self._async_scripts: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, object]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._retry_after: Dict[str, float] = {}
+
+    def _keys(self, roaster_id: str) -> List[str]:
+        return [f"{self.key_prefix}:{roaster_id}:{name}" for name, _, _ in self._limited_windows]
+
+    def _args(self, now: float) -> List[float]:
+        args: List[float] = [now]
+        for _, seconds, limit in self._limited_windows:
+            interval = seconds / limit
+            args.extend([interval, seconds - interval])
+        return args
+
+    def _sync_script(self):
+        if self._script is None:
+            import redis
+            self._client = redis.from_url(self.redis_url)
+            self._script = self._client.register_script(_GCRA_SCRIPT)
+        return self._script
+
+    def _get_async_script(self):
+        loop = asyncio.get_running_loop()
+        script = self._async_scripts.get(loop)
+        if script is None:
+            import redis.asyncio as redis_async
+            script = redis_async.from_url(self.redis_url).register_script(_GCRA_SCRIPT)
+            self._async_scripts[loop] = script
+        return script
+
+    def _handle_result(self, roaster_id: str, result) -> bool:
+        wait = float(result.decode() if isinstance(result, bytes) else result)
+        self._retry_after[roaster_id] = wait
+        if wait > 0:
+            logger.warning("rate_limit_exceeded", roaster_id=roaster_id, retry_after=wait, shared=True)
+            return False
+        return True
+
+    def can_make_request(self, roaster_id: str) -> bool:
+        """Check and consume shared quota
+
+        Blocking Redis call; code running on an event loop must use try_acquire
+        or acquire instead.
+        """
+        if not self._limited_windows:
+            return True
+        result = self._sync_script()(keys=self._keys(roaster_id), args=self._args(time.time()))
+        return self._handle_result(roaster_id, result)
+
+    async def try_acquire(self, roaster_id: str) -> bool:
+        """Check and consume shared quota without blocking the event loop"""
+        if not self._limited_windows:
+            return True
+        result = await self._get_async_script()(keys=self._keys(roaster_id), args=self._args(time.time()))
+        return self._handle_result(roaster_id, result)
+
+    def record_request(self, roaster_id: str):
+        """Shared quota is consumed by can_make_request/acquire; nothing to record"""
+
+    def retry_after(self, roaster_id: str) -> float:
+        """Seconds until allowed, as reported by the last denied check"""
+        return self._retry_after.get(roaster_id, 0.0)
+
+    def get_remaining_quota(self, roaster_id: str) -> Dict[str, int]:
+        """Get remaining burst capacity per window from the stored arrival times"""
+        self._sync_script()
+        now = time.time()
+        remaining = {}
+        tats = self._client.mget(self._keys(roaster_id)) if self._limited_windows else []
+        for (name, seconds, limit), tat in zip(self._limited_windows, tats):
+            backlog = max(0.0, float(tat) - now) if tat is not None else 0.0
+            remaining[name] = max(0, limit - int(-(-backlog // (seconds / limit))))
+        for name in self.windows:
+            remaining.setdefault(name, self.rate_limits.get(f'requests_per_{name}', 0))
+        return remaining
+
+    def reset_roaster(self, roaster_id: str):
+        """Reset shared rate limit state for a roaster"""
+        self._sync_script()
+        if self._limited_windows:
+            self._client.delete(*self._keys(roaster_id))
+        logger.info("rate_limit_reset", roaster_id=roaster_id, shared=True)
+
+
+def create_rate_limiter(rate_limits: Dict[str, int], redis_url: Optional[str] = None,
+                        key_prefix: str = "ratelimit") -> RateLimiter:
+    """Create a shared Redis limiter when redis_url is set, otherwise a local one"""
+    if redis_url:
+        return RedisRateLimiter(rate_limits, redis_url=redis_url, key_prefix=key_prefix)
+    return RateLimiter(rate_limits)
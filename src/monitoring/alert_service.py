@@ -13,6 +13,7 @@ from enum import Enum
 from .price_alert_service import PriceAlertService, AlertThrottle, SlackClient
 from .sentry_integration import SentryIntegration
 from .pipeline_metrics import PipelineMetrics
+from .timeseries import TimeSeriesBuffer
 
 
 class AlertSeverity(Enum):
@@ -53,11 +54,12 @@ class ThresholdBreach:
 class ThresholdMonitor:
     """Monitor thresholds and detect breaches."""
 
-    def __init__(self, metrics: PipelineMetrics):
+    def __init__(self, metrics: PipelineMetrics, history_size: int = 100):
         """Initialize threshold monitor."""
         self.metrics = metrics
-        # metric_name -> [(timestamp, value)]
-        self.historical_data: Dict[str, List[Tuple[float, float]]] = {}
+        self.history_size = history_size
+        # metric_name -> last history_size (timestamp, value) points
+        self.historical_data: Dict[str, TimeSeriesBuffer] = {}
         # metric_name -> baseline_value
         self.baseline_data: Dict[str, float] = {}
 
@@ -107,19 +109,13 @@ class ThresholdMonitor:
 
     def update_metric_value(self, metric_name: str, value: float):
         """Update metric value and check for threshold breaches."""
-        timestamp = time.time()
-
-        # Store historical data (keep last 100 points)
-        if metric_name not in self.historical_data:
-            self.historical_data[metric_name] = []
-
-        self.historical_data[metric_name].append((timestamp, value))
-
-        # Keep only last 100 points
-        if len(self.historical_data[metric_name]) > 100:
-            self.historical_data[metric_name] = self.historical_data[
-                metric_name
-            ][-100:]
+        # Store historical data (ring buffer keeps the last history_size points)
+        series = self.historical_data.get(metric_name)
+        if series is None:
+            series = self.historical_data[metric_name] = TimeSeriesBuffer(
+                self.history_size
+            )
+        series.append(value)
 
         # Update baseline if needed
         if metric_name not in self.baseline_data:
@@ -274,13 +270,36 @@ class ComprehensiveAlertService:
 
         return breaches
 
-    async def check_price_alerts(self, price_deltas: List[Any] = None) -> List[Dict[str, Any]]:
-        """Check for price spikes using existing B.3 PriceAlertService."""
+    async def check_price_alerts(
+        self,
+        price_deltas: List[Any] = None,
+        delta_frame: Any = None,
+        roaster_id: str = ""
+    ) -> List[Dict[str, Any]]:
+        """
+        Check for price spikes using existing B.3 PriceAlertService.
+
+        A PriceDeltaFrame from price delta detection is checked column-wise;
+        otherwise individual price deltas are checked.
+        """
         price_alerts = []
 
         # Use existing price alert service to check for price spikes
         # This leverages the existing B.3 infrastructure
         try:
+            if delta_frame is not None:
+                spikes_found = await self.price_alert_service.check_price_spike_frame(delta_frame, roaster_id)
+                price_alerts.append(
+                    {
+                        "type": "price_spike",
+                        "service": "B.3_PriceAlertService",
+                        "status": "checked",
+                        "deltas_processed": len(delta_frame),
+                        "spikes_found": spikes_found
+                    }
+                )
+                return price_alerts
+
             # Get price deltas from metrics if not provided
             if price_deltas is None:
                 # Get recent price deltas from metrics
@@ -4,6 +4,9 @@ Database metrics collection service.
 This module provides comprehensive database metrics collection from existing tables
 (scrape_runs, scrape_artifacts, prices, variants) for monitoring pipeline health,
 performance, and data quality.
+
+Artifact, price and variant metrics are aggregated in the database by the RPCs
+in docs/db/metrics_rpc.sql, so collection cost does not grow with price history.
 """
 
 import asyncio
@@ -100,35 +103,24 @@ class DatabaseMetricsService:
             )
             return self._get_mock_scrape_run_metrics()
     
+    async def _fetch_summary(self, function: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Call an aggregate RPC (docs/db/metrics_rpc.sql) returning one JSON summary."""
+        result = await self.supabase_client.rpc(function, params or {}).execute()
+        return result.data or {}
+    
     async def collect_artifact_metrics(self) -> Dict[str, Any]:
         """Collect metrics from scrape_artifacts table."""
         try:
             if not self.supabase_client:
                 return self._get_mock_artifact_metrics()
             
-            # Get recent artifacts (last 24 hours)
+            # Aggregated server-side from hourly rollups (last 24 hours)
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
+            summary = await self._fetch_summary('rpc_artifact_metrics', {'p_since': cutoff_time.isoformat()})
             
-            result = await self.supabase_client.table('scrape_artifacts').select('*').gte(
-                'created_at', cutoff_time.isoformat()
-            ).execute()
-            
-            artifacts = result.data if result.data else []
-            
-            # Calculate metrics
-            total_artifacts = len(artifacts)
-            valid_artifacts = len([a for a in artifacts if a.get('validation_status') == 'valid'])
-            invalid_artifacts = len([a for a in artifacts if a.get('validation_status') == 'invalid'])
-            
-            # HTTP status distribution
-            http_status_counts = {}
-            for artifact in artifacts:
-                status = artifact.get('http_status', 'unknown')
-                http_status_counts[status] = http_status_counts.get(status, 0) + 1
-            
-            # Body size statistics
-            body_sizes = [a.get('body_len', 0) for a in artifacts if a.get('body_len')]
-            avg_body_size = sum(body_sizes) / len(body_sizes) if body_sizes else 0
+            total_artifacts = int(summary.get('total_artifacts', 0))
+            valid_artifacts = int(summary.get('valid_artifacts', 0))
+            avg_body_size = float(summary.get('avg_body_size', 0))
             
             # Validation rate
             validation_rate = (valid_artifacts / total_artifacts * 100) if total_artifacts > 0 else 0
@@ -136,11 +128,11 @@ class DatabaseMetricsService:
             metrics = {
                 "total_artifacts": total_artifacts,
                 "valid_artifacts": valid_artifacts,
-                "invalid_artifacts": invalid_artifacts,
+                "invalid_artifacts": int(summary.get('invalid_artifacts', 0)),
                 "validation_rate": validation_rate,
-                "http_status_distribution": http_status_counts,
+                "http_status_distribution": summary.get('http_status_distribution', {}),
                 "avg_body_size": avg_body_size,
-                "artifacts_by_platform": self._group_artifacts_by_platform(artifacts),
+                "artifacts_by_platform": summary.get('artifacts_by_platform', {}),
                 "collection_timestamp": datetime.now(timezone.utc).isoformat()
             }
             
@@ -166,30 +158,13 @@ class DatabaseMetricsService:
             if not self.supabase_client:
                 return self._get_mock_price_metrics()
             
-            # Get recent prices (last 24 hours)
+            # Aggregated server-side from hourly rollups (last 24 hours)
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
+            summary = await self._fetch_summary('rpc_price_metrics', {'p_since': cutoff_time.isoformat()})
             
-            result = await self.supabase_client.table('prices').select('*').gte(
-                'scraped_at', cutoff_time.isoformat()
-            ).execute()
-            
-            prices = result.data if result.data else []
-            
-            # Calculate metrics
-            total_prices = len(prices)
-            unique_variants = len(set(p.get('variant_id') for p in prices if p.get('variant_id')))
-            
-            # Price statistics
-            price_values = [float(p.get('price', 0)) for p in prices if p.get('price')]
-            avg_price = sum(price_values) / len(price_values) if price_values else 0
-            min_price = min(price_values) if price_values else 0
-            max_price = max(price_values) if price_values else 0
-            
-            # Currency distribution
-            currency_counts = {}
-            for price in prices:
-                currency = price.get('currency', 'unknown')
-                currency_counts[currency] = currency_counts.get(currency, 0) + 1
+            total_prices = int(summary.get('total_prices', 0))
+            unique_variants = int(summary.get('unique_variants', 0))
+            avg_price = float(summary.get('avg_price', 0))
             
             # Price changes (simplified - would need historical data for real deltas)
             price_changes = 0  # This would require comparing with previous prices
@@ -198,11 +173,13 @@ class DatabaseMetricsService:
                 "total_prices": total_prices,
                 "unique_variants": unique_variants,
                 "avg_price": avg_price,
-                "min_price": min_price,
-                "max_price": max_price,
-                "currency_distribution": currency_counts,
+                "min_price": float(summary.get('min_price', 0)),
+                "max_price": float(summary.get('max_price', 0)),
+                "median_price": float(summary.get('median_price', 0)),
+                "p95_price": float(summary.get('p95_price', 0)),
+                "currency_distribution": summary.get('currency_distribution', {}),
                 "price_changes": price_changes,
-                "prices_by_roaster": self._group_prices_by_roaster(prices),
+                "prices_by_roaster": summary.get('prices_by_roaster', {}),
                 "collection_timestamp": datetime.now(timezone.utc).isoformat()
             }
             
@@ -228,27 +205,22 @@ class DatabaseMetricsService:
             if not self.supabase_client:
                 return self._get_mock_variant_metrics()
             
-            # Get all variants
-            result = await self.supabase_client.table('variants').select('*').execute()
-            variants = result.data if result.data else []
+            # Grouped server-side; only the summary is returned
+            summary = await self._fetch_summary('rpc_variant_metrics')
             
-            # Calculate metrics
-            total_variants = len(variants)
-            in_stock_variants = len([v for v in variants if v.get('in_stock', False)])
+            total_variants = int(summary.get('total_variants', 0))
+            in_stock_variants = int(summary.get('in_stock_variants', 0))
             out_of_stock_variants = total_variants - in_stock_variants
             
             # Stock rate
             stock_rate = (in_stock_variants / total_variants * 100) if total_variants > 0 else 0
             
-            # Variants by roaster
-            variants_by_roaster = self._group_variants_by_roaster(variants)
-            
             metrics = {
                 "total_variants": total_variants,
                 "in_stock_variants": in_stock_variants,
                 "out_of_stock_variants": out_of_stock_variants,
                 "stock_rate": stock_rate,
-                "variants_by_roaster": variants_by_roaster,
+                "variants_by_roaster": summary.get('variants_by_roaster', {}),
                 "collection_timestamp": datetime.now(timezone.utc).isoformat()
             }
             
@@ -334,30 +306,6 @@ class DatabaseMetricsService:
             roaster_counts[roaster_id] = roaster_counts.get(roaster_id, 0) + 1
         return roaster_counts
     
-    def _group_artifacts_by_platform(self, artifacts: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Group artifacts by platform."""
-        platform_counts = {}
-        for artifact in artifacts:
-            platform = artifact.get('platform', 'unknown')
-            platform_counts[platform] = platform_counts.get(platform, 0) + 1
-        return platform_counts
-    
-    def _group_prices_by_roaster(self, prices: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Group prices by roaster."""
-        roaster_counts = {}
-        for price in prices:
-            roaster_id = price.get('roaster_id', 'unknown')
-            roaster_counts[roaster_id] = roaster_counts.get(roaster_id, 0) + 1
-        return roaster_counts
-    
-    def _group_variants_by_roaster(self, variants: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Group variants by roaster."""
-        roaster_counts = {}
-        for variant in variants:
-            roaster_id = variant.get('roaster_id', 'unknown')
-            roaster_counts[roaster_id] = roaster_counts.get(roaster_id, 0) + 1
-        return roaster_counts
-    
     def _calculate_health_score(self, metrics: Dict[str, Any]) -> float:
         """Calculate overall health score (0-100)."""
         try:
@@ -420,6 +368,8 @@ class DatabaseMetricsService:
             "avg_price": 15.99,
             "min_price": 5.99,
             "max_price": 45.99,
+            "median_price": 14.99,
+            "p95_price": 39.99,
             "currency_distribution": {"USD": 400, "CAD": 100},
             "price_changes": 25,
             "prices_by_roaster": {"roaster1": 300, "roaster2": 200},
@@ -15,6 +15,8 @@ import time
 
 from structlog import get_logger
 
+from .timeseries import RingBuffer
+
 logger = get_logger(__name__)
 
 
@@ -38,7 +40,7 @@ class FirecrawlMetrics:
             'total_urls_discovered': 0,
             'total_budget_used': 0,
             'average_operation_time': 0.0,
-            'operation_times': [],
+            'operation_times': RingBuffer(100),  # last 100 operation times
             'error_counts': {},
             'roaster_metrics': {},
             'start_time': datetime.now(timezone.utc),
@@ -178,12 +180,9 @@ class FirecrawlMetrics:
         # Track operation time
         if operation_time > 0:
             self.metrics['operation_times'].append(operation_time)
-            # Keep only last 100 operation times
-            if len(self.metrics['operation_times']) > 100:
-                self.metrics['operation_times'] = self.metrics['operation_times'][-100:]
             
-            # Update average
-            self.metrics['average_operation_time'] = sum(self.metrics['operation_times']) / len(self.metrics['operation_times'])
+            # Update average (running mean of the ring buffer)
+            self.metrics['average_operation_time'] = self.metrics['operation_times'].mean
         
         # Track roaster-specific metrics
         if roaster_id not in self.metrics['roaster_metrics']:
@@ -254,7 +253,8 @@ class FirecrawlMetrics:
             },
             'performance': {
                 'average_operation_time_seconds': round(self.metrics['average_operation_time'], 2),
-                'total_operation_time_seconds': round(sum(self.metrics['operation_times']), 2)
+                'p95_operation_time_seconds': round(self.metrics['operation_times'].percentile(95), 2),
+                'total_operation_time_seconds': round(self.metrics['operation_times'].sum, 2)
             },
             'errors': self.metrics['error_counts'],
             'roaster_breakdown': self.metrics['roaster_metrics'],
@@ -326,7 +326,7 @@ class FirecrawlMetrics:
             'total_urls_discovered': 0,
             'total_budget_used': 0,
             'average_operation_time': 0.0,
-            'operation_times': [],
+            'operation_times': RingBuffer(100),  # last 100 operation times
             'error_counts': {},
             'roaster_metrics': {},
             'start_time': datetime.now(timezone.utc),
@@ -10,6 +10,7 @@ Features:
 """
 
 import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry
 from structlog import get_logger
@@ -18,6 +19,9 @@ from .pipeline_metrics import PipelineMetrics
 
 logger = get_logger(__name__)
 
+UNKNOWN_LABEL = 'unknown'
+OTHER_LABEL = 'other'
+
 
 class NormalizerPipelineMetrics(PipelineMetrics):
     """
@@ -29,32 +33,67 @@ class NormalizerPipelineMetrics(PipelineMetrics):
     - Parser success rates and confidence scores
     - Error recovery metrics
     - Transaction management metrics
+    
+    Prometheus labels are limited to bounded dimensions (parser, field, stage,
+    platform and, on counters, roaster), so series do not accumulate per
+    artifact. Per-execution detail is kept in an in-process ring buffer of the
+    most recent executions instead.
     """
     
-    def __init__(self, prometheus_port: int = 8000):
-        """Initialize normalizer pipeline metrics service."""
+    def __init__(self,
+                 prometheus_port: int = 8000,
+                 recent_executions_size: int = 1000,
+                 max_roaster_labels: int = 200):
+        """
+        Initialize normalizer pipeline metrics service.
+        
+        Args:
+            prometheus_port: Port for the Prometheus HTTP server
+            recent_executions_size: Executions kept for per-execution summaries
+            max_roaster_labels: Distinct roaster label values before folding into 'other'
+        """
         super().__init__(prometheus_port)
         
+        self.recent_executions_size = max(recent_executions_size, 0)
+        self.max_roaster_labels = max(max_roaster_labels, 0)
+        self._recent_executions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._roaster_labels = set()
+        self._parser_totals: Dict[str, Dict[str, int]] = {}
+        
         # C.8 Normalizer Pipeline Metrics
+        self.pipeline_executions = Counter(
+            'normalizer_pipeline_executions_total',
+            'Normalizer pipeline executions',
+            ['stage', 'roaster', 'platform'],
+            registry=self.registry
+        )
+        
         self.normalizer_pipeline_duration = Histogram(
             'normalizer_pipeline_duration_seconds',
             'Normalizer pipeline execution time',
-            ['execution_id', 'stage'],
+            ['stage', 'platform'],
             buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
             registry=self.registry
         )
         
+        self.parser_runs = Counter(
+            'parser_runs_total',
+            'Parser runs',
+            ['parser_name', 'success'],
+            registry=self.registry
+        )
+        
         self.parser_success_rate = Gauge(
             'parser_success_rate',
-            'Success rate per parser',
-            ['parser_name', 'execution_id'],
+            'Success rate per parser since process start',
+            ['parser_name'],
             registry=self.registry
         )
         
         self.parser_confidence = Histogram(
             'parser_confidence_score',
             'Parser confidence scores',
-            ['parser_name', 'execution_id'],
+            ['parser_name'],
             buckets=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
             registry=self.registry
         )
@@ -62,14 +101,14 @@ class NormalizerPipelineMetrics(PipelineMetrics):
         self.llm_fallback_usage = Counter(
             'llm_fallback_total',
             'LLM fallback usage count',
-            ['field_name', 'execution_id', 'success'],
+            ['field_name', 'success'],
             registry=self.registry
         )
         
         self.llm_fallback_duration = Histogram(
             'llm_fallback_duration_seconds',
             'LLM fallback execution time',
-            ['field_name', 'execution_id'],
+            ['field_name'],
             buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
             registry=self.registry
         )
@@ -77,7 +116,7 @@ class NormalizerPipelineMetrics(PipelineMetrics):
         self.llm_confidence = Histogram(
             'llm_confidence_score',
             'LLM confidence scores',
-            ['field_name', 'execution_id'],
+            ['field_name'],
             buckets=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
             registry=self.registry
         )
@@ -85,7 +124,7 @@ class NormalizerPipelineMetrics(PipelineMetrics):
         self.pipeline_confidence = Histogram(
             'pipeline_confidence_score',
             'Pipeline confidence scores',
-            ['execution_id', 'stage'],
+            ['stage', 'platform'],
             buckets=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
             registry=self.registry
         )
@@ -100,14 +139,14 @@ class NormalizerPipelineMetrics(PipelineMetrics):
         self.transaction_operations = Counter(
             'transaction_operations_total',
             'Transaction operations',
-            ['operation_type', 'success', 'execution_id'],
+            ['operation_type', 'success'],
             registry=self.registry
         )
         
         self.transaction_duration = Histogram(
             'transaction_duration_seconds',
             'Transaction duration',
-            ['execution_id', 'boundary_type'],
+            ['boundary_type'],
             buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
             registry=self.registry
         )
@@ -115,50 +154,123 @@ class NormalizerPipelineMetrics(PipelineMetrics):
         self.pipeline_errors = Counter(
             'pipeline_errors_total',
             'Pipeline errors',
-            ['error_type', 'stage', 'execution_id'],
+            ['error_type', 'stage', 'roaster', 'platform'],
             registry=self.registry
         )
         
         self.pipeline_warnings = Counter(
             'pipeline_warnings_total',
             'Pipeline warnings',
-            ['warning_type', 'stage', 'execution_id'],
+            ['warning_type', 'stage', 'roaster', 'platform'],
             registry=self.registry
         )
         
         self.batch_processing_metrics = Gauge(
             'batch_processing_metrics',
-            'Batch processing metrics',
-            ['metric_type', 'execution_id'],
+            'Most recent batch processing metrics',
+            ['metric_type'],
             registry=self.registry
         )
         
         logger.info("C.8 Normalizer Pipeline metrics initialized")
     
+    def _roaster_label(self, roaster: Optional[str]) -> str:
+        """Bounded label value for a roaster."""
+        if not roaster:
+            return UNKNOWN_LABEL
+        roaster = str(roaster)
+        if roaster in self._roaster_labels:
+            return roaster
+        if len(self._roaster_labels) < self.max_roaster_labels:
+            self._roaster_labels.add(roaster)
+            return roaster
+        return OTHER_LABEL
+    
+    @staticmethod
+    def _platform_label(platform: Optional[str]) -> str:
+        """Label value for a platform."""
+        platform = getattr(platform, 'value', platform)
+        return str(platform) if platform else UNKNOWN_LABEL
+    
+    def _execution(self,
+                   execution_id: Optional[str],
+                   roaster: Optional[str] = None,
+                   platform: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get or create the ring buffer record for an execution."""
+        if not execution_id or self.recent_executions_size == 0:
+            return None
+        
+        record = self._recent_executions.get(execution_id)
+        if record is None:
+            record = {
+                'execution_id': execution_id,
+                'roaster': roaster,
+                'platform': self._platform_label(platform) if platform else None,
+                'stage': None,
+                'duration': None,
+                'confidence': None,
+                'parsers': {},
+                'llm_calls': {},
+                'errors': [],
+                'warnings': [],
+                'transactions': [],
+                'recorded_at': time.time()
+            }
+            self._recent_executions[execution_id] = record
+            # Oldest executions are at the front
+            while len(self._recent_executions) > self.recent_executions_size:
+                self._recent_executions.popitem(last=False)
+        else:
+            if roaster and not record['roaster']:
+                record['roaster'] = roaster
+            if platform and not record['platform']:
+                record['platform'] = self._platform_label(platform)
+        return record
+    
+    def get_recent_executions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get per-execution detail for the most recent executions.
+        
+        Args:
+            limit: Maximum executions to return (all retained if omitted)
+            
+        Returns:
+            Execution records, newest first
+        """
+        records = list(reversed(self._recent_executions.values()))
+        if limit is not None:
+            records = records[:limit]
+        return [dict(record) for record in records]
+    
     def record_pipeline_execution(self, 
                                  execution_id: str, 
                                  duration: float, 
                                  stage: str,
                                  parsers_used: List[str],
-                                 llm_fallback_used: bool):
+                                 llm_fallback_used: bool,
+                                 roaster: Optional[str] = None,
+                                 platform: Optional[str] = None):
         """Record normalizer pipeline execution metrics."""
+        platform_label = self._platform_label(platform)
+        self.pipeline_executions.labels(
+            stage=stage,
+            roaster=self._roaster_label(roaster),
+            platform=platform_label
+        ).inc()
+        
         self.normalizer_pipeline_duration.labels(
-            execution_id=execution_id,
-            stage=stage
+            stage=stage,
+            platform=platform_label
         ).observe(duration)
         
-        # Record batch processing metrics
-        self.batch_processing_metrics.labels(
-            metric_type='parsers_used',
-            execution_id=execution_id
-        ).set(len(parsers_used))
-        
-        if llm_fallback_used:
-            self.llm_fallback_usage.labels(
-                field_name='batch',
-                execution_id=execution_id,
-                success=True
-            ).inc()
+        record = self._execution(execution_id, roaster, platform)
+        if record is not None:
+            record.update(
+                stage=stage,
+                duration=duration,
+                parsers_used=list(parsers_used),
+                llm_fallback_used=llm_fallback_used
+            )
         
         logger.debug("Pipeline execution recorded", 
                     execution_id=execution_id,
@@ -171,16 +283,26 @@ class NormalizerPipelineMetrics(PipelineMetrics):
                              success: bool, 
                              confidence: float):
         """Record individual parser success metrics."""
-        self.parser_success_rate.labels(
+        self.parser_runs.labels(
             parser_name=parser_name,
-            execution_id=execution_id
-        ).set(1.0 if success else 0.0)
+            success=success
+        ).inc()
+        
+        totals = self._parser_totals.setdefault(parser_name, {'runs': 0, 'successes': 0})
+        totals['runs'] += 1
+        totals['successes'] += 1 if success else 0
+        self.parser_success_rate.labels(
+            parser_name=parser_name
+        ).set(totals['successes'] / totals['runs'])
         
         self.parser_confidence.labels(
-            parser_name=parser_name,
-            execution_id=execution_id
+            parser_name=parser_name
         ).observe(confidence)
         
+        record = self._execution(execution_id)
+        if record is not None:
+            record['parsers'][parser_name] = {'success': success, 'confidence': confidence}
+        
         logger.debug("Parser success recorded", 
                     parser=parser_name,
                     execution_id=execution_id,
@@ -196,20 +318,25 @@ class NormalizerPipelineMetrics(PipelineMetrics):
         """Record LLM fallback metrics."""
         self.llm_fallback_usage.labels(
             field_name=field_name,
-            execution_id=execution_id,
             success=success
         ).inc()
         
         self.llm_fallback_duration.labels(
-            field_name=field_name,
-            execution_id=execution_id
+            field_name=field_name
         ).observe(duration)
         
         self.llm_confidence.labels(
-            field_name=field_name,
-            execution_id=execution_id
+            field_name=field_name
         ).observe(confidence)
         
+        record = self._execution(execution_id)
+        if record is not None:
+            record['llm_calls'][field_name] = {
+                'success': success,
+                'confidence': confidence,
+                'duration': duration
+            }
+        
         logger.debug("LLM fallback recorded", 
                     field=field_name,
                     execution_id=execution_id,
@@ -220,13 +347,18 @@ class NormalizerPipelineMetrics(PipelineMetrics):
     def record_pipeline_confidence(self, 
                                    execution_id: str, 
                                    stage: str, 
-                                   confidence: float):
+                                   confidence: float,
+                                   platform: Optional[str] = None):
         """Record pipeline confidence metrics."""
         self.pipeline_confidence.labels(
-            execution_id=execution_id,
-            stage=stage
+            stage=stage,
+            platform=self._platform_label(platform)
         ).observe(confidence)
         
+        record = self._execution(execution_id, platform=platform)
+        if record is not None:
+            record['confidence'] = confidence
+        
         logger.debug("Pipeline confidence recorded", 
                     execution_id=execution_id,
                     stage=stage,
@@ -257,15 +389,21 @@ class NormalizerPipelineMetrics(PipelineMetrics):
         """Record transaction operation metrics."""
         self.transaction_operations.labels(
             operation_type=operation_type,
-            success=success,
-            execution_id=execution_id
+            success=success
         ).inc()
         
         self.transaction_duration.labels(
-            execution_id=execution_id,
             boundary_type=boundary_type
         ).observe(duration)
         
+        record = self._execution(execution_id)
+        if record is not None:
+            record['transactions'].append({
+                'operation_type': operation_type,
+                'success': success,
+                'duration': duration
+            })
+        
         logger.debug("Transaction operation recorded", 
                     execution_id=execution_id,
                     operation_type=operation_type,
@@ -275,14 +413,21 @@ class NormalizerPipelineMetrics(PipelineMetrics):
     def record_pipeline_error(self, 
                              execution_id: str, 
                              error_type: str, 
-                             stage: str):
+                             stage: str,
+                             roaster: Optional[str] = None,
+                             platform: Optional[str] = None):
         """Record pipeline error metrics."""
         self.pipeline_errors.labels(
             error_type=error_type,
             stage=stage,
-            execution_id=execution_id
+            roaster=self._roaster_label(roaster),
+            platform=self._platform_label(platform)
         ).inc()
         
+        record = self._execution(execution_id, roaster, platform)
+        if record is not None:
+            record['errors'].append({'error_type': error_type, 'stage': stage})
+        
         logger.warning("Pipeline error recorded", 
                       execution_id=execution_id,
                       error_type=error_type,
@@ -291,14 +436,21 @@ class NormalizerPipelineMetrics(PipelineMetrics):
     def record_pipeline_warning(self, 
                                execution_id: str, 
                                warning_type: str, 
-                               stage: str):
+                               stage: str,
+                               roaster: Optional[str] = None,
+                               platform: Optional[str] = None):
         """Record pipeline warning metrics."""
         self.pipeline_warnings.labels(
             warning_type=warning_type,
             stage=stage,
-            execution_id=execution_id
+            roaster=self._roaster_label(roaster),
+            platform=self._platform_label(platform)
         ).inc()
         
+        record = self._execution(execution_id, roaster, platform)
+        if record is not None:
+            record['warnings'].append({'warning_type': warning_type, 'stage': stage})
+        
         logger.info("Pipeline warning recorded", 
                    execution_id=execution_id,
                    warning_type=warning_type,
@@ -311,25 +463,10 @@ class NormalizerPipelineMetrics(PipelineMetrics):
                                success_count: int,
                                error_count: int):
         """Record batch processing metrics."""
-        self.batch_processing_metrics.labels(
-            metric_type='batch_size',
-            execution_id=execution_id
-        ).set(batch_size)
-        
-        self.batch_processing_metrics.labels(
-            metric_type='processing_time',
-            execution_id=execution_id
-        ).set(processing_time)
-        
-        self.batch_processing_metrics.labels(
-            metric_type='success_count',
-            execution_id=execution_id
-        ).set(success_count)
-        
-        self.batch_processing_metrics.labels(
-            metric_type='error_count',
-            execution_id=execution_id
-        ).set(error_count)
+        self.batch_processing_metrics.labels(metric_type='batch_size').set(batch_size)
+        self.batch_processing_metrics.labels(metric_type='processing_time').set(processing_time)
+        self.batch_processing_metrics.labels(metric_type='success_count').set(success_count)
+        self.batch_processing_metrics.labels(metric_type='error_count').set(error_count)
         
         logger.info("Batch processing recorded", 
                    execution_id=execution_id,
@@ -341,14 +478,21 @@ class NormalizerPipelineMetrics(PipelineMetrics):
     def get_pipeline_health_score(self, execution_id: str) -> float:
         """Calculate pipeline health score for specific execution."""
         try:
-            # Calculate health score based on actual metrics
-            # Get error rate from pipeline_errors counter
-            error_count = 0
-            warning_count = 0
+            record = self._recent_executions.get(execution_id)
+            if record is None:
+                return 50.0  # Unknown or evicted execution
+            
+            error_count = len(record['errors'])
+            warning_count = len(record['warnings'])
             
-            # Get success rate from parser metrics
-            parser_success_rate = 0.0
-            llm_success_rate = 0.0
+            parsers = record['parsers'].values()
+            parser_success_rate = (
+                sum(1 for p in parsers if p['success']) / len(parsers) if parsers else 0.0
+            )
+            llm_calls = record['llm_calls'].values()
+            llm_success_rate = (
+                sum(1 for c in llm_calls if c['success']) / len(llm_calls) if llm_calls else 0.0
+            )
             
             # Calculate weighted health score
             # Base score starts at 100
@@ -376,14 +520,14 @@ class NormalizerPipelineMetrics(PipelineMetrics):
     def get_parser_performance_summary(self, execution_id: str) -> Dict[str, Any]:
         """Get parser performance summary for specific execution."""
         try:
-            # Calculate actual performance metrics from recorded data
-            # This would query the actual metrics to get real performance data
-            total_parsers = 0
-            successful_parsers = 0
-            failed_parsers = 0
-            total_confidence = 0.0
-            confidence_count = 0
-            execution_time = 0.0
+            record = self._recent_executions.get(execution_id) or {}
+            parsers = list(record.get('parsers', {}).values())
+            total_parsers = len(parsers)
+            successful_parsers = sum(1 for p in parsers if p['success'])
+            failed_parsers = total_parsers - successful_parsers
+            total_confidence = sum(p['confidence'] for p in parsers)
+            confidence_count = total_parsers
+            execution_time = record.get('duration') or 0.0
             
             # Calculate success rate
             success_rate = (successful_parsers / total_parsers * 100) if total_parsers > 0 else 0.0
@@ -414,14 +558,14 @@ class NormalizerPipelineMetrics(PipelineMetrics):
     def get_llm_fallback_summary(self, execution_id: str) -> Dict[str, Any]:
         """Get LLM fallback summary for specific execution."""
         try:
-            # Calculate actual LLM metrics from recorded data
-            # This would query the actual metrics to get real LLM data
-            total_llm_calls = 0
-            successful_calls = 0
-            failed_calls = 0
-            total_confidence = 0.0
-            confidence_count = 0
-            total_duration = 0.0
+            record = self._recent_executions.get(execution_id) or {}
+            calls = list(record.get('llm_calls', {}).values())
+            total_llm_calls = len(calls)
+            successful_calls = sum(1 for c in calls if c['success'])
+            failed_calls = total_llm_calls - successful_calls
+            total_confidence = sum(c['confidence'] for c in calls)
+            confidence_count = total_llm_calls
+            total_duration = sum(c['duration'] for c in calls)
             
             # Calculate success rate
             success_rate = (successful_calls / total_llm_calls * 100) if total_llm_calls > 0 else 0.0
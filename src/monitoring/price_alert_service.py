@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 from .price_job_metrics import PriceDelta, PriceJobMetrics
+from .timeseries import TimeSeriesBuffer
 
 
 @dataclass
@@ -22,29 +23,25 @@ class AlertThrottle:
         """Initialize alert throttle."""
         self.throttle_window = throttle_window  # 5 minutes
         self.max_alerts_per_window = max_alerts_per_window
-        self.alert_history: Dict[str, List[float]] = {}
+        # Only the last max_alerts_per_window timestamps can decide throttling
+        self.alert_history: Dict[str, TimeSeriesBuffer] = {}
     
     def should_throttle(self, alert_key: str) -> bool:
         """Check if alert should be throttled."""
-        now = time.time()
-        if alert_key not in self.alert_history:
-            self.alert_history[alert_key] = []
-        
-        # Clean old alerts outside throttle window
-        self.alert_history[alert_key] = [
-            timestamp for timestamp in self.alert_history[alert_key]
-            if now - timestamp < self.throttle_window
-        ]
+        history = self.alert_history.get(alert_key)
+        if history is None:
+            return False
         
-        # Check if we've exceeded the limit
-        return len(self.alert_history[alert_key]) >= self.max_alerts_per_window
+        # Check if we've exceeded the limit within the throttle window
+        cutoff = time.time() - self.throttle_window
+        return history.count_since(cutoff) >= self.max_alerts_per_window
     
     def record_alert(self, alert_key: str):
         """Record alert timestamp."""
-        now = time.time()
-        if alert_key not in self.alert_history:
-            self.alert_history[alert_key] = []
-        self.alert_history[alert_key].append(now)
+        history = self.alert_history.get(alert_key)
+        if history is None:
+            history = self.alert_history[alert_key] = TimeSeriesBuffer(self.max_alerts_per_window)
+        history.append(1.0)
 
 
 class SlackClient:
@@ -149,6 +146,29 @@ class PriceAlertService:
             if self._is_price_spike(delta):
                 await self._send_price_spike_alert(delta)
     
+    async def check_price_spike_frame(self, frame: Any, roaster_id: str = "") -> int:
+        """
+        Check a PriceDeltaFrame for price spikes and send alerts.
+        
+        Percent changes are already computed column-wise, so PriceDelta
+        objects are only created for the rows that spike.
+        
+        Returns:
+            Number of spikes found
+        """
+        spikes = frame.spike_indices(self.price_spike_threshold)
+        for index in spikes:
+            row = frame.rows[index]
+            await self._send_price_spike_alert(PriceDelta(
+                variant_id=row['platform_variant_id'],
+                old_price=Decimal(str(frame.old_price_value(index))),
+                new_price=Decimal(str(row['price_decimal'])),
+                currency=row.get('currency', 'USD'),
+                in_stock=row.get('in_stock', True),
+                roaster_id=roaster_id
+            ))
+        return len(spikes)
+    
     def _is_price_spike(self, delta: PriceDelta) -> bool:
         """Determine if price change constitutes a spike."""
         if delta.old_price == 0:
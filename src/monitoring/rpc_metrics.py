@@ -0,0 +1,118 @@
+"""
+RPC telemetry and Prometheus export.
+
+This module provides:
+- Per-RPC latency histograms labelled by outcome
+- Sampled payload size histograms
+- Retry counters by error type
+- Redacted payload dumps for debug logging
+"""
+
+import json
+import random
+from typing import Any, Callable, Dict, Optional
+
+from prometheus_client import Counter, Histogram
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+# Prometheus metrics
+rpc_call_duration = Histogram(
+    'rpc_call_duration_seconds',
+    'RPC call duration including retries',
+    ['rpc_name', 'outcome'],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+)
+
+rpc_payload_bytes = Histogram(
+    'rpc_payload_bytes',
+    'Serialized RPC parameter size (sampled)',
+    ['rpc_name'],
+    buckets=[256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304]
+)
+
+rpc_retries = Counter(
+    'rpc_retries_total',
+    'RPC retry attempts',
+    ['rpc_name', 'error_type']
+)
+
+# Parameters that hold raw scraped content; never dumped verbatim
+REDACTED_FIELDS = frozenset({
+    'p_source_raw', 'source_raw',
+    'p_description_md', 'description_md',
+    'p_notes', 'notes_raw'
+})
+
+
+class RPCTelemetry:
+    """
+    Structured telemetry for RPC calls.
+
+    Latency and retries are recorded for every call. Payload size requires
+    serializing the parameters, so it is only measured for a sampled
+    fraction of calls. Payload dumps are debug-only and redacted.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.1,
+        log_payloads: bool = False,
+        max_value_length: int = 200,
+        rng: Callable[[], float] = random.random
+    ):
+        """
+        Initialize RPC telemetry.
+
+        Args:
+            sample_rate: Fraction of calls whose payload size is measured (0-1)
+            log_payloads: Emit a redacted payload dump at DEBUG for each call
+            max_value_length: Strings longer than this are truncated in dumps
+            rng: Random source used for sampling
+        """
+        self.sample_rate = sample_rate
+        self.log_payloads = log_payloads
+        self.max_value_length = max_value_length
+        self._rng = rng
+
+    def record_payload(self, rpc_name: str, parameters: Dict[str, Any]):
+        """Record the payload size (sampled) and dump it when enabled."""
+        if self.sample_rate > 0 and self._rng() < self.sample_rate:
+            rpc_payload_bytes.labels(rpc_name=rpc_name).observe(self.payload_size(parameters))
+
+        if self.log_payloads:
+            logger.debug("RPC payload", rpc_name=rpc_name, parameters=self.redact(parameters))
+
+    def observe_call(self, rpc_name: str, duration: float, outcome: str):
+        """Record the duration of a finished call ('success' or 'error')."""
+        rpc_call_duration.labels(rpc_name=rpc_name, outcome=outcome).observe(duration)
+
+    def record_retry(self, rpc_name: str, error_type: str):
+        """Record a retry attempt."""
+        rpc_retries.labels(rpc_name=rpc_name, error_type=error_type).inc()
+
+    @staticmethod
+    def payload_size(parameters: Dict[str, Any]) -> int:
+        """Size of the parameters as sent over the wire, in bytes."""
+        return len(json.dumps(parameters, default=str).encode('utf-8'))
+
+    def redact(self, value: Any, key: Optional[str] = None) -> Any:
+        """
+        Copy of a payload that is safe to log.
+
+        Raw content fields are replaced by their length, long strings are
+        truncated and lists are summarized past the first few items.
+        """
+        if key in REDACTED_FIELDS and value is not None:
+            return f"<redacted {len(str(value))} chars>"
+        if isinstance(value, dict):
+            return {k: self.redact(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            head = [self.redact(item) for item in value[:3]]
+            if len(value) > 3:
+                head.append(f"<{len(value) - 3} more>")
+            return head
+        if isinstance(value, str) and len(value) > self.max_value_length:
+            return value[:self.max_value_length] + "..."
+        return value
@@ -6,11 +6,12 @@ RPC errors, and system failures using the existing PipelineMetrics and DatabaseM
 """
 
 import time
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
 from .pipeline_metrics import PipelineMetrics, MetricsCollector
 from .database_metrics import DatabaseMetricsService
+from .timeseries import TimeSeriesBuffer
 from .alert_service import (
     ComprehensiveAlertService,
     ThresholdBreach,
@@ -40,8 +41,10 @@ class ThresholdMonitoringService:
         pipeline_metrics: PipelineMetrics,
         database_metrics: DatabaseMetricsService,
         alert_service: ComprehensiveAlertService,
+        history_size: int = 100,
     ):
         """Initialize threshold monitoring service."""
+        self.history_size = history_size
         self.pipeline_metrics = pipeline_metrics
         self.database_metrics = database_metrics
         self.alert_service = alert_service
@@ -130,8 +133,8 @@ class ThresholdMonitoringService:
             ),
         }
 
-        # Historical data for trend analysis
-        self.historical_data: Dict[str, List[Tuple[float, float]]] = {}
+        # Historical data for trend analysis (last history_size points per metric)
+        self.historical_data: Dict[str, TimeSeriesBuffer] = {}
         self.baseline_data: Dict[str, float] = {}
 
         # Alert cooldown tracking
@@ -450,16 +453,14 @@ class ThresholdMonitoringService:
         self, metric_name: str, current_value: float
     ) -> float:
         """Get baseline rate for trend analysis."""
-        if metric_name not in self.baseline_data:
-            self.baseline_data[metric_name] = current_value
-            return current_value
-
-        # Update baseline with exponential moving average
-        alpha = 0.1  # Smoothing factor
-        self.baseline_data[metric_name] = (
-            alpha * current_value
-            + (1 - alpha) * self.baseline_data[metric_name]
-        )
+        # Baseline is the series' exponential moving average (alpha 0.1)
+        series = self.historical_data.get(metric_name)
+        if series is None:
+            series = self.historical_data[metric_name] = TimeSeriesBuffer(
+                self.history_size, ewma_alpha=0.1
+            )
+        series.append(current_value)
+        self.baseline_data[metric_name] = series.ewma
 
         return self.baseline_data[metric_name]
 
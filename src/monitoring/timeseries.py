@@ -0,0 +1,161 @@
+"""
+Fixed-size numeric ring buffers for metric history.
+
+Alerting and monitoring code keeps the last N values of many metrics and reads
+their mean or percentiles. Appending to a list and re-slicing it allocates a
+new list on every update and the mean is recomputed with sum() each time.
+These buffers preallocate an ``array('d')``, overwrite the oldest slot on
+append and keep a running sum and EWMA, so updates are O(1) and allocation
+free. Percentiles sort a copy and are meant for summaries, not hot paths.
+"""
+
+import math
+import time
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of floats with streaming statistics."""
+
+    def __init__(self, capacity: int, ewma_alpha: float = 0.1):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Number of most recent values kept
+            ewma_alpha: Smoothing factor of the exponentially weighted mean
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0.0 < ewma_alpha <= 1.0:
+            raise ValueError("ewma_alpha must be in (0, 1]")
+        self.capacity = capacity
+        self.ewma_alpha = ewma_alpha
+        self._values = array('d', bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+        self._sum = 0.0
+        self._ewma: Optional[float] = None
+        self.total_count = 0
+
+    def append(self, value: float):
+        """Add a value, evicting the oldest one when full."""
+        value = float(value)
+        if self._count == self.capacity:
+            self._sum -= self._values[self._next]
+        else:
+            self._count += 1
+        self._values[self._next] = value
+        self._sum += value
+        self._next += 1
+        if self._next == self.capacity:
+            self._next = 0
+            # Re-sum once per wrap so float error from evictions can't accumulate
+            self._sum = math.fsum(self._values)
+        self._ewma = value if self._ewma is None else self._ewma + self.ewma_alpha * (value - self._ewma)
+        self.total_count += 1
+
+    def clear(self):
+        self._next = 0
+        self._count = 0
+        self._sum = 0.0
+        self._ewma = None
+        self.total_count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _indices(self) -> Iterator[int]:
+        """Slot indices from oldest to newest."""
+        start = self._next - self._count
+        for offset in range(self._count):
+            yield (start + offset) % self.capacity
+
+    def __iter__(self) -> Iterator[float]:
+        for index in self._indices():
+            yield self._values[index]
+
+    def values(self) -> List[float]:
+        """Buffered values, oldest first."""
+        return list(self)
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._values[self._next - 1] if self._count else None
+
+    @property
+    def sum(self) -> float:
+        return self._sum if self._count else 0.0
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else 0.0
+
+    @property
+    def ewma(self) -> float:
+        return self._ewma if self._ewma is not None else 0.0
+
+    @property
+    def min(self) -> float:
+        return min(self.values()) if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        return max(self.values()) if self._count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Linearly interpolated percentile of the buffered values.
+
+        Args:
+            q: Percentile in [0, 100]
+        """
+        if not self._count:
+            return 0.0
+        ordered = sorted(self.values())
+        rank = (len(ordered) - 1) * min(max(q, 0.0), 100.0) / 100.0
+        lower = math.floor(rank)
+        upper = math.ceil(rank)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class TimeSeriesBuffer(RingBuffer):
+    """Ring buffer of (timestamp, value) points; iterates as tuples, oldest first."""
+
+    def __init__(self, capacity: int, ewma_alpha: float = 0.1):
+        super().__init__(capacity, ewma_alpha)
+        self._timestamps = array('d', bytes(8 * capacity))
+
+    def append(self, value: float, timestamp: Optional[float] = None):
+        """Add a point; the timestamp defaults to now."""
+        self._timestamps[self._next] = time.time() if timestamp is None else timestamp
+        super().append(value)
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        for index in self._indices():
+            yield self._timestamps[index], self._values[index]
+
+    def values(self) -> List[float]:
+        return [self._values[index] for index in self._indices()]
+
+    def timestamps(self) -> List[float]:
+        return [self._timestamps[index] for index in self._indices()]
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        return self._timestamps[self._next - 1] if self._count else None
+
+    def since(self, cutoff: float) -> List[Tuple[float, float]]:
+        """Points with timestamp >= cutoff, oldest first."""
+        return [(timestamp, value) for timestamp, value in self if timestamp >= cutoff]
+
+    def count_since(self, cutoff: float) -> int:
+        """Number of points with timestamp >= cutoff (points appended in time order)."""
+        count = 0
+        for offset in range(1, self._count + 1):
+            if self._timestamps[(self._next - offset) % self.capacity] < cutoff:
+                break
+            count += 1
+        return count
+
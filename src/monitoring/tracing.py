@@ -0,0 +1,497 @@
+"""
+Lightweight span tracing for the scrape pipeline.
+
+This module provides:
+- contextvars-based spans that nest across awaits and asyncio tasks
+- A shared no-op span when tracing is disabled, so instrumentation is near free
+- Prometheus histograms of stage durations
+- An OTLP/JSON lines file exporter readable by a local OpenTelemetry collector
+- An opt-in sampling profiler that writes flamegraph-ready folded stacks
+
+Stages are instrumented with ``span()``::
+
+    with span("fetch", roaster_id=roaster_id):
+        ...
+"""
+
+import functools
+import inspect
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter as StackCounter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from prometheus_client import Histogram
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+# Prometheus metrics
+pipeline_stage_duration = Histogram(
+    'pipeline_stage_duration_seconds',
+    'Duration of traced pipeline stages',
+    ['stage', 'outcome'],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0]
+)
+
+
+@dataclass
+class Span:
+    """A timed pipeline stage."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (0 while the span is open)."""
+        if self.end_time_ns is None:
+            return 0.0
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent_id is None
+
+    def set_attribute(self, key: str, value: Any):
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+
+class _NoopSpan:
+    """Span returned when tracing is disabled or the trace is not sampled."""
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+# Marks a trace whose root was not sampled so child spans are skipped too
+_UNSAMPLED = object()
+_current_span: ContextVar[Any] = ContextVar('pipeline_current_span', default=None)
+
+
+class PrometheusSpanExporter:
+    """Export span durations to the pipeline_stage_duration_seconds histogram."""
+
+    def export(self, span: Span):
+        pipeline_stage_duration.labels(
+            stage=span.name,
+            outcome='error' if span.error else 'success'
+        ).observe(span.duration)
+
+    def close(self):
+        pass
+
+
+class OTLPJsonFileExporter:
+    """
+    Append spans to a file in OTLP/JSON lines format.
+
+    Each line is an ExportTraceServiceRequest, as read by the OpenTelemetry
+    collector's ``otlpjsonfile`` receiver. Spans are buffered and written
+    when ``batch_size`` is reached, when a root span ends, or on close().
+    """
+
+    def __init__(self, path: str, service_name: str = "coffee-scraper", batch_size: int = 256):
+        """
+        Initialize file exporter.
+
+        Args:
+            path: File spans are appended to
+            service_name: service.name resource attribute
+            batch_size: Spans buffered before a write
+        """
+        self.path = path
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self._buffer: List[Span] = []
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, span: Span):
+        with self._lock:
+            self._buffer.append(span)
+            if span.is_root or len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        """Write buffered spans."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        self.flush()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        spans, self._buffer = self._buffer, []
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.to_otlp(spans), default=str) + "\n")
+        except OSError as e:
+            logger.warning("Failed to write trace file", path=self.path, error=str(e))
+
+    def to_otlp(self, spans: List[Span]) -> Dict[str, Any]:
+        """Build an OTLP/JSON ExportTraceServiceRequest for spans."""
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': [_otlp_attribute('service.name', self.service_name)]},
+                'scopeSpans': [{
+                    'scope': {'name': __name__},
+                    'spans': [_otlp_span(span) for span in spans]
+                }]
+            }]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {'boolValue': value}
+    elif isinstance(value, int):
+        typed = {'intValue': str(value)}
+    elif isinstance(value, float):
+        typed = {'doubleValue': value}
+    else:
+        typed = {'stringValue': str(value)}
+    return {'key': key, 'value': typed}
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    data = {
+        'traceId': span.trace_id,
+        'spanId': span.span_id,
+        'name': span.name,
+        'kind': 1,  # SPAN_KIND_INTERNAL
+        'startTimeUnixNano': str(span.start_time_ns),
+        'endTimeUnixNano': str(span.end_time_ns or span.start_time_ns),
+        'attributes': [_otlp_attribute(k, v) for k, v in span.attributes.items()],
+        'status': {'code': 2, 'message': span.error} if span.error else {'code': 1}
+    }
+    if span.parent_id:
+        data['parentSpanId'] = span.parent_id
+    return data
+
+
+class _SpanContext:
+    """Context manager that opens a span and exports it on exit."""
+
+    __slots__ = ('tracer', 'span', 'token')
+
+    def __init__(self, tracer: 'Tracer', span: Span):
+        self.tracer = tracer
+        self.span = span
+        self.token = None
+
+    def __enter__(self) -> Span:
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.span.end_time_ns = time.time_ns()
+        if exc is not None:
+            self.span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self.token)
+        self.tracer._export(self.span)
+        return False
+
+
+class _UnsampledContext:
+    """Context manager marking the current trace as not sampled."""
+
+    __slots__ = ('token',)
+
+    def __enter__(self) -> _NoopSpan:
+        self.token = _current_span.set(_UNSAMPLED)
+        return _NOOP_SPAN
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _current_span.reset(self.token)
+        return False
+
+
+class StackSampler:
+    """
+    Sampling profiler for a single thread.
+
+    A daemon thread periodically captures the target thread's stack and
+    counts identical stacks, producing the folded format consumed by
+    flamegraph.pl, speedscope and inferno.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None, max_depth: int = 128):
+        """
+        Initialize stack sampler.
+
+        Args:
+            interval: Seconds between samples
+            thread_id: Thread to sample (the calling thread if omitted)
+            max_depth: Frames kept per sample
+        """
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.max_depth = max_depth
+        self.samples: StackCounter = StackCounter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'StackSampler':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.stop()
+        return False
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._fold(frame)] += 1
+
+    def _fold(self, frame) -> str:
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            stack.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+            frame = frame.f_back
+        return ';'.join(reversed(stack))
+
+    def folded(self) -> str:
+        """Samples in folded stack format, one ``stack count`` per line."""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def write(self, path: str):
+        """Write folded stacks to a file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.folded())
+
+
+class Tracer:
+    """
+    Span tracer for pipeline stages.
+
+    When disabled, span() returns a shared no-op object without touching the
+    context. Sampling is decided once per trace at the root span; children of
+    an unsampled root are skipped as cheaply as when tracing is off.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        exporters: Optional[List[Any]] = None,
+        sample_rate: float = 1.0,
+        profile_dir: Optional[str] = None,
+        rng: Callable[[], float] = random.random
+    ):
+        """
+        Initialize tracer.
+
+        Args:
+            enabled: Record spans
+            exporters: Objects with export(span) and close() (Prometheus only if omitted)
+            sample_rate: Fraction of traces recorded (0-1)
+            profile_dir: Directory for folded stack profiles written by profile()
+            rng: Random source used for sampling
+        """
+        self.enabled = enabled
+        self.exporters = exporters if exporters is not None else [PrometheusSpanExporter()]
+        self.sample_rate = sample_rate
+        self.profile_dir = profile_dir
+        self._rng = rng
+
+    def span(self, name: str, **attributes: Any):
+        """
+        Context manager timing a pipeline stage.
+
+        Args:
+            name: Stage name (also the Prometheus stage label, keep it bounded)
+            **attributes: Span attributes (not used as metric labels)
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+
+        parent = _current_span.get()
+        if parent is _UNSAMPLED:
+            return _NOOP_SPAN
+        if parent is None:
+            if self.sample_rate < 1.0 and self._rng() >= self.sample_rate:
+                return _UnsampledContext()
+            trace_id, parent_id = os.urandom(16).hex(), None
+        else:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+
+        return _SpanContext(self, Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id,
+            attributes=attributes
+        ))
+
+    @contextmanager
+    def profile(self, name: str, enabled: bool = True, interval: float = 0.005) -> Iterator[Optional[StackSampler]]:
+        """
+        Sample the current thread's stacks for the duration of the block.
+
+        Folded stacks are written to ``<profile_dir>/<name>.folded``. Does
+        nothing unless enabled and a profile_dir is configured. Samples cover
+        everything running on the thread, so on an event loop thread they
+        include other tasks' frames as well.
+        """
+        if not enabled or not self.profile_dir:
+            yield None
+            return
+
+        sampler = StackSampler(interval=interval)
+        sampler.start()
+        try:
+            yield sampler
+        finally:
+            sampler.stop()
+            path = os.path.join(self.profile_dir, f"{name}.folded")
+            try:
+                sampler.write(path)
+                logger.info("Profile written", path=path, samples=sum(sampler.samples.values()))
+            except OSError as e:
+                logger.warning("Failed to write profile", path=path, error=str(e))
+
+    def close(self):
+        """Flush and close exporters."""
+        for exporter in self.exporters:
+            exporter.close()
+
+    def _export(self, span: Span):
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                logger.warning("Span export failed", span=span.name, error=str(e))
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
+
+
+def configure_tracing(
+    enabled: bool = True,
+    trace_file: Optional[str] = None,
+    sample_rate: float = 1.0,
+    profile_dir: Optional[str] = None,
+    service_name: str = "coffee-scraper"
+) -> Tracer:
+    """
+    Configure the process-wide tracer.
+
+    Args:
+        enabled: Record spans
+        trace_file: Also append spans to this OTLP/JSON lines file
+        sample_rate: Fraction of traces recorded (0-1)
+        profile_dir: Directory for folded stack profiles
+        service_name: service.name resource attribute in the trace file
+
+    Returns:
+        The configured tracer
+    """
+    global _tracer
+    _tracer.close()
+
+    exporters: List[Any] = [PrometheusSpanExporter()]
+    if trace_file:
+        exporters.append(OTLPJsonFileExporter(trace_file, service_name=service_name))
+
+    _tracer = Tracer(
+        enabled=enabled,
+        exporters=exporters,
+        sample_rate=sample_rate,
+        profile_dir=profile_dir
+    )
+    logger.info(
+        "Pipeline tracing configured",
+        enabled=enabled,
+        trace_file=trace_file,
+        sample_rate=sample_rate,
+        profile_dir=profile_dir
+    )
+    return _tracer
+
+
+def configure_tracing_from_env() -> Tracer:
+    """Configure the process-wide tracer from PIPELINE_TRACE_* environment variables."""
+    return configure_tracing(
+        enabled=os.getenv("PIPELINE_TRACING_ENABLED", "false").lower() == "true",
+        trace_file=os.getenv("PIPELINE_TRACE_FILE") or None,
+        sample_rate=float(os.getenv("PIPELINE_TRACE_SAMPLE_RATE", "1.0")),
+        profile_dir=os.getenv("PIPELINE_PROFILE_DIR") or None
+    )
+
+
+def span(name: str, **attributes: Any):
+    """Open a span on the process-wide tracer."""
+    return _tracer.span(name, **attributes)
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span, if any."""
+    value = _current_span.get()
+    return value if isinstance(value, Span) else None
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator wrapping a function in a span on the process-wide tracer."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with _tracer.span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _tracer.span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,170 @@
+"""
+Size- and age-bounded in-memory stores for pipeline bookkeeping.
+
+Pipeline state and transactions are keyed by execution ID and kept in memory
+while an artifact is processed. Plain dicts and lists grew with every artifact
+in long-running workers because nothing on the hot path removed finished
+entries. BoundedStore evicts the least recently written entries once it holds
+more than max_size, and entries older than max_age_seconds, on every write.
+Live sizes and evictions are exported as Prometheus metrics per store name.
+Sizes are summed over live stores at collect time, so stores dropped with
+their pipeline service stop being counted once they are garbage collected.
+"""
+
+import json
+import os
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, MutableMapping, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+STORE_ENTRIES = Gauge(
+    'pipeline_store_entries',
+    'Entries held in bounded pipeline stores',
+    ['store']
+)
+STORE_EVICTIONS = Counter(
+    'pipeline_store_evictions_total',
+    'Entries evicted from bounded pipeline stores',
+    ['store', 'reason']
+)
+
+EvictionCallback = Callable[[str, Any, str], None]
+
+# mappings are unhashable, so live stores are held weakly by id() per store name
+_live_stores: Dict[str, 'weakref.WeakValueDictionary[int, BoundedStore]'] = {}
+
+
+def _register_store(store: 'BoundedStore'):
+    """Track a store so its size is reported under its name until it is collected."""
+    stores = _live_stores.get(store.name)
+    if stores is None:
+        stores = weakref.WeakValueDictionary()
+        _live_stores[store.name] = stores
+        STORE_ENTRIES.labels(store=store.name).set_function(
+            lambda: sum(len(live) for live in list(stores.values()))
+        )
+    stores[id(store)] = store
+
+
+class BoundedStore(MutableMapping):
+    """
+    Insertion-ordered mapping bounded by size and entry age.
+
+    Writing a key moves it to the newest position and restarts its age.
+    ``on_evict(key, value, reason)`` is called for every evicted entry with
+    reason ``size`` or ``age``; explicit deletes are not evictions.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        max_age_seconds: Optional[float] = None,
+        on_evict: Optional[EvictionCallback] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize bounded store.
+
+        Args:
+            name: Store label in metrics and logs
+            max_size: Maximum entries kept
+            max_age_seconds: Maximum entry age (unbounded if None)
+            on_evict: Called with (key, value, reason) for evicted entries
+            clock: Monotonic time source
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.name = name
+        self.max_size = max_size
+        self.max_age_seconds = max_age_seconds
+        self.on_evict = on_evict
+        self._clock = clock
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self.evictions: Dict[str, int] = {'size': 0, 'age': 0}
+        _register_store(self)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._entries[key][1]
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = (self._clock(), value)
+        self.evict_expired()
+        while len(self._entries) > self.max_size:
+            self._evict_oldest('size')
+
+    def __delitem__(self, key: str):
+        del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def evict_expired(self) -> int:
+        """Evict entries older than max_age_seconds; returns the number evicted."""
+        if self.max_age_seconds is None:
+            return 0
+        cutoff = self._clock() - self.max_age_seconds
+        evicted = 0
+        while self._entries:
+            written_at, _ = next(iter(self._entries.values()))
+            if written_at > cutoff:
+                break
+            self._evict_oldest('age')
+            evicted += 1
+        return evicted
+
+    def _evict_oldest(self, reason: str):
+        key, (_, value) = self._entries.popitem(last=False)
+        self.evictions[reason] += 1
+        STORE_EVICTIONS.labels(store=self.name, reason=reason).inc()
+        if self.on_evict is not None:
+            try:
+                self.on_evict(key, value, reason)
+            except Exception as e:
+                logger.warning("Bounded store eviction callback failed",
+                               store=self.name, key=key, error=str(e))
+
+    def clear(self):
+        self._entries.clear()
+
+
+class JsonLinesSpillLog:
+    """
+    Append-only JSON lines log for records evicted from memory.
+
+    The file is rotated to ``<path>.1`` (replacing the previous one) once it
+    exceeds max_bytes, so disk use stays bounded too.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 50 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.records_written = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def append(self, record: Dict[str, Any]):
+        line = json.dumps(record, separators=(',', ':'), default=str) + '\n'
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) + len(line) > self.max_bytes:
+                os.replace(self.path, f"{self.path}.1")
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+            self.records_written += 1
+        except OSError as e:
+            logger.warning("Failed to spill record", path=self.path, error=str(e))
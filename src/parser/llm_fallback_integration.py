@@ -14,7 +14,7 @@ from structlog import get_logger
 
 from .pipeline_state import PipelineState
 from ..llm.llm_interface import LLMResult
-from ..llm.deepseek_wrapper import DeepSeekWrapperService
+from ..llm.deepseek_wrapper import DeepSeekWrapperService, RateLimitExceededError
 from ..llm.cache_service import CacheService
 from ..llm.rate_limiter import RateLimiter
 from ..llm.confidence_evaluator import ConfidenceEvaluator
@@ -74,19 +74,6 @@ class LLMFallbackService:
         
         for field in ambiguous_fields:
             try:
-                # Check rate limits
-                if not self.rate_limiter.can_make_request(artifact.get('roaster_id', 'default')):
-                    logger.warning("Rate limit exceeded for LLM fallback", 
-                                 field=field, 
-                                 roaster_id=artifact.get('roaster_id', 'default'))
-                    # Record rate limit exceeded
-                    self.llm_metrics.record_rate_limit_exceeded(artifact.get('roaster_id', 'default'))
-                    # Add warning to pipeline state if available
-                    if pipeline_state and hasattr(pipeline_state, 'add_warning'):
-                        pipeline_state.add_warning(f"Rate limit exceeded for LLM fallback on field {field}")
-                    llm_results[field] = self._create_rate_limit_marker(field)
-                    continue
-                
                 # Check cache first
                 cache_key = self._generate_cache_key(artifact, field)
                 cached_result = self.cache_service.get(cache_key)
@@ -96,12 +83,23 @@ class LLMFallbackService:
                     llm_results[field] = self._create_llm_result_from_cache(field, cached_result)
                     continue
                 
-                # Use Epic D's LLM service
+                # Use Epic D's LLM service; its acquire() is the only rate limit gate
                 prompt = self._get_llm_prompt(field, artifact)
-                llm_result = await self.llm_service.enrich_field(artifact, field, prompt)
+                try:
+                    llm_result = await self.llm_service.enrich_field(artifact, field, prompt)
+                except RateLimitExceededError:
+                    logger.warning("Rate limit exceeded for LLM fallback", 
+                                 field=field, 
+                                 roaster_id=artifact.get('roaster_id', 'default'))
+                    # Record rate limit exceeded
+                    self.llm_metrics.record_rate_limit_exceeded(artifact.get('roaster_id', 'default'))
+                    # Add warning to pipeline state if available
+                    if pipeline_state and hasattr(pipeline_state, 'add_warning'):
+                        pipeline_state.add_warning(f"Rate limit exceeded for LLM fallback on field {field}")
+                    llm_results[field] = self._create_rate_limit_marker(field)
+                    continue
                 
-                # Record the request for rate limiting and metrics
-                self.rate_limiter.record_request(artifact.get('roaster_id', 'default'))
+                # Record the request for metrics
                 self.llm_metrics.record_llm_call(artifact.get('roaster_id', 'default'), field, llm_result)
                 
                 # Apply Epic D's confidence evaluation
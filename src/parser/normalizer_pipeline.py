@@ -12,6 +12,7 @@ Features:
 import time
 import asyncio
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 from structlog import get_logger
@@ -22,8 +23,9 @@ from .pipeline_state import (
 )
 from .error_recovery import PipelineErrorRecovery, RecoveryDecision
 from .transaction_manager import PipelineTransactionManager, TransactionBoundary
+from .bounded_store import BoundedStore
 from ..config.pipeline_config import PipelineConfig
-from ..llm.deepseek_wrapper import DeepSeekWrapperService
+from ..llm.deepseek_wrapper import DeepSeekWrapperService, RateLimitExceededError
 from ..llm.cache_service import CacheService
 from ..llm.rate_limiter import RateLimiter
 from ..llm.confidence_evaluator import ConfidenceEvaluator
@@ -32,6 +34,7 @@ from ..llm.enrichment_persistence import EnrichmentPersistence
 from ..llm.llm_metrics import LLMServiceMetrics
 from ..monitoring.confidence_metrics import ConfidenceMetrics
 from ..monitoring.normalizer_pipeline_metrics import NormalizerPipelineMetrics
+from ..monitoring.tracing import traced
 
 # Import all C.1-C.7 parsers
 from .weight_parser import WeightParser, WeightResult
@@ -67,9 +70,20 @@ class NormalizerPipelineService:
         self.parsers = self._initialize_parsers(config)
         self.execution_order = self._define_execution_order()
         self.error_recovery = PipelineErrorRecovery(config.error_recovery)
-        self.state_manager = PipelineStateManager()
-        self.transaction_manager = PipelineTransactionManager(rpc_client) if rpc_client else None
-        self.metrics = NormalizerPipelineMetrics() if config.enable_metrics else None
+        self.state_manager = PipelineStateManager(
+            max_states=config.max_active_executions,
+            max_age_seconds=config.execution_ttl_seconds
+        )
+        self.transaction_manager = PipelineTransactionManager(
+            rpc_client,
+            max_active=config.max_active_executions,
+            active_ttl_seconds=config.execution_ttl_seconds,
+            max_completed=config.completed_transactions_retained,
+            spill_path=config.transaction_spill_path
+        ) if rpc_client else None
+        self.metrics = NormalizerPipelineMetrics(
+            recent_executions_size=config.metrics_recent_executions
+        ) if config.enable_metrics else None
         
         # Epic D services (if available)
         self.llm_service = None
@@ -191,13 +205,84 @@ class NormalizerPipelineService:
         
         logger.info("Epic D services initialized for LLM fallback")
     
+    @traced("normalize")
     def process_artifact(self, artifact: Dict) -> Dict[str, Any]:
         """Process artifact through complete normalizer pipeline."""
         start_time = time.time()
+        state, transaction = self._start_execution(artifact)
+        
+        try:
+            logger.info("Starting pipeline processing", execution_id=state.execution_id)
+            
+            # Execute deterministic parsers
+            state.stage = PipelineStage.DETERMINISTIC_PARSING
+            deterministic_results = self._execute_deterministic_parsers(artifact, state)
+            
+            # Check if LLM fallback is needed
+            needs_llm_fallback = self._needs_llm_fallback(deterministic_results)
+            
+            if needs_llm_fallback and self.llm_service:
+                state.stage = PipelineStage.LLM_FALLBACK
+                state.llm_results = self._execute_llm_fallback(artifact, deterministic_results, state)
+                self._record_llm_fallback_usage(state)
+            
+            return self._complete_execution(state, transaction, deterministic_results, start_time)
+            
+        except Exception as e:
+            self._fail_execution(state, transaction, e)
+    
+    @traced("normalize")
+    async def process_artifact_async(self, artifact: Dict) -> Dict[str, Any]:
+        """
+        Process artifact through the pipeline without blocking the event loop on LLM calls.
+        
+        All ambiguous fields of the artifact are sent to the LLM service in a single
+        multi-field request instead of one request per field.
+        """
+        start_time = time.time()
+        state, transaction = self._start_execution(artifact)
         
-        # Initialize pipeline state
+        try:
+            logger.info("Starting pipeline processing", execution_id=state.execution_id)
+            
+            state.stage = PipelineStage.DETERMINISTIC_PARSING
+            deterministic_results = self._execute_deterministic_parsers(artifact, state)
+            
+            if self._needs_llm_fallback(deterministic_results) and self.llm_service:
+                state.stage = PipelineStage.LLM_FALLBACK
+                state.llm_results = await self._execute_llm_fallback_async(artifact, deterministic_results, state)
+                self._record_llm_fallback_usage(state)
+            
+            return self._complete_execution(state, transaction, deterministic_results, start_time)
+            
+        except Exception as e:
+            self._fail_execution(state, transaction, e)
+    
+    async def process_batch_async(self, artifacts: List[Dict]) -> List[Dict[str, Any]]:
+        """
+        Process artifacts concurrently, bounded by llm_fallback.max_concurrent_artifacts.
+        
+        Failed artifacts yield the failed pipeline result instead of aborting the batch.
+        Results are returned in input order.
+        """
+        semaphore = asyncio.Semaphore(self.config.llm_fallback.max_concurrent_artifacts)
+        
+        async def process_one(artifact: Dict) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.process_artifact_async(artifact)
+                except PipelineExecutionError as e:
+                    return self._create_pipeline_result(e.state, 0.0)
+        
+        return await asyncio.gather(*(process_one(artifact) for artifact in artifacts))
+    
+    def _start_execution(self, artifact: Optional[Dict] = None) -> Tuple[PipelineState, Any]:
+        """Create pipeline state and open a transaction for one artifact."""
+        roaster, platform = self._metric_dimensions(artifact or {})
         state = PipelineState(
             execution_id=str(uuid.uuid4()),
+            roaster=roaster,
+            platform=platform,
             stage=PipelineStage.INITIALIZED,
             deterministic_results={},
             llm_results={},
@@ -216,84 +301,99 @@ class NormalizerPipelineService:
             )
             transaction.mark_in_progress()
         
-        try:
-            logger.info("Starting pipeline processing", execution_id=state.execution_id)
-            
-            # Execute deterministic parsers
-            state.stage = PipelineStage.DETERMINISTIC_PARSING
-            deterministic_results = self._execute_deterministic_parsers(artifact, state)
-            
-            # Check if LLM fallback is needed
-            needs_llm_fallback = self._needs_llm_fallback(deterministic_results)
-            
-            if needs_llm_fallback and self.llm_service:
-                state.stage = PipelineStage.LLM_FALLBACK
-                llm_results = self._execute_llm_fallback(artifact, deterministic_results, state)
-                state.llm_results = llm_results
-                
-                # Record LLM fallback metrics
-                if self.metrics and llm_results:
-                    for field, result in llm_results.items():
-                        self.metrics.record_llm_fallback_usage(state.execution_id, field)
-            
-            state.stage = PipelineStage.COMPLETED
-            processing_time = time.time() - start_time
-            
-            # Commit transaction if successful
-            if transaction:
-                transaction.commit()
-            
-            # Record metrics
-            if self.metrics:
-                self.metrics.record_pipeline_execution(
-                    state.execution_id,
-                    processing_time,
-                    state.stage.value,
-                    list(deterministic_results.keys()),
-                    len(state.llm_results) > 0
-                )
-                
-                # Record pipeline confidence
-                self.metrics.record_pipeline_confidence(
+        return state, transaction
+    
+    @staticmethod
+    def _metric_dimensions(artifact: Dict) -> Tuple[Optional[str], Optional[str]]:
+        """Roaster and platform of an artifact, used as bounded metric labels."""
+        roaster = artifact.get('roaster_id') or artifact.get('roaster_domain')
+        platform = artifact.get('source')
+        if not platform and isinstance(artifact.get('product'), dict):
+            platform = artifact['product'].get('platform')
+        platform = getattr(platform, 'value', platform)
+        return (str(roaster) if roaster else None), (str(platform) if platform else None)
+    
+    def _record_llm_fallback_usage(self, state: PipelineState):
+        """Record LLM fallback metrics."""
+        if self.metrics and state.llm_results:
+            for field, result in state.llm_results.items():
+                self.metrics.record_llm_fallback(
+                    field,
                     state.execution_id,
-                    state.stage.value,
-                    state.get_overall_confidence()
+                    getattr(result, 'execution_time', 0.0),
+                    getattr(result, 'confidence', 0.0),
+                    getattr(result, 'success', False)
                 )
+    
+    def _complete_execution(self, state: PipelineState, transaction: Any,
+                            deterministic_results: Dict[str, ParserResult], start_time: float) -> Dict[str, Any]:
+        """Mark pipeline completed, commit and record metrics."""
+        state.stage = PipelineStage.COMPLETED
+        processing_time = time.time() - start_time
+        
+        # Commit transaction if successful
+        if transaction:
+            transaction.commit()
+            self.transaction_manager.finish_transaction(state.execution_id)
+        
+        # Record metrics
+        if self.metrics:
+            self.metrics.record_pipeline_execution(
+                state.execution_id,
+                processing_time,
+                state.stage.value,
+                list(deterministic_results.keys()),
+                len(state.llm_results) > 0,
+                roaster=state.roaster,
+                platform=state.platform
+            )
             
-            logger.info("Pipeline processing completed", 
-                       execution_id=state.execution_id,
-                       processing_time=processing_time,
-                       deterministic_results=len(deterministic_results),
-                       llm_results=len(state.llm_results))
-            
-            return self._create_pipeline_result(state, processing_time)
-            
-        except Exception as e:
-            state.stage = PipelineStage.FAILED
-            state.add_error(PipelineError(
-                stage=state.stage,
+            # Record pipeline confidence
+            self.metrics.record_pipeline_confidence(
+                state.execution_id,
+                state.stage.value,
+                state.get_overall_confidence(),
+                platform=state.platform
+            )
+        
+        logger.info("Pipeline processing completed", 
+                   execution_id=state.execution_id,
+                   processing_time=processing_time,
+                   deterministic_results=len(deterministic_results),
+                   llm_results=len(state.llm_results))
+        
+        return self._create_pipeline_result(state, processing_time)
+    
+    def _fail_execution(self, state: PipelineState, transaction: Any, error: Exception):
+        """Record pipeline failure, roll back and raise PipelineExecutionError."""
+        state.stage = PipelineStage.FAILED
+        state.add_error(PipelineError(
+            stage=state.stage,
+            error_type="pipeline_failure",
+            message=str(error),
+            recoverable=self.error_recovery.is_recoverable(error)
+        ))
+        
+        # Record error metrics
+        if self.metrics:
+            self.metrics.record_pipeline_error(
+                state.execution_id,
                 error_type="pipeline_failure",
-                message=str(e),
-                recoverable=self.error_recovery.is_recoverable(e)
-            ))
-            
-            # Record error metrics
-            if self.metrics:
-                self.metrics.record_pipeline_error(
-                    state.execution_id,
-                    state.stage.value,
-                    "pipeline_failure"
-                )
-            
-            # Rollback transaction on failure
-            if transaction:
-                transaction.rollback()
-            
-            logger.error("Pipeline execution failed", 
-                        execution_id=state.execution_id,
-                        error=str(e))
-            
-            raise PipelineExecutionError(f"Pipeline execution failed: {str(e)}", state)
+                stage=state.stage.value,
+                roaster=state.roaster,
+                platform=state.platform
+            )
+        
+        # Rollback transaction on failure
+        if transaction:
+            transaction.rollback()
+            self.transaction_manager.finish_transaction(state.execution_id)
+        
+        logger.error("Pipeline execution failed", 
+                    execution_id=state.execution_id,
+                    error=str(error))
+        
+        raise PipelineExecutionError(f"Pipeline execution failed: {str(error)}", state) from error
     
     def _execute_deterministic_parsers(self, artifact: Dict, state: PipelineState) -> Dict[str, ParserResult]:
         """Execute deterministic parsers with error recovery."""
@@ -624,72 +724,103 @@ class NormalizerPipelineService:
         return low_confidence_count > 0
     
     def _execute_llm_fallback(self, artifact: Dict, deterministic_results: Dict[str, ParserResult], state: PipelineState) -> Dict[str, LLMResult]:
-        """Execute LLM fallback for ambiguous cases using Epic D services."""
+        """
+        Execute LLM fallback for ambiguous cases from synchronous code.
+        
+        The LLM service is async, so this runs _execute_llm_fallback_async to
+        completion: on a fresh event loop, or on a worker thread when called
+        from inside a running loop (which blocks that loop; async callers
+        should use process_artifact_async instead).
+        """
         if not self.llm_service:
             logger.warning("LLM service not available for fallback")
             return {}
         
-        llm_results = {}
+        coroutine = self._execute_llm_fallback_async(artifact, deterministic_results, state)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    
+    async def _execute_llm_fallback_async(self, artifact: Dict, deterministic_results: Dict[str, ParserResult], state: PipelineState) -> Dict[str, LLMResult]:
+        """
+        Execute LLM fallback for all ambiguous fields with one multi-field request.
+        
+        Rate limiting is enforced once, by the LLM service's acquire(); a
+        rate-limited artifact gets no LLM results.
+        """
         ambiguous_fields = self._identify_ambiguous_fields(deterministic_results)
         
         if not ambiguous_fields:
-            return llm_results
+            return {}
         
         logger.info("Executing LLM fallback", fields=ambiguous_fields)
         
+        prompts = {field: self._get_llm_prompt(field) for field in ambiguous_fields}
+        try:
+            enriched = await self.llm_service.enrich_fields(artifact, prompts)
+        except RateLimitExceededError:
+            logger.warning("Rate limit exceeded for LLM fallback", fields=ambiguous_fields)
+            return {}
+        except Exception as e:
+            logger.error("LLM fallback failed", fields=ambiguous_fields, error=str(e))
+            return {field: self._failed_llm_result(field, e) for field in ambiguous_fields}
+        
+        llm_results = {}
         for field in ambiguous_fields:
+            if field not in enriched:
+                llm_results[field] = self._failed_llm_result(field, LookupError("field missing from LLM response"))
+                continue
             try:
-                # Check rate limits
-                if not self.rate_limiter.can_make_request(artifact.get('roaster_id', 'default')):
-                    logger.warning("Rate limit exceeded for LLM fallback", field=field)
-                    continue
-                
-                # Use Epic D's LLM service
-                llm_result = self.llm_service.enrich_field(artifact, field, self._get_llm_prompt(field))
-                
-                # Record the request
-                self.rate_limiter.record_request(artifact.get('roaster_id', 'default'))
-                
-                # Apply confidence evaluation
-                confidence_evaluation = self.confidence_evaluator.evaluate_confidence(llm_result)
-                
-                # Persist enrichment data
-                enrichment_id = self.enrichment_persistence.persist_enrichment(artifact, llm_result, confidence_evaluation)
-                
-                if confidence_evaluation.action == 'auto_apply':
-                    llm_results[field] = LLMResult(
-                        field_name=field,
-                        success=True,
-                        confidence=confidence_evaluation.final_confidence,
-                        result_data=llm_result.to_dict(),
-                        warnings=[],
-                        execution_time=0.0
-                    )
-                else:
-                    # Mark for review
-                    self.review_workflow.mark_for_review(artifact, llm_result, confidence_evaluation)
-                    llm_results[field] = LLMResult(
-                        field_name=field,
-                        success=False,
-                        confidence=confidence_evaluation.final_confidence,
-                        result_data={'enrichment_id': enrichment_id, 'status': 'review'},
-                        warnings=['Marked for manual review'],
-                        execution_time=0.0
-                    )
-                
+                llm_results[field] = self._evaluate_llm_result(artifact, field, enriched[field])
             except Exception as e:
                 logger.error("LLM fallback failed", field=field, error=str(e))
-                llm_results[field] = LLMResult(
-                    field_name=field,
-                    success=False,
-                    confidence=0.0,
-                    result_data={},
-                    warnings=[f"LLM fallback failed: {str(e)}"],
-                    execution_time=0.0
-                )
+                llm_results[field] = self._failed_llm_result(field, e)
         
         return llm_results
     
+    def _evaluate_llm_result(self, artifact: Dict, field: str, llm_result: Any) -> LLMResult:
+        """Apply confidence evaluation, persist enrichment and route to review if needed."""
+        confidence_evaluation = self.confidence_evaluator.evaluate_confidence(llm_result)
+        
+        # Persist enrichment data
+        enrichment_id = self.enrichment_persistence.persist_enrichment(artifact, llm_result, confidence_evaluation)
+        
+        if confidence_evaluation.action == 'auto_apply':
+            return LLMResult(
+                field_name=field,
+                success=True,
+                confidence=confidence_evaluation.final_confidence,
+                result_data=llm_result.to_dict() if hasattr(llm_result, 'to_dict') else llm_result.model_dump(),
+                warnings=[],
+                execution_time=0.0
+            )
+        
+        # Mark for review
+        self.review_workflow.mark_for_review(artifact, llm_result, confidence_evaluation)
+        return LLMResult(
+            field_name=field,
+            success=False,
+            confidence=confidence_evaluation.final_confidence,
+            result_data={'enrichment_id': enrichment_id, 'status': 'review'},
+            warnings=['Marked for manual review'],
+            execution_time=0.0
+        )
+    
+    def _failed_llm_result(self, field: str, error: Exception) -> LLMResult:
+        """Create LLM result for a failed fallback."""
+        return LLMResult(
+            field_name=field,
+            success=False,
+            confidence=0.0,
+            result_data={},
+            warnings=[f"LLM fallback failed: {str(error)}"],
+            execution_time=0.0
+        )
+    
     def _identify_ambiguous_fields(self, deterministic_results: Dict[str, ParserResult]) -> List[str]:
         """Identify fields that need LLM fallback."""
         ambiguous_fields = []
@@ -740,8 +871,9 @@ class NormalizerPipelineService:
 class PipelineStateManager:
     """Manager for pipeline state operations."""
     
-    def __init__(self):
-        self.active_states: Dict[str, PipelineState] = {}
+    def __init__(self, max_states: int = 10000, max_age_seconds: Optional[float] = 3600.0):
+        # States that are never cleaned up are evicted by size and age
+        self.active_states: BoundedStore = BoundedStore('pipeline_states', max_states, max_age_seconds)
     
     def create_state(self) -> PipelineState:
         """Create new pipeline state."""
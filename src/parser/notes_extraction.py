@@ -6,34 +6,41 @@ Features:
 - Confidence scoring for extraction accuracy
 - Batch processing optimization for multiple products
 - Comprehensive error handling and logging
-- Pydantic result models for type safety
+- Lightweight slotted result objects for the parser hot path
 """
 
 import re
 from typing import Dict, List, Optional, Tuple, Any
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from structlog import get_logger
 
 logger = get_logger(__name__)
 
 
-class NotesExtractionResult(BaseModel):
-    """Represents a notes extraction result with metadata."""
+@dataclass(slots=True, kw_only=True)
+class NotesExtractionResult:
+    """Represents a notes extraction result with metadata (internal hot-path result)."""
     
-    notes_raw: List[str] = Field(..., description="Extracted tasting notes")
-    confidence_scores: List[float] = Field(..., description="Confidence scores for each note")
-    warnings: List[str] = Field(default_factory=list, description="Extraction warnings")
-    total_notes: int = Field(..., description="Total number of extracted notes")
-    extraction_success: bool = Field(..., description="Whether extraction was successful")
+    notes_raw: List[str]  # Extracted tasting notes
+    confidence_scores: List[float]  # Confidence scores for each note
+    warnings: List[str] = field(default_factory=list)
+    total_notes: int  # Total number of extracted notes
+    extraction_success: bool
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        return self.model_dump()
+        return {
+            'notes_raw': list(self.notes_raw),
+            'confidence_scores': list(self.confidence_scores),
+            'warnings': list(self.warnings),
+            'total_notes': self.total_notes,
+            'extraction_success': self.extraction_success
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'NotesExtractionResult':
         """Create NotesExtractionResult from dictionary."""
-        return cls.model_validate(data)
+        return cls(**data)
 
 
 class NotesExtractionService:
@@ -9,6 +9,7 @@ Features:
 """
 
 import uuid
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
@@ -42,34 +43,93 @@ class PipelineError(BaseModel):
         return self.model_dump()
 
 
-class PipelineWarning(BaseModel):
-    """Represents a pipeline warning."""
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _coerce_datetime(value: Any) -> datetime:
+    """Accept ISO strings produced by to_dict() round-trips."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+@dataclass(slots=True, kw_only=True)
+class PipelineWarning:
+    """
+    Represents a pipeline warning.
     
-    stage: PipelineStage = Field(..., description="Stage where warning occurred")
-    parser_name: Optional[str] = Field(default=None, description="Parser that generated warning")
-    message: str = Field(..., description="Warning message")
-    severity: str = Field(default="low", description="Warning severity (low, medium, high)")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    Internal hot-path object (created per low-confidence parser result), so it is a
+    slotted dataclass rather than a validated pydantic model.
+    """
+    
+    stage: PipelineStage
+    parser_name: Optional[str] = None
+    message: str
+    severity: str = "low"  # low, medium, high
+    timestamp: datetime = field(default_factory=_utcnow)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        return self.model_dump()
+        return {
+            'stage': self.stage,
+            'parser_name': self.parser_name,
+            'message': self.message,
+            'severity': self.severity,
+            'timestamp': self.timestamp
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PipelineWarning':
+        """Create PipelineWarning from dictionary."""
+        data = dict(data)
+        data['stage'] = PipelineStage(data['stage'])
+        if 'timestamp' in data:
+            data['timestamp'] = _coerce_datetime(data['timestamp'])
+        return cls(**data)
 
 
-class ParserResult(BaseModel):
-    """Represents a parser execution result."""
+@dataclass(slots=True, kw_only=True)
+class ParserResult:
+    """
+    Represents a parser execution result.
     
-    parser_name: str = Field(..., description="Name of the parser")
-    success: bool = Field(..., description="Whether parsing was successful")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
-    result_data: Dict[str, Any] = Field(default_factory=dict, description="Parsed data")
-    warnings: List[str] = Field(default_factory=list, description="Parser warnings")
-    execution_time: float = Field(default=0.0, description="Execution time in seconds")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    Built once per parser per artifact and never crosses a trust boundary, so it is a
+    slotted dataclass; pydantic validation stays at ArtifactModel ingestion and RPC
+    payload edges.
+    """
+    
+    parser_name: str
+    success: bool
+    confidence: float
+    result_data: Dict[str, Any] = field(default_factory=dict)
+    warnings: List[str] = field(default_factory=list)
+    execution_time: float = 0.0  # seconds
+    timestamp: datetime = field(default_factory=_utcnow)
+    
+    def __post_init__(self):
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(f"confidence must be between 0.0 and 1.0, got {self.confidence}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        return self.model_dump()
+        return {
+            'parser_name': self.parser_name,
+            'success': self.success,
+            'confidence': self.confidence,
+            'result_data': self.result_data,
+            'warnings': list(self.warnings),
+            'execution_time': self.execution_time,
+            'timestamp': self.timestamp
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ParserResult':
+        """Create ParserResult from dictionary."""
+        data = dict(data)
+        if 'timestamp' in data:
+            data['timestamp'] = _coerce_datetime(data['timestamp'])
+        return cls(**data)
 
 
 class LLMResult(BaseModel):
@@ -97,6 +157,8 @@ class PipelineState(BaseModel):
     llm_results: Dict[str, LLMResult] = Field(default_factory=dict, description="LLM fallback results")
     errors: List[PipelineError] = Field(default_factory=list, description="Pipeline errors")
     warnings: List[PipelineWarning] = Field(default_factory=list, description="Pipeline warnings")
+    roaster: Optional[str] = Field(default=None, description="Roaster of the processed artifact")
+    platform: Optional[str] = Field(default=None, description="Source platform of the processed artifact")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
@@ -193,7 +255,7 @@ class PipelineState(BaseModel):
         if 'deterministic_results' in data:
             deterministic_results = {}
             for k, v in data['deterministic_results'].items():
-                deterministic_results[k] = ParserResult(**v)
+                deterministic_results[k] = ParserResult.from_dict(v)
             data['deterministic_results'] = deterministic_results
         
         # Convert LLM results
@@ -209,6 +271,6 @@ class PipelineState(BaseModel):
         
         # Convert warnings
         if 'warnings' in data:
-            data['warnings'] = [PipelineWarning(**warning) for warning in data['warnings']]
+            data['warnings'] = [PipelineWarning.from_dict(warning) for warning in data['warnings']]
         
         return cls(**data)
@@ -12,24 +12,35 @@ Features:
 
 import re
 from typing import Any, Dict, List, Optional, Tuple
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from structlog import get_logger
 
 logger = get_logger(__name__)
 
 
-class RoastResult(BaseModel):
-    """Represents a parsed roast level result with metadata."""
+@dataclass(slots=True, kw_only=True)
+class RoastResult:
+    """Represents a parsed roast level result with metadata (internal hot-path result)."""
     
-    enum_value: str = Field(..., description="Canonical roast level")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score 0.0-1.0")
-    original_text: str = Field(..., description="Original roast text")
-    parsing_warnings: List[str] = Field(default_factory=list, description="Parsing warnings")
-    conversion_notes: str = Field("", description="Conversion notes")
+    enum_value: str  # Canonical roast level
+    confidence: float  # Confidence score 0.0-1.0
+    original_text: str
+    parsing_warnings: List[str] = field(default_factory=list)
+    conversion_notes: str = ""
+    
+    def __post_init__(self):
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(f"confidence must be between 0.0 and 1.0, got {self.confidence}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage (aligned with WeightResult)."""
-        return self.model_dump()
+        return {
+            'enum_value': self.enum_value,
+            'confidence': self.confidence,
+            'original_text': self.original_text,
+            'parsing_warnings': list(self.parsing_warnings),
+            'conversion_notes': self.conversion_notes
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RoastResult':
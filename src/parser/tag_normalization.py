@@ -6,34 +6,41 @@ Features:
 - Confidence scoring for tag normalization accuracy
 - Batch processing optimization for multiple products
 - Comprehensive error handling and logging
-- Pydantic result models for type safety
+- Lightweight slotted result objects for the parser hot path
 """
 
 import re
 from typing import Dict, List, Optional, Tuple, Any
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from structlog import get_logger
 
 logger = get_logger(__name__)
 
 
-class TagNormalizationResult(BaseModel):
-    """Represents a tag normalization result with metadata."""
+@dataclass(slots=True, kw_only=True)
+class TagNormalizationResult:
+    """Represents a tag normalization result with metadata (internal hot-path result)."""
     
-    normalized_tags: Dict[str, List[str]] = Field(..., description="Normalized tags by category")
-    confidence_scores: Dict[str, float] = Field(..., description="Confidence scores by category")
-    warnings: List[str] = Field(default_factory=list, description="Normalization warnings")
-    total_tags: int = Field(..., description="Total number of input tags")
-    normalized_count: int = Field(..., description="Number of successfully normalized tags")
+    normalized_tags: Dict[str, List[str]]  # Normalized tags by category
+    confidence_scores: Dict[str, float]  # Confidence scores by category
+    warnings: List[str] = field(default_factory=list)
+    total_tags: int  # Total number of input tags
+    normalized_count: int  # Number of successfully normalized tags
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        return self.model_dump()
+        return {
+            'normalized_tags': {k: list(v) for k, v in self.normalized_tags.items()},
+            'confidence_scores': dict(self.confidence_scores),
+            'warnings': list(self.warnings),
+            'total_tags': self.total_tags,
+            'normalized_count': self.normalized_count
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TagNormalizationResult':
         """Create TagNormalizationResult from dictionary."""
-        return cls.model_validate(data)
+        return cls(**data)
 
 
 class TagNormalizationService:
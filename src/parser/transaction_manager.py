@@ -14,6 +14,7 @@ from datetime import datetime, timezone, timedelta
 from enum import Enum
 from structlog import get_logger
 
+from .bounded_store import BoundedStore, JsonLinesSpillLog
 from .pipeline_state import PipelineState, PipelineStage, PipelineError
 from ..validator.rpc_client import RPCClient
 
@@ -240,12 +241,48 @@ class PipelineTransaction:
 
 
 class PipelineTransactionManager:
-    """Manager for pipeline transactions."""
+    """
+    Manager for pipeline transactions.
+
+    Active and completed transactions are held in bounded stores so a
+    long-running worker does not accumulate one entry per artifact. Active
+    transactions that are never finished are evicted after
+    ``active_ttl_seconds``; completed ones are kept up to ``max_completed``
+    for statistics. With ``spill_path`` set, completed transactions evicted
+    from memory are appended to a JSON lines log instead of being dropped.
+    """
     
-    def __init__(self, rpc_client: RPCClient):
+    def __init__(self,
+                 rpc_client: RPCClient,
+                 max_active: int = 10000,
+                 active_ttl_seconds: Optional[float] = 3600.0,
+                 max_completed: int = 1000,
+                 completed_max_age_seconds: Optional[float] = 24 * 3600.0,
+                 spill_path: Optional[str] = None):
         self.rpc_client = rpc_client
-        self.active_transactions: Dict[str, PipelineTransaction] = {}
-        self.completed_transactions: List[PipelineTransaction] = []
+        self.spill_log = JsonLinesSpillLog(spill_path) if spill_path else None
+        self.active_transactions: BoundedStore = BoundedStore(
+            'active_transactions', max_active, active_ttl_seconds,
+            on_evict=self._on_active_evicted
+        )
+        self.completed_transactions: BoundedStore = BoundedStore(
+            'completed_transactions', max_completed, completed_max_age_seconds,
+            on_evict=self._on_completed_evicted
+        )
+    
+    def _on_active_evicted(self, execution_id: str, transaction: PipelineTransaction, reason: str):
+        """Record an abandoned transaction evicted before it was finished."""
+        logger.warning("Unfinished transaction evicted",
+                       execution_id=execution_id,
+                       status=transaction.status.value,
+                       reason=reason)
+        if self.spill_log:
+            self.spill_log.append(transaction.to_dict())
+    
+    def _on_completed_evicted(self, execution_id: str, transaction: PipelineTransaction, reason: str):
+        """Spill a completed transaction evicted from memory."""
+        if self.spill_log:
+            self.spill_log.append(transaction.to_dict())
     
     def create_transaction(self, 
                           execution_id: str, 
@@ -264,6 +301,12 @@ class PipelineTransactionManager:
         """Get active transaction by execution ID."""
         return self.active_transactions.get(execution_id)
     
+    def finish_transaction(self, execution_id: str):
+        """Move a committed or rolled back transaction from active to completed."""
+        transaction = self.active_transactions.pop(execution_id, None)
+        if transaction is not None:
+            self.completed_transactions[execution_id] = transaction
+    
     def commit_transaction(self, execution_id: str) -> bool:
         """Commit transaction."""
         transaction = self.active_transactions.get(execution_id)
@@ -274,9 +317,7 @@ class PipelineTransactionManager:
         success = transaction.commit()
         
         if success:
-            # Move to completed transactions
-            self.completed_transactions.append(transaction)
-            del self.active_transactions[execution_id]
+            self.finish_transaction(execution_id)
         
         return success
     
@@ -290,9 +331,7 @@ class PipelineTransactionManager:
         success = transaction.rollback()
         
         if success:
-            # Move to completed transactions
-            self.completed_transactions.append(transaction)
-            del self.active_transactions[execution_id]
+            self.finish_transaction(execution_id)
         
         return success
     
@@ -305,10 +344,12 @@ class PipelineTransactionManager:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
         
         # Remove old completed transactions
-        self.completed_transactions = [
-            t for t in self.completed_transactions 
-            if t.start_time > cutoff_time
+        expired = [
+            execution_id for execution_id, t in self.completed_transactions.items()
+            if t.start_time <= cutoff_time
         ]
+        for execution_id in expired:
+            del self.completed_transactions[execution_id]
         
         logger.info("Completed transactions cleaned up", 
                    remaining_count=len(self.completed_transactions))
@@ -318,7 +359,7 @@ class PipelineTransactionManager:
         active_count = len(self.active_transactions)
         completed_count = len(self.completed_transactions)
         
-        successful_count = sum(1 for t in self.completed_transactions if t.is_successful())
+        successful_count = sum(1 for t in self.completed_transactions.values() if t.is_successful())
         failed_count = completed_count - successful_count
         
         return {
@@ -326,5 +367,8 @@ class PipelineTransactionManager:
             'completed_transactions': completed_count,
             'successful_transactions': successful_count,
             'failed_transactions': failed_count,
-            'success_rate': successful_count / completed_count if completed_count > 0 else 0
+            'success_rate': successful_count / completed_count if completed_count > 0 else 0,
+            'evicted_active_transactions': sum(self.active_transactions.evictions.values()),
+            'evicted_completed_transactions': sum(self.completed_transactions.evictions.values()),
+            'spilled_transactions': self.spill_log.records_written if self.spill_log else 0
         }
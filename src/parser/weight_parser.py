@@ -13,29 +13,42 @@ Features:
 
 import re
 from typing import Any, Dict, List, Optional, Tuple
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from structlog import get_logger
 
 logger = get_logger(__name__)
 
 
-class WeightResult(BaseModel):
-    """Represents a parsed weight result with metadata."""
+@dataclass(slots=True, kw_only=True)
+class WeightResult:
+    """Represents a parsed weight result with metadata (internal hot-path result)."""
     
-    grams: int = Field(..., ge=0, description="Weight in grams")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score 0.0-1.0")
-    original_format: str = Field(..., description="Original weight format")
-    parsing_warnings: List[str] = Field(default_factory=list, description="Parsing warnings")
-    conversion_notes: str = Field(default="", description="Conversion notes")
+    grams: int  # Weight in grams
+    confidence: float  # Confidence score 0.0-1.0
+    original_format: str
+    parsing_warnings: List[str] = field(default_factory=list)
+    conversion_notes: str = ""
+    
+    def __post_init__(self):
+        if self.grams < 0:
+            raise ValueError(f"grams must be non-negative, got {self.grams}")
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(f"confidence must be between 0.0 and 1.0, got {self.confidence}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage (aligned with PriceDelta)."""
-        return self.model_dump()
+        return {
+            'grams': self.grams,
+            'confidence': self.confidence,
+            'original_format': self.original_format,
+            'parsing_warnings': list(self.parsing_warnings),
+            'conversion_notes': self.conversion_notes
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WeightResult':
         """Create WeightResult from dictionary."""
-        return cls.model_validate(data)
+        return cls(**data)
 
 
 class WeightParser:
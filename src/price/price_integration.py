@@ -12,6 +12,7 @@ from .price_update_service import PriceUpdateService, PriceUpdateResult
 from .variant_update_service import VariantUpdateService
 from ..fetcher.price_fetcher import PriceFetcher
 from ..fetcher.price_parser import PriceDelta
+from ..validator.variant_snapshot import get_variant_snapshot_cache
 
 logger = get_logger(__name__)
 
@@ -298,18 +299,16 @@ class PriceIntegrationService:
                 logger.warning("No Supabase client available for existing variants")
                 return []
             
-            # Query existing variants for the roaster
-            result = self.supabase_client.table("variants").select(
-                "id, platform_variant_id, price_current, currency, in_stock"
-            ).eq("roaster_id", roaster_id).execute()
+            # Shared with the price fetcher's handle lookup; reloaded after price updates
+            snapshot = await get_variant_snapshot_cache(self.supabase_client).get(roaster_id)
             
-            if result.data:
+            if snapshot.variants:
                 logger.info(
                     "Retrieved existing variants",
                     roaster_id=roaster_id,
-                    variant_count=len(result.data)
+                    variant_count=len(snapshot.variants)
                 )
-                return result.data
+                return snapshot.variants
             else:
                 logger.info(
                     "No existing variants found",
@@ -12,6 +12,8 @@ from structlog import get_logger
 
 from ..validator.rpc_client import RPCClient
 from ..validator.database_integration import DatabaseIntegration
+from ..validator.db_gateway import get_database_gateway
+from ..validator.variant_snapshot import get_variant_snapshot_cache
 from ..fetcher.price_parser import PriceDelta
 
 logger = get_logger(__name__)
@@ -38,8 +40,7 @@ class PriceUpdateService:
     Service for atomic price updates extending existing DatabaseIntegration patterns.
     
     Features:
-    - Atomic price insertion using rpc_insert_price
-    - Variant pricing field updates
+    - Set-based price insertion and variant pricing updates using rpc_apply_price_deltas
     - Transaction-like behavior with rollback
     - Integration with existing RPCClient and DatabaseIntegration
     - Comprehensive error handling and logging
@@ -56,6 +57,8 @@ class PriceUpdateService:
         self.supabase_client = supabase_client
         self.rpc_client = rpc_client or RPCClient(supabase_client=supabase_client)
         self.database_integration = DatabaseIntegration(supabase_client=supabase_client)
+        # RPCClient calls block on HTTP; run them on the shared database worker pool
+        self.db = get_database_gateway(supabase_client)
         
         # Service statistics
         self.update_stats = {
@@ -93,18 +96,25 @@ class PriceUpdateService:
         )
         
         try:
-            # Step 1: Insert price records via RPC
-            price_ids = await self._insert_price_records(price_deltas)
+            # Insert price history and update variant pricing in one set-based RPC per chunk
+            apply_result = await self.db.run(self.rpc_client.apply_price_deltas, self._build_delta_rows(price_deltas))
+            price_ids = apply_result.price_ids
             
             if not price_ids:
                 return PriceUpdateResult(
                     success=False,
-                    errors=["Failed to insert any price records"],
+                    errors=["Failed to insert any price records"] + apply_result.errors,
                     processing_time_seconds=(datetime.now(timezone.utc) - start_time).total_seconds()
                 )
             
-            # Step 2: Update variant pricing fields
-            variant_updates = await self._update_variant_pricing(price_deltas)
+            variant_updates = len(apply_result.variant_ids)
+            
+            # Stored prices changed; the next job must reload the roaster snapshot
+            snapshot_cache = get_variant_snapshot_cache(self.supabase_client)
+            if snapshot_cache:
+                snapshot_cache.invalidate_variants(
+                    [delta.variant_id for delta in price_deltas] + list(apply_result.variant_ids)
+                )
             
             # Update statistics
             self.update_stats['total_updates'] += len(price_deltas)
@@ -146,115 +156,45 @@ class PriceUpdateService:
                 processing_time_seconds=(datetime.now(timezone.utc) - start_time).total_seconds()
             )
     
-    async def _insert_price_records(self, price_deltas: List[PriceDelta]) -> List[str]:
+    def _build_delta_rows(self, price_deltas: List[PriceDelta]) -> List[Dict[str, Any]]:
         """
-        Insert price records using rpc_insert_price.
+        Build rpc_apply_price_deltas rows from price deltas.
         
         Args:
-            price_deltas: List of price deltas to insert
+            price_deltas: List of price deltas to apply
             
         Returns:
-            List of inserted price IDs
+            List of delta rows (price record plus variant pricing fields)
         """
-        price_ids = []
+        rows = []
         
         for delta in price_deltas:
             try:
-                # Prepare price record data
-                price_data = {
+                detected_at = delta.detected_at.isoformat()
+                rows.append({
                     'variant_id': delta.variant_id,
                     'price': float(delta.new_price),
                     'currency': delta.currency,
-                    'scraped_at': delta.detected_at.isoformat(),
+                    'in_stock': delta.in_stock,
+                    'scraped_at': detected_at,
                     'source_raw': {
                         'old_price': float(delta.old_price) if delta.old_price else None,
                         'new_price': float(delta.new_price),
                         'currency': delta.currency,
                         'in_stock': delta.in_stock,
                         'sku': delta.sku,
-                        'detected_at': delta.detected_at.isoformat()
+                        'detected_at': detected_at
                     }
-                }
-                
-                # Insert price record via RPC
-                price_id = self.rpc_client.insert_price(**price_data)
-                price_ids.append(price_id)
-                
-                logger.debug(
-                    "Inserted price record",
-                    price_id=price_id,
-                    variant_id=delta.variant_id,
-                    price=float(delta.new_price),
-                    currency=delta.currency
-                )
-                
+                })
             except Exception as e:
                 logger.error(
-                    "Failed to insert price record",
-                    variant_id=delta.variant_id,
+                    "Failed to prepare price delta",
+                    variant_id=getattr(delta, 'variant_id', None),
                     error=str(e)
                 )
-                # Continue with other records even if one fails
                 continue
         
-        logger.info(
-            "Completed price record insertion",
-            total_deltas=len(price_deltas),
-            successful_inserts=len(price_ids)
-        )
-        
-        return price_ids
-    
-    async def _update_variant_pricing(self, price_deltas: List[PriceDelta]) -> int:
-        """
-        Update variant pricing fields.
-        
-        Args:
-            price_deltas: List of price deltas to update
-            
-        Returns:
-            Number of variant records updated
-        """
-        variant_updates = []
-        
-        for delta in price_deltas:
-            try:
-                # Prepare variant update data
-                update_data = {
-                    'variant_id': delta.variant_id,
-                    'price_current': float(delta.new_price),
-                    'price_last_checked_at': delta.detected_at.isoformat(),
-                    'in_stock': delta.in_stock,
-                    'currency': delta.currency
-                }
-                
-                variant_updates.append(update_data)
-                
-            except Exception as e:
-                logger.error(
-                    "Failed to prepare variant update",
-                    variant_id=delta.variant_id,
-                    error=str(e)
-                )
-                continue
-        
-        if not variant_updates:
-            logger.warning("No variant updates to perform")
-            return 0
-        
-        # Batch update variant pricing
-        batch_result = self.rpc_client.batch_update_variant_pricing(variant_updates)
-        
-        successful_updates = batch_result.get('successful_updates', 0)
-        
-        logger.info(
-            "Completed variant pricing updates",
-            total_updates=len(variant_updates),
-            successful_updates=successful_updates,
-            failed_updates=batch_result.get('failed_updates', 0)
-        )
-        
-        return successful_updates
+        return rows
     
     def get_update_stats(self) -> Dict[str, Any]:
         """
@@ -11,6 +11,8 @@ from structlog import get_logger
 
 from ..validator.rpc_client import RPCClient
 from ..validator.database_integration import DatabaseIntegration
+from ..validator.db_gateway import get_database_gateway
+from ..validator.variant_snapshot import get_variant_snapshot_cache
 
 logger = get_logger(__name__)
 
@@ -37,6 +39,8 @@ class VariantUpdateService:
         self.supabase_client = supabase_client
         self.rpc_client = rpc_client or RPCClient(supabase_client=supabase_client)
         self.database_integration = DatabaseIntegration(supabase_client=supabase_client)
+        # RPCClient calls block on HTTP; run them on the shared database worker pool
+        self.db = get_database_gateway(supabase_client)
         
         # Service statistics
         self.variant_stats = {
@@ -80,7 +84,8 @@ class VariantUpdateService:
             )
             
             # Update variant pricing fields
-            success = self.rpc_client.update_variant_pricing(
+            success = await self.db.run(
+                self.rpc_client.update_variant_pricing,
                 variant_id=variant_id,
                 price_current=float(new_price),
                 price_last_checked_at=scraped_at.isoformat(),
@@ -89,6 +94,7 @@ class VariantUpdateService:
             )
             
             if success:
+                self._invalidate_snapshots([variant_id])
                 self.variant_stats['successful_updates'] += 1
                 logger.info(
                     "Successfully updated variant pricing",
@@ -138,7 +144,9 @@ class VariantUpdateService:
         
         try:
             # Use RPC client batch update
-            batch_result = self.rpc_client.batch_update_variant_pricing(variant_updates)
+            batch_result = await self.db.run(self.rpc_client.batch_update_variant_pricing, variant_updates)
+            if batch_result.get('successful_updates', 0):
+                self._invalidate_snapshots(update.get('variant_id') for update in variant_updates)
             
             # Update statistics
             self.variant_stats['total_updates'] += len(variant_updates)
@@ -215,9 +223,10 @@ class VariantUpdateService:
             )
             
             # Use RPC client for update
-            success = self.rpc_client.update_variant_pricing(**update_data)
+            success = await self.db.run(self.rpc_client.update_variant_pricing, **update_data)
             
             if success:
+                self._invalidate_snapshots([variant_id])
                 self.variant_stats['successful_updates'] += 1
                 logger.info(
                     "Successfully updated variant availability",
@@ -244,6 +253,12 @@ class VariantUpdateService:
             )
             return False
     
+    def _invalidate_snapshots(self, variant_ids):
+        """Drop cached roaster snapshots that contain updated variants."""
+        snapshot_cache = get_variant_snapshot_cache(self.supabase_client)
+        if snapshot_cache:
+            snapshot_cache.invalidate_variants(variant_ids)
+    
     def get_variant_stats(self) -> Dict[str, Any]:
         """
         Get variant update service statistics.
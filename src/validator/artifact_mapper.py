@@ -215,55 +215,111 @@ class ArtifactMapper:
             # Map coffee data
             coffee_payload = self._map_coffee_data(artifact, roaster_id)
             
-            # Map variants data
-            variants_payloads = self._map_variants_data(artifact, metadata_only)
-            
-            # Map prices data
-            prices_payloads = self._map_prices_data(artifact, metadata_only)
-            
             # Map images data (only if not metadata-only)
             images_payloads = []
             if not metadata_only:
-                # Note: coffee_id will be available after coffee upsert in the pipeline
-                # For now, we'll process images without coffee_id (deduplication will work at image level)
-                # Use a temporary coffee_id for deduplication or ImageKit integration if service is available
-                temp_coffee_id = f"temp-{artifact.product.platform_product_id}" if (self.deduplication_service or self.imagekit_integration) else None
-                images_payloads = self._map_images_data(artifact, coffee_id=temp_coffee_id)
-            
-            result = {
-                'coffee': coffee_payload,
-                'variants': variants_payloads,
-                'prices': prices_payloads,
-                'images': images_payloads,
-                'metadata_only': metadata_only,
-                'roaster_id': roaster_id,
-                'platform_product_id': artifact.product.platform_product_id
-            }
-            
-            logger.info(
-                "Successfully mapped artifact to RPC payloads",
-                platform_product_id=artifact.product.platform_product_id,
-                roaster_id=roaster_id,
-                metadata_only=metadata_only,
-                variants_count=len(variants_payloads),
-                prices_count=len(prices_payloads),
-                images_count=len(images_payloads)
-            )
+                images_payloads = self._map_images_data(artifact, coffee_id=self._temp_coffee_id(artifact))
             
-            return result
+            return self._build_rpc_payloads(artifact, roaster_id, metadata_only, coffee_payload, images_payloads)
             
         except Exception as e:
-            self.mapping_stats['mapping_errors'] += 1
+            self._record_mapping_error(artifact, roaster_id, e)
+            raise
+    
+    async def map_artifact_to_rpc_payloads_async(
+        self,
+        artifact: ArtifactModel,
+        roaster_id: str,
+        metadata_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Map canonical artifact to RPC payloads without blocking the event loop.
+        
+        Same result as map_artifact_to_rpc_payloads, but the normalizer pipeline
+        (and its LLM fallback) and image batch processing are awaited instead
+        of run to completion inline.
+        
+        Args:
+            artifact: Canonical artifact model
+            roaster_id: Roaster ID for the artifact
+            metadata_only: Whether this is a metadata-only update
             
-            logger.error(
-                "Failed to map artifact to RPC payloads",
-                platform_product_id=artifact.product.platform_product_id,
-                roaster_id=roaster_id,
-                error=str(e)
-            )
+        Returns:
+            Dictionary with RPC payloads for coffee, variants, prices, and images
+        """
+        try:
+            self.mapping_stats['total_mapped'] += 1
+            
+            coffee_payload = await self._map_coffee_data_async(artifact, roaster_id)
             
+            images_payloads = []
+            if not metadata_only:
+                images_payloads = await self._map_images_data_async(artifact, coffee_id=self._temp_coffee_id(artifact))
+            
+            return self._build_rpc_payloads(artifact, roaster_id, metadata_only, coffee_payload, images_payloads)
+            
+        except Exception as e:
+            self._record_mapping_error(artifact, roaster_id, e)
             raise
     
+    def _temp_coffee_id(self, artifact: ArtifactModel) -> Optional[str]:
+        """
+        Temporary coffee ID for image deduplication and ImageKit uploads.
+        
+        The real coffee_id is only available after the coffee upsert, so images
+        are keyed by platform product ID; None when no image service is configured.
+        """
+        if self.deduplication_service or self.imagekit_integration:
+            return f"temp-{artifact.product.platform_product_id}"
+        return None
+    
+    def _build_rpc_payloads(
+        self,
+        artifact: ArtifactModel,
+        roaster_id: str,
+        metadata_only: bool,
+        coffee_payload: Dict[str, Any],
+        images_payloads: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Combine mapped coffee and image payloads with variants and prices."""
+        # Map variants data
+        variants_payloads = self._map_variants_data(artifact, metadata_only)
+        
+        # Map prices data
+        prices_payloads = self._map_prices_data(artifact, metadata_only)
+        
+        result = {
+            'coffee': coffee_payload,
+            'variants': variants_payloads,
+            'prices': prices_payloads,
+            'images': images_payloads,
+            'metadata_only': metadata_only,
+            'roaster_id': roaster_id,
+            'platform_product_id': artifact.product.platform_product_id
+        }
+        
+        logger.info(
+            "Successfully mapped artifact to RPC payloads",
+            platform_product_id=artifact.product.platform_product_id,
+            roaster_id=roaster_id,
+            metadata_only=metadata_only,
+            variants_count=len(variants_payloads),
+            prices_count=len(prices_payloads),
+            images_count=len(images_payloads)
+        )
+        
+        return result
+    
+    def _record_mapping_error(self, artifact: ArtifactModel, roaster_id: str, error: Exception):
+        self.mapping_stats['mapping_errors'] += 1
+        
+        logger.error(
+            "Failed to map artifact to RPC payloads",
+            platform_product_id=artifact.product.platform_product_id,
+            roaster_id=roaster_id,
+            error=str(error)
+        )
+    
     def _map_coffee_data(self, artifact: ArtifactModel, roaster_id: str) -> Dict[str, Any]:
         """
         Map artifact to coffee RPC payload.
@@ -285,9 +341,9 @@ class ArtifactMapper:
         # Fallback to individual parsers (legacy behavior)
         return self._map_coffee_data_legacy(artifact, roaster_id)
     
-    def _map_coffee_data_with_pipeline(self, artifact: ArtifactModel, roaster_id: str) -> Dict[str, Any]:
+    async def _map_coffee_data_async(self, artifact: ArtifactModel, roaster_id: str) -> Dict[str, Any]:
         """
-        Map artifact to coffee RPC payload using C.8 normalizer pipeline.
+        Map artifact to coffee RPC payload, awaiting the normalizer pipeline.
         
         Args:
             artifact: Canonical artifact model
@@ -296,11 +352,25 @@ class ArtifactMapper:
         Returns:
             Coffee RPC payload
         """
-        product = artifact.product
-        normalization = artifact.normalization
+        if not self.normalizer_pipeline:
+            return self._map_coffee_data_legacy(artifact, roaster_id)
+        
+        try:
+            pipeline_result = await self.normalizer_pipeline.process_artifact_async(
+                self._build_pipeline_input(artifact, roaster_id)
+            )
+        except Exception as e:
+            logger.error("Normalizer pipeline failed, falling back to legacy parsing", 
+                        error=str(e),
+                        artifact_id=artifact.product.platform_product_id)
+            return self._map_coffee_data_legacy(artifact, roaster_id)
         
-        # Convert artifact to dictionary for pipeline processing
-        artifact_dict = {
+        return self._map_coffee_data_with_pipeline(artifact, roaster_id, pipeline_result=pipeline_result)
+    
+    def _build_pipeline_input(self, artifact: ArtifactModel, roaster_id: str) -> Dict[str, Any]:
+        """Convert artifact to the dictionary the normalizer pipeline processes."""
+        product = artifact.product
+        return {
             'title': product.title,
             'description': product.description_html or '',
             'product': {
@@ -320,10 +390,34 @@ class ArtifactMapper:
             ],
             'roaster_id': roaster_id
         }
+    
+    def _map_coffee_data_with_pipeline(
+        self,
+        artifact: ArtifactModel,
+        roaster_id: str,
+        pipeline_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Map artifact to coffee RPC payload using C.8 normalizer pipeline.
+        
+        Args:
+            artifact: Canonical artifact model
+            roaster_id: Roaster ID
+            pipeline_result: Result of an already awaited pipeline run; the
+                pipeline is run synchronously when omitted
+            
+        Returns:
+            Coffee RPC payload
+        """
+        product = artifact.product
+        normalization = artifact.normalization
         
         # Process through normalizer pipeline
         try:
-            pipeline_result = self.normalizer_pipeline.process_artifact(artifact_dict)
+            if pipeline_result is None:
+                pipeline_result = self.normalizer_pipeline.process_artifact(
+                    self._build_pipeline_input(artifact, roaster_id)
+                )
             
             # Extract normalized data from pipeline result
             normalized_data = pipeline_result.get('normalized_data', {})
@@ -948,189 +1042,238 @@ class ArtifactMapper:
         Returns:
             List of image RPC payloads
         """
-        # Check if image processing is allowed (guard enforcement)
+        if not self._image_processing_allowed() or not artifact.product.images:
+            return []
+        
+        mode = self._image_processing_mode(coffee_id)
+        if mode is None:
+            # Standard processing without deduplication or ImageKit integration
+            return self._map_images_data_standard(artifact)
+        
+        try:
+            images_data = self._build_images_data(artifact)
+            if mode == 'deduplication':
+                processed_images = self.deduplication_service.process_batch_with_deduplication(
+                    images_data, coffee_id
+                )
+            else:
+                processed_images = self.imagekit_integration.process_batch_with_imagekit(
+                    images_data, coffee_id
+                )
+            return self._processed_images_to_payloads(mode, artifact, processed_images)
+        except Exception as e:
+            self._log_image_processing_failure(mode, e)
+            # Fall back to standard processing
+            return self._map_images_data_standard(artifact)
+    
+    async def _map_images_data_async(self, artifact: ArtifactModel, coffee_id: str = None) -> List[Dict[str, Any]]:
+        """
+        Map artifact images to RPC payloads, awaiting the async batch paths.
+        
+        Same result as _map_images_data, but hashes are computed concurrently
+        and ImageKit uploads run through the batch uploader.
+        
+        Args:
+            artifact: Canonical artifact model
+            coffee_id: Coffee ID for deduplication (optional)
+            
+        Returns:
+            List of image RPC payloads
+        """
+        if not self._image_processing_allowed() or not artifact.product.images:
+            return []
+        
+        mode = self._image_processing_mode(coffee_id)
+        if mode is None:
+            return self._map_images_data_standard(artifact)
+        
+        try:
+            images_data = self._build_images_data(artifact)
+            if mode == 'deduplication':
+                processed_images = await self.deduplication_service.process_batch_with_deduplication_async(
+                    images_data, coffee_id
+                )
+            else:
+                processed_images = await self.imagekit_integration.process_batch_with_imagekit_async(
+                    images_data, coffee_id
+                )
+            return self._processed_images_to_payloads(mode, artifact, processed_images)
+        except Exception as e:
+            self._log_image_processing_failure(mode, e)
+            return self._map_images_data_standard(artifact)
+    
+    def _image_processing_allowed(self) -> bool:
+        """Check if image processing is allowed (guard enforcement)."""
         if self.image_guard and not self.image_guard.check_image_processing_allowed("map_images_data"):
             logger.info(
                 "Image processing blocked by guard for price-only run",
                 operation="map_images_data",
                 metadata_only=self.metadata_only
             )
-            return []
+            return False
+        return True
+    
+    def _image_processing_mode(self, coffee_id: Optional[str]) -> Optional[str]:
+        """Image service to process with: 'deduplication', 'imagekit' or None for standard mapping."""
+        if self.deduplication_service and self.enable_image_deduplication and coffee_id:
+            return 'deduplication'
+        if self.imagekit_integration and self.enable_imagekit and coffee_id:
+            return 'imagekit'
+        return None
+    
+    def _build_images_data(self, artifact: ArtifactModel) -> List[Dict[str, Any]]:
+        """Prepare artifact images as input for the image services."""
+        images_data = []
+        for i, image in enumerate(artifact.product.images):
+            image_data = {
+                'url': image.url,
+                'alt': image.alt_text or '',
+                'width': getattr(image, 'width', None),
+                'height': getattr(image, 'height', None),
+                'sort_order': image.order or i,
+                'source_raw': {
+                    'source_id': image.source_id,
+                    'scraped_at': artifact.scraped_at.isoformat()
+                }
+            }
+            images_data.append(image_data)
+        return images_data
+    
+    def _log_image_processing_failure(self, mode: str, error: Exception):
+        if mode == 'deduplication':
+            logger.error(
+                "Failed to process images with deduplication service",
+                error=str(error)
+            )
+        else:
+            logger.error(
+                "Failed to process images with ImageKit integration, falling back to standard processing",
+                error=str(error)
+            )
+    
+    def _processed_images_to_payloads(
+        self,
+        mode: str,
+        artifact: ArtifactModel,
+        processed_images: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Convert image service results to RPC payloads."""
+        if mode == 'deduplication':
+            return self._deduplicated_images_to_payloads(artifact, processed_images)
+        return self._imagekit_images_to_payloads(processed_images)
+    
+    def _deduplicated_images_to_payloads(
+        self,
+        artifact: ArtifactModel,
+        processed_images: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         images_payloads = []
+        for processed_image in processed_images:
+            if 'error' in processed_image:
+                logger.warning(
+                    "Failed to process image with deduplication",
+                    image_url=processed_image.get('url'),
+                    error=processed_image['error']
+                )
+                continue
+            
+            # Create RPC payload for image
+            image_payload = {
+                'p_url': processed_image['url'],
+                'p_alt': processed_image.get('alt', ''),
+                'p_sort_order': processed_image.get('sort_order', 0),
+                'p_source_raw': processed_image.get('source_raw', {}),
+                'p_content_hash': processed_image.get('content_hash'),
+                'p_deduplication_status': processed_image.get('deduplication_status', 'unknown')
+            }
+            
+            # Add existing image ID if it's a duplicate
+            if processed_image.get('is_duplicate') and processed_image.get('image_id'):
+                image_payload['p_existing_image_id'] = processed_image['image_id']
+            
+            # Add dimensions if available
+            if processed_image.get('width'):
+                image_payload['p_width'] = processed_image['width']
+            if processed_image.get('height'):
+                image_payload['p_height'] = processed_image['height']
+            
+            images_payloads.append(image_payload)
+            self.mapping_stats['images_mapped'] += 1
         
-        if artifact.product.images:
-            # Process images with deduplication service if available and enabled
-            if self.deduplication_service and self.enable_image_deduplication and coffee_id:
-                try:
-                    # Prepare image data for deduplication
-                    images_data = []
-                    for i, image in enumerate(artifact.product.images):
-                        image_data = {
-                            'url': image.url,
-                            'alt': image.alt_text or '',
-                            'width': getattr(image, 'width', None),
-                            'height': getattr(image, 'height', None),
-                            'sort_order': image.order or i,
-                            'source_raw': {
-                                'source_id': image.source_id,
-                                'scraped_at': artifact.scraped_at.isoformat()
-                            }
-                        }
-                        images_data.append(image_data)
-                    
-                    # Process images with deduplication
-                    processed_images = self.deduplication_service.process_batch_with_deduplication(
-                        images_data, coffee_id
-                    )
-                    
-                    # Convert processed results to RPC payloads
-                    for processed_image in processed_images:
-                        if 'error' in processed_image:
-                            logger.warning(
-                                "Failed to process image with deduplication",
-                                image_url=processed_image.get('url'),
-                                error=processed_image['error']
-                            )
-                            continue
-                        
-                        # Create RPC payload for image
-                        image_payload = {
-                            'p_url': processed_image['url'],
-                            'p_alt': processed_image.get('alt', ''),
-                            'p_sort_order': processed_image.get('sort_order', 0),
-                            'p_source_raw': processed_image.get('source_raw', {}),
-                            'p_content_hash': processed_image.get('content_hash'),
-                            'p_deduplication_status': processed_image.get('deduplication_status', 'unknown')
-                        }
-                        
-                        # Add existing image ID if it's a duplicate
-                        if processed_image.get('is_duplicate') and processed_image.get('image_id'):
-                            image_payload['p_existing_image_id'] = processed_image['image_id']
-                        
-                        # Add dimensions if available
-                        if processed_image.get('width'):
-                            image_payload['p_width'] = processed_image['width']
-                        if processed_image.get('height'):
-                            image_payload['p_height'] = processed_image['height']
-                        
-                        images_payloads.append(image_payload)
-                        self.mapping_stats['images_mapped'] += 1
-                    
-                    logger.info(
-                        "Processed images with deduplication",
-                        total_images=len(artifact.product.images),
-                        processed_count=len(images_payloads)
-                    )
-                    
-                except Exception as e:
-                    logger.error(
-                        "Failed to process images with deduplication service",
-                        error=str(e)
-                    )
-                    # Fall back to standard processing
-                    images_payloads = self._map_images_data_standard(artifact)
-            # Process images with ImageKit integration if service is available and enabled
-            elif self.imagekit_integration and self.enable_imagekit and coffee_id:
-                try:
-                    # Prepare image data for deduplication
-                    images_data = []
-                    for i, image in enumerate(artifact.product.images):
-                        image_data = {
-                            'url': image.url,
-                            'alt': image.alt_text or '',
-                            'width': getattr(image, 'width', None),
-                            'height': getattr(image, 'height', None),
-                            'sort_order': image.order or i,
-                            'source_raw': {
-                                'source_id': image.source_id,
-                                'scraped_at': artifact.scraped_at.isoformat()
-                            }
-                        }
-                        images_data.append(image_data)
-                    
-                    # Process images with ImageKit integration
-                    processed_images = self.imagekit_integration.process_batch_with_imagekit(
-                        images_data, coffee_id
-                    )
-                    
-                    # Convert processed results to RPC payloads
-                    for processed_image in processed_images:
-                        if 'integration_error' in processed_image:
-                            logger.warning(
-                                "Failed to process image with ImageKit integration",
-                                image_url=processed_image.get('url'),
-                                error=processed_image['integration_error']
-                            )
-                            continue
-                        
-                        # Create RPC payload
-                        image_payload = {
-                            'p_url': processed_image['url'],
-                            'p_alt': processed_image.get('alt', ''),
-                            'p_sort_order': processed_image.get('sort_order', 0),
-                            'p_source_raw': processed_image.get('source_raw', {})
-                        }
-                        
-                        # Add dimensions if available
-                        if processed_image.get('width'):
-                            image_payload['p_width'] = processed_image['width']
-                        if processed_image.get('height'):
-                            image_payload['p_height'] = processed_image['height']
-                        
-                        # Add content hash for deduplication
-                        if processed_image.get('content_hash'):
-                            image_payload['p_content_hash'] = processed_image['content_hash']
-                        
-                        # Add ImageKit URL if available
-                        if processed_image.get('imagekit_url'):
-                            image_payload['p_imagekit_url'] = processed_image['imagekit_url']
-                        
-                        # Add processing metadata
-                        if processed_image.get('imagekit_upload_skipped'):
-                            image_payload['p_processing_status'] = 'skipped_duplicate'
-                            image_payload['p_existing_image_id'] = processed_image.get('existing_image_id')
-                        elif processed_image.get('imagekit_upload_failed'):
-                            image_payload['p_processing_status'] = 'imagekit_failed'
-                            image_payload['p_fallback_url'] = processed_image.get('fallback_url')
-                        else:
-                            image_payload['p_processing_status'] = 'processed'
-                        
-                        images_payloads.append(image_payload)
-                        self.mapping_stats['images_mapped'] += 1
-                        
-                        # Log processing result
-                        if processed_image.get('imagekit_upload_skipped'):
-                            logger.info(
-                                "ImageKit integration: duplicate skipped",
-                                image_url=processed_image['url'],
-                                existing_image_id=processed_image.get('existing_image_id')
-                            )
-                        elif processed_image.get('imagekit_upload_failed'):
-                            logger.warning(
-                                "ImageKit integration: upload failed, using fallback",
-                                image_url=processed_image['url'],
-                                fallback_url=processed_image.get('fallback_url'),
-                                error=processed_image.get('imagekit_error')
-                            )
-                        else:
-                            logger.info(
-                                "ImageKit integration: image processed successfully",
-                                image_url=processed_image['url'],
-                                imagekit_url=processed_image.get('imagekit_url'),
-                                content_hash=processed_image.get('content_hash')
-                            )
-                    
-                except Exception as e:
-                    logger.error(
-                        "Failed to process images with ImageKit integration, falling back to standard processing",
-                        error=str(e)
-                    )
-                    # Fall back to standard processing
-                    images_payloads = self._map_images_data_standard(artifact)
+        logger.info(
+            "Processed images with deduplication",
+            total_images=len(artifact.product.images),
+            processed_count=len(images_payloads)
+        )
+        return images_payloads
+    
+    def _imagekit_images_to_payloads(self, processed_images: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        images_payloads = []
+        for processed_image in processed_images:
+            if 'integration_error' in processed_image:
+                logger.warning(
+                    "Failed to process image with ImageKit integration",
+                    image_url=processed_image.get('url'),
+                    error=processed_image['integration_error']
+                )
+                continue
+            
+            # Create RPC payload
+            image_payload = {
+                'p_url': processed_image['url'],
+                'p_alt': processed_image.get('alt', ''),
+                'p_sort_order': processed_image.get('sort_order', 0),
+                'p_source_raw': processed_image.get('source_raw', {})
+            }
+            
+            # Add dimensions if available
+            if processed_image.get('width'):
+                image_payload['p_width'] = processed_image['width']
+            if processed_image.get('height'):
+                image_payload['p_height'] = processed_image['height']
+            
+            # Add content hash for deduplication
+            if processed_image.get('content_hash'):
+                image_payload['p_content_hash'] = processed_image['content_hash']
+            
+            # Add ImageKit URL if available
+            if processed_image.get('imagekit_url'):
+                image_payload['p_imagekit_url'] = processed_image['imagekit_url']
+            
+            # Add processing metadata
+            if processed_image.get('imagekit_upload_skipped'):
+                image_payload['p_processing_status'] = 'skipped_duplicate'
+                image_payload['p_existing_image_id'] = processed_image.get('existing_image_id')
+            elif processed_image.get('imagekit_upload_failed'):
+                image_payload['p_processing_status'] = 'imagekit_failed'
+                image_payload['p_fallback_url'] = processed_image.get('fallback_url')
             else:
-                # Standard processing without ImageKit integration
-                images_payloads = self._map_images_data_standard(artifact)
-        
+                image_payload['p_processing_status'] = 'processed'
+            
+            images_payloads.append(image_payload)
+            self.mapping_stats['images_mapped'] += 1
+            
+            # Log processing result
+            if processed_image.get('imagekit_upload_skipped'):
+                logger.info(
+                    "ImageKit integration: duplicate skipped",
+                    image_url=processed_image['url'],
+                    existing_image_id=processed_image.get('existing_image_id')
+                )
+            elif processed_image.get('imagekit_upload_failed'):
+                logger.warning(
+                    "ImageKit integration: upload failed, using fallback",
+                    image_url=processed_image['url'],
+                    fallback_url=processed_image.get('fallback_url'),
+                    error=processed_image.get('imagekit_error')
+                )
+            else:
+                logger.info(
+                    "ImageKit integration: image processed successfully",
+                    image_url=processed_image['url'],
+                    imagekit_url=processed_image.get('imagekit_url'),
+                    content_hash=processed_image.get('content_hash')
+                )
         return images_payloads
     
     def _map_images_data_standard(self, artifact: ArtifactModel) -> List[Dict[str, Any]]:
@@ -2,16 +2,19 @@
 Database integration for validator - stores validation results in scrape_artifacts table.
 """
 
+import asyncio
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 
+from pydantic import BaseModel
 from structlog import get_logger
 
 from .artifact_validator import ValidationResult
 from .rpc_client import RPCClient
 from .artifact_mapper import ArtifactMapper
+from .db_gateway import get_database_gateway
 
 logger = get_logger(__name__)
 
@@ -25,16 +28,19 @@ class DatabaseIntegration:
     - Track validation status and errors
     - Support for manual review workflow
     - Integration with existing database schema
+    - Multi-row inserts for batch validation results
     """
     
-    def __init__(self, supabase_client=None):
+    def __init__(self, supabase_client=None, batch_size: int = 500):
         """
         Initialize database integration.
         
         Args:
             supabase_client: Supabase client for database operations
+            batch_size: Maximum rows per scrape_artifacts insert in batch writes
         """
         self.supabase_client = supabase_client
+        self.batch_size = max(1, batch_size)
         self.rpc_client = RPCClient(supabase_client=supabase_client)
         self.artifact_mapper = ArtifactMapper()
         self.validation_stats = {
@@ -44,6 +50,30 @@ class DatabaseIntegration:
             'error_count': 0
         }
     
+    @staticmethod
+    def _build_artifact_row(validation_result: ValidationResult, scrape_run_id: str) -> Dict[str, Any]:
+        """Build the scrape_artifacts row for a validation result."""
+        artifact_data = validation_result.artifact_data
+        if isinstance(artifact_data, BaseModel):
+            artifact_data = artifact_data.model_dump(mode='json')
+        
+        return {
+            "scrape_run_id": scrape_run_id,
+            "artifact_data": artifact_data,
+            "validation_status": "valid" if validation_result.is_valid else "invalid",
+            "validation_errors": validation_result.errors if not validation_result.is_valid else None,
+            "created_at": validation_result.validated_at.isoformat(),
+            "processed_at": datetime.now(timezone.utc).isoformat() if validation_result.is_valid else None
+        }
+    
+    def _record_stored(self, validation_result: ValidationResult):
+        """Update stats for a stored validation result."""
+        self.validation_stats['total_stored'] += 1
+        if validation_result.is_valid:
+            self.validation_stats['valid_stored'] += 1
+        else:
+            self.validation_stats['invalid_stored'] += 1
+    
     def store_validation_result(
         self,
         validation_result: ValidationResult,
@@ -66,21 +96,9 @@ class DatabaseIntegration:
             Artifact ID if successful, None if failed
         """
         try:
-            # Determine validation status
-            if validation_result.is_valid:
-                validation_status = "valid"
-            else:
-                validation_status = "invalid"
-            
             # Prepare artifact data for storage
-            artifact_data = {
-                "scrape_run_id": scrape_run_id,
-                "artifact_data": validation_result.artifact_data,
-                "validation_status": validation_status,
-                "validation_errors": validation_result.errors if not validation_result.is_valid else None,
-                "created_at": validation_result.validated_at.isoformat(),
-                "processed_at": datetime.now(timezone.utc).isoformat() if validation_result.is_valid else None
-            }
+            artifact_data = self._build_artifact_row(validation_result, scrape_run_id)
+            validation_status = artifact_data["validation_status"]
             
             # Store in database
             if self.supabase_client:
@@ -98,13 +116,7 @@ class DatabaseIntegration:
                         response_filename=response_filename
                     )
                     
-                    # Update stats
-                    self.validation_stats['total_stored'] += 1
-                    if validation_result.is_valid:
-                        self.validation_stats['valid_stored'] += 1
-                    else:
-                        self.validation_stats['invalid_stored'] += 1
-                    
+                    self._record_stored(validation_result)
                     return artifact_id
                 else:
                     logger.error(
@@ -127,13 +139,7 @@ class DatabaseIntegration:
                     response_filename=response_filename
                 )
                 
-                # Update stats
-                self.validation_stats['total_stored'] += 1
-                if validation_result.is_valid:
-                    self.validation_stats['valid_stored'] += 1
-                else:
-                    self.validation_stats['invalid_stored'] += 1
-                
+                self._record_stored(validation_result)
                 return artifact_id
                 
         except Exception as e:
@@ -159,6 +165,10 @@ class DatabaseIntegration:
         """
         Store batch validation results in database.
         
+        Rows are written with one multi-row insert per ``batch_size`` results.
+        If a chunk insert fails, its rows are retried individually so one bad
+        row does not drop the rest of the chunk.
+        
         Args:
             validation_results: List of validation results to store
             scrape_run_id: Scrape run identifier
@@ -169,28 +179,160 @@ class DatabaseIntegration:
         Returns:
             List of artifact IDs (None for failed storage)
         """
-        artifact_ids = []
+        if not self.supabase_client:
+            # Mock storage has no per-row cost
+            artifact_ids = self._store_individually(
+                list(zip(validation_results, response_filenames)),
+                scrape_run_id, roaster_id, platform
+            )
+        else:
+            artifact_ids = []
+            for chunk in self._chunks(validation_results, response_filenames):
+                artifact_ids.extend(self._insert_chunk(chunk, scrape_run_id, roaster_id, platform))
+        
+        self._log_batch_stored(artifact_ids, roaster_id, platform)
+        return artifact_ids
+    
+    async def store_batch_validation_results_async(
+        self,
+        validation_results: List[ValidationResult],
+        scrape_run_id: str,
+        roaster_id: str,
+        platform: str,
+        response_filenames: List[str]
+    ) -> List[Optional[str]]:
+        """
+        Store batch validation results without blocking the event loop.
+        
+        Chunks are inserted concurrently through the shared database gateway,
+        which bounds the number of in-flight inserts.
+        
+        Args:
+            validation_results: List of validation results to store
+            scrape_run_id: Scrape run identifier
+            roaster_id: Roaster identifier
+            platform: Platform type
+            response_filenames: List of response filenames
+            
+        Returns:
+            List of artifact IDs (None for failed storage)
+        """
+        if not self.supabase_client:
+            return self.store_batch_validation_results(
+                validation_results=validation_results,
+                scrape_run_id=scrape_run_id,
+                roaster_id=roaster_id,
+                platform=platform,
+                response_filenames=response_filenames
+            )
         
-        for i, (result, filename) in enumerate(zip(validation_results, response_filenames)):
-            artifact_id = self.store_validation_result(
+        gateway = get_database_gateway(self.supabase_client)
+        
+        async def store_chunk(chunk):
+            rows = [self._build_artifact_row(result, scrape_run_id) for result, _ in chunk]
+            try:
+                response = await gateway.execute(self.supabase_client.table("scrape_artifacts").insert(rows))
+            except Exception as e:
+                self._log_chunk_failure(chunk, roaster_id, platform, e)
+                return await gateway.run(self._store_individually, chunk, scrape_run_id, roaster_id, platform)
+            return self._chunk_artifact_ids(chunk, response.data, roaster_id, platform)
+        
+        chunk_ids = await asyncio.gather(
+            *(store_chunk(chunk) for chunk in self._chunks(validation_results, response_filenames))
+        )
+        artifact_ids = [artifact_id for ids in chunk_ids for artifact_id in ids]
+        
+        self._log_batch_stored(artifact_ids, roaster_id, platform)
+        return artifact_ids
+    
+    def _chunks(
+        self,
+        validation_results: List[ValidationResult],
+        response_filenames: List[str]
+    ) -> List[List[Tuple[ValidationResult, str]]]:
+        """Pair results with filenames and split them into insert-sized chunks."""
+        pairs = list(zip(validation_results, response_filenames))
+        return [pairs[i:i + self.batch_size] for i in range(0, len(pairs), self.batch_size)]
+    
+    def _insert_chunk(
+        self,
+        chunk: List[Tuple[ValidationResult, str]],
+        scrape_run_id: str,
+        roaster_id: str,
+        platform: str
+    ) -> List[Optional[str]]:
+        """Insert a chunk with one multi-row insert, falling back to per-row inserts."""
+        rows = [self._build_artifact_row(result, scrape_run_id) for result, _ in chunk]
+        try:
+            response = self.supabase_client.table("scrape_artifacts").insert(rows).execute()
+        except Exception as e:
+            # One bad row fails the whole statement; retry rows one by one to isolate it
+            self._log_chunk_failure(chunk, roaster_id, platform, e)
+            return self._store_individually(chunk, scrape_run_id, roaster_id, platform)
+        return self._chunk_artifact_ids(chunk, response.data, roaster_id, platform)
+    
+    def _chunk_artifact_ids(
+        self,
+        chunk: List[Tuple[ValidationResult, str]],
+        data: Optional[List[Dict[str, Any]]],
+        roaster_id: str,
+        platform: str
+    ) -> List[Optional[str]]:
+        """Match inserted rows (returned in insert order) back to their results."""
+        if not data or len(data) != len(chunk):
+            logger.error(
+                "Failed to store validation results - unexpected insert response",
+                expected_rows=len(chunk),
+                returned_rows=len(data or []),
+                roaster_id=roaster_id,
+                platform=platform
+            )
+            return [None] * len(chunk)
+        
+        artifact_ids = []
+        for (result, _), row in zip(chunk, data):
+            self._record_stored(result)
+            artifact_ids.append(row.get("id"))
+        return artifact_ids
+    
+    def _store_individually(
+        self,
+        chunk: List[Tuple[ValidationResult, str]],
+        scrape_run_id: str,
+        roaster_id: str,
+        platform: str
+    ) -> List[Optional[str]]:
+        return [
+            self.store_validation_result(
                 validation_result=result,
                 scrape_run_id=scrape_run_id,
                 roaster_id=roaster_id,
                 platform=platform,
                 response_filename=filename
             )
-            artifact_ids.append(artifact_id)
-        
+            for result, filename in chunk
+        ]
+    
+    @staticmethod
+    def _log_chunk_failure(chunk, roaster_id: str, platform: str, error: Exception):
+        logger.warning(
+            "Bulk insert of validation results failed, retrying rows individually",
+            chunk_size=len(chunk),
+            roaster_id=roaster_id,
+            platform=platform,
+            error=str(error)
+        )
+    
+    @staticmethod
+    def _log_batch_stored(artifact_ids: List[Optional[str]], roaster_id: str, platform: str):
         logger.info(
             "Stored batch validation results",
-            total_results=len(validation_results),
+            total_results=len(artifact_ids),
             successful_storage=sum(1 for aid in artifact_ids if aid is not None),
             failed_storage=sum(1 for aid in artifact_ids if aid is None),
             roaster_id=roaster_id,
             platform=platform
         )
-        
-        return artifact_ids
     
     def get_validation_results(
         self,
@@ -0,0 +1,207 @@
+"""
+Async database gateway for Supabase/PostgREST access from async code.
+
+This module provides:
+- Non-blocking execution of Supabase queries and RPC calls
+- A shared, bounded worker pool per client (sync clients) and a per-loop
+  concurrency limit (async clients)
+- A sync shim so legacy callers can go through the same gateway
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+
+class DatabaseGateway:
+    """
+    Run database queries without blocking the event loop.
+
+    Queries are ordinary PostgREST builders (``client.table(...).select(...)``).
+    For an async client (``supabase.acreate_client``) ``execute()`` is awaited
+    directly; for the sync client it runs on a bounded thread pool shared by
+    every service using the same client, so one slow query occupies one
+    worker instead of freezing the loop. ``max_concurrency`` caps in-flight
+    queries per event loop for either kind of client.
+    """
+
+    def __init__(self, client, max_concurrency: int = 10, timeout: Optional[float] = None):
+        """
+        Initialize database gateway.
+
+        Args:
+            client: Supabase client (sync or async)
+            max_concurrency: Maximum in-flight queries (also the thread pool size)
+            timeout: Optional per-query timeout in seconds
+        """
+        # Weak reference so the shared gateway registry does not keep clients alive
+        try:
+            self._client_ref = weakref.ref(client)
+        except TypeError:
+            self._client_ref = lambda: client
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def client(self):
+        return self._client_ref()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # asyncio primitives bind to one loop, so keep one per running loop
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="db-gateway"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking database call on the gateway's worker pool.
+
+        Use this for legacy sync helpers (e.g. RPCClient methods) called from
+        async code. The call runs in a copy of the caller's context, so spans
+        opened inside it nest under the caller's span.
+        """
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+            future = loop.run_in_executor(self._get_executor(), call)
+            return await asyncio.wait_for(future, self.timeout)
+
+    async def execute(self, query) -> Any:
+        """
+        Execute a query builder and return the response.
+
+        Args:
+            query: Builder exposing ``execute()`` (sync or async)
+
+        Returns:
+            The PostgREST response (``.data`` holds the rows)
+        """
+        if inspect.iscoroutinefunction(query.execute):
+            async with self._semaphore():
+                return await asyncio.wait_for(query.execute(), self.timeout)
+        return await self.run(query.execute)
+
+    def execute_sync(self, query) -> Any:
+        """
+        Sync shim for legacy callers.
+
+        Runs sync builders inline and drives async builders to completion.
+        Must not be called from a running event loop with an async client.
+        """
+        if inspect.iscoroutinefunction(query.execute):
+            return asyncio.run(query.execute())
+        return query.execute()
+
+    async def select(
+        self,
+        table: str,
+        columns: str = "*",
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Select rows matching equality filters.
+
+        Args:
+            table: Table name
+            columns: Comma-separated column list
+            filters: Column -> value equality filters
+
+        Returns:
+            List of rows (empty when nothing matches)
+        """
+        query = self.client.table(table).select(columns)
+        for column, value in (filters or {}).items():
+            query = query.eq(column, value)
+        response = await self.execute(query)
+        return response.data or []
+
+    async def update(self, table: str, values: Dict[str, Any], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Update rows matching equality filters.
+
+        Args:
+            table: Table name
+            values: Column values to set
+            filters: Column -> value equality filters
+
+        Returns:
+            Updated rows
+        """
+        query = self.client.table(table).update(values)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        response = await self.execute(query)
+        return response.data or []
+
+    async def rpc(self, name: str, params: Dict[str, Any]) -> Any:
+        """
+        Call an RPC function.
+
+        Args:
+            name: RPC function name
+            params: RPC parameters
+
+        Returns:
+            The RPC response
+        """
+        return await self.execute(self.client.rpc(name, params))
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_gateways: "weakref.WeakKeyDictionary[Any, DatabaseGateway]" = weakref.WeakKeyDictionary()
+_default_gateway: Optional[DatabaseGateway] = None
+
+
+def get_database_gateway(client, max_concurrency: int = 10) -> DatabaseGateway:
+    """
+    Get the shared gateway for a client, creating it on first use.
+
+    Services built on the same Supabase client share one worker pool and
+    concurrency limit.
+    """
+    global _default_gateway
+    if client is None:
+        # No client: only run() is usable, but callers still share one pool
+        if _default_gateway is None:
+            _default_gateway = DatabaseGateway(None, max_concurrency=max_concurrency)
+        return _default_gateway
+
+    try:
+        gateway = _gateways.get(client)
+    except TypeError:
+        # Client cannot be weakly referenced; give it an unshared gateway
+        return DatabaseGateway(client, max_concurrency=max_concurrency)
+
+    if gateway is None:
+        gateway = DatabaseGateway(client, max_concurrency=max_concurrency)
+        _gateways[client] = gateway
+        logger.debug("Created database gateway", max_concurrency=max_concurrency)
+    return gateway
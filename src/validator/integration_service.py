@@ -2,6 +2,7 @@
 Integration service for validator - coordinates validation with A.2 fetcher pipeline.
 """
 
+import asyncio
 import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
@@ -15,9 +16,14 @@ from .artifact_validator import ArtifactValidator
 from .storage_reader import StorageReader
 from .validation_pipeline import ValidationPipeline
 from .database_integration import DatabaseIntegration
-from .rpc_client import RPCClient
+from .rpc_client import RPCClient, RPCUpsertBatcher
+from .db_gateway import get_database_gateway
+from .upsert_pipeline import StagedUpsertPipeline, StageLimits
+from .unchanged_filter import UnchangedArtifactFilter
+from .variant_snapshot import get_variant_snapshot_cache
 from .artifact_mapper import ArtifactMapper
 from .raw_artifact_persistence import RawArtifactPersistence
+from ..monitoring.tracing import span
 from ..config.validator_config import ValidatorConfig
 from ..config.imagekit_config import ImageKitConfig
 from ..config.text_cleaning_config import TextCleaningConfig
@@ -25,6 +31,8 @@ from ..config.text_normalization_config import TextNormalizationConfig
 from ..config.firecrawl_config import FirecrawlConfig
 from .type_utils import assert_imagekit_config
 from ..images.deduplication_service import ImageDeduplicationService
+from ..images.hash_cache import ImageHashCache
+from ..images.hash_computation import ImageHashComputer
 from ..images.imagekit_service import ImageKitService
 from ..images.imagekit_integration import ImageKitIntegrationService
 from ..parser.weight_parser import WeightParser
@@ -44,6 +52,7 @@ from ..parser.text_normalization import TextNormalizationService
 # Import Firecrawl services
 from ..fetcher.firecrawl_client import FirecrawlClient
 from ..fetcher.firecrawl_map_service import FirecrawlMapService
+from ..fetcher.firecrawl_budget_management_service import FirecrawlBudgetManagementService
 
 # Import C.8 normalizer pipeline components
 from ..parser.normalizer_pipeline import NormalizerPipelineService
@@ -55,7 +64,8 @@ from ..config.llm_config import LLMConfig
 # Import Epic D services for LLM fallback
 from ..llm.deepseek_wrapper import DeepSeekWrapperService
 from ..llm.cache_service import CacheService
-from ..llm.rate_limiter import RateLimiter
+from ..config.deepseek_config import DeepSeekConfig
+from ..llm.rate_limiter import create_rate_limiter
 from ..llm.confidence_evaluator import ConfidenceEvaluator
 from ..llm.review_workflow import ReviewWorkflow
 from ..llm.enrichment_persistence import EnrichmentPersistence
@@ -98,7 +108,10 @@ class ValidatorIntegrationService:
             storage_reader=self.storage_reader,
             validator=self.validator
         )
-        self.database_integration = DatabaseIntegration(supabase_client=supabase_client)
+        self.database_integration = DatabaseIntegration(
+            supabase_client=supabase_client,
+            batch_size=self.config.validation_audit_batch_size
+        )
         self.rpc_client = RPCClient(supabase_client=supabase_client)
         self.raw_artifact_persistence = RawArtifactPersistence(
             db_integration=self.database_integration,
@@ -107,7 +120,15 @@ class ValidatorIntegrationService:
         
         # Initialize image processing services
         if self.config.enable_image_deduplication:
-            self.image_deduplication_service = ImageDeduplicationService(self.rpc_client)
+            hash_cache = ImageHashCache(
+                max_size=self.config.image_hash_cache_size,
+                path=self.config.image_hash_cache_path,
+                ttl=self.config.image_hash_cache_ttl_seconds
+            )
+            self.image_deduplication_service = ImageDeduplicationService(
+                self.rpc_client,
+                hash_computer=ImageHashComputer(cache=hash_cache)
+            )
         else:
             self.image_deduplication_service = None
         
@@ -210,6 +231,7 @@ class ValidatorIntegrationService:
         
         # Initialize Firecrawl services (if enabled)
         self.firecrawl_client = None
+        self.firecrawl_budget_service = None
         self.firecrawl_map_service = None
         
         if hasattr(self.config, 'enable_firecrawl') and self.config.enable_firecrawl:
@@ -236,14 +258,22 @@ class ValidatorIntegrationService:
                 # Initialize Firecrawl client
                 self.firecrawl_client = FirecrawlClient(firecrawl_config)
                 
-                # Initialize Firecrawl map service
-                self.firecrawl_map_service = FirecrawlMapService(self.firecrawl_client)
+                # Initialize Firecrawl map service with budget-aware batch scheduling
+                self.firecrawl_budget_service = FirecrawlBudgetManagementService(
+                    self.firecrawl_client.budget_tracker,
+                    supabase_client=self.supabase_client
+                )
+                self.firecrawl_map_service = FirecrawlMapService(
+                    self.firecrawl_client,
+                    budget_service=self.firecrawl_budget_service
+                )
                 
                 logger.info("Firecrawl services initialized successfully")
                 
             except Exception as e:
                 logger.warning("Failed to initialize Firecrawl services", error=str(e))
                 self.firecrawl_client = None
+                self.firecrawl_budget_service = None
                 self.firecrawl_map_service = None
         
         # Initialize artifact mapper after image services
@@ -290,7 +320,11 @@ class ValidatorIntegrationService:
                             'requests_per_hour': llm_fallback_config.rate_limit_per_minute * 60,  # 60x per hour
                             'requests_per_day': llm_fallback_config.rate_limit_per_minute * 60 * 24  # 24x per day
                         }
-                        rate_limiter = RateLimiter(rate_limiter_config)
+                        # Shared across workers when DEEPSEEK_RATE_LIMIT_REDIS_URL is set
+                        rate_limiter = create_rate_limiter(
+                            rate_limiter_config,
+                            redis_url=DeepSeekConfig.from_env().rate_limit_redis_url
+                        )
                         
                         # Create cache service
                         cache_service = CacheService()
@@ -402,11 +436,12 @@ class ValidatorIntegrationService:
         
         try:
             # Process artifacts through validation pipeline
-            validation_results = self.validation_pipeline.process_storage_artifacts(
-                roaster_id=roaster_id,
-                platform=platform,
-                response_filenames=response_filenames
-            )
+            with span("validate", roaster_id=roaster_id, artifact_count=len(response_filenames)):
+                validation_results = self.validation_pipeline.process_storage_artifacts(
+                    roaster_id=roaster_id,
+                    platform=platform,
+                    response_filenames=response_filenames
+                )
             
             # Store validation results in database
             artifact_ids = self.database_integration.store_batch_validation_results(
@@ -516,7 +551,8 @@ class ValidatorIntegrationService:
         
         try:
             # Process artifacts through validation pipeline
-            validation_results = self.validation_pipeline.process_artifact_batch(artifacts)
+            with span("validate", roaster_id=roaster_id, artifact_count=len(artifacts)):
+                validation_results = self.validation_pipeline.process_artifact_batch(artifacts)
             
             # Generate response filenames for database storage
             response_filenames = [
@@ -841,6 +877,148 @@ class ValidatorIntegrationService:
         
         return health_status
     
+    def _new_transformation_results(
+        self,
+        roaster_id: str,
+        metadata_only: bool,
+        total_artifacts: int
+    ) -> Dict[str, Any]:
+        return {
+            'roaster_id': roaster_id,
+            'metadata_only': metadata_only,
+            'total_artifacts': total_artifacts,
+            'successful_transformations': 0,
+            'failed_transformations': 0,
+            'successful_upserts': 0,
+            'failed_upserts': 0,
+            'skipped_unchanged': 0,
+            'coffee_ids': [],
+            'variant_ids': [],
+            'price_ids': [],
+            'image_ids': [],
+            'errors': []
+        }
+    
+    def _create_unchanged_filter(self, roaster_id: str, metadata_only: bool = False) -> Optional[UnchangedArtifactFilter]:
+        """
+        Create the skip-unchanged filter for a run, or None when disabled.
+        
+        Metadata-only runs do not write images, so they neither skip products
+        nor record fingerprints; otherwise the next full refresh would skip a
+        product whose images were never written.
+        """
+        if not self.config.enable_skip_unchanged or metadata_only:
+            return None
+        return UnchangedArtifactFilter(
+            rpc_client=self.rpc_client,
+            roaster_id=roaster_id,
+            hash_service=getattr(self, 'hash_service', None)
+        )
+    
+    def _map_artifact(self, validation_result: Any, roaster_id: str, metadata_only: bool) -> Dict[str, Any]:
+        """Transform a valid artifact to RPC payloads."""
+        with span("map", roaster_id=roaster_id):
+            return self.artifact_mapper.map_artifact_to_rpc_payloads(
+                artifact=validation_result.artifact_data,
+                roaster_id=roaster_id,
+                metadata_only=metadata_only
+            )
+    
+    async def _map_artifact_async(self, validation_result: Any, roaster_id: str, metadata_only: bool) -> Dict[str, Any]:
+        """Transform a valid artifact to RPC payloads, awaiting the normalizer pipeline."""
+        with span("map", roaster_id=roaster_id):
+            return await self.artifact_mapper.map_artifact_to_rpc_payloads_async(
+                artifact=validation_result.artifact_data,
+                roaster_id=roaster_id,
+                metadata_only=metadata_only
+            )
+    
+    def _add_artifact_to_batcher(
+        self,
+        validation_result: Any,
+        batcher: RPCUpsertBatcher,
+        transformation_results: Dict[str, Any],
+        roaster_id: str,
+        metadata_only: bool,
+        rpc_payloads: Optional[Dict[str, Any]] = None,
+        mapping_error: Optional[Exception] = None
+    ):
+        """
+        Map a validation result (unless already mapped) and queue it for upsert.
+        
+        Invalid artifacts and mapping failures are counted in transformation_results.
+        """
+        artifact_id = getattr(validation_result, 'artifact_id', 'unknown')
+        try:
+            if not validation_result.is_valid:
+                logger.warning(
+                    "Skipping invalid artifact for transformation",
+                    artifact_id=artifact_id
+                )
+                transformation_results['failed_transformations'] += 1
+                return
+            
+            if mapping_error is not None:
+                raise mapping_error
+            if rpc_payloads is None:
+                rpc_payloads = self._map_artifact(validation_result, roaster_id, metadata_only)
+            
+            transformation_results['successful_transformations'] += 1
+            batcher.add(artifact_id, rpc_payloads)
+            
+        except Exception as e:
+            logger.error(
+                "Failed to transform artifact",
+                artifact_id=artifact_id,
+                error=str(e)
+            )
+            
+            transformation_results['failed_transformations'] += 1
+            transformation_results['failed_upserts'] += 1
+            transformation_results['errors'].append({
+                'artifact_id': artifact_id,
+                'error': str(e)
+            })
+    
+    def _invalidate_variant_snapshot(self, roaster_id: str, products: List[Any]):
+        """Drop the roaster's cached variant snapshot once a flush has written rows."""
+        if not any(product.upserted_rows for product in products):
+            return
+        snapshot_cache = get_variant_snapshot_cache(self.supabase_client)
+        if snapshot_cache:
+            snapshot_cache.invalidate(roaster_id)
+    
+    def _record_upserted_products(self, products: List[Any], transformation_results: Dict[str, Any]):
+        """Fold RPCUpsertBatcher results into transformation_results."""
+        for product in products:
+            transformation_results['successful_upserts'] += product.upserted_rows
+            if product.coffee_id is not None:
+                transformation_results['coffee_ids'].append(product.coffee_id)
+            transformation_results['variant_ids'].extend(product.variant_ids)
+            transformation_results['price_ids'].extend(product.price_ids)
+            transformation_results['image_ids'].extend(product.image_ids)
+            
+            if product.errors:
+                logger.error(
+                    "Failed to upsert artifact rows",
+                    artifact_id=product.key,
+                    coffee_id=product.coffee_id,
+                    errors=product.errors
+                )
+                transformation_results['failed_transformations'] += 1
+                transformation_results['failed_upserts'] += len(product.errors)
+                for error in product.errors:
+                    transformation_results['errors'].append({'artifact_id': product.key, **error})
+            else:
+                logger.info(
+                    "Successfully transformed and upserted artifact",
+                    artifact_id=product.key,
+                    coffee_id=product.coffee_id,
+                    variants_count=len(product.variant_ids),
+                    prices_count=len(product.price_ids),
+                    images_count=len(product.image_ids)
+                )
+    
     def transform_and_upsert_artifacts(
         self,
         validation_results: List[Any],
@@ -865,97 +1043,36 @@ class ValidatorIntegrationService:
             metadata_only=metadata_only
         )
         
-        transformation_results = {
-            'roaster_id': roaster_id,
-            'metadata_only': metadata_only,
-            'total_artifacts': len(validation_results),
-            'successful_transformations': 0,
-            'failed_transformations': 0,
-            'successful_upserts': 0,
-            'failed_upserts': 0,
-            'coffee_ids': [],
-            'variant_ids': [],
-            'price_ids': [],
-            'image_ids': [],
-            'errors': []
-        }
+        transformation_results = self._new_transformation_results(
+            roaster_id=roaster_id,
+            metadata_only=metadata_only,
+            total_artifacts=len(validation_results)
+        )
+        
+        batcher = RPCUpsertBatcher(self.rpc_client, include_images=not metadata_only)
+        
+        # Load every stored fingerprint for the roaster with one query
+        unchanged_filter = self._create_unchanged_filter(roaster_id, metadata_only)
+        if unchanged_filter:
+            unchanged_filter.load()
         
         for validation_result in validation_results:
-            try:
-                if not validation_result.is_valid:
-                    logger.warning(
-                        "Skipping invalid artifact for transformation",
-                        artifact_id=getattr(validation_result, 'artifact_id', 'unknown')
-                    )
-                    transformation_results['failed_transformations'] += 1
-                    continue
-                
-                # Transform artifact to RPC payloads
-                rpc_payloads = self.artifact_mapper.map_artifact_to_rpc_payloads(
-                    artifact=validation_result.artifact_data,
-                    roaster_id=roaster_id,
-                    metadata_only=metadata_only
-                )
-                
-                transformation_results['successful_transformations'] += 1
-                
-                # Upsert coffee record
-                coffee_id = self.rpc_client.upsert_coffee(**rpc_payloads['coffee'])
-                transformation_results['coffee_ids'].append(coffee_id)
-                transformation_results['successful_upserts'] += 1
-                
-                # Upsert variants
-                for variant_payload in rpc_payloads['variants']:
-                    variant_payload['p_coffee_id'] = coffee_id
-                    variant_id = self.rpc_client.upsert_variant(**variant_payload)
-                    transformation_results['variant_ids'].append(variant_id)
-                    transformation_results['successful_upserts'] += 1
-                
-                # Insert prices - match by variant order
-                variant_ids = transformation_results['variant_ids']
-                for i, price_payload in enumerate(rpc_payloads['prices']):
-                    if i < len(variant_ids):
-                        price_payload['variant_id'] = variant_ids[i]
-                        price_id = self.rpc_client.insert_price(**price_payload)
-                        transformation_results['price_ids'].append(price_id)
-                        transformation_results['successful_upserts'] += 1
-                    else:
-                        logger.warning(
-                            "Price payload index exceeds variant count",
-                            price_index=i,
-                            variant_count=len(variant_ids)
-                        )
-                
-                # Upsert images (only if not metadata-only)
-                if not metadata_only:
-                    for image_payload in rpc_payloads['images']:
-                        image_payload['p_coffee_id'] = coffee_id
-                        image_id = self.rpc_client.upsert_coffee_image(**image_payload)
-                        transformation_results['image_ids'].append(image_id)
-                        transformation_results['successful_upserts'] += 1
-                
-                logger.info(
-                    "Successfully transformed and upserted artifact",
-                    artifact_id=getattr(validation_result, 'artifact_id', 'unknown'),
-                    coffee_id=coffee_id,
-                    variants_count=len(rpc_payloads['variants']),
-                    prices_count=len(rpc_payloads['prices']),
-                    images_count=len(rpc_payloads['images'])
-                )
-                
-            except Exception as e:
-                logger.error(
-                    "Failed to transform and upsert artifact",
-                    artifact_id=getattr(validation_result, 'artifact_id', 'unknown'),
-                    error=str(e)
-                )
-                
-                transformation_results['failed_transformations'] += 1
-                transformation_results['failed_upserts'] += 1
-                transformation_results['errors'].append({
-                    'artifact_id': getattr(validation_result, 'artifact_id', 'unknown'),
-                    'error': str(e)
-                })
+            if unchanged_filter and unchanged_filter.is_unchanged(validation_result):
+                transformation_results['skipped_unchanged'] += 1
+                continue
+            self._add_artifact_to_batcher(
+                validation_result, batcher, transformation_results, roaster_id, metadata_only
+            )
+        
+        # Upsert all mapped artifacts with one bulk RPC per entity type
+        with span("upsert", roaster_id=roaster_id, artifact_count=len(batcher)):
+            products = batcher.flush()
+        self._record_upserted_products(products, transformation_results)
+        self._invalidate_variant_snapshot(roaster_id, products)
+        
+        if unchanged_filter:
+            unchanged_filter.touch_unchanged()
+            unchanged_filter.record_upserted(products)
         
         logger.info(
             "Completed artifact transformation and upsert",
@@ -964,7 +1081,8 @@ class ValidatorIntegrationService:
             successful_transformations=transformation_results['successful_transformations'],
             failed_transformations=transformation_results['failed_transformations'],
             successful_upserts=transformation_results['successful_upserts'],
-            failed_upserts=transformation_results['failed_upserts']
+            failed_upserts=transformation_results['failed_upserts'],
+            skipped_unchanged=transformation_results['skipped_unchanged']
         )
         
         return transformation_results
@@ -980,6 +1098,9 @@ class ValidatorIntegrationService:
         """
         Process artifacts through validation pipeline and upsert to database via RPC.
         
+        Sync entry point for process_artifacts_with_rpc_upsert_async; must not
+        be called from a running event loop.
+        
         Args:
             roaster_id: Roaster identifier
             platform: Platform type
@@ -990,6 +1111,42 @@ class ValidatorIntegrationService:
         Returns:
             Dictionary with processing results including RPC upsert results
         """
+        return asyncio.run(self.process_artifacts_with_rpc_upsert_async(
+            roaster_id=roaster_id,
+            platform=platform,
+            scrape_run_id=scrape_run_id,
+            response_filenames=response_filenames,
+            metadata_only=metadata_only
+        ))
+    
+    async def process_artifacts_with_rpc_upsert_async(
+        self,
+        roaster_id: str,
+        platform: str,
+        scrape_run_id: str,
+        response_filenames: List[str],
+        metadata_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Stream artifacts through validation, mapping and RPC upsert.
+        
+        Artifacts flow through bounded queues (see StagedUpsertPipeline), so
+        validation overlaps with database writes and memory does not grow
+        with the number of artifacts. Each batch of upsert_batch_size
+        artifacts is upserted and its validation results are stored for the
+        audit trail as soon as it is complete.
+        
+        Args:
+            roaster_id: Roaster identifier
+            platform: Platform type
+            scrape_run_id: Scrape run identifier
+            response_filenames: List of response filenames to process
+            metadata_only: Whether this is a metadata-only update
+            
+        Returns:
+            Dictionary with processing results including RPC upsert results.
+            artifact_ids are in completion order.
+        """
         logger.info(
             "Starting artifact processing with RPC upsert",
             roaster_id=roaster_id,
@@ -999,79 +1156,121 @@ class ValidatorIntegrationService:
             metadata_only=metadata_only
         )
         
-        # Process artifacts through validation pipeline
-        validation_results = self.validation_pipeline.process_storage_artifacts(
+        start_time = datetime.now(timezone.utc)
+        gateway = get_database_gateway(self.supabase_client)
+        rpc_results = self._new_transformation_results(
             roaster_id=roaster_id,
-            platform=platform,
-            response_filenames=response_filenames
+            metadata_only=metadata_only,
+            total_artifacts=0
         )
+        artifact_ids: List[Optional[str]] = []
+        counts = {'valid': 0, 'invalid': 0}
         
-        # Filter to only valid artifacts for RPC transformation
-        valid_artifacts = [result for result in validation_results if result.is_valid]
+        unchanged_filter = self._create_unchanged_filter(roaster_id, metadata_only)
+        if unchanged_filter:
+            await gateway.run(unchanged_filter.load)
         
-        if not valid_artifacts:
-            logger.warning(
-                "No valid artifacts found for RPC transformation",
+        async def validate(filename: str):
+            with span("validate", roaster_id=roaster_id):
+                result = await self.validation_pipeline.validate_storage_artifact(
+                    roaster_id=roaster_id,
+                    platform=platform,
+                    response_filename=filename
+                )
+            counts['valid' if result.is_valid else 'invalid'] += 1
+            return filename, result
+        
+        async def map_item(item):
+            filename, result = item
+            if not result.is_valid:
+                return filename, result, None, None, False
+            if unchanged_filter and unchanged_filter.is_unchanged(result):
+                return filename, result, None, None, True
+            try:
+                return filename, result, await self._map_artifact_async(result, roaster_id, metadata_only), None, False
+            except Exception as e:
+                return filename, result, None, e, False
+        
+        async def upsert(batch):
+            batcher = RPCUpsertBatcher(self.rpc_client, include_images=not metadata_only)
+            for _, result, payloads, error, unchanged in batch:
+                if not result.is_valid:
+                    continue
+                rpc_results['total_artifacts'] += 1
+                if unchanged:
+                    rpc_results['skipped_unchanged'] += 1
+                    continue
+                self._add_artifact_to_batcher(
+                    result, batcher, rpc_results, roaster_id, metadata_only,
+                    rpc_payloads=payloads, mapping_error=error
+                )
+            with span("upsert", roaster_id=roaster_id, artifact_count=len(batcher)):
+                products = await gateway.run(batcher.flush) if len(batcher) else []
+            self._record_upserted_products(products, rpc_results)
+            self._invalidate_variant_snapshot(roaster_id, products)
+            if unchanged_filter:
+                await gateway.run(unchanged_filter.touch_unchanged)
+                await gateway.run(unchanged_filter.record_upserted, products)
+            
+            # Store validation results in database (for audit trail)
+            stored_ids = await self.database_integration.store_batch_validation_results_async(
+                validation_results=[item[1] for item in batch],
+                scrape_run_id=scrape_run_id,
                 roaster_id=roaster_id,
                 platform=platform,
-                total_artifacts=len(validation_results)
+                response_filenames=[item[0] for item in batch]
+            )
+            artifact_ids.extend(stored_ids or [])
+        
+        pipeline = StagedUpsertPipeline(
+            validate=validate,
+            map_item=map_item,
+            upsert=upsert,
+            limits=StageLimits(
+                validation_concurrency=self.config.upsert_validation_concurrency,
+                mapping_concurrency=self.config.upsert_mapping_concurrency,
+                upsert_concurrency=self.config.upsert_write_concurrency,
+                queue_size=self.config.upsert_queue_size,
+                batch_size=self.config.upsert_batch_size
             )
-            
-            return {
-                'roaster_id': roaster_id,
-                'platform': platform,
-                'scrape_run_id': scrape_run_id,
-                'total_artifacts': len(response_filenames),
-                'valid_artifacts': 0,
-                'invalid_artifacts': len(validation_results),
-                'rpc_transformation': {
-                    'successful_transformations': 0,
-                    'failed_transformations': 0,
-                    'successful_upserts': 0,
-                    'failed_upserts': 0
-                },
-                'success': False,
-                'error': 'No valid artifacts found'
-            }
-        
-        # Transform and upsert valid artifacts
-        rpc_results = self.transform_and_upsert_artifacts(
-            validation_results=valid_artifacts,
-            roaster_id=roaster_id,
-            metadata_only=metadata_only
         )
+        try:
+            await pipeline.run(response_filenames)
+        finally:
+            # Image hash clients are bound to this event loop
+            await self._close_image_clients()
         
-        # Store validation results in database (for audit trail)
-        artifact_ids = self.database_integration.store_batch_validation_results(
-            validation_results=validation_results,
-            scrape_run_id=scrape_run_id,
-            roaster_id=roaster_id,
-            platform=platform,
-            response_filenames=response_filenames
-        )
+        valid_count = counts['valid']
+        invalid_count = counts['invalid']
         
         # Update service stats
         self.service_stats['total_processed'] += len(response_filenames)
-        self.service_stats['successful_validations'] += len(valid_artifacts)
-        self.service_stats['failed_validations'] += len(validation_results) - len(valid_artifacts)
+        self.service_stats['successful_validations'] += valid_count
+        self.service_stats['failed_validations'] += invalid_count
         
-        # Prepare comprehensive results
         results = {
             'roaster_id': roaster_id,
             'platform': platform,
             'scrape_run_id': scrape_run_id,
             'total_artifacts': len(response_filenames),
-            'valid_artifacts': len(valid_artifacts),
-            'invalid_artifacts': len(validation_results) - len(valid_artifacts),
+            'valid_artifacts': valid_count,
+            'invalid_artifacts': invalid_count,
             'artifact_ids': artifact_ids,
-            'validation_results': validation_results,
             'rpc_transformation': rpc_results,
-            'processing_time_seconds': (
-                self.service_stats['end_time'] - self.service_stats['start_time']
-            ).total_seconds() if self.service_stats['end_time'] else None,
-            'success': True
+            'processing_time_seconds': (datetime.now(timezone.utc) - start_time).total_seconds(),
+            'success': valid_count > 0
         }
         
+        if not valid_count:
+            logger.warning(
+                "No valid artifacts found for RPC transformation",
+                roaster_id=roaster_id,
+                platform=platform,
+                total_artifacts=invalid_count
+            )
+            results['error'] = 'No valid artifacts found'
+            return results
+        
         logger.info(
             "Completed artifact processing with RPC upsert",
             roaster_id=roaster_id,
@@ -1081,11 +1280,22 @@ class ValidatorIntegrationService:
             valid_artifacts=results['valid_artifacts'],
             invalid_artifacts=results['invalid_artifacts'],
             successful_upserts=rpc_results['successful_upserts'],
-            failed_upserts=rpc_results['failed_upserts']
+            failed_upserts=rpc_results['failed_upserts'],
+            skipped_unchanged=rpc_results['skipped_unchanged']
         )
         
         return results
     
+    async def _close_image_clients(self):
+        """Close HTTP clients opened by the image services for async batch processing."""
+        for service in (self.image_deduplication_service, self.imagekit_integration):
+            if service is None:
+                continue
+            try:
+                await service.aclose()
+            except Exception as e:
+                logger.warning("Failed to close image service clients", error=str(e))
+    
     async def discover_roaster_products_firecrawl(
         self,
         roaster_config: 'RoasterConfigSchema',
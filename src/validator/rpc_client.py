@@ -4,8 +4,11 @@ RPC client wrapper for Supabase RPC calls with error handling and retry logic.
 
 import time
 import json
+import asyncio
 import uuid
-from typing import Dict, Any, Optional, List
+import inspect
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -17,6 +20,9 @@ try:
 except ImportError:
     ImageProcessingGuard = None
 
+from .db_gateway import get_database_gateway
+from ..monitoring.rpc_metrics import RPCTelemetry
+
 logger = get_logger(__name__)
 
 
@@ -40,6 +46,78 @@ class RPCValidationError(RPCError):
     pass
 
 
+# Bulk RPCs take a JSON array of rows (keyed like the single-row RPC parameters)
+# and return one (idx, id, error) row per input row.
+BULK_RPC_NAMES = {
+    'coffee': 'rpc_bulk_upsert_coffees',
+    'variant': 'rpc_bulk_upsert_variants',
+    'price': 'rpc_bulk_insert_prices',
+    'image': 'rpc_bulk_upsert_coffee_images'
+}
+
+
+# Set-based price RPCs: one statement (and transaction) per chunk of rows.
+APPLY_PRICE_DELTAS_RPC = 'rpc_apply_price_deltas'
+BATCH_VARIANT_PRICING_RPC = 'rpc_batch_update_variant_pricing'
+
+_PRICE_DELTA_FIELDS = (
+    'variant_id', 'price', 'currency', 'in_stock', 'is_sale', 'scraped_at', 'source_url', 'source_raw'
+)
+_VARIANT_PRICING_FIELDS = ('price_current', 'price_last_checked_at', 'in_stock', 'currency')
+
+
+@dataclass(slots=True, kw_only=True)
+class PriceDeltaApplyResult:
+    """Outcome of applying a batch of price deltas."""
+    
+    total_deltas: int = 0
+    price_ids: List[str] = field(default_factory=list)
+    variant_ids: List[str] = field(default_factory=list)
+    failed_deltas: int = 0
+    errors: List[str] = field(default_factory=list)
+    
+    @property
+    def success(self) -> bool:
+        return not self.errors and self.failed_deltas == 0
+
+
+@dataclass(slots=True, kw_only=True)
+class BulkRowResult:
+    """Outcome of one row in a bulk RPC call."""
+    
+    index: int
+    id: Optional[str] = None
+    error: Optional[str] = None
+    
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.id is not None
+
+
+@dataclass(slots=True, kw_only=True)
+class ProductUpsertResult:
+    """Ids and per-row errors for one product written by RPCUpsertBatcher."""
+    
+    key: str
+    platform_product_id: Optional[str] = None
+    coffee_id: Optional[str] = None
+    variant_ids: List[str] = field(default_factory=list)
+    price_ids: List[str] = field(default_factory=list)
+    image_ids: List[str] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    
+    @property
+    def success(self) -> bool:
+        return self.coffee_id is not None and not self.errors
+    
+    @property
+    def upserted_rows(self) -> int:
+        return (
+            (1 if self.coffee_id is not None else 0)
+            + len(self.variant_ids) + len(self.price_ids) + len(self.image_ids)
+        )
+
+
 class RPCClient:
     """
     RPC client wrapper for Supabase RPC calls.
@@ -48,10 +126,12 @@ class RPCClient:
     - Error handling for RPC failures and database constraints
     - Retry logic with exponential backoff
     - Comprehensive logging for RPC call success/failure
+    - Prometheus telemetry for latency, payload size and retries
     - Support for all coffee pipeline RPC functions
     """
     
-    def __init__(self, supabase_client, max_retries: int = 3, base_delay: float = 1.0, metadata_only: bool = False):
+    def __init__(self, supabase_client, max_retries: int = 3, base_delay: float = 1.0, metadata_only: bool = False,
+                 bulk_chunk_size: int = 500, telemetry: Optional[RPCTelemetry] = None):
         """
         Initialize RPC client.
         
@@ -60,10 +140,14 @@ class RPCClient:
             max_retries: Maximum number of retry attempts
             base_delay: Base delay in seconds for exponential backoff
             metadata_only: Whether this is a metadata-only (price-only) run
+            bulk_chunk_size: Maximum rows sent in a single bulk RPC call
+            telemetry: RPC latency/payload/retry telemetry (Prometheus-backed by default)
         """
         self.supabase_client = supabase_client
         self.max_retries = max_retries
         self.base_delay = base_delay
+        self.bulk_chunk_size = bulk_chunk_size
+        self.telemetry = telemetry or RPCTelemetry()
         
         # RPC call statistics
         self.rpc_stats = {
@@ -97,6 +181,9 @@ class RPCClient:
         """
         Execute RPC call with retry logic and error handling.
         
+        Blocks the calling thread during backoff; async code should use
+        execute_rpc_async or run this on a DatabaseGateway worker.
+        
         Args:
             rpc_name: Name of the RPC function
             parameters: Parameters for the RPC call
@@ -109,99 +196,167 @@ class RPCClient:
             RPCError: For various RPC failures
         """
         self.rpc_stats['total_calls'] += 1
+        self.telemetry.record_payload(rpc_name, parameters)
+        started = time.perf_counter()
         
         last_exception = None
         
         for attempt in range(self.max_retries + 1):
             try:
-                logger.info(
-                    f"Executing {operation_description}",
-                    rpc_name=rpc_name,
-                    attempt=attempt + 1,
-                    max_retries=self.max_retries,
-                    parameters=parameters
-                )
+                self._log_rpc_attempt(rpc_name, operation_description, attempt)
                 
                 # Execute RPC call
                 result = self.supabase_client.rpc(rpc_name, parameters).execute()
-                
-                if result.data is not None:
-                    self.rpc_stats['successful_calls'] += 1
-                    
-                    logger.info(
-                        f"Successfully completed {operation_description}",
-                        rpc_name=rpc_name,
-                        attempt=attempt + 1,
-                        result_count=len(result.data) if isinstance(result.data, list) else 1
-                    )
-                    
-                    return result.data
-                else:
-                    # Handle case where RPC returns no data
-                    error_msg = f"RPC {rpc_name} returned no data"
-                    if hasattr(result, 'error') and result.error:
-                        error_msg += f": {result.error}"
-                    
-                    raise RPCError(error_msg)
+                data = self._handle_rpc_result(result, rpc_name, operation_description, attempt)
+                self.telemetry.observe_call(rpc_name, time.perf_counter() - started, 'success')
+                return data
                     
             except Exception as e:
                 last_exception = e
-                
-                # Classify error type (only on first attempt)
-                if attempt == 0:
-                    error_type = self._classify_error(e)
-                    if error_type == 'constraint':
-                        self.rpc_stats['constraint_errors'] += 1
-                    elif error_type == 'network':
-                        self.rpc_stats['network_errors'] += 1
-                    elif error_type == 'validation':
-                        self.rpc_stats['validation_errors'] += 1
-                else:
-                    # Use the same error type for retry attempts
-                    error_type = self._classify_error(e)
-                
-                logger.warning(
-                    f"RPC call failed for {operation_description}",
-                    rpc_name=rpc_name,
-                    attempt=attempt + 1,
-                    max_retries=self.max_retries,
-                    error_type=error_type,
-                    error=str(e)
-                )
-                
-                # Don't retry on constraint or validation errors
-                if error_type in ['constraint', 'validation']:
-                    self.rpc_stats['failed_calls'] += 1
+                delay = self._handle_rpc_failure(e, rpc_name, operation_description, attempt)
+                if delay is None:
                     break
+                time.sleep(delay)
+        
+        self.telemetry.observe_call(rpc_name, time.perf_counter() - started, 'error')
+        raise self._final_rpc_error(last_exception)
+    
+    async def execute_rpc_async(
+        self,
+        rpc_name: str,
+        parameters: Dict[str, Any],
+        operation_description: str = "RPC call"
+    ) -> Any:
+        """
+        Async variant of _execute_rpc_with_retry.
+        
+        The call runs through the client's DatabaseGateway and backoff uses
+        asyncio.sleep, so neither blocks the event loop.
+        """
+        self.rpc_stats['total_calls'] += 1
+        self.telemetry.record_payload(rpc_name, parameters)
+        started = time.perf_counter()
+        gateway = get_database_gateway(self.supabase_client)
+        
+        last_exception = None
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._log_rpc_attempt(rpc_name, operation_description, attempt)
                 
-                # Retry on network errors or other transient errors
-                if attempt < self.max_retries:
-                    delay = self.base_delay * (2 ** attempt)
-                    self.rpc_stats['retry_attempts'] += 1
+                result = await gateway.rpc(rpc_name, parameters)
+                data = self._handle_rpc_result(result, rpc_name, operation_description, attempt)
+                self.telemetry.observe_call(rpc_name, time.perf_counter() - started, 'success')
+                return data
                     
-                    logger.info(
-                        f"Retrying {operation_description} after delay",
-                        rpc_name=rpc_name,
-                        attempt=attempt + 1,
-                        delay_seconds=delay
-                    )
-                    
-                    time.sleep(delay)
-                else:
-                    # Only count as failed call when all retries are exhausted
-                    self.rpc_stats['failed_calls'] += 1
-                    logger.error(
-                        f"All retry attempts exhausted for {operation_description}",
-                        rpc_name=rpc_name,
-                        max_retries=self.max_retries,
-                        final_error=str(e)
-                    )
+            except Exception as e:
+                last_exception = e
+                delay = self._handle_rpc_failure(e, rpc_name, operation_description, attempt)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        
+        self.telemetry.observe_call(rpc_name, time.perf_counter() - started, 'error')
+        raise self._final_rpc_error(last_exception)
+    
+    def _log_rpc_attempt(self, rpc_name: str, operation_description: str, attempt: int):
+        # Parameters are never logged here; see RPCTelemetry for sampled sizes and redacted dumps
+        logger.debug(
+            f"Executing {operation_description}",
+            rpc_name=rpc_name,
+            attempt=attempt + 1,
+            max_retries=self.max_retries
+        )
+    
+    def _handle_rpc_result(self, result, rpc_name: str, operation_description: str, attempt: int) -> Any:
+        """Return the data of a successful RPC response, raising RPCError when there is none."""
+        if result.data is not None:
+            self.rpc_stats['successful_calls'] += 1
+            
+            logger.debug(
+                f"Successfully completed {operation_description}",
+                rpc_name=rpc_name,
+                attempt=attempt + 1,
+                result_count=len(result.data) if isinstance(result.data, list) else 1
+            )
+            
+            return result.data
+        
+        # Handle case where RPC returns no data
+        error_msg = f"RPC {rpc_name} returned no data"
+        if hasattr(result, 'error') and result.error:
+            error_msg += f": {result.error}"
+        
+        raise RPCError(error_msg)
+    
+    def _handle_rpc_failure(
+        self,
+        error: Exception,
+        rpc_name: str,
+        operation_description: str,
+        attempt: int
+    ) -> Optional[float]:
+        """
+        Record a failed attempt.
+        
+        Returns:
+            Backoff delay in seconds before the next attempt, or None to stop retrying
+        """
+        error_type = self._classify_error(error)
+        
+        # Classify error type (only on first attempt)
+        if attempt == 0:
+            if error_type == 'constraint':
+                self.rpc_stats['constraint_errors'] += 1
+            elif error_type == 'network':
+                self.rpc_stats['network_errors'] += 1
+            elif error_type == 'validation':
+                self.rpc_stats['validation_errors'] += 1
+        
+        logger.warning(
+            f"RPC call failed for {operation_description}",
+            rpc_name=rpc_name,
+            attempt=attempt + 1,
+            max_retries=self.max_retries,
+            error_type=error_type,
+            error=str(error)
+        )
+        
+        # Don't retry on constraint or validation errors
+        if error_type in ['constraint', 'validation']:
+            self.rpc_stats['failed_calls'] += 1
+            return None
+        
+        # Retry on network errors or other transient errors
+        if attempt < self.max_retries:
+            delay = self.base_delay * (2 ** attempt)
+            self.rpc_stats['retry_attempts'] += 1
+            self.telemetry.record_retry(rpc_name, error_type)
+            
+            logger.info(
+                f"Retrying {operation_description} after delay",
+                rpc_name=rpc_name,
+                attempt=attempt + 1,
+                delay_seconds=delay
+            )
+            
+            return delay
         
+        # Only count as failed call when all retries are exhausted
+        self.rpc_stats['failed_calls'] += 1
+        logger.error(
+            f"All retry attempts exhausted for {operation_description}",
+            rpc_name=rpc_name,
+            max_retries=self.max_retries,
+            final_error=str(error)
+        )
+        return None
+    
+    def _final_rpc_error(self, last_exception: Exception) -> RPCError:
         # All retries exhausted, raise the last exception
         if isinstance(last_exception, RPCError):
-            raise last_exception
-        else:
-            raise RPCError(f"RPC call failed after {self.max_retries} retries: {str(last_exception)}")
+            return last_exception
+        return RPCError(f"RPC call failed after {self.max_retries} retries: {str(last_exception)}")
     
     def _classify_error(self, error: Exception) -> str:
         """
@@ -579,6 +734,79 @@ class RPCClient:
         else:
             raise RPCError(f"Unexpected result format from rpc_upsert_coffee_image: {result}")
     
+    def _bulk_row(self, entity_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize a payload to the single-row RPC parameters.
+        
+        As in the single-row methods, required parameters are always sent
+        (as null when unset) so the RPC signature resolves, optional ones only
+        when set so their SQL defaults apply. Unknown keys are dropped.
+        """
+        allowed, required = _BULK_ROW_PARAMETERS[entity_type]
+        row = dict.fromkeys(required)
+        for key, value in payload.items():
+            name = key if key.startswith('p_') else f'p_{key}'
+            if name in allowed and (value is not None or name in required):
+                row[name] = value
+        return row
+    
+    def bulk_upsert(self, entity_type: str, payloads: List[Dict[str, Any]]) -> List[BulkRowResult]:
+        """
+        Write many rows of one entity type with one bulk RPC call per chunk.
+        
+        Args:
+            entity_type: One of 'coffee', 'variant', 'price' or 'image'
+            payloads: Row payloads keyed like the single-row RPC parameters
+                (with or without the 'p_' prefix)
+            
+        Returns:
+            One BulkRowResult per payload, in input order. A chunk whose RPC
+            call fails marks all of its rows failed; other chunks still run.
+            
+        Raises:
+            RPCValidationError: For an unknown entity type
+            RPCError: If image writes are blocked for a price-only run
+        """
+        if entity_type not in BULK_RPC_NAMES:
+            raise RPCValidationError(f"Unknown bulk entity type: {entity_type}")
+        
+        if entity_type == 'image' and self.image_guard and not self.image_guard.check_image_processing_allowed("bulk_upsert_coffee_images"):
+            raise RPCError("Image processing blocked for price-only run: bulk_upsert_coffee_images")
+        
+        rpc_name = BULK_RPC_NAMES[entity_type]
+        rows = [self._bulk_row(entity_type, payload) for payload in payloads]
+        results: List[BulkRowResult] = []
+        
+        for start in range(0, len(rows), self.bulk_chunk_size):
+            chunk = rows[start:start + self.bulk_chunk_size]
+            try:
+                data = self._execute_rpc_with_retry(
+                    rpc_name=rpc_name,
+                    parameters={'p_rows': chunk},
+                    operation_description=f"bulk {entity_type} upsert of {len(chunk)} rows"
+                )
+            except RPCError as e:
+                results.extend(BulkRowResult(index=start + i, error=str(e)) for i in range(len(chunk)))
+                continue
+            
+            returned = {row['idx']: row for row in data} if isinstance(data, list) else {}
+            for i in range(len(chunk)):
+                row = returned.get(i)
+                if row is None:
+                    results.append(BulkRowResult(index=start + i, error=f"{rpc_name} returned no result for row"))
+                else:
+                    results.append(BulkRowResult(index=start + i, id=row.get('id'), error=row.get('error')))
+        
+        failed = sum(1 for result in results if not result.succeeded)
+        logger.info(
+            "Completed bulk RPC write",
+            rpc_name=rpc_name,
+            total_rows=len(rows),
+            failed_rows=failed
+        )
+        
+        return results
+    
     def check_content_hash(self, content_hash: str) -> Optional[str]:
         """
         Check if content hash already exists in database.
@@ -605,6 +833,35 @@ class RPCClient:
         else:
             return None
     
+    def check_content_hashes(self, content_hashes: List[str]) -> Dict[str, str]:
+        """
+        Check many content hashes for existing images.
+        
+        Args:
+            content_hashes: SHA256 hashes to check for duplicates
+            
+        Returns:
+            Dictionary mapping each hash that already exists to its image ID
+        """
+        unique_hashes = list(dict.fromkeys(h for h in content_hashes if h))
+        existing: Dict[str, str] = {}
+        
+        for start in range(0, len(unique_hashes), self.bulk_chunk_size):
+            chunk = unique_hashes[start:start + self.bulk_chunk_size]
+            result = self._execute_rpc_with_retry(
+                rpc_name='rpc_check_content_hashes',
+                parameters={'p_content_hashes': chunk},
+                operation_description=f"check {len(chunk)} content hashes"
+            )
+            if isinstance(result, list):
+                existing.update(
+                    (row['content_hash'], row['image_id'])
+                    for row in result
+                    if row.get('image_id')
+                )
+        
+        return existing
+    
     def get_rpc_stats(self) -> Dict[str, Any]:
         """
         Get RPC client statistics.
@@ -749,6 +1006,9 @@ class RPCClient:
         """
         Batch update variant pricing for multiple variants.
         
+        Updates are sent to rpc_batch_update_variant_pricing in chunks of
+        bulk_chunk_size, one set-based UPDATE per chunk.
+        
         Args:
             variant_updates: List of variant update dictionaries with 'variant_id' and update fields
             
@@ -762,31 +1022,36 @@ class RPCClient:
             'errors': []
         }
         
+        rows = []
         for update in variant_updates:
+            if not update.get('variant_id'):
+                results['errors'].append("Missing variant_id in update")
+                results['failed_updates'] += 1
+                continue
+            row = {'variant_id': update['variant_id']}
+            row.update({key: update[key] for key in _VARIANT_PRICING_FIELDS if update.get(key) is not None})
+            rows.append(row)
+        
+        for start in range(0, len(rows), self.bulk_chunk_size):
+            chunk = rows[start:start + self.bulk_chunk_size]
             try:
-                variant_id = update.get('variant_id')
-                if not variant_id:
-                    results['errors'].append("Missing variant_id in update")
-                    results['failed_updates'] += 1
-                    continue
-                
-                # Remove variant_id from update data
-                update_data = {k: v for k, v in update.items() if k != 'variant_id'}
-                
-                success = self.update_variant_pricing(
-                    variant_id=variant_id,
-                    **update_data
+                data = self._execute_rpc_with_retry(
+                    rpc_name=BATCH_VARIANT_PRICING_RPC,
+                    parameters={'p_updates': chunk},
+                    operation_description=f"batch variant pricing update of {len(chunk)} variants"
                 )
-                
-                if success:
+            except RPCError as e:
+                results['failed_updates'] += len(chunk)
+                results['errors'].append(f"Error updating {len(chunk)} variants: {str(e)}")
+                continue
+            
+            updated = {str(row['variant_id']) for row in data or [] if isinstance(row, dict)}
+            for row in chunk:
+                if str(row['variant_id']) in updated:
                     results['successful_updates'] += 1
                 else:
                     results['failed_updates'] += 1
-                    results['errors'].append(f"Failed to update variant {variant_id}")
-                    
-            except Exception as e:
-                results['failed_updates'] += 1
-                results['errors'].append(f"Error updating variant {update.get('variant_id', 'unknown')}: {str(e)}")
+                    results['errors'].append(f"Failed to update variant {row['variant_id']}")
         
         logger.info(
             "Completed batch variant pricing update",
@@ -796,7 +1061,139 @@ class RPCClient:
         )
         
         return results
-
+    
+    def apply_price_deltas(self, deltas: List[Dict[str, Any]]) -> PriceDeltaApplyResult:
+        """
+        Insert price history and update variant pricing for many variants at once.
+        
+        Each chunk of bulk_chunk_size deltas is applied by a single
+        rpc_apply_price_deltas call, so its price rows and variant updates
+        commit together. When a variant appears more than once only its last
+        delta is applied.
+        
+        Args:
+            deltas: Delta dictionaries with 'variant_id' and 'price', and
+                optionally currency, in_stock, is_sale, scraped_at, source_url
+                and source_raw
+            
+        Returns:
+            PriceDeltaApplyResult with inserted price ids and updated variant ids.
+            A failed chunk is recorded in errors; other chunks still run.
+        """
+        result = PriceDeltaApplyResult(total_deltas=len(deltas))
+        
+        latest: Dict[str, Dict[str, Any]] = {}
+        for delta in deltas:
+            if not delta.get('variant_id') or delta.get('price') is None:
+                result.failed_deltas += 1
+                result.errors.append("Missing variant_id or price in delta")
+                continue
+            # Re-inserting moves the key to the end, keeping rows in last-seen order
+            latest.pop(delta['variant_id'], None)
+            latest[delta['variant_id']] = {
+                key: delta[key] for key in _PRICE_DELTA_FIELDS if delta.get(key) is not None
+            }
+        rows = list(latest.values())
+        
+        for start in range(0, len(rows), self.bulk_chunk_size):
+            chunk = rows[start:start + self.bulk_chunk_size]
+            try:
+                data = self._execute_rpc_with_retry(
+                    rpc_name=APPLY_PRICE_DELTAS_RPC,
+                    parameters={'p_deltas': chunk},
+                    operation_description=f"apply {len(chunk)} price deltas"
+                )
+            except RPCError as e:
+                result.failed_deltas += len(chunk)
+                result.errors.append(f"Error applying {len(chunk)} price deltas: {str(e)}")
+                continue
+            
+            applied = [row for row in data or [] if isinstance(row, dict)]
+            result.price_ids.extend(str(row['price_id']) for row in applied)
+            result.variant_ids.extend(str(row['variant_id']) for row in applied)
+            missing = len(chunk) - len(applied)
+            if missing > 0:
+                result.failed_deltas += missing
+                result.errors.append(f"{missing} price deltas referenced unknown variants")
+        
+        logger.info(
+            "Applied price deltas",
+            total_deltas=result.total_deltas,
+            applied=len(result.price_ids),
+            failed=result.failed_deltas
+        )
+        
+        return result
+    
+    def get_roaster_content_hashes(self, roaster_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the stored artifact fingerprints for every coffee of a roaster.
+        
+        Args:
+            roaster_id: Roaster ID
+            
+        Returns:
+            Mapping of platform_product_id to {'coffee_id', 'artifact_hash'}
+        """
+        data = self._execute_rpc_with_retry(
+            rpc_name='rpc_get_roaster_content_hashes',
+            parameters={'p_roaster_id': roaster_id},
+            operation_description=f"load content hashes for roaster {roaster_id}"
+        )
+        
+        known = {}
+        for row in data if isinstance(data, list) else []:
+            if isinstance(row, dict) and row.get('platform_product_id') and row.get('artifact_hash'):
+                known[row['platform_product_id']] = {
+                    'coffee_id': row.get('coffee_id'),
+                    'artifact_hash': row['artifact_hash']
+                }
+        return known
+    
+    def set_coffee_artifact_hashes(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Record artifact fingerprints for coffees, one RPC call per chunk.
+        
+        Args:
+            rows: Dictionaries with 'coffee_id' and 'artifact_hash'
+            
+        Returns:
+            Number of coffees updated
+        """
+        updated = 0
+        for start in range(0, len(rows), self.bulk_chunk_size):
+            chunk = rows[start:start + self.bulk_chunk_size]
+            data = self._execute_rpc_with_retry(
+                rpc_name='rpc_set_coffee_artifact_hashes',
+                parameters={'p_rows': chunk},
+                operation_description=f"record {len(chunk)} artifact hashes"
+            )
+            updated += data if isinstance(data, int) else 0
+        return updated
+    
+    def touch_unchanged_coffees(self, coffee_ids: List[str], seen_at: Optional[str] = None) -> int:
+        """
+        Mark the variants of unchanged coffees as seen, one RPC call per chunk.
+        
+        Args:
+            coffee_ids: IDs of coffees whose content did not change
+            seen_at: Last-seen timestamp (defaults to now)
+            
+        Returns:
+            Number of variants touched
+        """
+        seen_at = seen_at or datetime.now(timezone.utc).isoformat()
+        touched = 0
+        for start in range(0, len(coffee_ids), self.bulk_chunk_size):
+            chunk = coffee_ids[start:start + self.bulk_chunk_size]
+            data = self._execute_rpc_with_retry(
+                rpc_name='rpc_touch_unchanged_coffees',
+                parameters={'p_coffee_ids': chunk, 'p_seen_at': seen_at},
+                operation_description=f"touch {len(chunk)} unchanged coffees"
+            )
+            touched += data if isinstance(data, int) else 0
+        return touched
+    
     def upsert_roaster(
         self,
         name: str,
@@ -927,3 +1324,130 @@ class RPCClient:
             'network_errors': 0,
             'validation_errors': 0
         }
+
+
+def _rpc_parameter_names(method) -> Tuple[frozenset, Tuple[str, ...]]:
+    """RPC parameter names of a single-row method: (all, required in signature order)."""
+    parameters = [p for name, p in inspect.signature(method).parameters.items() if name != 'self']
+    return (
+        frozenset(f'p_{p.name}' for p in parameters),
+        tuple(f'p_{p.name}' for p in parameters if p.default is inspect.Parameter.empty)
+    )
+
+
+# Bulk rows accept exactly the parameters of the matching single-row RPC
+_BULK_ROW_PARAMETERS = {
+    'coffee': _rpc_parameter_names(RPCClient.upsert_coffee),
+    'variant': _rpc_parameter_names(RPCClient.upsert_variant),
+    'price': _rpc_parameter_names(RPCClient.insert_price),
+    'image': _rpc_parameter_names(RPCClient.upsert_coffee_image)
+}
+
+
+class RPCUpsertBatcher:
+    """
+    Collect mapped product payloads and write them with bulk RPCs.
+    
+    Payloads are grouped by entity type so a flush costs one bulk call per
+    entity type (per chunk) instead of one call per row. Coffee ids are wired
+    into variants and images, and variant ids into prices by position, as in
+    the single-row path. Rows whose parent failed are not written.
+    """
+    
+    def __init__(self, rpc_client: RPCClient, include_images: bool = True):
+        self.rpc_client = rpc_client
+        self.include_images = include_images
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+    
+    def __len__(self) -> int:
+        return len(self._pending)
+    
+    def add(self, key: str, rpc_payloads: Dict[str, Any]):
+        """Queue one product's payloads ('coffee', 'variants', 'prices', 'images')."""
+        self._pending.append((key, rpc_payloads))
+    
+    def _write(self, entity_type: str, items: List[Tuple[int, int, Dict[str, Any]]],
+               results: List[ProductUpsertResult]) -> Dict[Tuple[int, int], str]:
+        if not items:
+            return {}
+        
+        written = {}
+        rows = self.rpc_client.bulk_upsert(entity_type, [payload for _, _, payload in items])
+        for (product, position, _), row in zip(items, rows):
+            if row.succeeded:
+                written[(product, position)] = row.id
+            else:
+                results[product].errors.append({
+                    'entity_type': entity_type,
+                    'position': position,
+                    'error': row.error
+                })
+        return written
+    
+    def flush(self) -> List[ProductUpsertResult]:
+        """
+        Write all queued products.
+        
+        Returns:
+            One ProductUpsertResult per queued product, in the order added
+        """
+        products, self._pending = self._pending, []
+        results = [
+            ProductUpsertResult(
+                key=key,
+                platform_product_id=(
+                    payloads.get('platform_product_id')
+                    or payloads.get('coffee', {}).get('p_platform_product_id')
+                )
+            )
+            for key, payloads in products
+        ]
+        
+        coffees = self._write(
+            'coffee',
+            [(i, 0, payloads['coffee']) for i, (_, payloads) in enumerate(products)],
+            results
+        )
+        for (i, _), coffee_id in coffees.items():
+            results[i].coffee_id = coffee_id
+        
+        variant_items = []
+        image_items = []
+        for i, (_, payloads) in enumerate(products):
+            coffee_id = results[i].coffee_id
+            if coffee_id is None:
+                continue
+            for position, payload in enumerate(payloads.get('variants', [])):
+                variant_items.append((i, position, {**payload, 'p_coffee_id': coffee_id}))
+            if self.include_images:
+                for position, payload in enumerate(payloads.get('images', [])):
+                    image_items.append((i, position, {**payload, 'p_coffee_id': coffee_id}))
+        
+        variants = self._write('variant', variant_items, results)
+        
+        # Prices match variants by position within the same product
+        price_items = []
+        for i, (_, payloads) in enumerate(products):
+            if results[i].coffee_id is None:
+                continue
+            variant_count = len(payloads.get('variants', []))
+            for position, payload in enumerate(payloads.get('prices', [])):
+                if position >= variant_count:
+                    logger.warning(
+                        "Price payload index exceeds variant count",
+                        price_index=position,
+                        variant_count=variant_count
+                    )
+                    continue
+                variant_id = variants.get((i, position))
+                if variant_id is not None:
+                    price_items.append((i, position, {**payload, 'p_variant_id': variant_id}))
+        
+        prices = self._write('price', price_items, results)
+        images = self._write('image', image_items, results)
+        
+        for written, attribute in ((variants, 'variant_ids'), (prices, 'price_ids'), (images, 'image_ids')):
+            for (i, _), row_id in sorted(written.items()):
+                getattr(results[i], attribute).append(row_id)
+        
+        return results
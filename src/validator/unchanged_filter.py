@@ -0,0 +1,171 @@
+"""
+Skip-unchanged filter for the RPC upsert path.
+
+Most products are identical between full refreshes. This filter compares a
+fingerprint of each validated artifact with the fingerprint stored when the
+product was last written, so unchanged products skip mapping and upserts and
+only get their last-seen timestamps refreshed in bulk.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from structlog import get_logger
+
+from ..parser.content_hash import ContentHashService
+
+logger = get_logger(__name__)
+
+# Artifact fields that change on every scrape without the product changing
+_VOLATILE_FIELDS = {'scraped_at', 'collector_meta', 'collector_signals', 'audit'}
+
+
+class UnchangedArtifactFilter:
+    """
+    Per-run filter that drops artifacts whose content has not changed.
+
+    Usage: load() the roaster's stored fingerprints once, call is_unchanged()
+    per artifact, then touch_unchanged() and record_upserted() after each
+    upsert batch. Fingerprints are only recorded for products whose rows were
+    all written, so a partially failed product is retried on the next run.
+
+    Fingerprints describe a full write (coffee, variants, prices and images),
+    so the filter must not be used for metadata-only runs, which skip images.
+    """
+
+    def __init__(self, rpc_client, roaster_id: str, hash_service: Optional[ContentHashService] = None):
+        """
+        Initialize the filter.
+
+        Args:
+            rpc_client: RPCClient used to load and record fingerprints
+            roaster_id: Roaster whose artifacts are being processed
+            hash_service: Hash service (a default one is created if omitted)
+        """
+        self.rpc_client = rpc_client
+        self.roaster_id = roaster_id
+        self.hash_service = hash_service or ContentHashService()
+        self.known: Dict[str, Dict[str, Any]] = {}
+        self.loaded = False
+        self.skipped = 0
+        self._pending_touch: List[str] = []
+        self._pending_hashes: Dict[str, str] = {}
+
+    def load(self) -> int:
+        """
+        Load stored fingerprints for the roaster with a single query.
+
+        On failure the filter stays disabled and every artifact is treated as changed.
+
+        Returns:
+            Number of known fingerprints
+        """
+        try:
+            known = self.rpc_client.get_roaster_content_hashes(self.roaster_id)
+            self.known = known if isinstance(known, dict) else {}
+            self.loaded = True
+        except Exception as e:
+            logger.warning(
+                "Failed to load content hashes, processing all artifacts",
+                roaster_id=self.roaster_id,
+                error=str(e)
+            )
+            self.known = {}
+            self.loaded = False
+        return len(self.known)
+
+    def artifact_hash(self, artifact: Any) -> Optional[str]:
+        """Fingerprint of an artifact's content, ignoring per-scrape metadata."""
+        try:
+            if hasattr(artifact, 'model_dump'):
+                data = artifact.model_dump(mode='json', exclude=_VOLATILE_FIELDS)
+            elif isinstance(artifact, dict):
+                data = {key: value for key, value in artifact.items() if key not in _VOLATILE_FIELDS}
+            else:
+                return None
+            return self.hash_service.generate_hashes(data).raw_hash or None
+        except Exception as e:
+            logger.warning("Failed to fingerprint artifact", error=str(e))
+            return None
+
+    @staticmethod
+    def _product_id(artifact: Any) -> Optional[str]:
+        product = getattr(artifact, 'product', None)
+        if product is None and isinstance(artifact, dict):
+            product = artifact.get('product')
+        if isinstance(product, dict):
+            return product.get('platform_product_id')
+        return getattr(product, 'platform_product_id', None)
+
+    def is_unchanged(self, validation_result: Any) -> bool:
+        """
+        Check a validated artifact against the stored fingerprint.
+
+        Unchanged artifacts are queued for touch_unchanged(); changed ones have
+        their fingerprint remembered for record_upserted().
+        """
+        if not self.loaded or not validation_result.is_valid:
+            return False
+
+        artifact = validation_result.artifact_data
+        fingerprint = self.artifact_hash(artifact)
+        if fingerprint is None:
+            return False
+
+        product_id = self._product_id(artifact)
+        if not product_id:
+            return False
+
+        known = self.known.get(product_id)
+        if known and known.get('artifact_hash') == fingerprint and known.get('coffee_id'):
+            self._pending_touch.append(known['coffee_id'])
+            self.skipped += 1
+            return True
+
+        # Matched to ProductUpsertResult.platform_product_id in record_upserted
+        self._pending_hashes[product_id] = fingerprint
+        return False
+
+    def touch_unchanged(self) -> int:
+        """Refresh last-seen timestamps for queued unchanged coffees in bulk."""
+        coffee_ids, self._pending_touch = self._pending_touch, []
+        if not coffee_ids:
+            return 0
+        try:
+            return self.rpc_client.touch_unchanged_coffees(coffee_ids)
+        except Exception as e:
+            logger.warning(
+                "Failed to touch unchanged coffees",
+                roaster_id=self.roaster_id,
+                coffee_count=len(coffee_ids),
+                error=str(e)
+            )
+            return 0
+
+    def record_upserted(self, products: List[Any]) -> int:
+        """
+        Record fingerprints for products written without errors.
+
+        Args:
+            products: ProductUpsertResult list from RPCUpsertBatcher.flush()
+
+        Returns:
+            Number of fingerprints recorded
+        """
+        rows = []
+        for product in products:
+            fingerprint = self._pending_hashes.pop(product.platform_product_id, None)
+            if fingerprint and product.success and product.coffee_id:
+                rows.append({'coffee_id': product.coffee_id, 'artifact_hash': fingerprint})
+        if not rows:
+            return 0
+        try:
+            self.rpc_client.set_coffee_artifact_hashes(rows)
+        except Exception as e:
+            logger.warning(
+                "Failed to record artifact hashes",
+                roaster_id=self.roaster_id,
+                product_count=len(rows),
+                error=str(e)
+            )
+            return 0
+        return len(rows)
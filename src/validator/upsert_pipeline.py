@@ -0,0 +1,122 @@
+"""
+Staged streaming pipeline for validate -> map -> upsert processing.
+
+This module provides:
+- Stages connected by bounded asyncio queues, so a slow stage applies
+  backpressure instead of letting work pile up in memory
+- Per-stage worker limits
+- Batched final stage for bulk database writes
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+# Queue sentinel telling a worker its upstream stage has finished
+_DONE = object()
+
+
+@dataclass(slots=True, kw_only=True)
+class StageLimits:
+    """Worker counts and buffering for a StagedUpsertPipeline."""
+
+    validation_concurrency: int = 4
+    mapping_concurrency: int = 2
+    upsert_concurrency: int = 2
+    queue_size: int = 100
+    batch_size: int = 50
+
+
+class StagedUpsertPipeline:
+    """
+    Stream items through validate, map and batched upsert stages.
+
+    Each stage runs its own pool of workers and hands results to the next
+    stage through a queue of at most ``queue_size`` items, so validation,
+    mapping and database writes overlap while memory stays bounded by the
+    queue and batch sizes rather than the number of items. Upsert workers
+    collect up to ``batch_size`` mapped items before calling ``upsert``.
+
+    Stage callables should handle per-item failures themselves; an exception
+    escaping a stage cancels the whole pipeline and is re-raised from run().
+    """
+
+    def __init__(
+        self,
+        validate: Callable[[Any], Awaitable[Any]],
+        map_item: Callable[[Any], Awaitable[Any]],
+        upsert: Callable[[List[Any]], Awaitable[None]],
+        limits: Optional[StageLimits] = None
+    ):
+        self.validate = validate
+        self.map_item = map_item
+        self.upsert = upsert
+        self.limits = limits or StageLimits()
+
+    async def _run_stage(self, inbox: asyncio.Queue, outbox: asyncio.Queue,
+                         handler: Callable[[Any], Awaitable[Any]], workers: int):
+        async def worker():
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    return
+                await outbox.put(await handler(item))
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    async def _run_batch_stage(self, inbox: asyncio.Queue, workers: int):
+        async def worker():
+            batch: List[Any] = []
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    break
+                batch.append(item)
+                if len(batch) >= self.limits.batch_size:
+                    await self.upsert(batch)
+                    batch = []
+            if batch:
+                await self.upsert(batch)
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    async def run(self, items: Iterable[Any]):
+        """
+        Run every item through the pipeline.
+
+        Args:
+            items: Inputs for the validate stage (e.g. response filenames)
+        """
+        limits = self.limits
+        validate_in = asyncio.Queue(maxsize=limits.queue_size)
+        map_in = asyncio.Queue(maxsize=limits.queue_size)
+        upsert_in = asyncio.Queue(maxsize=limits.queue_size)
+
+        async def then_close(stage: Awaitable[None], downstream: asyncio.Queue, workers: int):
+            await stage
+            for _ in range(workers):
+                await downstream.put(_DONE)
+
+        async def feed():
+            for item in items:
+                await validate_in.put(item)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(then_close(feed(), validate_in, limits.validation_concurrency))
+                group.create_task(then_close(
+                    self._run_stage(validate_in, map_in, self.validate, limits.validation_concurrency),
+                    map_in, limits.mapping_concurrency
+                ))
+                group.create_task(then_close(
+                    self._run_stage(map_in, upsert_in, self.map_item, limits.mapping_concurrency),
+                    upsert_in, limits.upsert_concurrency
+                ))
+                group.create_task(self._run_batch_stage(upsert_in, limits.upsert_concurrency))
+        except ExceptionGroup as group_error:
+            # Other stages were cancelled; surface the failure that caused it
+            raise group_error.exceptions[0]
@@ -129,6 +129,66 @@ class ValidationPipeline:
         
         return results
     
+    async def validate_storage_artifact(
+        self,
+        roaster_id: str,
+        platform: str,
+        response_filename: str
+    ) -> ValidationResult:
+        """
+        Validate a single artifact from A.2 storage.
+        
+        Streaming counterpart of process_storage_artifacts: updates the same
+        stats and persists invalid artifacts, but returns one result so callers
+        can pass it on without holding the whole batch.
+        
+        Args:
+            roaster_id: Roaster identifier
+            platform: Platform type
+            response_filename: Response filename to validate
+            
+        Returns:
+            Validation result (an invalid result on pipeline errors)
+        """
+        if self.pipeline_stats['start_time'] is None:
+            self.pipeline_stats['start_time'] = datetime.now(timezone.utc)
+        
+        try:
+            result = await self.validator.validate_from_storage(
+                roaster_id=roaster_id,
+                platform=platform,
+                response_filename=response_filename
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to process artifact",
+                roaster_id=roaster_id,
+                platform=platform,
+                filename=response_filename,
+                error=str(e)
+            )
+            
+            self.pipeline_stats['error_count'] += 1
+            self.pipeline_stats['end_time'] = datetime.now(timezone.utc)
+            
+            return ValidationResult(
+                is_valid=False,
+                artifact_data={},
+                errors=[f"Pipeline error: {str(e)}"],
+                artifact_id=f"{roaster_id}_{platform}_{response_filename}"
+            )
+        
+        self.pipeline_stats['total_processed'] += 1
+        if result.is_valid:
+            self.pipeline_stats['valid_count'] += 1
+        else:
+            self.pipeline_stats['invalid_count'] += 1
+            # Persist invalid artifacts for manual review
+            self._persist_invalid_artifact(result)
+        self.pipeline_stats['end_time'] = datetime.now(timezone.utc)
+        
+        return result
+    
     def process_artifact_batch(self, artifacts: List[Dict[str, Any]]) -> List[ValidationResult]:
         """
         Process a batch of artifacts through validation pipeline.
@@ -0,0 +1,199 @@
+"""
+Roaster-scoped snapshot of stored variants for price jobs.
+
+A price job needs a roaster's stored variants (for delta detection) and its
+product handles (for per-product fetching). These used to be two separate
+queries, repeated on every job. The snapshot loads both with one embedded
+PostgREST select from ``variants`` and is cached per client, so the fetcher
+and delta detection of a job, and jobs that follow, share one round-trip.
+
+Each roaster has a version that the price and variant update services, and
+full-refresh bulk upserts, bump after writing, which drops the cached
+snapshot. A load that overlaps an invalidation is returned to its caller but
+not cached.
+"""
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from structlog import get_logger
+
+from .db_gateway import get_database_gateway
+
+logger = get_logger(__name__)
+
+# variants reach their roaster only through coffee_id, so the parent coffee is
+# embedded with an inner join and filtered on coffees.roaster_id
+SNAPSHOT_COLUMNS = (
+    "id, platform_variant_id, price_current, currency, in_stock, "
+    "price_last_checked_at, coffees!inner(platform_product_id, slug, roaster_id)"
+)
+
+
+@dataclass
+class RoasterSnapshot:
+    """Stored variants and product handles of one roaster."""
+    roaster_id: str
+    version: int
+    variants: List[Dict[str, Any]] = field(default_factory=list)
+    product_handles: List[str] = field(default_factory=list)
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+class VariantSnapshotCache:
+    """Versioned per-roaster cache of RoasterSnapshot."""
+
+    def __init__(self, client, ttl_seconds: float = 300.0):
+        """
+        Initialize snapshot cache.
+
+        Args:
+            client: Supabase client the snapshots are loaded with
+            ttl_seconds: Maximum snapshot age; bounds staleness from writers
+                outside this process
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._snapshots: Dict[str, RoasterSnapshot] = {}
+        self._versions: Dict[str, int] = {}
+        self._variant_roasters: Dict[str, str] = {}
+        # Load locks per event loop; asyncio.Lock cannot be shared across loops
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.stats = {'hits': 0, 'loads': 0, 'invalidations': 0}
+
+    def version(self, roaster_id: str) -> int:
+        return self._versions.get(roaster_id, 0)
+
+    async def get(self, roaster_id: str) -> RoasterSnapshot:
+        """
+        Get the snapshot of a roaster, loading it on a miss.
+
+        Concurrent callers for the same roaster wait for a single load.
+        Query errors propagate to the caller.
+        """
+        snapshot = self._fresh(roaster_id)
+        if snapshot is not None:
+            self.stats['hits'] += 1
+            return snapshot
+
+        async with self._lock(roaster_id):
+            snapshot = self._fresh(roaster_id)
+            if snapshot is not None:
+                self.stats['hits'] += 1
+                return snapshot
+            return await self._load(roaster_id)
+
+    def _lock(self, roaster_id: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        locks = self._locks.get(loop)
+        if locks is None:
+            locks = self._locks[loop] = {}
+        lock = locks.get(roaster_id)
+        if lock is None:
+            lock = locks[roaster_id] = asyncio.Lock()
+        return lock
+
+    def _fresh(self, roaster_id: str) -> Optional[RoasterSnapshot]:
+        snapshot = self._snapshots.get(roaster_id)
+        if snapshot is None or snapshot.version != self.version(roaster_id):
+            return None
+        if time.monotonic() - snapshot.loaded_at > self.ttl_seconds:
+            return None
+        return snapshot
+
+    async def _load(self, roaster_id: str) -> RoasterSnapshot:
+        version = self.version(roaster_id)
+        result = await get_database_gateway(self.client).execute(
+            self.client.table("variants").select(SNAPSHOT_COLUMNS).eq("coffees.roaster_id", roaster_id)
+        )
+        self.stats['loads'] += 1
+
+        variants = []
+        handles = []
+        seen_handles = set()
+        for row in result.data or []:
+            variant = dict(row)
+            coffee = variant.pop('coffees', None) or {}
+            variants.append(variant)
+            handle = coffee.get('platform_product_id') or coffee.get('slug')
+            if handle and handle not in seen_handles:
+                seen_handles.add(handle)
+                handles.append(handle)
+
+        snapshot = RoasterSnapshot(
+            roaster_id=roaster_id,
+            version=version,
+            variants=variants,
+            product_handles=handles
+        )
+        if version == self.version(roaster_id):
+            self._snapshots[roaster_id] = snapshot
+            for variant in variants:
+                for key in ('id', 'platform_variant_id'):
+                    if variant.get(key):
+                        self._variant_roasters[str(variant[key])] = roaster_id
+
+        logger.info(
+            "Loaded variant snapshot",
+            roaster_id=roaster_id,
+            variant_count=len(variants),
+            handle_count=len(handles)
+        )
+        return snapshot
+
+    def invalidate(self, roaster_id: str):
+        """Drop a roaster's snapshot and bump its version."""
+        self._versions[roaster_id] = self.version(roaster_id) + 1
+        self._snapshots.pop(roaster_id, None)
+        self.stats['invalidations'] += 1
+
+    def invalidate_variants(self, variant_ids: Iterable[Any]):
+        """
+        Invalidate the roasters owning the given variants.
+
+        Variant IDs may be database or platform IDs. Unknown IDs are ignored,
+        since a roaster whose snapshot was never cached has nothing stale.
+        """
+        roasters = {
+            self._variant_roasters[str(variant_id)]
+            for variant_id in variant_ids
+            if variant_id is not None and str(variant_id) in self._variant_roasters
+        }
+        for roaster_id in roasters:
+            self.invalidate(roaster_id)
+
+    def clear(self):
+        for roaster_id in list(self._snapshots):
+            self.invalidate(roaster_id)
+        self._variant_roasters.clear()
+
+
+_caches: "weakref.WeakKeyDictionary[Any, VariantSnapshotCache]" = weakref.WeakKeyDictionary()
+
+
+def get_variant_snapshot_cache(client) -> Optional[VariantSnapshotCache]:
+    """
+    Get the shared snapshot cache for a client, creating it on first use.
+
+    Fetchers and update services built on the same Supabase client share one
+    cache, so updates invalidate what the next job reads. Returns None
+    without a client.
+    """
+    if client is None:
+        return None
+
+    try:
+        cache = _caches.get(client)
+    except TypeError:
+        # Client cannot be weakly referenced; give it an unshared cache
+        return VariantSnapshotCache(client)
+
+    if cache is None:
+        cache = VariantSnapshotCache(client)
+        _caches[client] = cache
+    return cache
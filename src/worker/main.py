@@ -22,6 +22,7 @@ from dotenv import load_dotenv
 from src.config.roaster_config import RoasterConfig
 from src.worker.queue import QueueManager
 from src.worker.tasks import execute_scraping_job
+from src.monitoring.tracing import configure_tracing_from_env, get_tracer, span
 from src.utils.logging import setup_logging
 
 # Load environment variables
@@ -88,8 +89,10 @@ class Worker:
             # Get roaster configuration
             config = await self.roaster_config.get_roaster_config(roaster_id)
             
-            # Execute the scraping job
-            result = await execute_scraping_job(job, config)
+            # Execute the scraping job; profiling is opt-in per job
+            with span("job", job_id=job_id, roaster_id=roaster_id), \
+                    get_tracer().profile(f"job-{job_id}", enabled=self._profiling_enabled(job)):
+                result = await execute_scraping_job(job, config)
             
             logger.info("Job completed", 
                        job_id=job_id, 
@@ -112,6 +115,25 @@ class Worker:
         finally:
             self.semaphore.release()
     
+    def _profiling_enabled(self, job) -> bool:
+        """
+        Whether to profile a job.
+        
+        The profiler samples the event loop thread, which concurrent jobs
+        share, so profiles are only taken when the worker runs one job at a
+        time (WORKER_CONCURRENCY=1).
+        """
+        if not job.get('profile'):
+            return False
+        if self.concurrency != 1:
+            logger.warning(
+                "Job profiling requires WORKER_CONCURRENCY=1, skipping profile",
+                job_id=job.get('id'),
+                concurrency=self.concurrency
+            )
+            return False
+        return True
+    
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
         logger.info("Received shutdown signal", signal=signum)
@@ -127,6 +149,7 @@ async def main():
     """Main entrypoint for the worker."""
     # Set up logging
     setup_logging()
+    configure_tracing_from_env()
     
     # Get configuration from environment
     concurrency = int(os.getenv('WORKER_CONCURRENCY', '3'))
@@ -18,6 +18,7 @@ import structlog
 # Import Firecrawl services
 from ..fetcher.firecrawl_client import FirecrawlClient
 from ..fetcher.firecrawl_map_service import FirecrawlMapService
+from ..fetcher.firecrawl_budget_management_service import FirecrawlBudgetManagementService
 from ..fetcher.platform_fetcher_service import PlatformFetcherService
 from ..config.firecrawl_config import (
     FirecrawlConfig, 
@@ -26,6 +27,7 @@ from ..config.firecrawl_config import (
 )
 from ..config.roaster_schema import RoasterConfigSchema, RoasterConfigValidator
 from ..fetcher.base_fetcher import FetcherConfig
+from ..monitoring.tracing import span
 
 logger = structlog.get_logger(__name__)
 
@@ -146,10 +148,11 @@ async def execute_scraping_job(job_data: Dict[str, Any], config: Dict[str, Any])
             job_data_dict = job_data.get('data', {}).copy()
             job_data_dict.pop('job_type', None)
             
-            result = await platform_service.fetch_products_with_cascade(
-                job_type=job_type,
-                **job_data_dict
-            )
+            with span("fetch", roaster_id=roaster_id, job_type=job_type):
+                result = await platform_service.fetch_products_with_cascade(
+                    job_type=job_type,
+                    **job_data_dict
+                )
             
             if result.success:
                 logger.info("Platform-based scraping completed successfully", 
@@ -419,7 +422,8 @@ async def execute_firecrawl_map_job(job_data: Dict[str, Any], config: Dict[str,
         
         # Initialize Firecrawl services
         firecrawl_client = FirecrawlClient(firecrawl_config)
-        firecrawl_map_service = FirecrawlMapService(firecrawl_client)
+        budget_service = FirecrawlBudgetManagementService(firecrawl_client.budget_tracker)
+        firecrawl_map_service = FirecrawlMapService(firecrawl_client, budget_service=budget_service)
         
         # Create roaster config with platform-aware settings
         roaster_config = RoasterConfigSchema(
@@ -516,7 +520,8 @@ async def execute_firecrawl_batch_map_job(job_data: Dict[str, Any], config: Dict
         
         # Initialize Firecrawl services
         firecrawl_client = FirecrawlClient(firecrawl_config)
-        firecrawl_map_service = FirecrawlMapService(firecrawl_client)
+        budget_service = FirecrawlBudgetManagementService(firecrawl_client.budget_tracker)
+        firecrawl_map_service = FirecrawlMapService(firecrawl_client, budget_service=budget_service)
         
         # Create roaster configs with platform-aware settings for fallback
         roaster_configs = []
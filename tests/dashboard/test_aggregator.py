@@ -0,0 +1,134 @@
+"""
+Tests for the dashboard background aggregator.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.dashboard.aggregator import DashboardAggregator, MemorySnapshotStore, compute_etag
+
+
+class CountingProducer:
+    """Async section producer that counts its calls."""
+
+    def __init__(self, data=None, delay: float = 0.0):
+        self.data = data if data is not None else {'total_products': 10}
+        self.delay = delay
+        self.calls = 0
+        self.error = None
+
+    async def __call__(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return dict(self.data)
+
+
+@pytest.fixture
+def aggregator():
+    aggregator = DashboardAggregator(refresh_interval=60)
+    yield aggregator
+    aggregator.stop()
+
+
+class TestDashboardAggregator:
+    """Test cases for DashboardAggregator."""
+
+    def test_requests_are_served_from_snapshot(self, aggregator):
+        """Test repeated reads don't call the producer again."""
+        producer = CountingProducer()
+        aggregator.register('business_metrics', producer)
+
+        snapshots = [aggregator.get('business_metrics') for _ in range(5)]
+
+        assert producer.calls == 1
+        assert snapshots[0].data == {'total_products': 10}
+        assert snapshots[0].etag == compute_etag({'total_products': 10})
+        assert {snapshot.etag for snapshot in snapshots} == {snapshots[0].etag}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_computation(self):
+        """Test concurrent refreshes of a section run the producer once."""
+        aggregator = DashboardAggregator()
+        producer = CountingProducer(delay=0.05)
+        aggregator.register('overview', producer)
+
+        snapshots = await asyncio.gather(*(aggregator.refresh('overview') for _ in range(5)))
+
+        assert producer.calls == 1
+        assert len({id(snapshot) for snapshot in snapshots}) == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_data_keeps_snapshot(self):
+        """Test a refresh with identical data keeps the timestamp and ETag."""
+        aggregator = DashboardAggregator()
+        producer = CountingProducer()
+        aggregator.register('overview', producer)
+
+        first = await aggregator.refresh('overview')
+        second = await aggregator.refresh('overview')
+        producer.data = {'total_products': 11}
+        third = await aggregator.refresh('overview')
+
+        assert second is first
+        assert third.etag != first.etag
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_serves_last_good_snapshot(self):
+        """Test producer errors keep the previous data, or surface without it."""
+        aggregator = DashboardAggregator()
+        producer = CountingProducer()
+        aggregator.register('pipeline_status', producer)
+
+        good = await aggregator.refresh('pipeline_status')
+        producer.error = RuntimeError('Database connection not available')
+        after_failure = await aggregator.refresh('pipeline_status')
+
+        failing = CountingProducer()
+        failing.error = RuntimeError('Database connection not available')
+        aggregator.register('budget', failing)
+        error_snapshot = await aggregator.refresh('budget')
+
+        assert after_failure is good
+        assert error_snapshot.error == 'Database connection not available'
+        assert error_snapshot.data == {}
+
+    def test_background_loop_refreshes_sections(self):
+        """Test the background thread refreshes every section on its interval."""
+        aggregator = DashboardAggregator(refresh_interval=0.05)
+        producer = CountingProducer()
+        aggregator.register('metrics', producer)
+
+        aggregator.start()
+        try:
+            deadline = time.monotonic() + 2
+            while producer.calls < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            aggregator.stop()
+
+        assert producer.calls >= 3
+        assert not aggregator.running
+
+    def test_expired_snapshot_is_recomputed(self, aggregator):
+        """Test snapshots past their TTL are not served."""
+        store = MemorySnapshotStore()
+        aggregator.store = store
+        aggregator.ttl = 0.01
+        producer = CountingProducer()
+        aggregator.register('roasters', producer)
+
+        aggregator.get('roasters')
+        time.sleep(0.02)
+        aggregator.get('roasters')
+
+        assert producer.calls == 2
+
+    def test_unknown_section(self, aggregator):
+        """Test unknown sections raise KeyError."""
+        with pytest.raises(KeyError):
+            aggregator.get('missing')
@@ -221,6 +221,19 @@ class TestFirecrawlBudgetManagementService:
         assert roaster_budget['used_budget'] == 100
         assert budget_service.budget_state['global_budget_used'] == 100
     
+    @pytest.mark.asyncio
+    async def test_is_budget_near_exhaustion(self, budget_service):
+        """Test near-exhaustion check for global and roaster budgets."""
+        budget_service.budget_tracker.current_usage = 850
+        assert budget_service.is_budget_near_exhaustion(threshold_percentage=90.0) is False
+        assert budget_service.is_budget_near_exhaustion(pending_cost=50, threshold_percentage=90.0) is True
+        
+        # Unknown roasters are not gated
+        assert budget_service.is_budget_near_exhaustion(roaster_id="test_roaster") is False
+        
+        await budget_service.record_budget_usage("test_roaster", 900)
+        assert budget_service.is_budget_near_exhaustion(roaster_id="test_roaster", threshold_percentage=90.0) is True
+    
     def test_integration_with_budget_tracker(self, budget_service):
         """Test integration with existing FirecrawlBudgetTracker."""
         # Verify that the service uses the provided budget tracker
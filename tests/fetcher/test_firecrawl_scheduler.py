@@ -0,0 +1,134 @@
+"""
+Tests for the budget-aware Firecrawl batch scheduler.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+from src.fetcher.firecrawl_scheduler import FirecrawlBatchScheduler, ScheduledOperation
+from src.config.firecrawl_config import FirecrawlBudgetTracker, FirecrawlConfig
+
+
+class TestFirecrawlBatchScheduler:
+    """Test cases for FirecrawlBatchScheduler."""
+    
+    @pytest.fixture
+    def budget_tracker(self):
+        """Budget tracker with a small limit."""
+        return FirecrawlBudgetTracker(FirecrawlConfig(api_key="test_api_key_1234567890", budget_limit=10))
+    
+    def _operation(self, key, calls, value=1.0, tracker=None, delay=0.0, roaster_id=None):
+        async def run():
+            calls.append(key)
+            await asyncio.sleep(delay)
+            if tracker is not None:
+                tracker.record_operation()
+            return key
+        return ScheduledOperation(key=key, run=run, expected_value=value, roaster_id=roaster_id)
+    
+    @pytest.mark.asyncio
+    async def test_runs_highest_value_first_and_keeps_input_order(self):
+        """Operations start by value per credit; outcomes follow input order."""
+        calls = []
+        scheduler = FirecrawlBatchScheduler(max_concurrency=1)
+        operations = [
+            self._operation("low", calls, value=1.0),
+            self._operation("high", calls, value=5.0),
+            self._operation("mid", calls, value=3.0)
+        ]
+        
+        outcomes = await scheduler.run(operations)
+        
+        assert calls == ["high", "mid", "low"]
+        assert [o.key for o in outcomes] == ["low", "high", "mid"]
+        assert all(o.status == "completed" for o in outcomes)
+    
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self):
+        """No more than max_concurrency operations run at once."""
+        active = 0
+        peak = 0
+        
+        async def run():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+        
+        scheduler = FirecrawlBatchScheduler(max_concurrency=3)
+        await scheduler.run([ScheduledOperation(key=str(i), run=run) for i in range(10)])
+        
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    async def test_stops_admitting_when_budget_near_exhaustion(self, budget_tracker):
+        """Operations past the stop threshold are skipped, counting in-flight work."""
+        calls = []
+        budget_tracker.current_usage = 6
+        scheduler = FirecrawlBatchScheduler(
+            max_concurrency=4,
+            budget_tracker=budget_tracker,
+            budget_limit=10,
+            stop_threshold=90.0
+        )
+        operations = [self._operation(str(i), calls, tracker=budget_tracker, delay=0.01) for i in range(5)]
+        
+        outcomes = await scheduler.run(operations)
+        
+        # 6 used + 2 in flight is 80%; a third would reach the 90% threshold
+        assert calls == ["0", "1"]
+        assert [o.status for o in outcomes] == ["completed", "completed", "skipped", "skipped", "skipped"]
+    
+    @pytest.mark.asyncio
+    async def test_skips_roasters_near_their_budget(self):
+        """Roaster-level exhaustion skips only that roaster's operations."""
+        calls = []
+        budget_service = Mock()
+        budget_service.is_budget_near_exhaustion.side_effect = (
+            lambda roaster_id=None, pending_cost=0, threshold_percentage=80.0: roaster_id == "spent"
+        )
+        scheduler = FirecrawlBatchScheduler(budget_service=budget_service)
+        operations = [
+            self._operation("a", calls, roaster_id="spent"),
+            self._operation("b", calls, roaster_id="fresh")
+        ]
+        
+        outcomes = await scheduler.run(operations)
+        
+        assert calls == ["b"]
+        assert [o.status for o in outcomes] == ["skipped", "completed"]
+    
+    @pytest.mark.asyncio
+    async def test_failures_are_captured(self):
+        """A failing operation does not stop the rest of the batch."""
+        async def fail():
+            raise RuntimeError("boom")
+        
+        async def succeed():
+            return "ok"
+        
+        scheduler = FirecrawlBatchScheduler(max_concurrency=2)
+        outcomes = await scheduler.run([
+            ScheduledOperation(key="bad", run=fail),
+            ScheduledOperation(key="good", run=succeed)
+        ])
+        
+        assert outcomes[0].status == "failed"
+        assert isinstance(outcomes[0].error, RuntimeError)
+        assert outcomes[1].result == "ok"
+    
+    def test_from_client_caps_concurrency_at_rate_limit(self):
+        """Concurrency never exceeds the per-minute rate limit."""
+        client = Mock()
+        client.config = FirecrawlConfig(
+            api_key="test_api_key_1234567890",
+            rate_limit_per_minute=2,
+            max_concurrent_requests=8
+        )
+        
+        scheduler = FirecrawlBatchScheduler.from_client(client)
+        
+        assert scheduler.max_concurrency == 2
+        assert scheduler.budget_tracker is client.budget_tracker
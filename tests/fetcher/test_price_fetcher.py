@@ -242,11 +242,31 @@ class TestPriceFetcher:
         assert float(deltas[0].old_price) == 25.99
         assert float(deltas[0].new_price) == 29.99
     
+    @pytest.mark.asyncio
+    async def test_detect_and_report_deltas_checks_frame_for_spikes(self):
+        """Test the delta frame is passed to the alert service for spike detection."""
+        alert_service = MagicMock()
+        alert_service.check_price_alerts = AsyncMock(return_value=[])
+        self.price_fetcher.alert_service = alert_service
+        fetched_data = [{'variants': [
+            {'platform_variant_id': '67890', 'price_decimal': 45.00, 'currency': 'USD', 'in_stock': True}
+        ]}]
+        existing_variants = [
+            {'platform_variant_id': '67890', 'price_current': 25.00, 'currency': 'USD', 'in_stock': True}
+        ]
+        
+        deltas = await self.price_fetcher.detect_and_report_deltas(fetched_data, existing_variants)
+        
+        assert len(deltas) == 1
+        kwargs = alert_service.check_price_alerts.call_args.kwargs
+        assert kwargs['roaster_id'] == "test_roaster"
+        assert list(kwargs['delta_frame'].spike_indices(50.0)) == [0]
+    
     @pytest.mark.asyncio
     async def test_detect_and_report_deltas_error(self):
         """Test detecting deltas with error."""
         # Mock parser to raise error
-        with patch.object(self.price_fetcher.price_parser, 'detect_price_deltas', side_effect=Exception("Test error")):
+        with patch.object(self.price_fetcher.price_parser, 'build_delta_frame', side_effect=Exception("Test error")):
             deltas = await self.price_fetcher.detect_and_report_deltas([], [])
             
             assert deltas == []
@@ -351,3 +351,58 @@ class TestPriceParser:
         # Test missing weight
         variant_missing = {}
         assert self.parser._extract_weight(variant_missing) is None
+    
+    def test_detect_price_deltas_columnar(self):
+        """Test columnar delta detection creates deltas for changed rows only."""
+        fetched_products = [
+            {
+                'platform_product_id': '1',
+                'variants': [
+                    {'platform_variant_id': 'same', 'price_decimal': Decimal('25.99'), 'currency': 'USD', 'in_stock': True},
+                    {'platform_variant_id': 'price', 'price_decimal': Decimal('19.50'), 'currency': 'USD', 'in_stock': True},
+                    {'platform_variant_id': 'stock', 'price_decimal': Decimal('10.00'), 'currency': 'USD', 'in_stock': False},
+                    {'platform_variant_id': 'new', 'price_decimal': Decimal('5.00'), 'currency': 'USD', 'in_stock': True},
+                    {'platform_variant_id': 'no-old-price', 'price_decimal': Decimal('7.00'), 'currency': 'USD', 'in_stock': True},
+                    {'platform_variant_id': 'no-price', 'price_decimal': None, 'currency': 'USD', 'in_stock': True},
+                    {'price_decimal': Decimal('1.00')},
+                ]
+            }
+        ]
+        existing_variants = [
+            {'platform_variant_id': 'same', 'price_current': 25.99, 'currency': 'USD', 'in_stock': True},
+            {'platform_variant_id': 'price', 'price_current': '18.00', 'currency': 'USD', 'in_stock': True},
+            {'platform_variant_id': 'stock', 'price_current': Decimal('10.00'), 'currency': 'USD', 'in_stock': True},
+            {'platform_variant_id': 'no-old-price', 'price_current': None, 'currency': 'USD', 'in_stock': True},
+        ]
+        
+        deltas = self.parser.detect_price_deltas(fetched_products, existing_variants)
+        
+        summary = [(d.variant_id, d.old_price, d.new_price, d.in_stock, d.old_in_stock) for d in deltas]
+        assert summary == [
+            ('price', Decimal('18.00'), Decimal('19.50'), True, True),
+            ('stock', Decimal('10.00'), Decimal('10.00'), False, True),
+            ('new', None, Decimal('5.00'), True, None),
+            ('no-old-price', None, Decimal('7.00'), True, True),
+        ]
+    
+    def test_delta_frame_percent_change(self):
+        """Test percent changes are computed column-wise and skip currency changes."""
+        fetched_products = [{
+            'variants': [
+                {'platform_variant_id': 'a', 'price_decimal': Decimal('40.00'), 'currency': 'USD'},
+                {'platform_variant_id': 'b', 'price_decimal': Decimal('40.00'), 'currency': 'EUR'},
+                {'platform_variant_id': 'c', 'price_decimal': Decimal('10.00'), 'currency': 'USD'},
+            ]
+        }]
+        existing_variants = [
+            {'platform_variant_id': 'a', 'price_current': 25.0, 'currency': 'USD', 'in_stock': True},
+            {'platform_variant_id': 'b', 'price_current': 25.0, 'currency': 'USD', 'in_stock': True},
+        ]
+        
+        frame = self.parser.build_delta_frame(fetched_products, existing_variants)
+        
+        assert frame.percent_change[0] == pytest.approx(60.0)
+        assert list(frame.spike_indices(50.0)) == [0]
+        assert frame.old_price_value(0) == 25.0
+        assert frame.old_price_value(2) is None
+        assert frame.summary()['total_deltas'] == 3
@@ -2,11 +2,13 @@
 Unit tests for image deduplication service functionality.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from src.images.deduplication_service import ImageDeduplicationService, ImageDeduplicationError
-from src.images.hash_computation import ImageHashComputer
+from src.images.hash_computation import AsyncImageHashComputer, ImageHashComputer
 
 
 class TestImageDeduplicationService:
@@ -288,3 +290,82 @@ class TestImageDeduplicationService:
         
         # Verify hash computer stats were also reset
         self.mock_hash_computer.reset_stats.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_process_batch_with_deduplication_async(self):
+        """Test async batch resolves every hash with one database lookup."""
+        async_computer = Mock(spec=AsyncImageHashComputer)
+        async_computer.compute_batch_hashes = AsyncMock(return_value={
+            'https://example.com/1.jpg': 'hash1',
+            'https://example.com/2.jpg': 'hash2'
+        })
+        self.mock_rpc_client.check_content_hashes.return_value = {'hash2': 'existing-image-2'}
+        service = ImageDeduplicationService(
+            rpc_client=self.mock_rpc_client,
+            hash_computer=self.mock_hash_computer,
+            async_hash_computer=async_computer
+        )
+        images = [
+            {'url': 'https://example.com/1.jpg'},
+            {'url': 'https://example.com/2.jpg'},
+            {'url': 'https://example.com/3.jpg'}
+        ]
+        
+        results = await service.process_batch_with_deduplication_async(images, 'coffee-123')
+        
+        self.mock_rpc_client.check_content_hashes.assert_called_once_with(['hash1', 'hash2'])
+        self.mock_rpc_client.check_content_hash.assert_not_called()
+        assert [r['deduplication_status'] for r in results] == ['new_image', 'skipped_duplicate', 'error']
+        assert results[1]['image_id'] == 'existing-image-2'
+        assert service.stats['duplicates_found'] == 1
+        assert service.stats['deduplication_errors'] == 1
+    
+    def test_owned_async_hash_computer_is_per_loop_and_closed(self):
+        """Test a lazily created async computer is replaced per event loop and closed by aclose."""
+        self.mock_rpc_client.check_content_hashes.return_value = {}
+        service = ImageDeduplicationService(
+            rpc_client=self.mock_rpc_client,
+            hash_computer=ImageHashComputer()
+        )
+        computers = []
+        
+        def make_computer(**kwargs):
+            computer = Mock(spec=AsyncImageHashComputer)
+            computer.compute_batch_hashes = AsyncMock(return_value={'https://example.com/1.jpg': 'hash1'})
+            computer.aclose = AsyncMock()
+            computers.append(computer)
+            return computer
+        
+        async def process_twice(close: bool):
+            for _ in range(2):
+                await service.process_batch_with_deduplication_async(
+                    [{'url': 'https://example.com/1.jpg'}], 'coffee-123'
+                )
+            if close:
+                await service.aclose()
+        
+        with patch('src.images.deduplication_service.AsyncImageHashComputer', side_effect=make_computer):
+            asyncio.run(process_twice(close=False))
+            assert len(computers) == 1
+            asyncio.run(process_twice(close=True))
+            assert len(computers) == 2
+        
+        computers[0].aclose.assert_not_awaited()
+        computers[1].aclose.assert_awaited_once()
+        assert service.async_hash_computer is None
+    
+    @pytest.mark.asyncio
+    async def test_aclose_leaves_injected_async_computer_open(self):
+        """Test aclose does not close an async computer owned by the caller."""
+        async_computer = Mock(spec=AsyncImageHashComputer)
+        async_computer.aclose = AsyncMock()
+        service = ImageDeduplicationService(
+            rpc_client=self.mock_rpc_client,
+            hash_computer=self.mock_hash_computer,
+            async_hash_computer=async_computer
+        )
+        
+        await service.aclose()
+        
+        async_computer.aclose.assert_not_awaited()
+        assert service.async_hash_computer is async_computer
@@ -4,10 +4,14 @@ Unit tests for image hash computation functionality.
 
 import pytest
 import hashlib
+import threading
 from unittest.mock import Mock, patch, MagicMock
+import asyncio
+import httpx
 import requests
 
-from src.images.hash_computation import ImageHashComputer, ImageHashComputationError
+from src.images.hash_cache import ImageHashCache
+from src.images.hash_computation import AsyncImageHashComputer, ImageHashComputer, ImageHashComputationError
 
 
 class TestImageHashComputer:
@@ -251,3 +255,138 @@ class TestImageHashComputer:
         self.hash_computer.clear_cache()
         
         assert len(self.hash_computer.hash_cache) == 0
+
+
+class TestAsyncImageHashComputer:
+    """Test cases for AsyncImageHashComputer."""
+    
+    @staticmethod
+    def make_computer(handler, **kwargs):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncImageHashComputer(client=client, max_retries=0, **kwargs)
+    
+    @pytest.mark.asyncio
+    async def test_header_hash_matches_sync_computer(self):
+        """Test header-based hashes match ImageHashComputer so stored hashes stay valid."""
+        headers = {'ETag': '"abc123"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        computer = self.make_computer(lambda request: httpx.Response(200, headers=headers))
+        
+        sync_computer = ImageHashComputer(max_retries=0)
+        with patch.object(sync_computer, '_make_request_with_retry', return_value=Mock(headers=headers)):
+            expected = sync_computer.compute_image_hash('https://example.com/a.jpg')
+        
+        assert await computer.compute_image_hash('https://example.com/a.jpg') == expected
+        assert computer.stats['header_hashes_computed'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_streams_content_without_cache_headers(self):
+        """Test images without ETag/Last-Modified are hashed from the streamed body."""
+        body = b"image bytes" * 1000
+        
+        def handler(request):
+            if request.method == 'HEAD':
+                return httpx.Response(200)
+            return httpx.Response(200, content=body)
+        
+        computer = self.make_computer(handler)
+        
+        assert await computer.compute_image_hash('https://example.com/b.jpg') == hashlib.sha256(body).hexdigest()
+        assert computer.stats['content_hashes_computed'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_batch_bounded_concurrency_and_failures(self):
+        """Test batch hashing limits in-flight requests and drops failed URLs."""
+        in_flight = 0
+        peak = 0
+        
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if request.url.path == '/missing.jpg':
+                return httpx.Response(404)
+            return httpx.Response(200, headers={'ETag': request.url.path})
+        
+        computer = self.make_computer(handler, max_concurrency=3)
+        urls = [f'https://example.com/{i}.jpg' for i in range(10)] + ['https://example.com/missing.jpg']
+        
+        results = await computer.compute_batch_hashes(urls)
+        
+        assert len(results) == 10
+        assert 'https://example.com/missing.jpg' not in results
+        assert peak <= 3
+
+
+class TestImageHashCache:
+    """Test cases for the two-tier ImageHashCache."""
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted, not the oldest inserted."""
+        cache = ImageHashCache(max_size=2)
+        cache.set("url1", "hash1")
+        cache.set("url2", "hash2")
+        
+        # Touch url1 so url2 becomes least recently used
+        assert cache.get("url1") == "hash1"
+        cache.set("url3", "hash3")
+        
+        assert cache.get("url1") == "hash1"
+        assert cache.get("url2") is None
+        assert len(cache) == 2
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test hashes survive a new process via the SQLite tier."""
+        path = str(tmp_path / "hashes.sqlite3")
+        first = ImageHashCache(path=path)
+        first.set("https://example.com/a.jpg", "hash-a")
+        first.close()
+        
+        second = ImageHashCache(path=path)
+        
+        assert second.get("https://example.com/a.jpg") == "hash-a"
+    
+    @pytest.mark.asyncio
+    async def test_async_access_runs_sqlite_off_loop(self, tmp_path):
+        """Test aget/aset do SQLite work in a worker thread and memory hits stay inline."""
+        cache = ImageHashCache(path=str(tmp_path / "hashes.sqlite3"))
+        loop_thread = threading.get_ident()
+        threads = []
+        original_load = cache._load
+        
+        def load(url):
+            threads.append(threading.get_ident())
+            return original_load(url)
+        
+        await cache.aset("url1", "hash1")
+        cache._memory.clear()
+        with patch.object(cache, '_load', side_effect=load):
+            assert await cache.aget("url1") == "hash1"
+            assert await cache.aget("url1") == "hash1"
+        
+        assert len(threads) == 1
+        assert threads[0] != loop_thread
+    
+    def test_expired_entries_are_rechecked(self):
+        """Test entries older than the TTL are reported as misses."""
+        cache = ImageHashCache(ttl=60)
+        
+        with patch('src.images.hash_cache.time.time', return_value=1000.0):
+            cache.set("url1", "hash1")
+        with patch('src.images.hash_cache.time.time', return_value=1030.0):
+            assert cache.get("url1") == "hash1"
+        with patch('src.images.hash_cache.time.time', return_value=1061.0):
+            assert cache.get("url1") is None
+    
+    def test_computer_skips_request_for_persisted_hash(self, tmp_path):
+        """Test a new computer reuses hashes persisted by a previous run."""
+        path = str(tmp_path / "hashes.sqlite3")
+        ImageHashComputer(cache=ImageHashCache(path=path))._update_cache("https://example.com/a.jpg", "hash-a")
+        
+        computer = ImageHashComputer(cache=ImageHashCache(path=path))
+        with patch.object(computer, '_compute_header_hash') as mock_header_hash:
+            assert computer.compute_image_hash("https://example.com/a.jpg") == "hash-a"
+        
+        mock_header_hash.assert_not_called()
+        assert computer.stats['cache_hits'] == 1
@@ -0,0 +1,167 @@
+"""
+Tests for the concurrent ImageKit batch uploader.
+"""
+
+import threading
+import time
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.config.imagekit_config import BatchUploadConfig, ImageKitConfig, ImageKitResult
+from src.images.imagekit_integration import ImageKitIntegrationService
+from src.images.imagekit_service import ImageKitService
+from src.images.imagekit_uploader import ImageKitBatchUploader
+from src.images.performance_monitor import ImagePerformanceMonitor
+
+
+@pytest.fixture
+def imagekit_service():
+    """Create ImageKit service for testing."""
+    config = ImageKitConfig(
+        public_key="public_test_key",
+        private_key="private_test_key",
+        url_endpoint="https://ik.imagekit.io/test",
+        enabled=True
+    )
+    return ImageKitService(config, max_retries=1, backoff_factor=2.0)
+
+
+def upload_result(url="https://ik.imagekit.io/test/a.jpg", size=None):
+    return MagicMock(url=url, file_id="file-1", size=size)
+
+
+@pytest.mark.asyncio
+async def test_uploads_run_concurrently(imagekit_service):
+    """Test uploads overlap up to max_concurrent."""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def upload_file(file, file_name, options):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return upload_result()
+
+    uploader = ImageKitBatchUploader(imagekit_service, max_concurrent=3)
+    images = [{'url': f'https://example.com/{i}.jpg', 'content': b'img'} for i in range(6)]
+
+    with patch.object(imagekit_service.client, 'upload_file', side_effect=upload_file):
+        results = await uploader.upload_batch(images)
+
+    assert all(result.success for result in results)
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_remote_fetch_failure_falls_back_to_spooled_upload(imagekit_service, tmp_path):
+    """Test the source is streamed to a spool file when ImageKit cannot fetch it."""
+    body = b"x" * 10000
+    uploaded = []
+
+    def upload_file(file, file_name, options):
+        if isinstance(file, str):
+            raise Exception("Remote fetch blocked")
+        uploaded.append(file.read())
+        return upload_result()
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+    monitor = ImagePerformanceMonitor(enable_system_monitoring=False)
+    monitor.start_monitoring()
+    uploader = ImageKitBatchUploader(imagekit_service, client=client, spool_dir=str(tmp_path), monitor=monitor)
+
+    with patch.object(imagekit_service.client, 'upload_file', side_effect=upload_file):
+        result = await uploader.upload({'url': 'https://example.com/a.jpg'})
+
+    assert result.success
+    assert uploaded == [body]
+    assert list(tmp_path.iterdir()) == []  # Spool file removed
+    assert monitor.current_metrics.uploads_completed == 1
+    assert monitor.current_metrics.bytes_uploaded == len(body)
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_does_not_block_loop(imagekit_service):
+    """Test retries back off with asyncio.sleep."""
+    calls = iter([Exception("timeout"), upload_result()])
+
+    def upload_file(file, file_name, options):
+        outcome = next(calls)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    with patch.object(imagekit_service.client, 'upload_file', side_effect=upload_file), \
+         patch('src.images.imagekit_service.asyncio.sleep', new=AsyncMock()) as mock_sleep, \
+         patch('src.images.imagekit_service.time.sleep') as mock_time_sleep:
+        result = await imagekit_service.upload_image_async('https://example.com/a.jpg', b'img')
+
+    assert result.success
+    mock_sleep.assert_called_once_with(1.0)
+    mock_time_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_integration_async_batch_skips_duplicates():
+    """Test the async integration path uploads only new images."""
+    config = ImageKitConfig(
+        public_key="public_test_key",
+        private_key="private_test_key",
+        url_endpoint="https://ik.imagekit.io/test"
+    )
+    service = ImageKitIntegrationService(rpc_client=MagicMock(), imagekit_config=config)
+
+    async def dedup(images, coffee_id):
+        return [
+            {**images[0], 'content_hash': 'h1', 'is_duplicate': False, 'deduplication_status': 'new_image'},
+            {'url': images[1]['url'], 'image_id': 'img-2', 'is_duplicate': True,
+             'deduplication_status': 'skipped_duplicate'}
+        ]
+
+    service.deduplication_service.process_batch_with_deduplication_async = dedup
+    uploader = MagicMock()
+    uploader.upload_batch = AsyncMock(return_value=[
+        ImageKitResult(success=True, imagekit_url='https://ik/1.jpg', file_id='f1', upload_time=0.1)
+    ])
+    results = await service.process_batch_with_imagekit_async(
+        [{'url': 'https://example.com/1.jpg'}, {'url': 'https://example.com/2.jpg'}],
+        'coffee-1',
+        batch_config=BatchUploadConfig(max_concurrent=2),
+        uploader=uploader
+    )
+
+    assert results[0]['imagekit_url'] == 'https://ik/1.jpg'
+    assert results[1]['imagekit_upload_skipped'] is True
+    assert all(r['integration_status'] == 'completed' for r in results)
+    assert service.stats['imagekit_uploads'] == 1
+    assert [image['url'] for image in uploader.upload_batch.call_args.args[0]] == ['https://example.com/1.jpg']
+
+
+@pytest.mark.asyncio
+async def test_integration_async_batch_reports_upload_throughput():
+    """Test the uploader built by the async integration path records into the service monitor."""
+    config = ImageKitConfig(
+        public_key="public_test_key",
+        private_key="private_test_key",
+        url_endpoint="https://ik.imagekit.io/test"
+    )
+    monitor = ImagePerformanceMonitor(enable_system_monitoring=False)
+    service = ImageKitIntegrationService(
+        rpc_client=MagicMock(), imagekit_config=config, enable_deduplication=False, monitor=monitor
+    )
+
+    with patch.object(service.imagekit_service.client, 'upload_file', return_value=upload_result(size=100)):
+        results = await service.process_batch_with_imagekit_async(
+            [{'url': 'https://example.com/1.jpg', 'content': b'img'}], 'coffee-1'
+        )
+
+    assert results[0]['imagekit_url'] == "https://ik.imagekit.io/test/a.jpg"
+    assert monitor.current_metrics is None
+    assert monitor.metrics_history[-1].uploads_completed == 1
+    assert monitor.metrics_history[-1].bytes_uploaded == 100
@@ -170,6 +170,8 @@ class TestImagePerformanceMonitor:
         metrics2.avg_processing_time = 1.5
         metrics2.memory_usage_mb = 150.0
         metrics2.cache_hit_rate = 0.7
+        metrics2.p50_processing_time = 1.2
+        metrics2.p95_processing_time = 3.0
         
         self.monitor.metrics_history = [metrics1, metrics2]
         
@@ -185,6 +187,8 @@ class TestImagePerformanceMonitor:
         assert stats['avg_cache_hit_rate'] == 0.75
         assert stats['duplicate_rate'] == 5/15
         assert stats['error_rate'] == 1/15
+        assert stats['last_p50_processing_time'] == 1.2
+        assert stats['last_p95_processing_time'] == 3.0
         assert 'recommendations' in stats
     
     def test_reset_history(self):
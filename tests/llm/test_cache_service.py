@@ -3,7 +3,7 @@
 import pytest
 from datetime import datetime
 
-from src.llm.cache_service import CacheService, MemoryBackend
+from src.llm.cache_service import CacheService, MemoryBackend, SQLiteBackend, TieredBackend
 from src.llm.llm_interface import LLMResult
 from src.config.cache_config import CacheConfig
 
@@ -199,3 +199,87 @@ class TestMemoryBackend:
         assert await backend.get('llm:key1') is None
         assert await backend.get('llm:key2') is None
         assert await backend.get('other:key3') == 'value3'
+
+
+class TestSQLiteBackend:
+    """Tests for the durable SQLite cache tier"""
+    
+    @pytest.mark.asyncio
+    async def test_values_survive_reopen(self, tmp_path):
+        """Test that cached values persist across backend instances"""
+        path = str(tmp_path / 'llm_cache.sqlite3')
+        await SQLiteBackend(path).set('llm:key1', 'value1', ttl=3600)
+        
+        assert await SQLiteBackend(path).get('llm:key1') == 'value1'
+    
+    @pytest.mark.asyncio
+    async def test_expiry_and_clear_pattern(self, tmp_path):
+        """Test TTL expiry and pattern clearing"""
+        backend = SQLiteBackend(str(tmp_path / 'llm_cache.sqlite3'))
+        await backend.set('llm:expired', 'value', ttl=0)
+        await backend.set('llm:key1', 'value1')
+        await backend.set('other:key2', 'value2')
+        
+        assert await backend.get('llm:expired') is None
+        await backend.clear('llm:*')
+        assert await backend.get('llm:key1') is None
+        assert await backend.get('other:key2') == 'value2'
+    
+    @pytest.mark.asyncio
+    async def test_expired_rows_pruned_on_write(self, tmp_path):
+        """Test expired rows that are never read again are deleted by later writes"""
+        backend = SQLiteBackend(str(tmp_path / 'llm_cache.sqlite3'), prune_interval=0)
+        await backend.set('llm:expired', 'value', ttl=0)
+        await backend.set('llm:key1', 'value1')
+        
+        rows = backend._conn.execute("SELECT key FROM llm_cache").fetchall()
+        assert rows == [('llm:key1',)]
+    
+    @pytest.mark.asyncio
+    async def test_prune_between_intervals(self, tmp_path):
+        """Test writes within prune_interval leave expired rows for prune()"""
+        backend = SQLiteBackend(str(tmp_path / 'llm_cache.sqlite3'), prune_interval=3600)
+        await backend.set('llm:key1', 'value1')
+        await backend.set('llm:expired', 'value', ttl=-1)
+        
+        assert await backend.prune() == 1
+        assert await backend.get('llm:key1') == 'value1'
+
+
+class TestTieredBackend:
+    """Tests for the local-over-remote cache"""
+    
+    @pytest.mark.asyncio
+    async def test_remote_hit_backfills_local(self):
+        """Test that a remote hit is written back to the local tier"""
+        local, remote = MemoryBackend(), MemoryBackend()
+        lookups = []
+        backend = TieredBackend(local, remote, on_lookup=lambda tier, hit: lookups.append((tier, hit)))
+        await remote.set('llm:key1', 'value1')
+        
+        assert await backend.get('llm:key1') == 'value1'
+        assert await local.get('llm:key1') == 'value1'
+        assert await backend.get('llm:key1') == 'value1'
+        assert lookups == [('local', False), ('remote', True), ('local', True)]
+    
+    @pytest.mark.asyncio
+    async def test_backfill_uses_remote_ttl(self):
+        """Test backfilled local entries expire with the remote entry"""
+        local, remote = MemoryBackend(), MemoryBackend()
+        backend = TieredBackend(local, remote, backfill_ttl=60)
+        await remote.set('llm:key1', 'value1', ttl=30 * 86400)
+        
+        assert await backend.get('llm:key1') == 'value1'
+        _, local_ttl = await local.get_with_ttl('llm:key1')
+        assert local_ttl > 29 * 86400
+    
+    @pytest.mark.asyncio
+    async def test_set_writes_both_tiers(self):
+        """Test that set writes to local and remote tiers"""
+        local, remote = MemoryBackend(), MemoryBackend()
+        backend = TieredBackend(local, remote)
+        
+        await backend.set('llm:key1', 'value1')
+        
+        assert await local.get('llm:key1') == 'value1'
+        assert await remote.get('llm:key1') == 'value1'
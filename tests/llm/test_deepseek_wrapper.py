@@ -77,13 +77,20 @@ class TestDeepSeekWrapperService:
     
     @pytest.mark.asyncio
     async def test_cache_key_generation(self, deepseek_config, cache_service, rate_limiter):
-        """Test cache key is generated correctly from raw_payload_hash and field"""
+        """Test cache key depends on prompt inputs, model and prompt version only"""
         service = DeepSeekWrapperService(deepseek_config, cache_service, rate_limiter)
         
-        artifact = {'raw_payload_hash': 'abc123', 'name': 'Test Coffee'}
-        cache_key = service._generate_cache_key(artifact, 'variety')
+        artifact = {'raw_payload_hash': 'abc123', 'name': 'Test Coffee', 'scraped_at': '2025-01-01T00:00:00'}
+        rescraped = {'raw_payload_hash': 'def456', 'name': 'Test Coffee', 'scraped_at': '2025-01-08T00:00:00'}
+        cache_key = service._generate_cache_key(artifact, 'variety', 'Extract variety')
+        
+        assert cache_key.startswith('llm:deepseek-chat:v1:')
+        assert cache_key == service._generate_cache_key(rescraped, 'variety', 'Extract variety')
+        assert cache_key != service._generate_cache_key({'name': 'Other Coffee'}, 'variety', 'Extract variety')
+        assert cache_key != service._generate_cache_key(artifact, 'variety', 'Extract variety v2')
         
-        assert cache_key == 'llm:abc123:variety'
+        deepseek_config.prompt_version = 'v2'
+        assert cache_key != service._generate_cache_key(artifact, 'variety', 'Extract variety')
     
     @pytest.mark.asyncio
     async def test_cache_key_generation_without_hash(self, deepseek_config, cache_service, rate_limiter):
@@ -104,7 +111,7 @@ class TestDeepSeekWrapperService:
         
         # Pre-populate cache
         artifact = {'raw_payload_hash': 'test123', 'name': 'Coffee'}
-        cache_key = service._generate_cache_key(artifact, 'variety')
+        cache_key = service._generate_cache_key(artifact, 'variety', 'Extract variety')
         cached_result = LLMResult(
             field='variety',
             value='Gesha',
@@ -269,3 +276,47 @@ class TestDeepSeekWrapperService:
             # Should have 1 result (second artifact succeeded)
             assert len(results) == 1
             assert results[0].field == 'variety'
+    
+    @pytest.mark.asyncio
+    async def test_enrich_fields_uses_single_call(self, deepseek_config, cache_service, rate_limiter, mock_openai_response):
+        """Test that several fields are enriched with one structured-output call"""
+        service = DeepSeekWrapperService(deepseek_config, cache_service, rate_limiter)
+        mock_openai_response.choices[0].message.content = '{"roast": "light", "process": "washed"}'
+        
+        artifact = {'raw_payload_hash': 'hash1', 'roaster_id': 'roaster1', 'title': 'Coffee 1'}
+        prompts = {'roast': 'Roast level', 'process': 'Process method', 'variety': 'Variety'}
+        
+        with patch.object(service.provider.chat.completions, 'create', return_value=mock_openai_response) as create:
+            results = await service.enrich_fields(artifact, prompts)
+        
+        assert create.call_count == 1
+        assert create.call_args.kwargs['response_format'] == {"type": "json_object"}
+        assert results['roast'].value == 'light'
+        assert results['process'].value == 'washed'
+        assert 'variety' not in results
+        
+        # Answered fields are now cached individually
+        with patch.object(service.provider.chat.completions, 'create') as create:
+            cached = await service.enrich_fields(artifact, {'roast': 'Roast level', 'process': 'Process method'})
+        
+        create.assert_not_called()
+        assert cached['roast'].value == 'light'
+        
+        # Single-field calls cache raw model output and must not read parsed values
+        single_key = service._generate_cache_key(artifact, 'roast', 'Roast level')
+        assert await cache_service.get(single_key) is None
+    
+    @pytest.mark.asyncio
+    async def test_results_cached_with_long_ttl(self, deepseek_config, rate_limiter, mock_openai_response):
+        """Test successful results are cached for cache_ttl, not the request timeout"""
+        cache_service = Mock(spec=CacheService)
+        cache_service.metrics = None
+        cache_service.get = AsyncMock(return_value=None)
+        cache_service.set = AsyncMock()
+        service = DeepSeekWrapperService(deepseek_config, cache_service, rate_limiter)
+        
+        with patch.object(service.provider.chat.completions, 'create', return_value=mock_openai_response):
+            await service.enrich_field({'name': 'Coffee'}, 'variety', 'Extract variety')
+        
+        assert cache_service.set.call_args.kwargs['ttl'] == deepseek_config.cache_ttl
+        assert deepseek_config.cache_ttl > deepseek_config.timeout
@@ -1,9 +1,12 @@
 """Unit tests for rate limiter."""
 
+import asyncio
+
 import pytest
 import time
+from unittest.mock import AsyncMock, Mock, patch
 
-from src.llm.rate_limiter import RateLimiter
+from src.llm.rate_limiter import RateLimiter, RedisRateLimiter, SlidingWindowCounter, create_rate_limiter
 
 
 class TestRateLimiter:
@@ -139,10 +142,101 @@ class TestRateLimiter:
         # At day limit now
         assert limiter.can_make_request('roaster1') is False
         
-        # Manually age the requests by modifying timestamps
-        current_time = time.time()
-        old_time = current_time - 86401  # Just over 1 day ago
-        limiter.request_counts['roaster1'] = [old_time, old_time, old_time]
+        # Move the clock just over 1 day ahead so the old requests expire
+        future_time = time.time() + 86401
+        with patch('src.llm.rate_limiter.time.time', return_value=future_time):
+            # Should be able to make request again (old ones cleaned up)
+            assert limiter.can_make_request('roaster1') is True
+    
+    def test_sliding_window_expires_per_bucket(self):
+        """Test that requests leave the window one bucket at a time"""
+        counter = SlidingWindowCounter(60, buckets=6)
+        counter.add(0.0)
+        counter.add(15.0)
+        
+        assert counter.count(59.0) == 2
+        assert counter.count(61.0) == 1  # bucket [0, 10) has expired
+        assert counter.count(75.0) == 0
+    
+    def test_retry_after_reports_oldest_bucket_expiry(self):
+        """Test retry_after waits until enough requests expire"""
+        counter = SlidingWindowCounter(60, buckets=6)
+        counter.add(5.0)
+        counter.add(25.0)
+        
+        assert counter.retry_after(30.0, limit=2) == pytest.approx(30.0)
+        assert counter.retry_after(30.0, limit=3) == 0.0
+    
+    def test_record_request_consumes_quota(self):
+        """Test record_request counts requests that bypassed the check"""
+        limiter = RateLimiter({'requests_per_minute': 2})
+        limiter.record_request('roaster1')
+        limiter.record_request('roaster1')
         
-        # Should be able to make request again (old ones cleaned up)
-        assert limiter.can_make_request('roaster1') is True
+        assert limiter.can_make_request('roaster1') is False
+        assert limiter.retry_after('roaster1') > 0
+    
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_quota(self):
+        """Test acquire sleeps until quota frees up"""
+        limiter = RateLimiter({'requests_per_minute': 1})
+        assert await limiter.acquire('roaster1') is True
+        
+        with patch('src.llm.rate_limiter.asyncio.sleep') as mock_sleep, \
+                patch.object(limiter, 'can_make_request', side_effect=[False, True]):
+            assert await limiter.acquire('roaster1') is True
+        
+        mock_sleep.assert_awaited_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 60
+    
+    @pytest.mark.asyncio
+    async def test_acquire_times_out(self):
+        """Test acquire gives up once the timeout elapses"""
+        limiter = RateLimiter({'requests_per_minute': 1})
+        assert await limiter.acquire('roaster1', timeout=0) is True
+        assert await limiter.acquire('roaster1', timeout=0) is False
+    
+    @pytest.mark.asyncio
+    async def test_redis_acquire_never_makes_blocking_calls(self):
+        """Test the shared limiter checks quota through the async Redis client only"""
+        limiter = RedisRateLimiter({'requests_per_minute': 10})
+        script = AsyncMock(side_effect=[b'0.5', b'0'])
+        
+        with patch.object(limiter, '_get_async_script', return_value=script), \
+                patch.object(limiter, '_sync_script') as sync_script, \
+                patch('src.llm.rate_limiter.asyncio.sleep') as mock_sleep:
+            assert await limiter.acquire('roaster1') is True
+        
+        sync_script.assert_not_called()
+        assert script.await_count == 2
+        mock_sleep.assert_awaited_once_with(0.5)
+    
+    def test_redis_async_client_is_per_event_loop(self):
+        """Test acquire from successive asyncio.run calls uses a client opened in each loop"""
+        limiter = RedisRateLimiter({'requests_per_minute': 10})
+        loops = []
+        
+        def from_url(url):
+            loops.append(asyncio.get_running_loop())
+            client = Mock()
+            client.register_script.return_value = AsyncMock(return_value=b'0')
+            return client
+        
+        async def acquire_twice():
+            return [await limiter.acquire('roaster1') for _ in range(2)]
+        
+        with patch('redis.asyncio.from_url', side_effect=from_url):
+            assert asyncio.run(acquire_twice()) == [True, True]
+            assert asyncio.run(acquire_twice()) == [True, True]
+        
+        assert len(loops) == 2
+        assert loops[0] is not loops[1]
+    
+    def test_create_rate_limiter(self):
+        """Test factory picks the shared limiter only when a Redis URL is given"""
+        limits = {'requests_per_minute': 10}
+        
+        assert type(create_rate_limiter(limits)) is RateLimiter
+        shared = create_rate_limiter(limits, redis_url='redis://localhost:6379/1')
+        assert isinstance(shared, RedisRateLimiter)
+        assert shared.redis_url == 'redis://localhost:6379/1'
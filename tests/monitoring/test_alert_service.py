@@ -183,6 +183,24 @@ class TestComprehensiveAlertService:
             assert "Review Rate Spike" in call_args["text"]
             assert call_args["attachments"][0]["color"] == "warning"
     
+    @pytest.mark.asyncio
+    async def test_check_price_alerts_uses_delta_frame(self):
+        """Test a delta frame is checked column-wise instead of per delta."""
+        frame = Mock()
+        frame.__len__ = Mock(return_value=3)
+        price_alert_service = self.alert_service.price_alert_service
+        
+        with patch.object(price_alert_service, 'check_price_spike_frame', new_callable=AsyncMock) as mock_frame, \
+             patch.object(price_alert_service, 'check_price_spike', new_callable=AsyncMock) as mock_deltas:
+            mock_frame.return_value = 1
+            
+            alerts = await self.alert_service.check_price_alerts(delta_frame=frame, roaster_id="test_roaster")
+        
+        mock_frame.assert_awaited_once_with(frame, "test_roaster")
+        mock_deltas.assert_not_called()
+        assert alerts[0]["deltas_processed"] == 3
+        assert alerts[0]["spikes_found"] == 1
+    
     def test_alert_cooldown(self):
         """Test alert cooldown functionality."""
         # Test cooldown check
@@ -314,6 +314,48 @@ class TestDatabaseMetricsService:
         assert "overall_health_score" in metrics
         assert "collection_timestamp" in metrics
     
+    @pytest.mark.asyncio
+    async def test_collect_metrics_from_aggregate_rpcs(self):
+        """Test price, artifact and variant metrics come from summary RPCs, not table rows."""
+        summaries = {
+            'rpc_price_metrics': {
+                'total_prices': 1200, 'unique_variants': 300, 'avg_price': 18.5,
+                'min_price': 4.0, 'max_price': 60.0, 'median_price': 16.0, 'p95_price': 45.0,
+                'currency_distribution': {'INR': 1200}, 'prices_by_roaster': {'r1': 700, 'r2': 500}
+            },
+            'rpc_artifact_metrics': {
+                'total_artifacts': 200, 'valid_artifacts': 180, 'invalid_artifacts': 20,
+                'avg_body_size': 2048.0, 'http_status_distribution': {'200': 200},
+                'artifacts_by_platform': {'shopify': 200}
+            },
+            'rpc_variant_metrics': {
+                'total_variants': 400, 'in_stock_variants': 300, 'variants_by_roaster': {'r1': 400}
+            }
+        }
+        mock_client = Mock()
+
+        def rpc(function, params):
+            query = Mock()
+            query.execute = AsyncMock(return_value=Mock(data=summaries[function]))
+            return query
+
+        mock_client.rpc.side_effect = rpc
+        service = DatabaseMetricsService(supabase_client=mock_client)
+
+        prices = await service.collect_price_metrics()
+        artifacts = await service.collect_artifact_metrics()
+        variants = await service.collect_variant_metrics()
+
+        mock_client.table.assert_not_called()
+        assert 'p_since' in mock_client.rpc.call_args_list[0].args[1]
+        assert prices['total_prices'] == 1200
+        assert prices['p95_price'] == 45.0
+        assert prices['prices_by_roaster'] == {'r1': 700, 'r2': 500}
+        assert artifacts['validation_rate'] == 90.0
+        assert artifacts['avg_body_size'] == 2048.0
+        assert variants['out_of_stock_variants'] == 100
+        assert variants['stock_rate'] == 75.0
+
     def test_get_cached_metrics(self):
         """Test getting cached metrics."""
         service = DatabaseMetricsService()
@@ -0,0 +1,89 @@
+"""
+Tests for normalizer pipeline metrics label cardinality and execution history.
+"""
+
+import uuid
+
+from src.monitoring.normalizer_pipeline_metrics import NormalizerPipelineMetrics, OTHER_LABEL
+
+
+def _series_count(metrics: NormalizerPipelineMetrics) -> int:
+    return sum(len(family.samples) for family in metrics.registry.collect())
+
+
+def _record_execution(metrics: NormalizerPipelineMetrics, roaster: str = "roaster-a") -> str:
+    execution_id = str(uuid.uuid4())
+    metrics.record_parser_success("weight", execution_id, True, 0.9)
+    metrics.record_parser_success("roast", execution_id, False, 0.4)
+    metrics.record_pipeline_execution(
+        execution_id, 0.2, "completed", ["weight", "roast"], False,
+        roaster=roaster, platform="shopify"
+    )
+    metrics.record_pipeline_confidence(execution_id, "completed", 0.65, platform="shopify")
+    return execution_id
+
+
+class TestNormalizerPipelineMetrics:
+    """Test normalizer pipeline metrics."""
+
+    def test_series_do_not_grow_per_execution(self):
+        """Test new executions reuse existing series instead of creating new ones."""
+        metrics = NormalizerPipelineMetrics()
+        _record_execution(metrics)
+        series_after_one = _series_count(metrics)
+
+        for _ in range(50):
+            _record_execution(metrics)
+
+        assert _series_count(metrics) == series_after_one
+        assert 'execution_id' not in metrics.export_metrics()
+
+    def test_roaster_labels_are_capped(self):
+        """Test roasters beyond the cap are folded into a single label value."""
+        metrics = NormalizerPipelineMetrics(max_roaster_labels=2)
+
+        for roaster in ["a", "b", "c", "d"]:
+            _record_execution(metrics, roaster=roaster)
+
+        exported = metrics.export_metrics()
+        assert 'roaster="a"' in exported
+        assert 'roaster="b"' in exported
+        assert 'roaster="c"' not in exported
+        assert f'roaster="{OTHER_LABEL}"' in exported
+
+    def test_recent_executions_ring_buffer(self):
+        """Test only the most recent executions are kept, newest first."""
+        metrics = NormalizerPipelineMetrics(recent_executions_size=3)
+        execution_ids = [_record_execution(metrics) for _ in range(5)]
+
+        recent = metrics.get_recent_executions()
+
+        assert [r['execution_id'] for r in recent] == execution_ids[:1:-1]
+        assert recent[0]['roaster'] == "roaster-a"
+        assert recent[0]['platform'] == "shopify"
+
+    def test_execution_summaries_use_recorded_detail(self):
+        """Test per-execution summaries are computed from the ring buffer."""
+        metrics = NormalizerPipelineMetrics()
+        execution_id = _record_execution(metrics)
+        metrics.record_llm_fallback("roast", execution_id, 1.5, 0.8, True)
+
+        parser_summary = metrics.get_parser_performance_summary(execution_id)
+        llm_summary = metrics.get_llm_fallback_summary(execution_id)
+
+        assert parser_summary['total_parsers'] == 2
+        assert parser_summary['successful_parsers'] == 1
+        assert parser_summary['success_rate'] == 50.0
+        assert parser_summary['execution_time'] == 0.2
+        assert llm_summary['total_llm_calls'] == 1
+        assert llm_summary['total_duration'] == 1.5
+        assert 0.0 < metrics.get_pipeline_health_score(execution_id) <= 100.0
+
+    def test_parser_success_rate_is_cumulative(self):
+        """Test the parser success gauge reflects all runs, not the last one."""
+        metrics = NormalizerPipelineMetrics()
+        for success in [True, True, True, False]:
+            metrics.record_parser_success("weight", str(uuid.uuid4()), success, 0.9)
+
+        value = metrics.registry.get_sample_value('parser_success_rate', {'parser_name': 'weight'})
+        assert value == 0.75
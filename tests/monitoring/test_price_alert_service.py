@@ -220,6 +220,32 @@ class TestPriceAlertService:
             await service.check_price_spike([delta])
             mock_send.assert_not_called()
     
+    @pytest.mark.asyncio
+    async def test_check_price_spike_frame(self):
+        """Test spike alerts are sent only for spiking rows of a delta frame."""
+        from src.fetcher.price_columns import PriceDeltaFrame
+        
+        service = PriceAlertService("test", "test")
+        frame = PriceDeltaFrame.build(
+            [{'variants': [
+                {'platform_variant_id': 'spike', 'price_decimal': Decimal('40.00'), 'currency': 'USD'},
+                {'platform_variant_id': 'small', 'price_decimal': Decimal('30.00'), 'currency': 'USD'},
+            ]}],
+            [
+                {'platform_variant_id': 'spike', 'price_current': 25.0, 'currency': 'USD', 'in_stock': True},
+                {'platform_variant_id': 'small', 'price_current': 25.0, 'currency': 'USD', 'in_stock': True},
+            ]
+        )
+        
+        with patch.object(service, '_send_price_spike_alert') as mock_send:
+            spikes = await service.check_price_spike_frame(frame, roaster_id="test-roaster")
+        
+        assert spikes == 1
+        delta = mock_send.call_args[0][0]
+        assert delta.variant_id == "spike"
+        assert delta.price_change_percentage == pytest.approx(60.0)
+        assert delta.roaster_id == "test-roaster"
+    
     @pytest.mark.asyncio
     async def test_send_price_spike_alert(self):
         """Test sending price spike alert."""
@@ -0,0 +1,72 @@
+"""
+Tests for RPC telemetry.
+"""
+
+from unittest.mock import Mock, patch
+
+from prometheus_client import REGISTRY
+
+from src.monitoring.rpc_metrics import RPCTelemetry
+from src.validator.rpc_client import RPCClient
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestRPCTelemetry:
+    """Test cases for RPCTelemetry."""
+
+    def test_payload_size_is_sampled(self):
+        """Test payload size is only measured for sampled calls."""
+        before = sample('rpc_payload_bytes_count', rpc_name='rpc_test_sampled')
+
+        RPCTelemetry(sample_rate=0.5, rng=lambda: 0.9).record_payload('rpc_test_sampled', {'p': 1})
+        RPCTelemetry(sample_rate=0.5, rng=lambda: 0.1).record_payload('rpc_test_sampled', {'p': 1})
+
+        assert sample('rpc_payload_bytes_count', rpc_name='rpc_test_sampled') == before + 1
+
+    def test_redact_hides_raw_content(self):
+        """Test raw content fields and long strings are not dumped verbatim."""
+        telemetry = RPCTelemetry(max_value_length=10)
+
+        redacted = telemetry.redact({
+            'p_rows': [{'p_source_raw': '{"huge": "payload"}', 'p_name': 'x' * 50}] * 5,
+            'p_description_md': '# Coffee'
+        })
+
+        assert redacted['p_description_md'] == '<redacted 8 chars>'
+        assert redacted['p_rows'][0]['p_source_raw'] == '<redacted 19 chars>'
+        assert redacted['p_rows'][0]['p_name'] == 'x' * 10 + '...'
+        assert redacted['p_rows'][-1] == '<2 more>'
+
+
+class TestRPCClientTelemetry:
+    """Test cases for RPCClient telemetry and logging."""
+
+    def test_rpc_call_records_latency_and_retries(self):
+        """Test retries and final outcome are exported to Prometheus."""
+        client = Mock()
+        client.rpc.return_value.execute.side_effect = [Exception("connection timeout"), Mock(data='id-1')]
+        rpc_client = RPCClient(supabase_client=client, max_retries=2, base_delay=0)
+        success_before = sample('rpc_call_duration_seconds_count', rpc_name='rpc_test_retry', outcome='success')
+        retries_before = sample('rpc_retries_total', rpc_name='rpc_test_retry', error_type='network')
+
+        with patch('src.validator.rpc_client.time.sleep'):
+            assert rpc_client._execute_rpc_with_retry('rpc_test_retry', {'p_id': 1}) == 'id-1'
+
+        assert sample('rpc_call_duration_seconds_count', rpc_name='rpc_test_retry', outcome='success') == success_before + 1
+        assert sample('rpc_retries_total', rpc_name='rpc_test_retry', error_type='network') == retries_before + 1
+
+    def test_parameters_not_logged_at_info(self):
+        """Test RPC parameters never reach INFO logs."""
+        client = Mock()
+        client.rpc.return_value.execute.return_value = Mock(data='id-1')
+        rpc_client = RPCClient(supabase_client=client)
+
+        with patch('src.validator.rpc_client.logger') as mock_logger:
+            rpc_client._execute_rpc_with_retry('rpc_upsert_coffee', {'p_source_raw': 'secret'})
+
+        for call in mock_logger.info.call_args_list:
+            assert 'parameters' not in call.kwargs
+            assert 'secret' not in str(call)
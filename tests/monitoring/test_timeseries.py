@@ -0,0 +1,91 @@
+"""
+Tests for the fixed-size metric ring buffers.
+"""
+
+import statistics
+
+import pytest
+
+from src.monitoring.price_alert_service import AlertThrottle
+from src.monitoring.timeseries import RingBuffer, TimeSeriesBuffer
+
+
+class TestRingBuffer:
+    """Test cases for RingBuffer."""
+
+    def test_keeps_last_values_in_order(self):
+        """Test the oldest values are evicted once capacity is reached."""
+        buffer = RingBuffer(3)
+        for value in range(1, 6):
+            buffer.append(value)
+
+        assert len(buffer) == 3
+        assert buffer.values() == [3.0, 4.0, 5.0]
+        assert buffer.last == 5.0
+        assert buffer.total_count == 5
+
+    def test_streaming_statistics_match_recomputed(self):
+        """Test running mean/sum match a recomputation across many wraps."""
+        buffer = RingBuffer(7)
+        values = [((i * 37) % 101) / 10 for i in range(250)]
+        for value in values:
+            buffer.append(value)
+
+        window = values[-7:]
+        assert buffer.sum == pytest.approx(sum(window))
+        assert buffer.mean == pytest.approx(statistics.mean(window))
+        assert buffer.min == min(window)
+        assert buffer.max == max(window)
+        assert buffer.percentile(50) == pytest.approx(statistics.median(window))
+
+    def test_percentile_interpolates(self):
+        """Test percentiles interpolate between ranks."""
+        buffer = RingBuffer(10)
+        for value in [10, 20, 30, 40]:
+            buffer.append(value)
+
+        assert buffer.percentile(0) == 10.0
+        assert buffer.percentile(100) == 40.0
+        assert buffer.percentile(50) == 25.0
+
+    def test_ewma(self):
+        """Test the exponentially weighted mean starts at the first value."""
+        buffer = RingBuffer(5, ewma_alpha=0.5)
+        buffer.append(10)
+        buffer.append(20)
+
+        assert buffer.ewma == 15.0
+
+    def test_empty_buffer(self):
+        """Test statistics of an empty buffer are zero."""
+        buffer = RingBuffer(5)
+
+        assert buffer.mean == 0.0
+        assert buffer.percentile(95) == 0.0
+        assert buffer.last is None
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestTimeSeriesBuffer:
+    """Test cases for TimeSeriesBuffer."""
+
+    def test_points_and_window_queries(self):
+        """Test points iterate as (timestamp, value) and can be filtered by time."""
+        series = TimeSeriesBuffer(3)
+        for timestamp in [100.0, 200.0, 300.0, 400.0]:
+            series.append(timestamp / 10, timestamp=timestamp)
+
+        assert list(series) == [(200.0, 20.0), (300.0, 30.0), (400.0, 40.0)]
+        assert series.since(300.0) == [(300.0, 30.0), (400.0, 40.0)]
+        assert series.count_since(250.0) == 2
+        assert series.last_timestamp == 400.0
+
+    def test_alert_throttle_history_is_bounded(self):
+        """Test alert throttling keeps at most max_alerts_per_window timestamps per key."""
+        throttle = AlertThrottle(throttle_window=300, max_alerts_per_window=3)
+        for _ in range(50):
+            throttle.record_alert("price_spike:roaster-a")
+
+        assert len(throttle.alert_history["price_spike:roaster-a"]) == 3
+        assert throttle.should_throttle("price_spike:roaster-a")
@@ -0,0 +1,141 @@
+"""
+Tests for pipeline span tracing, exporters and the stack sampler.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.monitoring import tracing
+from src.monitoring.tracing import OTLPJsonFileExporter, StackSampler, Tracer
+
+
+class RecordingExporter:
+    """Exporter keeping finished spans in memory."""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+    def close(self):
+        pass
+
+
+class TestTracer:
+    """Test cases for Tracer."""
+
+    def test_disabled_tracer_returns_shared_noop(self):
+        """Test disabled tracing allocates no spans and exports nothing."""
+        exporter = RecordingExporter()
+        tracer = Tracer(enabled=False, exporters=[exporter])
+
+        with tracer.span("fetch") as first, tracer.span("store") as second:
+            first.set_attribute("ignored", True)
+
+        assert first is second
+        assert exporter.spans == []
+
+    def test_spans_nest_and_share_trace(self):
+        """Test child spans link to their parent within one trace."""
+        exporter = RecordingExporter()
+        tracer = Tracer(enabled=True, exporters=[exporter])
+
+        with tracer.span("job", roaster_id="r1"):
+            with tracer.span("fetch"):
+                pass
+
+        fetch, job = exporter.spans
+        assert job.is_root
+        assert fetch.parent_id == job.span_id
+        assert fetch.trace_id == job.trace_id
+        assert job.attributes == {"roaster_id": "r1"}
+        assert job.duration >= fetch.duration >= 0
+
+    @pytest.mark.asyncio
+    async def test_context_propagates_to_tasks(self):
+        """Test spans opened in concurrent tasks are children of the enclosing span."""
+        exporter = RecordingExporter()
+        tracer = Tracer(enabled=True, exporters=[exporter])
+
+        async def stage(name):
+            with tracer.span(name):
+                await asyncio.sleep(0)
+
+        with tracer.span("job"):
+            await asyncio.gather(stage("validate"), stage("upsert"))
+
+        job = exporter.spans[-1]
+        children = [s for s in exporter.spans if s is not job]
+        assert {s.name for s in children} == {"validate", "upsert"}
+        assert all(s.parent_id == job.span_id for s in children)
+
+    def test_errors_are_recorded_and_reraised(self):
+        """Test a failing stage marks its span and still raises."""
+        exporter = RecordingExporter()
+        tracer = Tracer(enabled=True, exporters=[exporter])
+
+        with pytest.raises(ValueError):
+            with tracer.span("map"):
+                raise ValueError("bad artifact")
+
+        assert exporter.spans[0].error == "ValueError: bad artifact"
+
+    def test_unsampled_trace_skips_children(self):
+        """Test sampling is decided once at the root span."""
+        exporter = RecordingExporter()
+        tracer = Tracer(enabled=True, exporters=[exporter], sample_rate=0.5, rng=lambda: 0.9)
+
+        with tracer.span("job"):
+            with tracer.span("fetch"):
+                pass
+
+        assert exporter.spans == []
+
+    def test_traced_decorator_uses_configured_tracer(self, monkeypatch):
+        """Test the module decorator records spans for async functions."""
+        exporter = RecordingExporter()
+        monkeypatch.setattr(tracing, "_tracer", Tracer(enabled=True, exporters=[exporter]))
+
+        @tracing.traced("normalize")
+        async def normalize():
+            return tracing.current_span().name
+
+        assert asyncio.run(normalize()) == "normalize"
+        assert [s.name for s in exporter.spans] == ["normalize"]
+
+
+class TestExporters:
+    """Test cases for span exporters and the profiler."""
+
+    def test_otlp_json_file_written_per_trace(self, tmp_path):
+        """Test spans are flushed as one OTLP/JSON line when the root ends."""
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(enabled=True, exporters=[OTLPJsonFileExporter(str(path))])
+
+        with tracer.span("job", products=3):
+            with tracer.span("fetch"):
+                pass
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 1
+        spans = json.loads(lines[0])['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert [s['name'] for s in spans] == ["fetch", "job"]
+        assert spans[0]['parentSpanId'] == spans[1]['spanId']
+        assert spans[1]['attributes'] == [{'key': 'products', 'value': {'intValue': '3'}}]
+
+    def test_stack_sampler_produces_folded_stacks(self):
+        """Test the sampler captures the profiled thread's stacks."""
+        def busy_stage():
+            end = time.time() + 0.1
+            while time.time() < end:
+                pass
+
+        with StackSampler(interval=0.001) as sampler:
+            busy_stage()
+
+        assert sampler.samples
+        assert any("busy_stage" in line for line in sampler.folded().splitlines())
@@ -0,0 +1,131 @@
+"""
+Tests for bounded pipeline state and transaction stores.
+"""
+
+import gc
+import json
+from unittest.mock import Mock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.parser.bounded_store import BoundedStore
+from src.parser.normalizer_pipeline import PipelineStateManager
+from src.parser.transaction_manager import PipelineTransactionManager
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _gauge_value(store_name: str) -> float:
+    return REGISTRY.get_sample_value('pipeline_store_entries', {'store': store_name})
+
+
+class TestBoundedStore:
+    """Test cases for BoundedStore."""
+
+    def test_evicts_oldest_beyond_max_size(self):
+        """Test the least recently written entries are evicted first."""
+        evicted = []
+        store = BoundedStore('test_size', max_size=2,
+                             on_evict=lambda key, value, reason: evicted.append((key, reason)))
+        store['a'] = 1
+        store['b'] = 2
+        store['a'] = 3
+        store['c'] = 4
+
+        assert list(store) == ['a', 'c']
+        assert store['a'] == 3
+        assert evicted == [('b', 'size')]
+        assert store.evictions == {'size': 1, 'age': 0}
+
+    def test_evicts_expired_entries_on_write(self):
+        """Test entries older than max_age_seconds are evicted on the next write."""
+        clock = FakeClock()
+        store = BoundedStore('test_age', max_size=10, max_age_seconds=60, clock=clock)
+        store['old'] = 1
+        clock.now = 30.0
+        store['newer'] = 2
+        clock.now = 61.0
+        store['new'] = 3
+
+        assert 'old' not in store
+        assert list(store) == ['newer', 'new']
+        assert store.evictions['age'] == 1
+
+    def test_gauge_tracks_live_size(self):
+        """Test the entries gauge follows inserts, deletes, evictions and clear."""
+        store = BoundedStore('test_gauge', max_size=2)
+        store['a'] = 1
+        store['b'] = 2
+        store['c'] = 3
+        assert _gauge_value('test_gauge') == 2
+
+        del store['b']
+        assert _gauge_value('test_gauge') == 1
+
+        store.clear()
+        assert _gauge_value('test_gauge') == 0
+        with pytest.raises(ValueError):
+            BoundedStore('test_invalid', max_size=0)
+
+    def test_gauge_drops_discarded_stores(self):
+        """Test entries in stores that were garbage collected are no longer counted."""
+        kept = BoundedStore('test_gauge_discarded', max_size=10)
+        kept['a'] = 1
+        discarded = BoundedStore('test_gauge_discarded', max_size=10)
+        discarded['b'] = 2
+        discarded['c'] = 3
+        assert _gauge_value('test_gauge_discarded') == 3
+
+        del discarded
+        gc.collect()
+        assert _gauge_value('test_gauge_discarded') == 1
+
+
+class TestBoundedPipelineStores:
+    """Test cases for bounded state and transaction managers."""
+
+    def test_state_manager_is_bounded(self):
+        """Test pipeline states never exceed max_states."""
+        manager = PipelineStateManager(max_states=5)
+        states = [manager.create_state() for _ in range(20)]
+
+        assert len(manager.active_states) == 5
+        assert manager.get_state(states[-1].execution_id) is states[-1]
+        assert manager.get_state(states[0].execution_id) is None
+
+    def test_completed_transactions_are_bounded_and_spilled(self, tmp_path):
+        """Test completed transactions beyond the limit are spilled to disk."""
+        spill_path = tmp_path / 'transactions.jsonl'
+        manager = PipelineTransactionManager(Mock(), max_completed=3, spill_path=str(spill_path))
+        for index in range(10):
+            manager.create_transaction(f"exec-{index}")
+            manager.commit_transaction(f"exec-{index}")
+
+        stats = manager.get_transaction_stats()
+        assert stats['active_transactions'] == 0
+        assert stats['completed_transactions'] == 3
+        assert stats['spilled_transactions'] == 7
+
+        records = [json.loads(line) for line in spill_path.read_text().splitlines()]
+        assert [record['execution_id'] for record in records] == [f"exec-{index}" for index in range(7)]
+        assert all(record['status'] == 'committed' for record in records)
+
+    def test_finish_transaction_after_direct_rollback(self):
+        """Test transactions finished by the caller leave the active store."""
+        manager = PipelineTransactionManager(Mock())
+        transaction = manager.create_transaction("exec-1")
+        transaction.rollback()
+        manager.finish_transaction("exec-1")
+
+        assert "exec-1" not in manager.active_transactions
+        assert manager.completed_transactions["exec-1"] is transaction
+        assert manager.get_transaction_stats()['failed_transactions'] == 1
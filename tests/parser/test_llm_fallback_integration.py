@@ -15,6 +15,7 @@ from datetime import datetime, timezone
 from typing import Dict, List, Any
 
 from src.parser.llm_fallback_integration import LLMFallbackService
+from src.llm.deepseek_wrapper import RateLimitExceededError
 from src.parser.pipeline_state import PipelineState, PipelineStage, PipelineWarning
 from src.config.llm_config import LLMConfig
 from src.config.pipeline_config import LLMFallbackConfig
@@ -197,8 +198,11 @@ class TestLLMFallbackService:
         """Test LLM fallback with rate limiting."""
         service = LLMFallbackService(llm_config, **mock_epic_d_services)
         
-        # Mock rate limiting
-        mock_epic_d_services['rate_limiter'].can_make_request.return_value = False
+        # Mock rate limiting; the LLM service's acquire() is the only gate
+        mock_epic_d_services['cache_service'].get.return_value = None
+        mock_epic_d_services['llm_service'].enrich_field = AsyncMock(
+            side_effect=RateLimitExceededError("Rate limit exceeded for roaster roaster-123")
+        )
         mock_epic_d_services['llm_metrics'].record_rate_limit_exceeded = Mock()
 
         # Mock pipeline state
@@ -208,7 +212,8 @@ class TestLLMFallbackService:
         # Execute LLM fallback
         results = await service.process_ambiguous_cases(sample_artifact, low_confidence_results, mock_state)
         
-        # Verify rate limiting was handled
+        # Verify rate limiting was handled without consuming quota twice
+        mock_epic_d_services['rate_limiter'].can_make_request.assert_not_called()
         mock_epic_d_services['llm_metrics'].record_rate_limit_exceeded.assert_called()
         mock_state.add_warning.assert_called()
         
@@ -15,6 +15,7 @@ from datetime import datetime, timezone
 from typing import Dict, List, Any
 
 from src.parser.normalizer_pipeline import NormalizerPipelineService, PipelineExecutionError
+from src.llm.deepseek_wrapper import RateLimitExceededError
 from src.parser.pipeline_state import PipelineState, PipelineStage, PipelineError, PipelineWarning
 from src.config.pipeline_config import PipelineConfig
 from src.parser.error_recovery import ErrorRecoveryConfig, RecoveryAction
@@ -447,6 +448,84 @@ class TestNormalizerPipelineService:
                     assert 'Low confidence warning' in result.warnings
 
 
+    @pytest.mark.asyncio
+    async def test_async_llm_fallback_batches_fields(self, pipeline_config, sample_artifact, mock_epic_d_services):
+        """Test async fallback sends all ambiguous fields in one enrich_fields call."""
+        pipeline = NormalizerPipelineService(pipeline_config)
+        pipeline.initialize_epic_d_services(**mock_epic_d_services)
+        mock_epic_d_services['rate_limiter'].can_make_request.return_value = True
+        mock_epic_d_services['llm_service'].enrich_fields = AsyncMock(return_value={
+            'weight': Mock(to_dict=Mock(return_value={'value': '250g'})),
+            'roast': Mock(to_dict=Mock(return_value={'value': 'light'}))
+        })
+        mock_epic_d_services['confidence_evaluator'].evaluate_confidence.return_value = Mock(
+            action='auto_apply', final_confidence=0.9
+        )
+
+        deterministic_results = {
+            'weight': Mock(confidence=0.2),
+            'roast': Mock(confidence=0.3),
+            'process': Mock(confidence=0.9)
+        }
+
+        llm_results = await pipeline._execute_llm_fallback_async(sample_artifact, deterministic_results, Mock())
+
+        mock_epic_d_services['llm_service'].enrich_fields.assert_awaited_once()
+        prompts = mock_epic_d_services['llm_service'].enrich_fields.call_args.args[1]
+        assert set(prompts) == {'weight', 'roast'}
+        assert llm_results['weight'].success is True
+        assert llm_results['roast'].result_data == {'value': 'light'}
+        # The LLM service's acquire() is the only rate limit gate
+        mock_epic_d_services['rate_limiter'].can_make_request.assert_not_called()
+
+    def test_sync_llm_fallback_awaits_llm_service(self, pipeline_config, sample_artifact, mock_epic_d_services):
+        """Test the sync fallback runs the async LLM service to completion."""
+        pipeline = NormalizerPipelineService(pipeline_config)
+        pipeline.initialize_epic_d_services(**mock_epic_d_services)
+        mock_epic_d_services['llm_service'].enrich_fields = AsyncMock(return_value={
+            'weight': Mock(to_dict=Mock(return_value={'value': '250g'}))
+        })
+        mock_epic_d_services['confidence_evaluator'].evaluate_confidence.return_value = Mock(
+            action='auto_apply', final_confidence=0.9
+        )
+
+        llm_results = pipeline._execute_llm_fallback(sample_artifact, {'weight': Mock(confidence=0.2)}, Mock())
+
+        assert llm_results['weight'].success is True
+        assert llm_results['weight'].result_data == {'value': '250g'}
+
+    @pytest.mark.asyncio
+    async def test_async_llm_fallback_rate_limited(self, pipeline_config, sample_artifact, mock_epic_d_services):
+        """Test a rate-limited artifact gets no LLM results instead of failing."""
+        pipeline = NormalizerPipelineService(pipeline_config)
+        pipeline.initialize_epic_d_services(**mock_epic_d_services)
+        mock_epic_d_services['llm_service'].enrich_fields = AsyncMock(
+            side_effect=RateLimitExceededError("Rate limit exceeded for roaster r1")
+        )
+
+        llm_results = await pipeline._execute_llm_fallback_async(
+            sample_artifact, {'weight': Mock(confidence=0.2)}, Mock()
+        )
+
+        assert llm_results == {}
+
+    @pytest.mark.asyncio
+    async def test_process_batch_async_preserves_order(self, pipeline_config):
+        """Test concurrent batch processing returns one result per artifact in order."""
+        pipeline_config.llm_fallback.max_concurrent_artifacts = 2
+        pipeline = NormalizerPipelineService(pipeline_config)
+        artifacts = [
+            {'title': f'Coffee {i} - 250g', 'description': 'Washed light roast', 'roaster_id': 'r1'}
+            for i in range(5)
+        ]
+
+        results = await pipeline.process_batch_async(artifacts)
+
+        assert len(results) == 5
+        assert all(result['stage'] == 'completed' for result in results)
+        assert len({result['execution_id'] for result in results}) == 5
+
+
 class TestPipelineIntegration:
     """Integration tests for the complete normalizer pipeline."""
 
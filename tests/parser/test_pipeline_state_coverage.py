@@ -127,6 +127,24 @@ class TestParserResult:
         assert dict_result['execution_time'] == 0.0  # default value
         assert 'timestamp' in dict_result
 
+    def test_parser_result_from_dict_round_trip(self):
+        """Test ParserResult round-trips through to_dict/from_dict with ISO timestamps."""
+        result = ParserResult(parser_name="test_parser", success=True, confidence=0.7)
+        data = result.to_dict()
+        data['timestamp'] = data['timestamp'].isoformat()
+
+        restored = ParserResult.from_dict(data)
+
+        assert restored == result
+
+    def test_parser_result_is_lightweight(self):
+        """Test ParserResult is a slotted object with a cheap confidence guard."""
+        result = ParserResult(parser_name="test_parser", success=True, confidence=0.5)
+
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(ValueError):
+            ParserResult(parser_name="test_parser", success=True, confidence=1.5)
+
 
 class TestLLMResult:
     """Test LLMResult model."""
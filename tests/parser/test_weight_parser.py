@@ -205,3 +205,13 @@ class TestWeightParser:
         assert 'kg' in metrics['supported_units'], "Should support kilograms"
         assert 'oz' in metrics['supported_units'], "Should support ounces"
         assert 'lb' in metrics['supported_units'], "Should support pounds"
+    
+    def test_weight_result_validation(self):
+        """Test WeightResult rejects negative grams and out-of-range confidence."""
+        with pytest.raises(ValueError):
+            WeightResult(grams=-1, confidence=0.9, original_format="-1g")
+        with pytest.raises(ValueError):
+            WeightResult(grams=250, confidence=1.2, original_format="250g")
+        
+        result = WeightResult(grams=0, confidence=0.0, original_format="")
+        assert result.grams == 0
@@ -0,0 +1,86 @@
+"""
+Tests for the storefront replay server and fetcher load generator.
+"""
+
+import httpx
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from benchmarks.fetcher_load import run_load
+from benchmarks.replay_server import ReplayConfig, ReplayServer
+from src.fetcher.base_fetcher import FetcherConfig
+from src.fetcher.shopify_fetcher import ShopifyFetcher
+
+
+def _fast_config(**overrides) -> ReplayConfig:
+    return ReplayConfig(latency=0.0, latency_jitter=0.0, seed=1, **overrides)
+
+
+def _fast_fetcher_config() -> FetcherConfig:
+    return FetcherConfig(politeness_delay=0.0, jitter_range=0.0, retry_delay=0.01)
+
+
+class TestReplayServer:
+    """Test cases for ReplayServer."""
+
+    @pytest.mark.asyncio
+    async def test_shopify_pagination_through_fetcher(self):
+        """Test the Shopify fetcher pages through the whole replayed catalog."""
+        async with ReplayServer(config=_fast_config()) as server:
+            fetcher = ShopifyFetcher(_fast_fetcher_config(), "shopify-0", server.roaster_url("shopify-0"))
+            async with fetcher:
+                first_page = await fetcher.fetch_products(limit=10, page=1)
+                all_products = await fetcher.fetch_all_products()
+
+        assert len(first_page) == 10
+        assert len(all_products) == len(server.catalogs['shopify'])
+
+    @pytest.mark.asyncio
+    async def test_etag_returns_not_modified(self):
+        """Test a matching If-None-Match is answered with 304."""
+        async with ReplayServer(config=_fast_config()) as server:
+            url = f"{server.roaster_url('woocommerce-1')}/wp-json/wc/store/products"
+            async with httpx.AsyncClient() as client:
+                first = await client.get(url, params={'per_page': 5})
+                second = await client.get(url, params={'per_page': 5},
+                                          headers={'If-None-Match': first.headers['ETag']})
+
+        assert first.status_code == 200
+        assert first.headers['X-WP-Total'] == str(len(server.catalogs['woocommerce']))
+        assert second.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_and_platform_routing(self):
+        """Test per-roaster 429s carry Retry-After and other platforms 404."""
+        async with ReplayServer(config=_fast_config(rate_limit=2, rate_limit_window=60, retry_after=7)) as server:
+            url = f"{server.roaster_url('shopify-0')}/products.json"
+            async with httpx.AsyncClient() as client:
+                statuses = [(await client.get(url)).status_code for _ in range(2)]
+                limited = await client.get(url)
+                other_roaster = await client.get(f"{server.roaster_url('shopify-9')}/products.json")
+                wrong_platform = await client.get(f"{server.roaster_url('woocommerce-9')}/products.json")
+
+        assert statuses == [200, 200]
+        assert limited.status_code == 429
+        assert limited.headers['Retry-After'] == "7"
+        assert other_roaster.status_code == 200
+        assert wrong_platform.status_code == 404
+        assert server.get_stats()['status_counts'][429] == 1
+
+
+class TestFetcherLoad:
+    """Test cases for the load generator."""
+
+    @pytest.mark.asyncio
+    async def test_load_run_fetches_every_roaster(self):
+        """Test simulated roasters are fetched through the platform cascade."""
+        async with ReplayServer(config=_fast_config()) as server:
+            report = await run_load(4, 2, _fast_fetcher_config(), server=server)
+
+        assert report.succeeded == 4
+        assert {run.platform for run in report.runs} == {"shopify", "woocommerce"}
+        assert sum(run.products for run in report.runs) == 2 * (
+            len(server.catalogs['shopify']) + len(server.catalogs['woocommerce'])
+        )
+        assert "4 succeeded" in report.summary()
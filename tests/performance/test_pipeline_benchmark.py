@@ -0,0 +1,65 @@
+"""
+Tests for the end-to-end pipeline benchmark harness.
+"""
+
+import json
+
+from benchmarks.pipeline_benchmark import (
+    BenchmarkResult,
+    PipelineBenchmark,
+    STAGES,
+    compare_results,
+    latest_result,
+    load_corpus,
+    load_result,
+    save_result,
+    scale_corpus,
+)
+
+
+class TestPipelineBenchmark:
+    """Test cases for the pipeline benchmark."""
+
+    def test_corpus_loads_recorded_samples(self):
+        """Test Shopify and WooCommerce samples are both loaded."""
+        corpus = load_corpus()
+
+        assert {platform for platform, _, _ in corpus} == {"shopify", "woocommerce"}
+
+    def test_scaled_copies_have_unique_ids(self):
+        """Test synthetic copies do not collide with the recorded products."""
+        corpus = load_corpus()
+        payloads = list(scale_corpus(corpus, len(corpus) * 2))
+
+        ids = [json.loads(payload)['id'] for _, _, payload in payloads]
+        assert len(ids) == len(corpus) * 2
+        assert len(set(ids)) == len(ids)
+
+    def test_run_measures_every_stage(self):
+        """Test a small run reports throughput and latency for every stage."""
+        benchmark = PipelineBenchmark(load_corpus(), batch_size=20)
+        result = benchmark.run(60)
+
+        assert benchmark.mapper.normalizer_pipeline is benchmark.normalizer
+        assert result.failed == 0
+        assert result.products_per_sec > 0
+        assert set(result.stages) == set(STAGES)
+        assert result.stages['map'].count == 60
+        assert result.stages['upsert'].count == 3
+        assert result.stages['map'].p99_ms >= result.stages['map'].p50_ms
+
+    def test_results_round_trip_and_compare(self, tmp_path):
+        """Test stored results reload and slowdowns are reported."""
+        result = PipelineBenchmark(load_corpus(), batch_size=20).run(20)
+        path = save_result(result, tmp_path)
+
+        baseline = load_result(path)
+        assert latest_result(tmp_path, 20) == path
+        assert compare_results(result, baseline) == []
+
+        slower = BenchmarkResult.from_dict(result.to_dict())
+        slower.products_per_sec = baseline.products_per_sec / 2
+        slower.stages['map'].p99_ms = baseline.stages['map'].p99_ms * 3 + 1
+        regressions = compare_results(slower, baseline)
+        assert any(r.startswith("throughput") for r in regressions)
+        assert any(r.startswith("map p99_ms") for r in regressions)
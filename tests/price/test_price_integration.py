@@ -10,6 +10,7 @@ from decimal import Decimal
 
 from src.price.price_update_service import PriceUpdateService
 from src.price.variant_update_service import VariantUpdateService
+from src.validator.rpc_client import PriceDeltaApplyResult
 from src.fetcher.price_parser import PriceDelta, PriceParser
 from src.fetcher.price_fetcher import PriceFetcher
 
@@ -26,13 +27,14 @@ class TestPriceIntegration:
     def mock_rpc_client(self):
         """Mock RPC client."""
         mock_client = Mock()
-        # Make insert_price return unique IDs
-        price_id_counter = 0
-        def mock_insert_price(*args, **kwargs):
-            nonlocal price_id_counter
-            price_id_counter += 1
-            return f"price_{price_id_counter}"
-        mock_client.insert_price.side_effect = mock_insert_price
+        # Make apply_price_deltas return unique price IDs for every delta
+        def mock_apply_price_deltas(deltas):
+            return PriceDeltaApplyResult(
+                total_deltas=len(deltas),
+                price_ids=[f"price_{i + 1}" for i in range(len(deltas))],
+                variant_ids=[delta['variant_id'] for delta in deltas]
+            )
+        mock_client.apply_price_deltas.side_effect = mock_apply_price_deltas
         
         # Make batch_update_variant_pricing return correct counts
         def mock_batch_update_variant_pricing(*args, **kwargs):
@@ -100,16 +102,17 @@ class TestPriceIntegration:
         assert result.variant_updates == 2
         assert result.errors == []
         
-        # Verify RPC operations were called
-        assert price_update_service.rpc_client.insert_price.call_count == 2
-        assert price_update_service.rpc_client.batch_update_variant_pricing.call_count == 1
+        # Verify a single set-based RPC operation was called
+        assert price_update_service.rpc_client.apply_price_deltas.call_count == 1
+        price_update_service.rpc_client.insert_price.assert_not_called()
+        price_update_service.rpc_client.batch_update_variant_pricing.assert_not_called()
         
-        # Verify price record insertion calls
-        insert_calls = price_update_service.rpc_client.insert_price.call_args_list
-        assert insert_calls[0][1]['variant_id'] == "variant_1"
-        assert insert_calls[0][1]['price'] == 24.99
-        assert insert_calls[1][1]['variant_id'] == "variant_2"
-        assert insert_calls[1][1]['price'] == 15.99
+        # Verify delta rows
+        rows = price_update_service.rpc_client.apply_price_deltas.call_args[0][0]
+        assert rows[0]['variant_id'] == "variant_1"
+        assert rows[0]['price'] == 24.99
+        assert rows[1]['variant_id'] == "variant_2"
+        assert rows[1]['price'] == 15.99
     
     @pytest.mark.asyncio
     async def test_price_update_with_currency_validation(self, price_update_service):
@@ -131,8 +134,8 @@ class TestPriceIntegration:
         assert len(result.price_ids) == 1
         
         # Verify currency was passed correctly
-        insert_call = price_update_service.rpc_client.insert_price.call_args[1]
-        assert insert_call['currency'] == "EUR"
+        row = price_update_service.rpc_client.apply_price_deltas.call_args[0][0][0]
+        assert row['currency'] == "EUR"
     
     @pytest.mark.asyncio
     async def test_price_update_with_availability_changes(self, price_update_service):
@@ -155,21 +158,18 @@ class TestPriceIntegration:
         assert result.variant_updates == 1
         
         # Verify variant update included availability
-        batch_call = price_update_service.rpc_client.batch_update_variant_pricing.call_args[0][0]
-        assert batch_call[0]['in_stock'] is False
+        row = price_update_service.rpc_client.apply_price_deltas.call_args[0][0][0]
+        assert row['in_stock'] is False
     
     @pytest.mark.asyncio
     async def test_price_update_rollback_scenario(self, price_update_service):  
         """Test price update rollback scenario."""
-        # Mock RPC client to fail on variant updates
-        def mock_batch_update_variant_pricing(*args, **kwargs):
-            return {
-                'total_updates': 1,
-                'successful_updates': 0,
-                'failed_updates': 1,
-                'errors': ['Variant update failed']
-            }
-        price_update_service.rpc_client.batch_update_variant_pricing.side_effect = mock_batch_update_variant_pricing
+        # A failed chunk rolls back both the price rows and the variant updates
+        price_update_service.rpc_client.apply_price_deltas.side_effect = lambda deltas: PriceDeltaApplyResult(
+            total_deltas=len(deltas),
+            failed_deltas=len(deltas),
+            errors=['Error applying 1 price deltas: Variant update failed']
+        )
 
         price_deltas = [
             PriceDelta(
@@ -184,11 +184,10 @@ class TestPriceIntegration:
 
         result = await price_update_service.update_prices_atomic(price_deltas)  
 
-        # Should still succeed as we don't implement rollback in this version   
-        # (This would be enhanced in a production system)
-        assert result.success is True
-        assert len(result.price_ids) == 1
-        assert result.variant_updates == 0  # Failed variant updates
+        assert result.success is False
+        assert len(result.price_ids) == 0
+        assert result.variant_updates == 0
+        assert 'Error applying 1 price deltas: Variant update failed' in result.errors
     
     @pytest.mark.asyncio
     async def test_batch_price_update_performance(self, price_update_service):
@@ -213,9 +212,9 @@ class TestPriceIntegration:
         assert len(result.price_ids) == 50
         assert result.variant_updates == 50
         
-        # Verify all RPC operations were called
-        assert price_update_service.rpc_client.insert_price.call_count == 50
-        assert price_update_service.rpc_client.batch_update_variant_pricing.call_count == 1
+        # Verify all deltas went through one RPC operation
+        assert price_update_service.rpc_client.apply_price_deltas.call_count == 1
+        assert len(price_update_service.rpc_client.apply_price_deltas.call_args[0][0]) == 50
         
         # Verify performance metrics
         stats = price_update_service.get_update_stats()
@@ -228,7 +227,11 @@ class TestPriceIntegration:
     async def test_price_update_error_handling(self, price_update_service):
         """Test price update error handling."""
         # Mock RPC client to fail on price insertion
-        price_update_service.rpc_client.insert_price.side_effect = Exception("Database connection failed")
+        price_update_service.rpc_client.apply_price_deltas.side_effect = lambda deltas: PriceDeltaApplyResult(
+            total_deltas=len(deltas),
+            failed_deltas=len(deltas),
+            errors=["Error applying 1 price deltas: Database connection failed"]
+        )
         
         price_deltas = [
             PriceDelta(
@@ -245,8 +248,9 @@ class TestPriceIntegration:
         
         assert result.success is False
         assert len(result.price_ids) == 0
-        assert len(result.errors) == 1
+        assert len(result.errors) == 2
         assert "Failed to insert any price records" in result.errors[0]
+        assert "Database connection failed" in result.errors[1]
     
     def test_price_update_service_initialization(self, mock_supabase_client, mock_rpc_client):
         """Test price update service initialization."""
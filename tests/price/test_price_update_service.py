@@ -9,6 +9,7 @@ from decimal import Decimal
 
 from src.price.price_update_service import PriceUpdateService, PriceUpdateResult
 from src.fetcher.price_parser import PriceDelta
+from src.validator.rpc_client import PriceDeltaApplyResult
 
 
 class TestPriceUpdateService:
@@ -23,13 +24,11 @@ class TestPriceUpdateService:
     def mock_rpc_client(self):
         """Mock RPC client."""
         mock_client = Mock()
-        mock_client.insert_price.return_value = "price_123"
-        mock_client.batch_update_variant_pricing.return_value = {
-            'total_updates': 2,
-            'successful_updates': 2,
-            'failed_updates': 0,
-            'errors': []
-        }
+        mock_client.apply_price_deltas.side_effect = lambda deltas: PriceDeltaApplyResult(
+            total_deltas=len(deltas),
+            price_ids=[f"price_{123 + i}" for i in range(len(deltas))],
+            variant_ids=[delta['variant_id'] for delta in deltas]
+        )
         return mock_client
     
     @pytest.fixture
@@ -73,9 +72,9 @@ class TestPriceUpdateService:
         assert result.errors == []
         assert result.processing_time_seconds > 0
         
-        # Verify RPC client was called correctly
-        assert price_update_service.rpc_client.insert_price.call_count == 2
-        assert price_update_service.rpc_client.batch_update_variant_pricing.call_count == 1
+        # Verify RPC client was called once for the whole batch
+        assert price_update_service.rpc_client.apply_price_deltas.call_count == 1
+        price_update_service.rpc_client.insert_price.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_update_prices_atomic_no_deltas(self, price_update_service):
@@ -89,61 +88,49 @@ class TestPriceUpdateService:
     async def test_update_prices_atomic_rpc_failure(self, price_update_service, sample_price_deltas):
         """Test atomic price update with RPC failure."""
         # Mock RPC client to raise exception
-        price_update_service.rpc_client.insert_price.side_effect = Exception("RPC Error")
+        price_update_service.rpc_client.apply_price_deltas.side_effect = Exception("RPC Error")
         
         result = await price_update_service.update_prices_atomic(sample_price_deltas)
         
         assert result.success is False
-        assert "Failed to insert any price records" in result.errors[0]
-    
-    @pytest.mark.asyncio
-    async def test_insert_price_records_success(self, price_update_service, sample_price_deltas):
-        """Test successful price record insertion."""
-        price_ids = await price_update_service._insert_price_records(sample_price_deltas)
-        
-        assert len(price_ids) == 2
-        assert price_ids == ["price_123", "price_123"]
-        
-        # Verify RPC calls
-        assert price_update_service.rpc_client.insert_price.call_count == 2
+        assert "RPC Error" in result.errors[0]
+        assert price_update_service.update_stats['failed_updates'] == 2
     
     @pytest.mark.asyncio
-    async def test_insert_price_records_partial_failure(self, price_update_service, sample_price_deltas):
-        """Test price record insertion with partial failure."""
-        # Mock RPC client to fail on second call
-        price_update_service.rpc_client.insert_price.side_effect = [
-            "price_123",  # First call succeeds
-            Exception("RPC Error")  # Second call fails
-        ]
+    async def test_update_prices_atomic_partial_apply(self, price_update_service, sample_price_deltas):
+        """Test atomic price update when only some deltas are applied."""
+        price_update_service.rpc_client.apply_price_deltas.side_effect = None
+        price_update_service.rpc_client.apply_price_deltas.return_value = PriceDeltaApplyResult(
+            total_deltas=2,
+            price_ids=["price_123"],
+            variant_ids=["variant_1"],
+            failed_deltas=1,
+            errors=["1 price deltas referenced unknown variants"]
+        )
         
-        price_ids = await price_update_service._insert_price_records(sample_price_deltas)
+        result = await price_update_service.update_prices_atomic(sample_price_deltas)
         
-        assert len(price_ids) == 1
-        assert price_ids == ["price_123"]
+        assert result.success is True
+        assert result.price_ids == ["price_123"]
+        assert result.variant_updates == 1
     
-    @pytest.mark.asyncio
-    async def test_update_variant_pricing_success(self, price_update_service, sample_price_deltas):
-        """Test successful variant pricing update."""
-        variant_updates = await price_update_service._update_variant_pricing(sample_price_deltas)
-        
-        assert variant_updates == 2
-        
-        # Verify batch update was called
-        assert price_update_service.rpc_client.batch_update_variant_pricing.call_count == 1
-        
-        # Verify the batch update data
-        call_args = price_update_service.rpc_client.batch_update_variant_pricing.call_args[0][0]
-        assert len(call_args) == 2
-        assert call_args[0]['variant_id'] == "variant_1"
-        assert call_args[1]['variant_id'] == "variant_2"
+    def test_build_delta_rows(self, price_update_service, sample_price_deltas):
+        """Test building set-based delta rows from price deltas."""
+        rows = price_update_service._build_delta_rows(sample_price_deltas)
+        
+        assert len(rows) == 2
+        assert rows[0]['variant_id'] == "variant_1"
+        assert rows[0]['price'] == 24.99
+        assert rows[0]['in_stock'] is True
+        assert rows[0]['source_raw']['old_price'] == 19.99
+        assert rows[1]['variant_id'] == "variant_2"
+        assert rows[1]['in_stock'] is False
+        assert rows[1]['source_raw']['old_price'] is None
+        assert rows[1]['scraped_at'] == sample_price_deltas[1].detected_at.isoformat()
     
-    @pytest.mark.asyncio
-    async def test_update_variant_pricing_no_deltas(self, price_update_service):
-        """Test variant pricing update with no deltas."""
-        variant_updates = await price_update_service._update_variant_pricing([])
-        
-        assert variant_updates == 0
-        assert price_update_service.rpc_client.batch_update_variant_pricing.call_count == 0
+    def test_build_delta_rows_no_deltas(self, price_update_service):
+        """Test building delta rows with no deltas."""
+        assert price_update_service._build_delta_rows([]) == []
     
     def test_get_update_stats(self, price_update_service):
         """Test getting update statistics."""
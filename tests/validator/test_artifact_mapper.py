@@ -4,7 +4,7 @@ Tests for artifact mapper functionality.
 
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from src.validator.artifact_mapper import ArtifactMapper
 from src.validator.models import (
@@ -349,6 +349,58 @@ class TestArtifactMapper:
         assert 'coffee' in result
         assert result['roaster_id'] is None
     
+    @pytest.mark.asyncio
+    async def test_map_artifact_async_awaits_pipeline(self):
+        """Test the async mapping path awaits the pipeline instead of running it inline."""
+        pipeline = Mock()
+        pipeline.process_artifact_async = AsyncMock(return_value={
+            'normalized_data': {'roast_level': 'medium'},
+            'deterministic_results': {},
+            'warnings': [],
+            'errors': []
+        })
+        mapper = ArtifactMapper(normalizer_pipeline=pipeline)
+        artifact = self.create_test_artifact()
+        
+        result = await mapper.map_artifact_to_rpc_payloads_async(artifact, "roaster-123")
+        
+        pipeline.process_artifact_async.assert_awaited_once()
+        pipeline.process_artifact.assert_not_called()
+        assert pipeline.process_artifact_async.call_args.args[0]['roaster_id'] == "roaster-123"
+        assert result['coffee']['p_roast_level'] == 'medium'
+        assert len(result['variants']) == 1
+    
+    @pytest.mark.asyncio
+    async def test_map_artifact_async_uses_async_image_batch(self):
+        """Test the async mapping path hashes images through the async batch path."""
+        dedup_service = Mock()
+        dedup_service.process_batch_with_deduplication_async = AsyncMock(return_value=[
+            {'url': 'https://test.com/image1.jpg', 'alt': 'Test image 1', 'sort_order': 1,
+             'content_hash': 'hash1', 'deduplication_status': 'new_image', 'is_duplicate': False},
+            {'url': 'https://test.com/image2.jpg', 'content_hash': 'hash2', 'is_duplicate': True,
+             'image_id': 'existing-2', 'deduplication_status': 'skipped_duplicate'},
+        ])
+        mapper = ArtifactMapper()
+        mapper.deduplication_service = dedup_service
+        mapper.enable_image_deduplication = True
+        artifact = self.create_test_artifact()
+        artifact.product.images = [
+            ImageModel(url="https://test.com/image1.jpg", alt_text="Test image 1", order=1, source_id="img1"),
+            ImageModel(url="https://test.com/image2.jpg", alt_text="Test image 2", order=2, source_id="img2"),
+        ]
+        
+        result = await mapper.map_artifact_to_rpc_payloads_async(artifact, "roaster-123")
+        
+        dedup_service.process_batch_with_deduplication_async.assert_awaited_once()
+        dedup_service.process_batch_with_deduplication.assert_not_called()
+        images_data, coffee_id = dedup_service.process_batch_with_deduplication_async.call_args.args
+        assert [image['url'] for image in images_data] == [
+            "https://test.com/image1.jpg", "https://test.com/image2.jpg"
+        ]
+        assert coffee_id == "temp-prod-123"
+        assert [image['p_content_hash'] for image in result['images']] == ['hash1', 'hash2']
+        assert result['images'][1]['p_existing_image_id'] == 'existing-2'
+    
     def test_get_mapping_stats(self):
         """Test mapping statistics retrieval."""
         # Set some stats
@@ -311,3 +311,86 @@ class TestDatabaseIntegrationSimple:
                 assert len(result['variant_ids']) == 1
                 assert len(result['price_ids']) == 1
                 assert len(result['image_ids']) == 0  # No images for metadata-only
+
+    def make_results(self, count):
+        """Create real validation results for batch storage tests."""
+        return [
+            ValidationResult(
+                is_valid=i % 2 == 0,
+                artifact_data={"test": f"data-{i}"},
+                errors=[] if i % 2 == 0 else [f"Error {i}"],
+                artifact_id=f"test-artifact-{i}"
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def echo_insert(rows):
+        """Return one inserted row per input row, in order."""
+        query = Mock()
+        query.execute.return_value = Mock(data=[{"id": f"id-{row['artifact_data']['test']}"} for row in rows])
+        return query
+
+    def test_store_batch_validation_results_bulk_insert(self):
+        """Test batch results are written with one insert per chunk."""
+        client = Mock()
+        client.table.return_value.insert.side_effect = self.echo_insert
+        db_integration = DatabaseIntegration(supabase_client=client, batch_size=2)
+
+        artifact_ids = db_integration.store_batch_validation_results(
+            validation_results=self.make_results(5),
+            scrape_run_id="run-1",
+            roaster_id="test-roaster",
+            platform="shopify",
+            response_filenames=[f"file{i}.json" for i in range(5)]
+        )
+
+        assert artifact_ids == [f"id-data-{i}" for i in range(5)]
+        assert [len(c.args[0]) for c in client.table.return_value.insert.call_args_list] == [2, 2, 1]
+        assert db_integration.validation_stats['total_stored'] == 5
+        assert db_integration.validation_stats['valid_stored'] == 3
+
+    def test_store_batch_validation_results_falls_back_per_row(self):
+        """Test a failed chunk insert is retried row by row."""
+        client = Mock()
+
+        def insert(rows):
+            # Per-row retries insert a single dict
+            if isinstance(rows, list) or rows['artifact_data']['test'] == "data-1":
+                query = Mock()
+                query.execute.side_effect = Exception("invalid input syntax")
+                return query
+            return self.echo_insert([rows])
+
+        client.table.return_value.insert.side_effect = insert
+        db_integration = DatabaseIntegration(supabase_client=client, batch_size=3)
+
+        artifact_ids = db_integration.store_batch_validation_results(
+            validation_results=self.make_results(3),
+            scrape_run_id="run-1",
+            roaster_id="test-roaster",
+            platform="shopify",
+            response_filenames=["a.json", "b.json", "c.json"]
+        )
+
+        assert artifact_ids == ["id-data-0", None, "id-data-2"]
+        assert db_integration.validation_stats['total_stored'] == 2
+        assert db_integration.validation_stats['error_count'] == 1
+
+    @pytest.mark.asyncio
+    async def test_store_batch_validation_results_async(self):
+        """Test the async variant inserts chunks and preserves result order."""
+        client = Mock()
+        client.table.return_value.insert.side_effect = self.echo_insert
+        db_integration = DatabaseIntegration(supabase_client=client, batch_size=2)
+
+        artifact_ids = await db_integration.store_batch_validation_results_async(
+            validation_results=self.make_results(5),
+            scrape_run_id="run-1",
+            roaster_id="test-roaster",
+            platform="shopify",
+            response_filenames=[f"file{i}.json" for i in range(5)]
+        )
+
+        assert artifact_ids == [f"id-data-{i}" for i in range(5)]
+        assert client.table.return_value.insert.call_count == 3
@@ -0,0 +1,163 @@
+"""
+Tests for the async database gateway.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.monitoring.tracing import Tracer
+from src.validator.db_gateway import DatabaseGateway, get_database_gateway
+from src.validator.rpc_client import RPCClient, RPCError
+
+
+class TestDatabaseGateway:
+    """Test cases for DatabaseGateway."""
+
+    @pytest.mark.asyncio
+    async def test_select_runs_sync_client_off_loop(self):
+        """Test sync queries run on a worker thread, not the event loop thread."""
+        client = Mock()
+        threads = []
+
+        def execute():
+            threads.append(threading.get_ident())
+            return Mock(data=[{'id': 'r1'}])
+
+        client.table.return_value.select.return_value.eq.return_value.execute.side_effect = execute
+        gateway = DatabaseGateway(client)
+
+        rows = await gateway.select('roasters', '*', {'id': 'r1'})
+
+        assert rows == [{'id': 'r1'}]
+        assert threads[0] != threading.get_ident()
+        client.table.assert_called_once_with('roasters')
+        client.table.return_value.select.return_value.eq.assert_called_once_with('id', 'r1')
+
+    @pytest.mark.asyncio
+    async def test_slow_query_does_not_block_loop(self):
+        """Test other coroutines keep running while a sync query blocks."""
+        query = Mock()
+        query.execute.side_effect = lambda: time.sleep(0.2) or Mock(data=[])
+        gateway = DatabaseGateway(Mock())
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        await asyncio.gather(gateway.execute(query), ticker())
+
+        assert ticks == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test no more than max_concurrency queries run at once."""
+        gateway = DatabaseGateway(Mock(), max_concurrency=2)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(gateway.run(work) for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_async_client_is_awaited(self):
+        """Test async builders are awaited directly."""
+        query = Mock()
+        query.execute = AsyncMock(return_value=Mock(data=[{'id': 'v1'}]))
+        gateway = DatabaseGateway(Mock())
+
+        response = await gateway.execute(query)
+
+        assert response.data == [{'id': 'v1'}]
+        query.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_keeps_caller_span_context(self):
+        """Test spans opened on the worker pool nest under the caller's span."""
+        finished = []
+        exporter = Mock(export=finished.append)
+        tracer = Tracer(enabled=True, exporters=[exporter])
+        gateway = DatabaseGateway(Mock())
+
+        def query():
+            with tracer.span("query"):
+                return threading.get_ident()
+
+        with tracer.span("upsert"):
+            thread_id = await gateway.run(query)
+
+        query_span, upsert_span = finished
+        assert thread_id != threading.get_ident()
+        assert query_span.parent_id == upsert_span.span_id
+        assert query_span.trace_id == upsert_span.trace_id
+
+    def test_execute_sync_shim(self):
+        """Test the sync shim executes sync and async builders."""
+        gateway = DatabaseGateway(Mock())
+        sync_query = Mock()
+        sync_query.execute.return_value = Mock(data=[1])
+        async_query = Mock()
+        async_query.execute = AsyncMock(return_value=Mock(data=[2]))
+
+        assert gateway.execute_sync(sync_query).data == [1]
+        assert gateway.execute_sync(async_query).data == [2]
+
+    def test_gateway_shared_per_client(self):
+        """Test services using the same client share one gateway."""
+        client = Mock()
+
+        assert get_database_gateway(client) is get_database_gateway(client)
+        assert get_database_gateway(client) is not get_database_gateway(Mock())
+        assert get_database_gateway(None) is get_database_gateway(None)
+
+
+class TestRPCClientAsync:
+    """Test cases for RPCClient.execute_rpc_async."""
+
+    @pytest.mark.asyncio
+    async def test_execute_rpc_async_retries_with_async_sleep(self):
+        """Test retries back off with asyncio.sleep instead of time.sleep."""
+        client = Mock()
+        ok = Mock(data=[{'id': 'p1'}])
+        client.rpc.return_value.execute.side_effect = [Exception("connection timeout"), ok]
+        rpc_client = RPCClient(supabase_client=client, max_retries=2, base_delay=0.5)
+
+        with patch('src.validator.rpc_client.asyncio.sleep', new=AsyncMock()) as mock_sleep, \
+             patch('src.validator.rpc_client.time.sleep') as mock_time_sleep:
+            data = await rpc_client.execute_rpc_async('rpc_insert_price', {'p_price': 1})
+
+        assert data == [{'id': 'p1'}]
+        mock_sleep.assert_awaited_once_with(0.5)
+        mock_time_sleep.assert_not_called()
+        assert rpc_client.rpc_stats['retry_attempts'] == 1
+        assert rpc_client.rpc_stats['successful_calls'] == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_rpc_async_constraint_error_no_retry(self):
+        """Test constraint errors are not retried."""
+        client = Mock()
+        client.rpc.return_value.execute.side_effect = Exception("duplicate key violates unique constraint")
+        rpc_client = RPCClient(supabase_client=client, max_retries=2)
+
+        with pytest.raises(RPCError):
+            await rpc_client.execute_rpc_async('rpc_insert_price', {'p_price': 1})
+
+        assert client.rpc.return_value.execute.call_count == 1
+        assert rpc_client.rpc_stats['failed_calls'] == 1
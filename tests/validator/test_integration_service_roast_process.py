@@ -12,6 +12,7 @@ from src.validator.models import (
     SourceEnum, PlatformEnum, RoastLevelEnum, ProcessEnum, SpeciesEnum
 )
 from src.validator.artifact_validator import ValidationResult
+from src.validator.rpc_client import BulkRowResult
 
 
 class TestValidatorIntegrationServiceRoastProcess:
@@ -91,12 +92,11 @@ class TestValidatorIntegrationServiceRoastProcess:
     @patch('src.validator.integration_service.RPCClient')
     def test_transform_and_upsert_artifacts_with_roast_process(self, mock_rpc_client):
         """Test that transform_and_upsert_artifacts includes roast and process parsing."""
-        # Mock RPC client
+        # Mock RPC client bulk writes
         mock_rpc = Mock()
-        mock_rpc.upsert_coffee.return_value = "coffee-123"
-        mock_rpc.upsert_variant.return_value = "variant-123"
-        mock_rpc.insert_price.return_value = "price-123"
-        mock_rpc.upsert_coffee_image.return_value = "image-123"
+        mock_rpc.bulk_upsert.side_effect = lambda entity_type, payloads: [
+            BulkRowResult(index=i, id=f"{entity_type}-{i}") for i in range(len(payloads))
+        ]
         mock_rpc_client.return_value = mock_rpc
         
         # Create service with mocked RPC client
@@ -123,14 +123,13 @@ class TestValidatorIntegrationServiceRoastProcess:
         assert len(results['coffee_ids']) == 1
         assert len(results['variant_ids']) == 1
         
-        # Verify RPC calls were made
-        mock_rpc.upsert_coffee.assert_called_once()
-        mock_rpc.upsert_variant.assert_called_once()
-        mock_rpc.insert_price.assert_called_once()
-        # Note: upsert_coffee_image is not called because there are no images in test data
+        # Verify one bulk RPC call per entity type
+        # Note: no image call because there are no images in test data
+        bulk_calls = {c.args[0]: c.args[1] for c in mock_rpc.bulk_upsert.call_args_list}
+        assert list(bulk_calls) == ['coffee', 'variant', 'price']
         
         # Verify coffee upsert includes roast and process data
-        coffee_call_args = mock_rpc.upsert_coffee.call_args[1]
+        coffee_call_args = bulk_calls['coffee'][0]
         assert 'p_roast_level' in coffee_call_args
         assert 'p_process' in coffee_call_args
         assert 'p_roast_level_raw' in coffee_call_args
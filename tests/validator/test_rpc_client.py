@@ -6,7 +6,10 @@ import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, timezone
 
-from src.validator.rpc_client import RPCClient, RPCError, RPCConstraintError, RPCNetworkError, RPCValidationError
+from src.validator.rpc_client import (
+    RPCClient, RPCError, RPCConstraintError, RPCNetworkError, RPCValidationError,
+    BulkRowResult, RPCUpsertBatcher
+)
 
 
 class TestRPCClient:
@@ -377,3 +380,182 @@ class TestRPCClient:
         assert self.rpc_client.rpc_stats['constraint_errors'] == 0
         assert self.rpc_client.rpc_stats['network_errors'] == 0
         assert self.rpc_client.rpc_stats['validation_errors'] == 0
+    
+    def test_bulk_upsert_chunks_and_normalizes_rows(self):
+        """Test bulk upsert sends one call per chunk with single-RPC parameter names."""
+        self.rpc_client.bulk_chunk_size = 2
+        
+        def rpc(name, params):
+            result = Mock()
+            result.data = [{'idx': i, 'id': f"v-{row['p_sku']}", 'error': None} for i, row in enumerate(params['p_rows'])]
+            return Mock(execute=Mock(return_value=result))
+        
+        self.mock_supabase.rpc.side_effect = rpc
+        
+        results = self.rpc_client.bulk_upsert('variant', [
+            {'p_coffee_id': 'c1', 'p_sku': 'a', 'p_weight_g': 250, 'p_grind': None, 'p_unknown': 1},
+            {'coffee_id': 'c1', 'sku': 'b', 'weight_g': 500},
+            {'p_coffee_id': 'c2', 'p_sku': 'c', 'p_weight_g': 250}
+        ])
+        
+        assert [r.id for r in results] == ['v-a', 'v-b', 'v-c']
+        assert [r.index for r in results] == [0, 1, 2]
+        assert self.mock_supabase.rpc.call_count == 2
+        first_name, first_params = self.mock_supabase.rpc.call_args_list[0].args
+        assert first_name == 'rpc_bulk_upsert_variants'
+        # Unset required parameters are sent as null, unset optional ones are omitted
+        assert first_params['p_rows'][0] == {
+            'p_coffee_id': 'c1', 'p_platform_variant_id': None, 'p_sku': 'a', 'p_weight_g': 250
+        }
+        assert first_params['p_rows'][1] == {
+            'p_coffee_id': 'c1', 'p_platform_variant_id': None, 'p_sku': 'b', 'p_weight_g': 500
+        }
+    
+    def test_bulk_coffee_row_keeps_required_nulls(self):
+        """Test required coffee parameters without a value are sent as explicit nulls."""
+        self.mock_supabase.rpc.return_value.execute.return_value.data = [{'idx': 0, 'id': 'coffee-1', 'error': None}]
+        
+        results = self.rpc_client.bulk_upsert('coffee', [{
+            'p_bean_species': 'arabica',
+            'p_name': 'Test Coffee',
+            'p_slug': 'test-coffee',
+            'p_roaster_id': 'roaster-1',
+            'p_process': 'washed',
+            'p_process_raw': None,
+            'p_roast_level': 'light',
+            'p_roast_level_raw': 'Light',
+            'p_roast_style_raw': None,
+            'p_description_md': None,
+            'p_direct_buy_url': 'https://example.com/coffee',
+            'p_platform_product_id': 'prod-1',
+            'p_decaf': None,
+            'p_tags': ['fruity']
+        }])
+        
+        assert results[0].id == 'coffee-1'
+        row = self.mock_supabase.rpc.call_args.args[1]['p_rows'][0]
+        assert row['p_process_raw'] is None
+        assert row['p_roast_style_raw'] is None
+        assert row['p_description_md'] is None
+        assert 'p_decaf' not in row
+        assert row['p_tags'] == ['fruity']
+    
+    def test_bulk_upsert_reports_row_and_chunk_failures(self):
+        """Test per-row errors and failed chunks are reported per row."""
+        self.rpc_client.bulk_chunk_size = 2
+        ok = Mock()
+        ok.data = [{'idx': 0, 'id': 'p-1', 'error': None}, {'idx': 1, 'id': None, 'error': 'price must be positive'}]
+        self.mock_supabase.rpc.return_value.execute.side_effect = [ok, Exception("duplicate key violates unique constraint")]
+        
+        results = self.rpc_client.bulk_upsert('price', [{'p_price': 1}, {'p_price': -1}, {'p_price': 2}])
+        
+        assert results[0].succeeded
+        assert results[1].error == 'price must be positive'
+        assert not results[2].succeeded
+        assert 'constraint' in results[2].error
+    
+    def test_bulk_upsert_unknown_entity_type(self):
+        """Test unknown bulk entity types are rejected."""
+        with pytest.raises(RPCValidationError):
+            self.rpc_client.bulk_upsert('roaster', [{}])
+    
+    def test_apply_price_deltas_chunks_and_keeps_last_delta(self):
+        """Test price deltas are deduplicated per variant and applied one chunk per call."""
+        self.rpc_client.bulk_chunk_size = 2
+        
+        def rpc(name, params):
+            result = Mock()
+            result.data = [
+                {'variant_id': row['variant_id'], 'price_id': f"p-{row['variant_id']}"}
+                for row in params['p_deltas'] if row['variant_id'] != 'missing'
+            ]
+            return Mock(execute=Mock(return_value=result))
+        
+        self.mock_supabase.rpc.side_effect = rpc
+        
+        result = self.rpc_client.apply_price_deltas([
+            {'variant_id': 'v1', 'price': 10.0, 'in_stock': None},
+            {'variant_id': 'v2', 'price': 20.0},
+            {'variant_id': 'v1', 'price': 12.0, 'in_stock': False},
+            {'variant_id': 'missing', 'price': 5.0},
+            {'variant_id': None, 'price': 1.0}
+        ])
+        
+        assert self.mock_supabase.rpc.call_count == 2
+        first_name, first_params = self.mock_supabase.rpc.call_args_list[0].args
+        assert first_name == 'rpc_apply_price_deltas'
+        assert first_params['p_deltas'] == [
+            {'variant_id': 'v2', 'price': 20.0},
+            {'variant_id': 'v1', 'price': 12.0, 'in_stock': False}
+        ]
+        assert result.price_ids == ['p-v2', 'p-v1']
+        assert result.variant_ids == ['v2', 'v1']
+        assert result.failed_deltas == 2
+        assert not result.success
+    
+    def test_apply_price_deltas_failed_chunk(self):
+        """Test a failed chunk is reported without aborting the rest."""
+        self.rpc_client.bulk_chunk_size = 1
+        ok = Mock()
+        ok.data = [{'variant_id': 'v2', 'price_id': 'p-2'}]
+        self.mock_supabase.rpc.return_value.execute.side_effect = [Exception("duplicate key violates unique constraint"), ok]
+        
+        result = self.rpc_client.apply_price_deltas([{'variant_id': 'v1', 'price': 1}, {'variant_id': 'v2', 'price': 2}])
+        
+        assert result.price_ids == ['p-2']
+        assert result.failed_deltas == 1
+        assert 'constraint' in result.errors[0]
+    
+    def test_batch_update_variant_pricing_is_set_based(self):
+        """Test variant pricing updates are sent in one call per chunk."""
+        response = Mock()
+        response.data = [{'variant_id': 'v1'}]
+        self.mock_supabase.rpc.return_value.execute.return_value = response
+        
+        result = self.rpc_client.batch_update_variant_pricing([
+            {'variant_id': 'v1', 'price_current': 10.0, 'in_stock': None},
+            {'variant_id': 'v2', 'price_current': 12.0},
+            {'price_current': 1.0}
+        ])
+        
+        self.mock_supabase.rpc.assert_called_once_with('rpc_batch_update_variant_pricing', {'p_updates': [
+            {'variant_id': 'v1', 'price_current': 10.0},
+            {'variant_id': 'v2', 'price_current': 12.0}
+        ]})
+        assert result['total_updates'] == 3
+        assert result['successful_updates'] == 1
+        assert result['failed_updates'] == 2
+        assert "Failed to update variant v2" in result['errors']
+    
+    def test_batcher_wires_ids_between_entities(self):
+        """Test batcher passes coffee ids to variants and variant ids to prices per product."""
+        def bulk_upsert(entity_type, payloads):
+            if entity_type == 'variant' and len(payloads) > 1:
+                # Second product's variant fails
+                return [BulkRowResult(index=0, id='variant-0'), BulkRowResult(index=1, error='bad grind')]
+            return [BulkRowResult(index=i, id=f"{entity_type}-{i}") for i in range(len(payloads))]
+        
+        self.rpc_client.bulk_upsert = Mock(side_effect=bulk_upsert)
+        batcher = RPCUpsertBatcher(self.rpc_client)
+        for key in ('a', 'b'):
+            batcher.add(key, {
+                'coffee': {'p_name': key},
+                'variants': [{'p_sku': f'{key}-250'}],
+                'prices': [{'p_price': 10.0}],
+                'images': [{'p_url': f'https://img/{key}.jpg'}]
+            })
+        
+        results = batcher.flush()
+        
+        calls = {c.args[0]: c.args[1] for c in self.rpc_client.bulk_upsert.call_args_list}
+        assert list(calls) == ['coffee', 'variant', 'price', 'image']
+        assert [v['p_coffee_id'] for v in calls['variant']] == ['coffee-0', 'coffee-1']
+        assert calls['price'] == [{'p_price': 10.0, 'p_variant_id': 'variant-0'}]
+        
+        assert results[0].success
+        assert results[0].price_ids == ['price-0']
+        assert results[0].upserted_rows == 4
+        assert not results[1].success
+        assert results[1].coffee_id == 'coffee-1'
+        assert results[1].errors == [{'entity_type': 'variant', 'position': 0, 'error': 'bad grind'}]
+        assert len(batcher) == 0
@@ -3,13 +3,15 @@ Integration tests for RPC functionality with staging database.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timezone
 
 from src.validator.integration_service import ValidatorIntegrationService
 from src.config.validator_config import ValidatorConfig
 from src.config.imagekit_config import ImageKitConfig
 from src.validator.artifact_validator import ValidationResult
+from src.validator.rpc_client import BulkRowResult
+from src.validator.variant_snapshot import get_variant_snapshot_cache
 from src.validator.models import (
     ArtifactModel, ProductModel, VariantModel,
     SourceEnum, PlatformEnum, WeightUnitEnum, RoastLevelEnum, 
@@ -40,17 +42,24 @@ class TestRPCIntegration:
             supabase_client=self.mock_supabase
         )
         
-        # Mock the RPC client methods
-        self.integration_service.rpc_client.upsert_coffee = Mock()
-        self.integration_service.rpc_client.upsert_variant = Mock()
-        self.integration_service.rpc_client.insert_price = Mock()
-        self.integration_service.rpc_client.upsert_coffee_image = Mock()
+        # Mock the bulk RPC writes (one call per entity type)
+        self.integration_service.rpc_client.bulk_upsert = Mock(side_effect=self.fake_bulk_upsert)
         
         # Mock the artifact mapper
         self.integration_service.artifact_mapper.map_artifact_to_rpc_payloads = Mock()
         
         # Mock the database integration methods
         self.integration_service.database_integration.store_batch_validation_results = Mock()
+        self.integration_service.database_integration.store_batch_validation_results_async = AsyncMock()
+    
+    @staticmethod
+    def fake_bulk_upsert(entity_type, payloads):
+        """Return a generated id for every row."""
+        return [BulkRowResult(index=i, id=f"{entity_type}-{i}") for i in range(len(payloads))]
+    
+    def bulk_upsert_entity_types(self):
+        """Entity types written, in call order."""
+        return [c.args[0] for c in self.integration_service.rpc_client.bulk_upsert.call_args_list]
     
     def create_test_validation_result(self) -> ValidationResult:
         """Create a test validation result."""
@@ -108,7 +117,7 @@ class TestRPCIntegration:
         
         # Create test validation results
         validation_result = self.create_test_validation_result()
-        mock_pipeline.process_storage_artifacts.return_value = [validation_result]
+        mock_pipeline.validate_storage_artifact = AsyncMock(return_value=validation_result)
         
         # Replace the actual validation pipeline with our mock
         self.integration_service.validation_pipeline = mock_pipeline
@@ -121,13 +130,8 @@ class TestRPCIntegration:
             'images': []
         }
         
-        # Mock RPC client responses
-        self.integration_service.rpc_client.upsert_coffee.return_value = "coffee-123"
-        self.integration_service.rpc_client.upsert_variant.return_value = "variant-123"
-        self.integration_service.rpc_client.insert_price.return_value = "price-123"
-        
         # Mock database integration
-        self.integration_service.database_integration.store_batch_validation_results.return_value = ["artifact-123"]
+        self.integration_service.database_integration.store_batch_validation_results_async.return_value = ["artifact-123"]
         
         # Test processing
         result = self.integration_service.process_artifacts_with_rpc_upsert(
@@ -154,10 +158,8 @@ class TestRPCIntegration:
         assert rpc_results['failed_transformations'] == 0
         assert rpc_results['failed_upserts'] == 0
         
-        # Verify RPC calls were made
-        self.integration_service.rpc_client.upsert_coffee.assert_called_once()
-        self.integration_service.rpc_client.upsert_variant.assert_called_once()
-        self.integration_service.rpc_client.insert_price.assert_called_once()
+        # Verify one bulk RPC call per entity type
+        assert self.bulk_upsert_entity_types() == ['coffee', 'variant', 'price']
     
     @patch('src.validator.integration_service.ValidationPipeline')
     def test_process_artifacts_with_rpc_upsert_metadata_only(self, mock_pipeline_class):
@@ -168,7 +170,7 @@ class TestRPCIntegration:
         
         # Create test validation results
         validation_result = self.create_test_validation_result()
-        mock_pipeline.process_storage_artifacts.return_value = [validation_result]
+        mock_pipeline.validate_storage_artifact = AsyncMock(return_value=validation_result)
         
         # Replace the actual validation pipeline with our mock
         self.integration_service.validation_pipeline = mock_pipeline
@@ -181,13 +183,8 @@ class TestRPCIntegration:
             'images': []
         }
         
-        # Mock RPC client responses
-        self.integration_service.rpc_client.upsert_coffee.return_value = "coffee-123"
-        self.integration_service.rpc_client.upsert_variant.return_value = "variant-123"
-        self.integration_service.rpc_client.insert_price.return_value = "price-123"
-        
         # Mock database integration
-        self.integration_service.database_integration.store_batch_validation_results.return_value = ["artifact-123"]
+        self.integration_service.database_integration.store_batch_validation_results_async.return_value = ["artifact-123"]
         
         # Test processing with metadata-only flag
         result = self.integration_service.process_artifacts_with_rpc_upsert(
@@ -224,10 +221,11 @@ class TestRPCIntegration:
             errors=["Validation failed"],
         )
         
-        mock_pipeline.process_storage_artifacts.return_value = [validation_result]
+        mock_pipeline.validate_storage_artifact = AsyncMock(return_value=validation_result)
+        self.integration_service.validation_pipeline = mock_pipeline
         
         # Mock database integration
-        self.integration_service.database_integration.store_batch_validation_results.return_value = ["artifact-123"]
+        self.integration_service.database_integration.store_batch_validation_results_async.return_value = ["artifact-123"]
         
         # Test processing
         result = self.integration_service.process_artifacts_with_rpc_upsert(
@@ -247,9 +245,7 @@ class TestRPCIntegration:
         assert result['error'] == 'No valid artifacts found'
         
         # Verify no RPC calls were made
-        self.integration_service.rpc_client.upsert_coffee.assert_not_called()
-        self.integration_service.rpc_client.upsert_variant.assert_not_called()
-        self.integration_service.rpc_client.insert_price.assert_not_called()
+        self.integration_service.rpc_client.bulk_upsert.assert_not_called()
     
     @patch('src.validator.integration_service.ValidationPipeline')
     def test_process_artifacts_with_rpc_upsert_transformation_error(self, mock_pipeline_class):
@@ -260,7 +256,7 @@ class TestRPCIntegration:
         
         # Create test validation results
         validation_result = self.create_test_validation_result()
-        mock_pipeline.process_storage_artifacts.return_value = [validation_result]
+        mock_pipeline.validate_storage_artifact = AsyncMock(return_value=validation_result)
         
         # Replace the actual validation pipeline with our mock
         self.integration_service.validation_pipeline = mock_pipeline
@@ -273,11 +269,13 @@ class TestRPCIntegration:
             'images': []
         }
         
-        # Mock RPC client to raise error
-        self.integration_service.rpc_client.upsert_coffee.side_effect = Exception("RPC error")
+        # Mock the coffee row failing in the bulk RPC
+        self.integration_service.rpc_client.bulk_upsert.side_effect = (
+            lambda entity_type, payloads: [BulkRowResult(index=0, error="RPC error")]
+        )
         
         # Mock database integration
-        self.integration_service.database_integration.store_batch_validation_results.return_value = ["artifact-123"]
+        self.integration_service.database_integration.store_batch_validation_results_async.return_value = ["artifact-123"]
         
         # Test processing
         result = self.integration_service.process_artifacts_with_rpc_upsert(
@@ -300,6 +298,60 @@ class TestRPCIntegration:
         assert len(rpc_results['errors']) == 1
         assert rpc_results['errors'][0]['error'] == "RPC error"
     
+    def test_process_artifacts_with_rpc_upsert_streams_in_batches(self):
+        """Test artifacts are upserted and audited in batches of upsert_batch_size."""
+        valid_result = self.create_test_validation_result()
+        invalid_result = ValidationResult(
+            artifact_id="artifact-bad",
+            artifact_data={},
+            is_valid=False,
+            errors=["Validation failed"]
+        )
+        
+        async def validate_storage_artifact(roaster_id, platform, response_filename):
+            return invalid_result if response_filename == "bad.json" else valid_result
+        
+        mock_pipeline = Mock()
+        mock_pipeline.validate_storage_artifact = validate_storage_artifact
+        self.integration_service.validation_pipeline = mock_pipeline
+        self.integration_service.config.upsert_batch_size = 2
+        self.integration_service.config.upsert_write_concurrency = 1
+        # The streaming path awaits the mapper so pipeline LLM calls do not block the loop
+        self.integration_service.artifact_mapper.map_artifact_to_rpc_payloads_async = AsyncMock(return_value={
+            'coffee': {'title': 'Test Coffee', 'roaster_id': 'roaster-123'},
+            'variants': [],
+            'prices': [],
+            'images': []
+        })
+        store = self.integration_service.database_integration.store_batch_validation_results_async
+        store.side_effect = lambda validation_results, response_filenames, **kwargs: list(response_filenames)
+        dedup_service = Mock()
+        dedup_service.aclose = AsyncMock()
+        self.integration_service.image_deduplication_service = dedup_service
+        
+        filenames = ["a.json", "bad.json", "c.json", "d.json", "e.json"]
+        result = self.integration_service.process_artifacts_with_rpc_upsert(
+            roaster_id="roaster-123",
+            platform="shopify",
+            scrape_run_id="run-123",
+            response_filenames=filenames
+        )
+        
+        assert result['success'] is True
+        assert result['valid_artifacts'] == 4
+        assert result['invalid_artifacts'] == 1
+        assert sorted(result['artifact_ids']) == sorted(filenames)
+        assert result['rpc_transformation']['total_artifacts'] == 4
+        assert result['rpc_transformation']['successful_transformations'] == 4
+        assert len(result['rpc_transformation']['coffee_ids']) == 4
+        # Three batches: one coffee bulk write each, one audit write each
+        assert [len(c.kwargs['response_filenames']) for c in store.call_args_list] == [2, 2, 1]
+        assert self.bulk_upsert_entity_types() == ['coffee', 'coffee', 'coffee']
+        # Image hash clients are closed in the loop that opened them
+        dedup_service.aclose.assert_awaited_once()
+        # Each flushed batch drops the roaster's variant snapshot
+        assert get_variant_snapshot_cache(self.mock_supabase).version("roaster-123") == 3
+    
     def test_transform_and_upsert_artifacts_success(self):
         """Test successful artifact transformation and upsert."""
         # Create test validation results
@@ -313,11 +365,6 @@ class TestRPCIntegration:
             'images': []
         }
         
-        # Mock RPC client responses
-        self.integration_service.rpc_client.upsert_coffee.return_value = "coffee-123"
-        self.integration_service.rpc_client.upsert_variant.return_value = "variant-123"
-        self.integration_service.rpc_client.insert_price.return_value = "price-123"
-        
         # Test transformation
         result = self.integration_service.transform_and_upsert_artifacts(
             validation_results=[validation_result],
@@ -338,10 +385,63 @@ class TestRPCIntegration:
         assert len(result['price_ids']) == 1
         assert len(result['errors']) == 0
         
-        # Verify RPC calls were made
-        self.integration_service.rpc_client.upsert_coffee.assert_called_once()
-        self.integration_service.rpc_client.upsert_variant.assert_called_once()
-        self.integration_service.rpc_client.insert_price.assert_called_once()
+        # Verify one bulk RPC call per entity type
+        assert self.bulk_upsert_entity_types() == ['coffee', 'variant', 'price']
+        # Price jobs must reload the variants the full refresh just wrote
+        assert get_variant_snapshot_cache(self.mock_supabase).version("roaster-123") == 1
+    
+    def test_transform_and_upsert_artifacts_skips_unchanged(self):
+        """Test artifacts matching their stored fingerprint skip mapping and upsert."""
+        validation_result = self.create_test_validation_result()
+        rpc_client = self.integration_service.rpc_client
+        fingerprint = self.integration_service._create_unchanged_filter("roaster-123").artifact_hash(
+            validation_result.artifact_data
+        )
+        rpc_client.get_roaster_content_hashes = Mock(return_value={
+            'prod-123': {'coffee_id': 'coffee-1', 'artifact_hash': fingerprint}
+        })
+        rpc_client.touch_unchanged_coffees = Mock(return_value=1)
+        
+        result = self.integration_service.transform_and_upsert_artifacts(
+            validation_results=[validation_result],
+            roaster_id="roaster-123",
+            metadata_only=False
+        )
+        
+        assert result['skipped_unchanged'] == 1
+        assert result['successful_transformations'] == 0
+        self.integration_service.artifact_mapper.map_artifact_to_rpc_payloads.assert_not_called()
+        rpc_client.bulk_upsert.assert_not_called()
+        rpc_client.touch_unchanged_coffees.assert_called_once_with(['coffee-1'])
+    
+    def test_metadata_only_run_bypasses_unchanged_filter(self):
+        """Test metadata-only runs neither skip products nor record fingerprints."""
+        validation_result = self.create_test_validation_result()
+        rpc_client = self.integration_service.rpc_client
+        fingerprint = self.integration_service._create_unchanged_filter("roaster-123").artifact_hash(
+            validation_result.artifact_data
+        )
+        rpc_client.get_roaster_content_hashes = Mock(return_value={
+            'prod-123': {'coffee_id': 'coffee-1', 'artifact_hash': fingerprint}
+        })
+        rpc_client.set_coffee_artifact_hashes = Mock()
+        self.integration_service.artifact_mapper.map_artifact_to_rpc_payloads.return_value = {
+            'coffee': {'title': 'Test Coffee', 'roaster_id': 'roaster-123'},
+            'variants': [],
+            'prices': [],
+            'images': []
+        }
+        
+        result = self.integration_service.transform_and_upsert_artifacts(
+            validation_results=[validation_result],
+            roaster_id="roaster-123",
+            metadata_only=True
+        )
+        
+        assert result['skipped_unchanged'] == 0
+        assert result['successful_transformations'] == 1
+        rpc_client.get_roaster_content_hashes.assert_not_called()
+        rpc_client.set_coffee_artifact_hashes.assert_not_called()
     
     def test_transform_and_upsert_artifacts_with_invalid_artifacts(self):
         """Test transformation with invalid artifacts."""
@@ -368,9 +468,7 @@ class TestRPCIntegration:
         assert result['failed_upserts'] == 0
         
         # Verify no RPC calls were made
-        self.integration_service.rpc_client.upsert_coffee.assert_not_called()
-        self.integration_service.rpc_client.upsert_variant.assert_not_called()
-        self.integration_service.rpc_client.insert_price.assert_not_called()
+        self.integration_service.rpc_client.bulk_upsert.assert_not_called()
     
     def test_transform_and_upsert_artifacts_with_transformation_error(self):
         """Test transformation with transformation error."""
@@ -0,0 +1,110 @@
+"""
+Tests for the skip-unchanged artifact filter.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from src.validator.artifact_validator import ValidationResult
+from src.validator.rpc_client import ProductUpsertResult
+from src.validator.unchanged_filter import UnchangedArtifactFilter
+
+
+def make_result(price="24.99", scraped_at=None, artifact_id="artifact-1", product_id="prod-1"):
+    """Create a valid validation result with a dict artifact."""
+    artifact = {
+        'source': 'shopify',
+        'roaster_domain': 'test.com',
+        'scraped_at': (scraped_at or datetime.now(timezone.utc)).isoformat(),
+        'product': {
+            'platform_product_id': product_id,
+            'title': 'Test Coffee',
+            'variants': [{'platform_variant_id': 'var-1', 'price': price, 'in_stock': True}]
+        }
+    }
+    return ValidationResult(is_valid=True, artifact_data=artifact, artifact_id=artifact_id)
+
+
+class TestUnchangedArtifactFilter:
+    """Test cases for UnchangedArtifactFilter."""
+
+    def make_filter(self, known=None):
+        rpc_client = Mock()
+        rpc_client.get_roaster_content_hashes.return_value = known or {}
+        unchanged_filter = UnchangedArtifactFilter(rpc_client, "roaster-1")
+        unchanged_filter.load()
+        return unchanged_filter
+
+    def test_fingerprint_ignores_scrape_metadata(self):
+        """Test re-scraping the same content yields the same fingerprint."""
+        unchanged_filter = self.make_filter()
+        first = make_result(scraped_at=datetime(2025, 1, 1, tzinfo=timezone.utc))
+        second = make_result(scraped_at=datetime(2025, 2, 1, tzinfo=timezone.utc))
+
+        assert unchanged_filter.artifact_hash(first.artifact_data) == \
+            unchanged_filter.artifact_hash(second.artifact_data)
+
+    def test_unchanged_artifact_is_skipped_and_touched(self):
+        """Test a matching fingerprint skips the artifact and touches the coffee."""
+        probe = self.make_filter()
+        fingerprint = probe.artifact_hash(make_result().artifact_data)
+        unchanged_filter = self.make_filter({
+            'prod-1': {'coffee_id': 'coffee-1', 'artifact_hash': fingerprint}
+        })
+        unchanged_filter.rpc_client.touch_unchanged_coffees.return_value = 1
+
+        assert unchanged_filter.is_unchanged(make_result()) is True
+        assert unchanged_filter.touch_unchanged() == 1
+        unchanged_filter.rpc_client.touch_unchanged_coffees.assert_called_once_with(['coffee-1'])
+        # Queue is cleared after touching
+        assert unchanged_filter.touch_unchanged() == 0
+
+    def test_price_change_is_not_skipped(self):
+        """Test a price change produces a different fingerprint."""
+        probe = self.make_filter()
+        fingerprint = probe.artifact_hash(make_result().artifact_data)
+        unchanged_filter = self.make_filter({
+            'prod-1': {'coffee_id': 'coffee-1', 'artifact_hash': fingerprint}
+        })
+
+        assert unchanged_filter.is_unchanged(make_result(price="26.99")) is False
+
+    def test_record_upserted_only_for_fully_written_products(self):
+        """Test fingerprints are stored only for products without errors."""
+        unchanged_filter = self.make_filter()
+        unchanged_filter.is_unchanged(make_result(artifact_id="a1", product_id="prod-1"))
+        unchanged_filter.is_unchanged(make_result(price="1.00", artifact_id="a2", product_id="prod-2"))
+
+        recorded = unchanged_filter.record_upserted([
+            ProductUpsertResult(key="a1", platform_product_id="prod-1", coffee_id="coffee-1"),
+            ProductUpsertResult(key="a2", platform_product_id="prod-2", coffee_id="coffee-2",
+                                errors=[{"entity": "price", "error": "failed"}]),
+        ])
+
+        assert recorded == 1
+        rows = unchanged_filter.rpc_client.set_coffee_artifact_hashes.call_args.args[0]
+        assert [row['coffee_id'] for row in rows] == ['coffee-1']
+
+    def test_fingerprints_keyed_by_product_not_artifact_id(self):
+        """Test artifacts without an artifact_id do not overwrite each other's fingerprints."""
+        unchanged_filter = self.make_filter()
+        unchanged_filter.is_unchanged(make_result(artifact_id=None, product_id="prod-1"))
+        unchanged_filter.is_unchanged(make_result(price="1.00", artifact_id=None, product_id="prod-2"))
+
+        recorded = unchanged_filter.record_upserted([
+            ProductUpsertResult(key="unknown", platform_product_id="prod-1", coffee_id="coffee-1"),
+            ProductUpsertResult(key="unknown", platform_product_id="prod-2", coffee_id="coffee-2"),
+        ])
+
+        assert recorded == 2
+        rows = unchanged_filter.rpc_client.set_coffee_artifact_hashes.call_args.args[0]
+        assert rows[0]['artifact_hash'] != rows[1]['artifact_hash']
+
+    def test_load_failure_disables_filter(self):
+        """Test a failed hash lookup processes every artifact."""
+        rpc_client = Mock()
+        rpc_client.get_roaster_content_hashes.side_effect = Exception("timeout")
+        unchanged_filter = UnchangedArtifactFilter(rpc_client, "roaster-1")
+
+        assert unchanged_filter.load() == 0
+        assert unchanged_filter.is_unchanged(make_result()) is False
@@ -0,0 +1,115 @@
+"""
+Tests for the staged validate -> map -> upsert pipeline.
+"""
+
+import asyncio
+
+import pytest
+
+from src.validator.upsert_pipeline import StagedUpsertPipeline, StageLimits
+
+
+class TestStagedUpsertPipeline:
+    """Test cases for StagedUpsertPipeline."""
+
+    @pytest.mark.asyncio
+    async def test_all_items_reach_upsert_in_batches(self):
+        """Test every item is validated, mapped and upserted in bounded batches."""
+        batches = []
+
+        async def validate(item):
+            return item * 10
+
+        async def map_item(item):
+            return item + 1
+
+        async def upsert(batch):
+            batches.append(list(batch))
+
+        pipeline = StagedUpsertPipeline(
+            validate=validate,
+            map_item=map_item,
+            upsert=upsert,
+            limits=StageLimits(batch_size=3, upsert_concurrency=1)
+        )
+
+        await pipeline.run(range(7))
+
+        assert sorted(x for batch in batches for x in batch) == [i * 10 + 1 for i in range(7)]
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_backpressure_bounds_items_in_flight(self):
+        """Test a slow upsert stage stops validation from running far ahead."""
+        validated = 0
+        upserted = 0
+        max_ahead = 0
+
+        async def validate(item):
+            nonlocal validated, max_ahead
+            validated += 1
+            max_ahead = max(max_ahead, validated - upserted)
+            return item
+
+        async def map_item(item):
+            return item
+
+        async def upsert(batch):
+            nonlocal upserted
+            await asyncio.sleep(0.001)
+            upserted += len(batch)
+
+        limits = StageLimits(
+            validation_concurrency=2,
+            mapping_concurrency=1,
+            upsert_concurrency=1,
+            queue_size=2,
+            batch_size=1
+        )
+        await StagedUpsertPipeline(validate, map_item, upsert, limits).run(range(100))
+
+        assert upserted == 100
+        # Three queues, one item held per worker, one in the current batch
+        assert max_ahead <= 3 * limits.queue_size + 2 + 1 + 1 + 1
+
+    @pytest.mark.asyncio
+    async def test_stage_concurrency_limit(self):
+        """Test a stage never runs more workers than configured."""
+        running = 0
+        peak = 0
+
+        async def validate(item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return item
+
+        async def passthrough(item):
+            return item
+
+        async def upsert(batch):
+            pass
+
+        limits = StageLimits(validation_concurrency=3)
+        await StagedUpsertPipeline(validate, passthrough, upsert, limits).run(range(20))
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_stage_failure_cancels_pipeline(self):
+        """Test an exception escaping a stage is raised from run()."""
+        async def validate(item):
+            if item == 5:
+                raise ValueError("boom")
+            return item
+
+        async def passthrough(item):
+            return item
+
+        async def upsert(batch):
+            pass
+
+        with pytest.raises(ValueError, match="boom"):
+            await StagedUpsertPipeline(validate, passthrough, upsert).run(range(10))
@@ -0,0 +1,125 @@
+"""
+Tests for the roaster-scoped variant snapshot cache.
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from src.fetcher.price_parser import PriceDelta
+from src.price.price_update_service import PriceUpdateService
+from src.validator.rpc_client import PriceDeltaApplyResult
+from src.validator.variant_snapshot import SNAPSHOT_COLUMNS, get_variant_snapshot_cache
+
+
+def _snapshot_client():
+    """Supabase client mock returning two variants of one coffee."""
+    client = Mock()
+    client.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [
+        {
+            'id': 'v1', 'platform_variant_id': 'pv1', 'price_current': 19.99,
+            'currency': 'USD', 'in_stock': True,
+            'coffees': {'platform_product_id': 'product-1', 'slug': 'coffee-one'}
+        },
+        {
+            'id': 'v2', 'platform_variant_id': 'pv2', 'price_current': 29.99,
+            'currency': 'USD', 'in_stock': False,
+            'coffees': {'platform_product_id': None, 'slug': 'coffee-one'}
+        },
+    ]
+    return client
+
+
+class TestVariantSnapshotCache:
+    """Test cases for VariantSnapshotCache."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_loads_variants_and_handles_once(self):
+        """Test one query serves both variants and product handles."""
+        client = _snapshot_client()
+        cache = get_variant_snapshot_cache(client)
+
+        snapshot = await cache.get("roaster-1")
+        again = await cache.get("roaster-1")
+
+        assert again is snapshot
+        assert [v['platform_variant_id'] for v in snapshot.variants] == ['pv1', 'pv2']
+        assert 'coffees' not in snapshot.variants[0]
+        assert snapshot.product_handles == ['product-1', 'coffee-one']
+        assert client.table.call_count == 1
+        client.table.assert_called_once_with("variants")
+        client.table.return_value.select.assert_called_once_with(SNAPSHOT_COLUMNS)
+        assert "coffees!inner(" in SNAPSHOT_COLUMNS and "roaster_id" in SNAPSHOT_COLUMNS
+        # variants have no roaster_id column; filter through the embedded coffee
+        client.table.return_value.select.return_value.eq.assert_called_once_with(
+            "coffees.roaster_id", "roaster-1"
+        )
+        assert get_variant_snapshot_cache(client) is cache
+        assert get_variant_snapshot_cache(None) is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_load(self):
+        """Test concurrent callers for a roaster wait for a single load."""
+        client = _snapshot_client()
+        cache = get_variant_snapshot_cache(client)
+
+        snapshots = await asyncio.gather(*(cache.get("roaster-1") for _ in range(5)))
+
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert cache.stats['loads'] == 1
+
+    def test_locks_are_per_event_loop(self):
+        """Test contended loads work when the cache is reused from another event loop."""
+        client = _snapshot_client()
+        cache = get_variant_snapshot_cache(client)
+
+        async def load_concurrently():
+            return await asyncio.gather(*(cache.get("roaster-1") for _ in range(3)))
+
+        asyncio.run(load_concurrently())
+        cache.invalidate("roaster-1")
+        snapshots = asyncio.run(load_concurrently())
+
+        assert all(snapshot.version == 1 for snapshot in snapshots)
+        assert cache.stats['loads'] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_variants_bumps_owning_roaster(self):
+        """Test invalidating by database or platform ID drops the roaster snapshot."""
+        client = _snapshot_client()
+        cache = get_variant_snapshot_cache(client)
+        first = await cache.get("roaster-1")
+
+        cache.invalidate_variants(['unknown'])
+        assert await cache.get("roaster-1") is first
+
+        cache.invalidate_variants(['pv2'])
+        second = await cache.get("roaster-1")
+
+        assert second is not first
+        assert second.version == 1
+        assert client.table.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_price_update_invalidates_snapshot(self):
+        """Test a successful price update drops the cached snapshot."""
+        client = _snapshot_client()
+        cache = get_variant_snapshot_cache(client)
+        await cache.get("roaster-1")
+
+        rpc_client = Mock()
+        rpc_client.apply_price_deltas.return_value = PriceDeltaApplyResult(
+            price_ids=['price-1'], variant_ids=['v1']
+        )
+        service = PriceUpdateService(supabase_client=client, rpc_client=rpc_client)
+        result = await service.update_prices_atomic([
+            PriceDelta(variant_id='pv1', old_price=Decimal('19.99'), new_price=Decimal('24.99'),
+                       currency='USD', in_stock=True)
+        ])
+
+        assert result.success
+        assert cache.version("roaster-1") == 1
+        await cache.get("roaster-1")
+        assert cache.stats['loads'] == 2
@@ -9,7 +9,10 @@ import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any
 
-from src.worker.tasks import execute_scraping_job, _update_roaster_platform, execute_firecrawl_map_job
+from src.worker.tasks import (
+    execute_scraping_job, _update_roaster_platform, execute_firecrawl_map_job, execute_firecrawl_batch_map_job
+)
+from src.fetcher.firecrawl_budget_management_service import FirecrawlBudgetManagementService
 from src.config.roaster_schema import RoasterConfigSchema
 
 
@@ -450,6 +453,31 @@ class TestWorkerTasksEpicBIntegration:
             assert result['status'] == 'completed'
             assert result['job_type'] == 'price_only'
     
+    @pytest.mark.asyncio
+    async def test_firecrawl_batch_map_job_injects_budget_service(self, mock_config):
+        """Test batch map jobs schedule against the client's budget service."""
+        job_data = {
+            'id': 'test_job_batch',
+            'data': {'roaster_ids': ['roaster_a', 'roaster_b']}
+        }
+        
+        with patch('src.worker.tasks.FirecrawlMapService') as mock_service_class:
+            mock_service = AsyncMock()
+            mock_service.batch_discover_products.return_value = {
+                'successful_discoveries': 2,
+                'total_urls_discovered': 4,
+                'results': []
+            }
+            mock_service_class.return_value = mock_service
+            
+            result = await execute_firecrawl_batch_map_job(job_data, mock_config)
+        
+        client = mock_service_class.call_args.args[0]
+        budget_service = mock_service_class.call_args.kwargs['budget_service']
+        assert isinstance(budget_service, FirecrawlBudgetManagementService)
+        assert budget_service.budget_tracker is client.budget_tracker
+        assert result['status'] == 'completed'
+    
     @pytest.mark.asyncio
     async def test_firecrawl_map_job_full_refresh_mode(self, mock_config):
         """Test Firecrawl map job with full refresh mode."""